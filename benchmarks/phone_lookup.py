@@ -0,0 +1,62 @@
+"""
+Benchmark: phone number to country / pricing tier resolution
+
+Compares the prefix table behind get_country_from_phone with the previous
+sort-and-scan lookup, per calling-code length, and measures bulk
+resolution and estimate_cost throughput.
+
+Run with: python benchmarks/phone_lookup.py
+"""
+
+import random
+import timeit
+
+from sendly import estimate_cost, get_country_from_phone, resolve_destinations
+from sendly.utils.validation import _COUNTRY_PREFIXES
+
+SAMPLES = {
+    "1-digit code (+1, US/CA)": "+14165551234",
+    "2-digit code (+44, GB)": "+447911123456",
+    "3-digit code (+351, PT)": "+351912345678",
+    "unknown code (+999)": "+999123456789",
+}
+
+
+def scan_lookup(phone):
+    """The previous implementation: sort the prefixes, then try each in turn"""
+    digits = phone.lstrip("+")
+    if digits.startswith("1") and len(digits) == 11:
+        return "US"
+    for prefix in sorted(_COUNTRY_PREFIXES, key=len, reverse=True):
+        if digits.startswith(prefix):
+            return _COUNTRY_PREFIXES[prefix]
+    return None
+
+
+def per_call(fn, phone, number=200_000):
+    return timeit.timeit(lambda: fn(phone), number=number) / number * 1e9
+
+
+def main():
+    print(f"{'number':<28}{'table (ns)':>12}{'scan (ns)':>12}")
+    for label, phone in SAMPLES.items():
+        table = per_call(get_country_from_phone, phone)
+        scan = per_call(scan_lookup, phone, number=20_000)
+        print(f"{label:<28}{table:>12.0f}{scan:>12.0f}")
+
+    # National parts: 7 digits after a NANP area code, 9 elsewhere
+    prefixes = ["1416" + "#" * 7, "1212" + "#" * 7] + [code + "#" * 9 for code in _COUNTRY_PREFIXES]
+    phones = [
+        "+" + "".join(str(random.randrange(10)) if c == "#" else c for c in random.choice(prefixes))
+        for _ in range(1_000_000)
+    ]
+    seconds = timeit.timeit(lambda: resolve_destinations(phones), number=1)
+    print(f"\nresolve_destinations: {len(phones) / seconds:,.0f} numbers/s")
+
+    messages = [{"to": phone, "text": "Your order has shipped!"} for phone in phones]
+    seconds = timeit.timeit(lambda: estimate_cost(messages), number=1)
+    print(f"estimate_cost:        {len(messages) / seconds:,.0f} messages/s")
+
+
+if __name__ == "__main__":
+    main()
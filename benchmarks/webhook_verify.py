@@ -0,0 +1,73 @@
+"""
+Benchmark: webhook signature verification
+
+Compares the static Webhooks.verify_signature with a reusable
+WebhookVerifier (str, bytes and memoryview bodies, one and two active
+secrets) and measures verify_many throughput.
+
+Run with: python benchmarks/webhook_verify.py
+"""
+
+import json
+import time
+import timeit
+
+from sendly import Webhooks, WebhookVerifier
+
+SECRET = "whsec_" + "k" * 32
+OLD_SECRET = "whsec_" + "o" * 32
+
+
+def make_payload(size):
+    event = {
+        "id": "evt_1",
+        "type": "message.delivered",
+        "data": {"object": {"id": "msg_1", "status": "delivered", "text": ""}},
+    }
+    base = len(json.dumps(event))
+    event["data"]["object"]["text"] = "x" * max(size - base, 0)
+    return json.dumps(event)
+
+
+def per_call(fn, number=100_000):
+    return timeit.timeit(fn, number=number) / number * 1e9
+
+
+def main():
+    timestamp = str(int(time.time()))
+    verifier = WebhookVerifier(SECRET)
+    rotating = WebhookVerifier(SECRET, OLD_SECRET)
+
+    print("ns per call; verifier columns by body type, 'old key' is a rotated secret")
+    print(f"{'body':<8}{'static':>10}{'str':>10}{'bytes':>10}{'memview':>10}{'old key':>10}")
+    for size in (256, 1024, 8192):
+        text = make_payload(size)
+        body = text.encode()
+        view = memoryview(body)
+        signature = Webhooks.generate_signature(text, SECRET, timestamp)
+        old_signature = Webhooks.generate_signature(text, OLD_SECRET, timestamp)
+
+        static = per_call(lambda: Webhooks.verify_signature(text, signature, SECRET, timestamp))
+        as_str = per_call(lambda: verifier.verify(text, signature, timestamp))
+        as_bytes = per_call(lambda: verifier.verify(body, signature, timestamp))
+        as_view = per_call(lambda: verifier.verify(view, signature, timestamp))
+        old_key = per_call(lambda: rotating.verify(body, old_signature, timestamp))
+        print(
+            f"{size:<8}{static:>10.0f}{as_str:>10.0f}{as_bytes:>10.0f}{as_view:>10.0f}{old_key:>10.0f}"
+        )
+
+    text = make_payload(1024)
+    body = text.encode()
+    signature = Webhooks.generate_signature(text, SECRET, timestamp)
+    events = [(body, signature, timestamp)] * 100_000
+
+    seconds = timeit.timeit(
+        lambda: [Webhooks.verify_signature(p, s, SECRET, t) for p, s, t in events], number=1
+    )
+    print(f"\nverify_signature loop: {len(events) / seconds:,.0f} events/s")
+    seconds = timeit.timeit(lambda: verifier.verify_many(events), number=1)
+    print(f"verify_many:           {len(events) / seconds:,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
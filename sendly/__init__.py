@@ -33,10 +33,18 @@ __version__ = "3.33.0"
 
 # Main clients
 from .client import AsyncSendly, Sendly
+from .pool import AsyncSendlyPool, SendlyPool
+from .tracking import (
+    AsyncDeliveryTracker,
+    DeliveryResult,
+    DeliveryTracker,
+    DeliveryTrackerStats,
+)
 
 # Errors
 from .errors import (
     AuthenticationError,
+    CircuitOpenError,
     InsufficientCreditsError,
     NetworkError,
     NotFoundError,
@@ -85,6 +93,9 @@ from .types import (
     AutoTopUpSettings,
     BillingBreakdown,
     BillingBreakdownSummary,
+    BatchChunkError,
+    BatchStreamSummary,
+    BatchUpdate,
     BulkProvisionResult,
     BulkProvisionResultItem,
     BulkProvisionSummary,
@@ -135,6 +146,7 @@ from .types import (
     SenderType,
     SendlyConfig,
     SendMessageRequest,
+    SendResult,
     SetCustomDomainResult,
     SetWorkspaceWebhookResult,
     SuspendWorkspaceResult,
@@ -153,12 +165,42 @@ from .types import (
 )
 
 # Utilities (for advanced usage)
+from .utils.cache import CacheStats, ResponseCache
+from .utils.codec import JsonCodec
+from .utils.encoding import SegmentInfo, get_encoding, get_segment_info, split_segments
+from .utils.hooks import ErrorEvent, Hooks, RequestEvent, ResponseEvent, RetryEvent
+from .utils.http import RequestOptions
+from .utils.metrics import MetricsCollector
+from .utils.models import LazyModel, ResponseMode
+from .utils.pagination import AsyncPaginator, Page, PageCursor, Paginator
+from .utils.preflight import BatchPreflight
+from .utils.pricing import (
+    CostEstimate,
+    Destination,
+    EncodingOptimization,
+    estimate_cost,
+    get_pricing_tier,
+    optimize_encoding,
+    resolve_destination,
+    resolve_destinations,
+)
+from .utils.rate_limit import AsyncRateLimiter, RateLimiter, RateLimiterStats
+from .utils.retry import (
+    CircuitBreaker,
+    CircuitBreakerStats,
+    RetryBudget,
+    RetryPolicy,
+    deadline,
+)
 from .utils.validation import (
+    PhoneValidationResult,
     calculate_segments,
     get_country_from_phone,
     is_country_supported,
+    normalize_phone_number,
     validate_message_text,
     validate_phone_number,
+    validate_phone_numbers,
     validate_sender_id,
 )
 
@@ -170,6 +212,7 @@ from .webhooks import (
     WebhookMessageStatus,
     Webhooks,
     WebhookSignatureError,
+    WebhookVerifier,
 )
 
 __all__ = [
@@ -178,6 +221,13 @@ __all__ = [
     # Clients
     "Sendly",
     "AsyncSendly",
+    "SendlyPool",
+    "AsyncSendlyPool",
+    # Delivery tracking
+    "DeliveryTracker",
+    "AsyncDeliveryTracker",
+    "DeliveryResult",
+    "DeliveryTrackerStats",
     # Types
     "SendlyConfig",
     "SendMessageRequest",
@@ -189,6 +239,10 @@ __all__ = [
     "MessageListResponse",
     "RateLimitInfo",
     "PricingTier",
+    "SendResult",
+    "BatchStreamSummary",
+    "BatchChunkError",
+    "BatchUpdate",
     # Webhook types
     "Webhook",
     "WebhookCreatedResponse",
@@ -290,13 +344,62 @@ __all__ = [
     "NotFoundError",
     "NetworkError",
     "TimeoutError",
+    "CircuitOpenError",
+    # Rate limiting
+    "RateLimiter",
+    "AsyncRateLimiter",
+    "RateLimiterStats",
+    # Retries
+    "RetryPolicy",
+    "RetryBudget",
+    "CircuitBreaker",
+    "CircuitBreakerStats",
+    "deadline",
+    # Per-request options
+    "RequestOptions",
+    # Response cache
+    "ResponseCache",
+    "CacheStats",
+    # JSON codecs
+    "JsonCodec",
+    # Instrumentation
+    "Hooks",
+    "RequestEvent",
+    "ResponseEvent",
+    "RetryEvent",
+    "ErrorEvent",
+    "MetricsCollector",
+    # Response modes
+    "LazyModel",
+    "ResponseMode",
+    # Pagination
+    "Paginator",
+    "AsyncPaginator",
+    "Page",
+    "PageCursor",
     # Utilities
     "validate_phone_number",
     "validate_message_text",
     "validate_sender_id",
     "get_country_from_phone",
     "is_country_supported",
+    "normalize_phone_number",
+    "validate_phone_numbers",
+    "PhoneValidationResult",
     "calculate_segments",
+    "get_segment_info",
+    "get_encoding",
+    "split_segments",
+    "SegmentInfo",
+    "estimate_cost",
+    "get_pricing_tier",
+    "resolve_destination",
+    "resolve_destinations",
+    "Destination",
+    "CostEstimate",
+    "BatchPreflight",
+    "optimize_encoding",
+    "EncodingOptimization",
     # Webhooks
     "Webhooks",
     "WebhookSignatureError",
@@ -304,4 +407,5 @@ __all__ = [
     "WebhookEventType",
     "WebhookMessageData",
     "WebhookMessageStatus",
+    "WebhookVerifier",
 ]
@@ -4,7 +4,9 @@ Sendly Client
 Main entry point for the Sendly SDK.
 """
 
-from typing import Any, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Union
+
+import httpx
 
 from .resources.account import AccountResource, AsyncAccountResource
 from .resources.business_upgrade import (
@@ -25,7 +27,15 @@ from .resources.templates import AsyncTemplatesResource, TemplatesResource
 from .resources.verify import AsyncVerifyResource, VerifyResource
 from .resources.webhooks import AsyncWebhooksResource, WebhooksResource
 from .types import RateLimitInfo, SendlyConfig
-from .utils.http import AsyncHttpClient, HttpClient
+from .utils.cache import CacheStats, ResponseCache
+from .utils.codec import CodecTypes
+from .utils.hooks import Hooks
+from .utils.http import AsyncHttpClient, HttpClient, RequestOptions, TimeoutTypes
+from .utils.metrics import MetricsCollector
+from .utils.models import ResponseMode
+from .utils.rate_limit import AsyncRateLimiter, RateLimiter, RateLimiterStats
+from .utils.retry import CircuitBreakerStats, RetryPolicy
+from .utils.streaming import DEFAULT_STREAM_KEYS, ModelTypes, build_item
 
 DEFAULT_BASE_URL = "https://sendly.live/api/v1"
 DEFAULT_TIMEOUT = 30.0
@@ -61,6 +71,15 @@ class Sendly:
     Example with context manager:
         >>> with Sendly('sk_live_v1_xxx') as client:
         ...     message = client.messages.send(to='+1555...', text='Hello!')
+
+    Example with connection pool tuning:
+        >>> import httpx
+        >>> client = Sendly(
+        ...     'sk_live_v1_xxx',
+        ...     timeout=httpx.Timeout(10.0, connect=2.0),
+        ...     limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        ...     http2=True,
+        ... )
     """
 
     def __init__(
@@ -68,10 +87,23 @@ class Sendly:
         api_key: Optional[str] = None,
         *,
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: TimeoutTypes = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         organization_id: Optional[str] = None,
         config: Optional[SendlyConfig] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.Client] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        rate_limiter: Union[bool, RateLimiter, None] = None,
+        response_mode: ResponseMode = "model",
+        json_codec: CodecTypes = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Union[bool, MetricsCollector, None] = None,
+        idempotency_keys: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Union[bool, ResponseCache, None] = None,
+        coalesce: bool = False,
     ):
         """
         Create a new Sendly client
@@ -79,10 +111,45 @@ class Sendly:
         Args:
             api_key: Your Sendly API key (sk_test_v1_xxx or sk_live_v1_xxx)
             base_url: Base URL for the API (default: https://sendly.live/api/v1)
-            timeout: Request timeout in seconds (default: 30)
+            timeout: Request timeout in seconds (default: 30), or an
+                ``httpx.Timeout`` for per-phase connect/read/write/pool timeouts
             max_retries: Maximum retry attempts (default: 3)
             organization_id: Organization ID for multi-workspace support
             config: Alternative configuration object
+            limits: Connection pool limits (``httpx.Limits``): max connections,
+                max keep-alive connections and keep-alive expiry
+            http2: Enable HTTP/2 multiplexing (requires ``sendly[http2]``)
+            http_client: Caller-owned httpx client to send requests through.
+                Share one between several SDK instances to share a pool; the
+                SDK never closes it.
+            transport: Custom httpx transport for the SDK-owned client (not
+                together with ``http_client``)
+            rate_limiter: Pace requests client-side from the X-RateLimit-*
+                headers. Pass True for a default limiter, or a limiter
+                instance to share one quota between several clients.
+            response_mode: How responses are turned into models: "model"
+                (validated pydantic models, the default), "raw" (plain dicts)
+                or "lazy" (fields validated on first access). Return
+                annotations describe "model"; raw results are dicts
+            json_codec: JSON codec for request and response bodies: "auto"
+                (default; orjson or msgspec when installed, else stdlib),
+                "json", "orjson", "msgspec", or a ``JsonCodec`` instance
+            hooks: Callbacks fired around every request attempt
+                (``on_request``, ``on_response``, ``on_retry``, ``on_error``)
+            metrics: Aggregate request metrics. Pass True for a new
+                ``MetricsCollector``, or an instance to share one between
+                clients; read it back from ``client.metrics``.
+            idempotency_keys: Send a generated ``Idempotency-Key`` with every
+                POST/PATCH call, reused across its retries (default: True)
+            retry_policy: Backoff, retry budget, circuit breaker and default
+                deadline for retries; without one, server errors are retried
+                at once and failed connections back off exponentially
+            cache: Cache read-mostly GET endpoints (countries, templates,
+                labels, rules, account). Pass True for a default
+                ``ResponseCache``, or an instance to set TTLs or share one
+                between clients.
+            coalesce: Let identical GETs made at the same time (same path,
+                query and organization) share one request and its response
         """
         # Handle configuration
         if config is not None:
@@ -106,6 +173,19 @@ class Sendly:
             timeout=timeout,
             max_retries=max_retries,
             organization_id=organization_id,
+            limits=limits,
+            http2=http2,
+            http_client=http_client,
+            transport=transport,
+            rate_limiter=rate_limiter,
+            response_mode=response_mode,
+            json_codec=json_codec,
+            hooks=hooks,
+            metrics=metrics,
+            idempotency_keys=idempotency_keys,
+            retry_policy=retry_policy,
+            cache=cache,
+            coalesce=coalesce,
         )
 
         # Initialize resources
@@ -165,6 +245,97 @@ class Sendly:
         """
         return self._http.get_rate_limit_info()
 
+    def get_rate_limiter_stats(self) -> Optional[RateLimiterStats]:
+        """
+        Get client-side rate limiter statistics
+
+        Returns:
+            Current token count and wait-time counters, or None if the client
+            was created without ``rate_limiter``
+
+        Example:
+            >>> stats = client.get_rate_limiter_stats()
+            >>> if stats:
+            ...     print(f'{stats.tokens:.1f} tokens, waited {stats.total_wait:.2f}s')
+        """
+        return self._http.get_rate_limiter_stats()
+
+    def get_circuit_breaker_stats(self) -> Optional[CircuitBreakerStats]:
+        """
+        Get circuit breaker state
+
+        Returns:
+            State and counters, or None if the client's ``retry_policy`` has
+            no circuit breaker
+
+        Example:
+            >>> stats = client.get_circuit_breaker_stats()
+            >>> if stats and stats.state == 'open':
+            ...     print(f'API failing, probing again in {stats.retry_in:.0f}s')
+        """
+        return self._http.get_circuit_breaker_stats()
+
+    def get_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Get response cache statistics
+
+        Returns:
+            Hit, miss, revalidation and eviction counters, or None if the
+            client was created without ``cache``
+
+        Example:
+            >>> stats = client.get_cache_stats()
+            >>> if stats:
+            ...     print(f'{stats.hit_ratio:.0%} of cacheable reads served locally')
+        """
+        return self._http.get_cache_stats()
+
+    @property
+    def metrics(self) -> Optional[MetricsCollector]:
+        """The client's metrics collector, or None if created without ``metrics``"""
+        return self._http.metrics
+
+    def stream(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: ModelTypes[Any] = None,
+        keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+        method: str = "GET",
+        body: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[Any]:
+        """
+        Stream the items of a large list response one at a time
+
+        The response body is decoded incrementally, so the first item is
+        available before the download finishes and the full payload is
+        never held in memory.
+
+        Args:
+            path: API path, e.g. '/messages'
+            params: Query parameters
+            model: Pydantic model (or any callable) to build each item with;
+                raw dicts are yielded when omitted
+            keys: Top-level keys whose array is streamed (default: data,
+                campaigns, contacts, workspaces, verifications)
+            method: HTTP method (default GET)
+            body: JSON request body
+            request_options: Per-call overrides (organization, headers, timeout, ...)
+
+        Yields:
+            One item per array element
+
+        Example:
+            >>> from sendly.types import Message
+            >>> for message in client.stream('/messages', {'limit': 100}, model=Message):
+            ...     print(message.id)
+        """
+        for item in self._http.stream(
+            method, path, body=body, params=params, keys=keys, options=request_options
+        ):
+            yield build_item(model, item)
+
     def set_organization_id(self, org_id: str) -> None:
         self._http.organization_id = org_id
 
@@ -207,10 +378,23 @@ class AsyncSendly:
         api_key: Optional[str] = None,
         *,
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: TimeoutTypes = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         organization_id: Optional[str] = None,
         config: Optional[SendlyConfig] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Union[bool, AsyncRateLimiter, None] = None,
+        response_mode: ResponseMode = "model",
+        json_codec: CodecTypes = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Union[bool, MetricsCollector, None] = None,
+        idempotency_keys: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Union[bool, ResponseCache, None] = None,
+        coalesce: bool = False,
     ):
         """
         Create a new async Sendly client
@@ -218,10 +402,45 @@ class AsyncSendly:
         Args:
             api_key: Your Sendly API key (sk_test_v1_xxx or sk_live_v1_xxx)
             base_url: Base URL for the API (default: https://sendly.live/api/v1)
-            timeout: Request timeout in seconds (default: 30)
+            timeout: Request timeout in seconds (default: 30), or an
+                ``httpx.Timeout`` for per-phase connect/read/write/pool timeouts
             max_retries: Maximum retry attempts (default: 3)
             organization_id: Organization ID for multi-workspace support
             config: Alternative configuration object
+            limits: Connection pool limits (``httpx.Limits``): max connections,
+                max keep-alive connections and keep-alive expiry
+            http2: Enable HTTP/2 multiplexing (requires ``sendly[http2]``)
+            http_client: Caller-owned httpx client to send requests through.
+                Share one between several SDK instances to share a pool; the
+                SDK never closes it.
+            transport: Custom httpx transport for the SDK-owned client (not
+                together with ``http_client``)
+            rate_limiter: Pace requests client-side from the X-RateLimit-*
+                headers. Pass True for a default limiter, or a limiter
+                instance to share one quota between several clients.
+            response_mode: How responses are turned into models: "model"
+                (validated pydantic models, the default), "raw" (plain dicts)
+                or "lazy" (fields validated on first access). Return
+                annotations describe "model"; raw results are dicts
+            json_codec: JSON codec for request and response bodies: "auto"
+                (default; orjson or msgspec when installed, else stdlib),
+                "json", "orjson", "msgspec", or a ``JsonCodec`` instance
+            hooks: Callbacks fired around every request attempt
+                (``on_request``, ``on_response``, ``on_retry``, ``on_error``)
+            metrics: Aggregate request metrics. Pass True for a new
+                ``MetricsCollector``, or an instance to share one between
+                clients; read it back from ``client.metrics``.
+            idempotency_keys: Send a generated ``Idempotency-Key`` with every
+                POST/PATCH call, reused across its retries (default: True)
+            retry_policy: Backoff, retry budget, circuit breaker and default
+                deadline for retries; without one, server errors are retried
+                at once and failed connections back off exponentially
+            cache: Cache read-mostly GET endpoints (countries, templates,
+                labels, rules, account). Pass True for a default
+                ``ResponseCache``, or an instance to set TTLs or share one
+                between clients.
+            coalesce: Let identical GETs made at the same time (same path,
+                query and organization) share one request and its response
         """
         # Handle configuration
         if config is not None:
@@ -245,6 +464,19 @@ class AsyncSendly:
             timeout=timeout,
             max_retries=max_retries,
             organization_id=organization_id,
+            limits=limits,
+            http2=http2,
+            http_client=http_client,
+            transport=transport,
+            rate_limiter=rate_limiter,
+            response_mode=response_mode,
+            json_codec=json_codec,
+            hooks=hooks,
+            metrics=metrics,
+            idempotency_keys=idempotency_keys,
+            retry_policy=retry_policy,
+            cache=cache,
+            coalesce=coalesce,
         )
 
         # Initialize resources
@@ -292,6 +524,78 @@ class AsyncSendly:
         """
         return self._http.get_rate_limit_info()
 
+    def get_rate_limiter_stats(self) -> Optional[RateLimiterStats]:
+        """
+        Get client-side rate limiter statistics
+
+        Returns:
+            Current token count and wait-time counters, or None if the client
+            was created without ``rate_limiter``
+
+        Example:
+            >>> stats = client.get_rate_limiter_stats()
+            >>> if stats:
+            ...     print(f'{stats.tokens:.1f} tokens, waited {stats.total_wait:.2f}s')
+        """
+        return self._http.get_rate_limiter_stats()
+
+    def get_circuit_breaker_stats(self) -> Optional[CircuitBreakerStats]:
+        """
+        Get circuit breaker state
+
+        Returns:
+            State and counters, or None if the client's ``retry_policy`` has
+            no circuit breaker
+
+        Example:
+            >>> stats = client.get_circuit_breaker_stats()
+            >>> if stats and stats.state == 'open':
+            ...     print(f'API failing, probing again in {stats.retry_in:.0f}s')
+        """
+        return self._http.get_circuit_breaker_stats()
+
+    def get_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Get response cache statistics
+
+        Returns:
+            Hit, miss, revalidation and eviction counters, or None if the
+            client was created without ``cache``
+
+        Example:
+            >>> stats = client.get_cache_stats()
+            >>> if stats:
+            ...     print(f'{stats.hit_ratio:.0%} of cacheable reads served locally')
+        """
+        return self._http.get_cache_stats()
+
+    @property
+    def metrics(self) -> Optional[MetricsCollector]:
+        """The client's metrics collector, or None if created without ``metrics``"""
+        return self._http.metrics
+
+    async def stream(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        model: ModelTypes[Any] = None,
+        keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+        method: str = "GET",
+        body: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the items of a large list response one at a time (async)
+
+        Example:
+            >>> async for message in client.stream('/messages', model=Message):
+            ...     print(message.id)
+        """
+        async for item in self._http.stream(
+            method, path, body=body, params=params, keys=keys, options=request_options
+        ):
+            yield build_item(model, item)
+
     def set_organization_id(self, org_id: str) -> None:
         self._http.organization_id = org_id
 
@@ -12,6 +12,9 @@ from .types import ApiErrorResponse
 class SendlyError(Exception):
     """Base error class for all Sendly SDK errors"""
 
+    retry_after: Optional[float] = None
+    """Seconds the server asked us to wait before retrying, when it said."""
+
     def __init__(
         self,
         message: str,
@@ -105,7 +108,7 @@ class RateLimitError(SendlyError):
     def __init__(
         self,
         message: str,
-        retry_after: int,
+        retry_after: float,
         status_code: Optional[int] = None,
         response: Optional[ApiErrorResponse] = None,
     ):
@@ -167,3 +170,14 @@ class TimeoutError(SendlyError):
 
     def __init__(self, message: str = "Request timed out"):
         super().__init__(message, "internal_error")
+
+
+class CircuitOpenError(SendlyError):
+    """Thrown when the circuit breaker is failing calls fast"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"Circuit breaker is open; the API has been failing. Retry in {retry_after:.1f}s",
+            "circuit_open",
+        )
+        self.retry_after = retry_after
@@ -0,0 +1,314 @@
+"""
+Sendly Client Pool
+
+Serves many tenants (API keys and organizations) from one shared connection
+pool, instead of one client, pool and set of TLS sessions per tenant.
+"""
+
+import abc
+import itertools
+import threading
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, TypeVar, Union
+
+import httpx
+
+from .client import DEFAULT_TIMEOUT, AsyncSendly, Sendly
+from .utils.http import TimeoutTypes
+from .utils.metrics import MetricsCollector
+from .utils.rate_limit import AsyncRateLimiter, RateLimiter
+
+C = TypeVar("C", Sendly, AsyncSendly)
+
+
+def _headroom(client: Union[Sendly, AsyncSendly]) -> float:
+    """Requests a client's key can send right now, as far as we know"""
+    stats = client.get_rate_limiter_stats()
+    if stats is not None:
+        return stats.tokens
+    info = client.get_rate_limit_info()
+    return float("inf") if info is None else info.remaining
+
+
+class _Tenant(Generic[C]):
+    """The clients of one tenant, one per API key"""
+
+    def __init__(self, clients: List[C]):
+        self.clients: List[C] = clients
+        self._turn = itertools.count()
+
+    def pick(self) -> C:
+        """The client whose key has the most headroom, rotating among ties"""
+        clients = self.clients
+        if len(clients) == 1:
+            return clients[0]
+        start = next(self._turn) % len(clients)
+        rotated = clients[start:] + clients[:start]
+        return max(rotated, key=_headroom)
+
+
+class _BasePool(abc.ABC, Generic[C]):
+    """Tenant registry shared by the sync and async pools"""
+
+    def __init__(
+        self,
+        rate_limiter: bool,
+        metrics: Union[bool, MetricsCollector, None],
+        options: Dict[str, Any],
+    ):
+        self.rate_limiter = rate_limiter
+        self.metrics: Optional[MetricsCollector] = (
+            MetricsCollector() if metrics is True else metrics or None
+        )
+        self._options = options
+        self._tenants: Dict[str, _Tenant[C]] = {}
+        self._limiters: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, tenant: object) -> bool:
+        return tenant in self._tenants
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._tenants))
+
+    def __getitem__(self, tenant: str) -> C:
+        return self.client(tenant)
+
+    def client(self, tenant: str) -> C:
+        """
+        Get a client for ``tenant``
+
+        A tenant with several API keys gets the key with the most rate-limit
+        headroom, rotating between keys that are equally free.
+
+        Raises:
+            KeyError: If the tenant was never added
+        """
+        try:
+            return self._tenants[tenant].pick()
+        except KeyError:
+            raise KeyError(f"Unknown tenant: {tenant!r}") from None
+
+    def clients(self, tenant: str) -> List[C]:
+        """Every client of ``tenant``, one per API key"""
+        return list(self._tenants[tenant].clients)
+
+    def add(
+        self,
+        tenant: str,
+        api_key: Union[str, Sequence[str]],
+        organization_id: Optional[str] = None,
+    ) -> None:
+        """
+        Register a tenant
+
+        Args:
+            tenant: Name used to look the tenant up
+            api_key: The tenant's API key, or several keys of the same
+                organization to spread its traffic across
+            organization_id: Organization to act on (``X-Organization-Id``).
+                Without one the tenant sends no organization header; the
+                ``SENDLY_ORG_ID`` environment variable never applies to
+                pool tenants.
+
+        Raises:
+            ValueError: If the tenant exists or no key is given
+        """
+        keys = [api_key] if isinstance(api_key, str) else list(api_key)
+        if not keys:
+            raise ValueError("At least one API key is required")
+        with self._lock:
+            if tenant in self._tenants:
+                raise ValueError(f"Tenant already added: {tenant!r}")
+            clients = [self._build(key, organization_id) for key in keys]
+            for client in clients:
+                # Pin the tenant's own org over the SENDLY_ORG_ID fallback
+                client._http.organization_id = organization_id
+            self._tenants[tenant] = _Tenant(clients)
+
+    def remove(self, tenant: str) -> None:
+        """Forget a tenant (the shared pool stays open)"""
+        with self._lock:
+            self._tenants.pop(tenant, None)
+
+    def _limiter(self, api_key: str) -> Any:
+        """The rate limiter for a key, shared by every tenant using it (lock held)"""
+        if not self.rate_limiter:
+            return None
+        limiter = self._limiters.get(api_key)
+        if limiter is None:
+            limiter = self._limiters[api_key] = self._new_limiter()
+        return limiter
+
+    @abc.abstractmethod
+    def _new_limiter(self) -> Any:
+        """A rate limiter for one API key"""
+
+    @abc.abstractmethod
+    def _build(self, api_key: str, organization_id: Optional[str]) -> C:
+        """A client for one API key of a tenant, on the shared pool"""
+
+
+class SendlyPool(_BasePool[Sendly]):
+    """
+    Many tenants over one connection pool (synchronous)
+
+    Each tenant gets its own :class:`Sendly` client (and so its own API key,
+    organization and rate-limit state), but every client sends through the
+    same ``httpx.Client``. Clients are safe to use from several threads.
+
+    Example:
+        >>> pool = SendlyPool(limits=httpx.Limits(max_connections=200), rate_limiter=True)
+        >>> pool.add('acme', 'sk_live_v1_acme', organization_id='org_acme')
+        >>> pool.add('globex', ['sk_live_v1_globex_1', 'sk_live_v1_globex_2'])
+        >>> pool['acme'].messages.send(to='+15551234567', text='Hi from Acme')
+        >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: TimeoutTypes = DEFAULT_TIMEOUT,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.Client] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        rate_limiter: bool = False,
+        metrics: Union[bool, MetricsCollector, None] = None,
+        **options: Any,
+    ):
+        """
+        Args:
+            timeout: Request timeout for every tenant
+            limits: Limits of the shared connection pool
+            http2: Enable HTTP/2 on the shared pool (requires ``sendly[http2]``)
+            http_client: Caller-owned httpx client to share instead of
+                creating one; the pool never closes it
+            transport: Custom transport for the pool-owned client
+            rate_limiter: Pace each API key client-side; tenants sharing a
+                key share its limiter
+            metrics: True, or a shared ``MetricsCollector``, to aggregate
+                every tenant's requests into ``pool.metrics``
+            **options: Passed to every :class:`Sendly` client (base_url,
+                max_retries, hooks, retry_policy, response_mode, ...)
+        """
+        if http_client is not None and transport is not None:
+            raise ValueError("Pass either http_client or transport, not both")
+        super().__init__(rate_limiter, metrics, options)
+        self._timeout = timeout
+        self._owns_client = http_client is None
+        if http_client is None:
+            kwargs: Dict[str, Any] = {"timeout": timeout, "http2": http2}
+            if limits is not None:
+                kwargs["limits"] = limits
+            if transport is not None:
+                kwargs["transport"] = transport
+            http_client = httpx.Client(**kwargs)
+        self.http_client = http_client
+
+    def _new_limiter(self) -> RateLimiter:
+        return RateLimiter()
+
+    def _build(self, api_key: str, organization_id: Optional[str]) -> Sendly:
+        return Sendly(
+            api_key,
+            organization_id=organization_id,
+            timeout=self._timeout,
+            http_client=self.http_client,
+            rate_limiter=self._limiter(api_key),
+            metrics=self.metrics,
+            **self._options,
+        )
+
+    def close(self) -> None:
+        """Close the shared connection pool (caller-owned clients are left open)"""
+        if self._owns_client:
+            self.http_client.close()
+
+    def __enter__(self) -> "SendlyPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncSendlyPool(_BasePool[AsyncSendly]):
+    """
+    Many tenants over one connection pool (asynchronous)
+
+    Async version of :class:`SendlyPool`; every tenant's :class:`AsyncSendly`
+    client sends through the same ``httpx.AsyncClient``.
+
+    Example:
+        >>> async with AsyncSendlyPool(http2=True) as pool:
+        ...     pool.add('acme', 'sk_live_v1_acme', organization_id='org_acme')
+        ...     await pool['acme'].messages.send(to='+15551234567', text='Hi')
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: TimeoutTypes = DEFAULT_TIMEOUT,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: bool = False,
+        metrics: Union[bool, MetricsCollector, None] = None,
+        **options: Any,
+    ):
+        """
+        Args:
+            timeout: Request timeout for every tenant
+            limits: Limits of the shared connection pool
+            http2: Enable HTTP/2 on the shared pool (requires ``sendly[http2]``)
+            http_client: Caller-owned httpx client to share instead of
+                creating one; the pool never closes it
+            transport: Custom transport for the pool-owned client
+            rate_limiter: Pace each API key client-side; tenants sharing a
+                key share its limiter
+            metrics: True, or a shared ``MetricsCollector``, to aggregate
+                every tenant's requests into ``pool.metrics``
+            **options: Passed to every :class:`AsyncSendly` client (base_url,
+                max_retries, hooks, retry_policy, response_mode, ...)
+        """
+        if http_client is not None and transport is not None:
+            raise ValueError("Pass either http_client or transport, not both")
+        super().__init__(rate_limiter, metrics, options)
+        self._timeout = timeout
+        self._owns_client = http_client is None
+        if http_client is None:
+            kwargs: Dict[str, Any] = {"timeout": timeout, "http2": http2}
+            if limits is not None:
+                kwargs["limits"] = limits
+            if transport is not None:
+                kwargs["transport"] = transport
+            http_client = httpx.AsyncClient(**kwargs)
+        self.http_client = http_client
+
+    def _new_limiter(self) -> AsyncRateLimiter:
+        return AsyncRateLimiter()
+
+    def _build(self, api_key: str, organization_id: Optional[str]) -> AsyncSendly:
+        return AsyncSendly(
+            api_key,
+            organization_id=organization_id,
+            timeout=self._timeout,
+            http_client=self.http_client,
+            rate_limiter=self._limiter(api_key),
+            metrics=self.metrics,
+            **self._options,
+        )
+
+    async def close(self) -> None:
+        """Close the shared connection pool (caller-owned clients are left open)"""
+        if self._owns_client:
+            await self.http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncSendlyPool":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
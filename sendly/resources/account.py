@@ -4,10 +4,11 @@ Account Resource
 Access account information, credit balance, and API keys.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ..types import Account, ApiKey, Credits, CreditTransaction
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
+from ..utils.pagination import AsyncPaginator, CursorTypes, Page, Paginator
 
 
 def _transform_response(data: Dict[str, Any], key_map: Dict[str, str]) -> Dict[str, Any]:
@@ -64,28 +65,31 @@ class AccountResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def get(self) -> Account:
+    def get(self, request_options: Optional[RequestOptions] = None) -> Account:
         """
         Get account information.
 
         Returns:
             Account details
         """
-        response = self._http.request("GET", "/account")
-        return Account(**_transform_response(response, ACCOUNT_KEY_MAP))
+        response = self._http.request("GET", "/account", options=request_options)
+        return self._http.parse(Account, _transform_response(response, ACCOUNT_KEY_MAP))
 
-    def get_credits(self) -> Credits:
+    def get_credits(self, request_options: Optional[RequestOptions] = None) -> Credits:
         """
         Get credit balance.
 
         Returns:
             Current credit balance and reserved credits
         """
-        response = self._http.request("GET", "/credits")
-        return Credits(**_transform_response(response, CREDITS_KEY_MAP))
+        response = self._http.request("GET", "/credits", options=request_options)
+        return self._http.parse(Credits, _transform_response(response, CREDITS_KEY_MAP))
 
     def get_credit_transactions(
-        self, limit: Optional[int] = None, offset: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> List[CreditTransaction]:
         """
         Get credit transaction history.
@@ -103,21 +107,74 @@ class AccountResource:
         if offset is not None:
             params["offset"] = offset
 
-        response = self._http.request("GET", "/credits/transactions", params=params)
-        return [CreditTransaction(**_transform_response(t, TRANSACTION_KEY_MAP)) for t in response]
+        response = self._http.request(
+            "GET", "/credits/transactions", params=params, options=request_options
+        )
+        return [
+            self._http.parse(CreditTransaction, _transform_response(t, TRANSACTION_KEY_MAP))
+            for t in response
+        ]
+
+    def iter_credit_transactions(
+        self,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[CreditTransaction]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Paginator[CreditTransaction]:
+        """
+        Iterate through the full credit transaction history.
+
+        Args:
+            page_size: Transactions to fetch per request (max 100)
+            prefetch: Page requests to keep in flight
+            max_items: Stop after this many transactions
+            cursor: PageCursor (or encoded token) to resume from
+            on_page: Called with each Page before its transactions are yielded
 
-    def transfer_credits(self, target_organization_id: str, amount: int) -> Dict[str, Any]:
+        Returns:
+            A Paginator yielding credit transactions
+        """
+
+        def fetch_page(offset: int, limit: int) -> Page[CreditTransaction]:
+            response = self.get_credit_transactions(
+                limit=limit, offset=offset, request_options=request_options
+            )
+            return Page(response, offset, limit)
+
+        return Paginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
+
+    def transfer_credits(
+        self,
+        target_organization_id: str,
+        amount: int,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, Any]:
         if not target_organization_id:
             raise ValueError("target_organization_id is required")
         if not isinstance(amount, int) or amount <= 0:
             raise ValueError("amount must be a positive integer")
 
-        return self._http.request("POST", "/credits/transfer", body={
-            "targetOrganizationId": target_organization_id,
-            "amount": amount,
-        })
-
-    def list_api_keys(self) -> List[ApiKey]:
+        return self._http.request(
+            "POST",
+            "/credits/transfer",
+            body={
+                "targetOrganizationId": target_organization_id,
+                "amount": amount,
+            },
+            options=request_options,
+        )
+
+    def list_api_keys(self, request_options: Optional[RequestOptions] = None) -> List[ApiKey]:
         """
         List API keys for the account.
 
@@ -126,10 +183,10 @@ class AccountResource:
         Returns:
             Array of API keys
         """
-        response = self._http.request("GET", "/keys")
-        return [ApiKey(**_transform_response(k, API_KEY_MAP)) for k in response]
+        response = self._http.request("GET", "/keys", options=request_options)
+        return [self._http.parse(ApiKey, _transform_response(k, API_KEY_MAP)) for k in response]
 
-    def get_api_key(self, key_id: str) -> ApiKey:
+    def get_api_key(self, key_id: str, request_options: Optional[RequestOptions] = None) -> ApiKey:
         """
         Get a specific API key by ID.
 
@@ -139,10 +196,12 @@ class AccountResource:
         Returns:
             API key details
         """
-        response = self._http.request("GET", f"/keys/{key_id}")
-        return ApiKey(**_transform_response(response, API_KEY_MAP))
+        response = self._http.request("GET", f"/keys/{key_id}", options=request_options)
+        return self._http.parse(ApiKey, _transform_response(response, API_KEY_MAP))
 
-    def get_api_key_usage(self, key_id: str) -> Dict[str, Any]:
+    def get_api_key_usage(
+        self, key_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         """
         Get usage statistics for an API key.
 
@@ -152,10 +211,15 @@ class AccountResource:
         Returns:
             Usage statistics
         """
-        response = self._http.request("GET", f"/keys/{key_id}/usage")
+        response = self._http.request("GET", f"/keys/{key_id}/usage", options=request_options)
         return response
 
-    def create_api_key(self, name: str, expires_at: Optional[str] = None) -> Dict[str, Any]:
+    def create_api_key(
+        self,
+        name: str,
+        expires_at: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, Any]:
         """
         Create a new API key.
 
@@ -177,10 +241,10 @@ class AccountResource:
         if expires_at:
             body["expiresAt"] = expires_at
 
-        response = self._http.request("POST", "/account/keys", body=body)
+        response = self._http.request("POST", "/account/keys", body=body, options=request_options)
         return response
 
-    def revoke_api_key(self, key_id: str) -> None:
+    def revoke_api_key(self, key_id: str, request_options: Optional[RequestOptions] = None) -> None:
         """
         Revoke an API key.
 
@@ -190,7 +254,7 @@ class AccountResource:
         if not key_id:
             raise ValueError("API key ID is required")
 
-        self._http.request("DELETE", f"/account/keys/{key_id}")
+        self._http.request("DELETE", f"/account/keys/{key_id}", options=request_options)
 
 
 class AsyncAccountResource:
@@ -203,18 +267,21 @@ class AsyncAccountResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def get(self) -> Account:
+    async def get(self, request_options: Optional[RequestOptions] = None) -> Account:
         """Get account information."""
-        response = await self._http.request("GET", "/account")
-        return Account(**_transform_response(response, ACCOUNT_KEY_MAP))
+        response = await self._http.request("GET", "/account", options=request_options)
+        return self._http.parse(Account, _transform_response(response, ACCOUNT_KEY_MAP))
 
-    async def get_credits(self) -> Credits:
+    async def get_credits(self, request_options: Optional[RequestOptions] = None) -> Credits:
         """Get credit balance."""
-        response = await self._http.request("GET", "/credits")
-        return Credits(**_transform_response(response, CREDITS_KEY_MAP))
+        response = await self._http.request("GET", "/credits", options=request_options)
+        return self._http.parse(Credits, _transform_response(response, CREDITS_KEY_MAP))
 
     async def get_credit_transactions(
-        self, limit: Optional[int] = None, offset: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> List[CreditTransaction]:
         """Get credit transaction history."""
         params = {}
@@ -223,36 +290,86 @@ class AsyncAccountResource:
         if offset is not None:
             params["offset"] = offset
 
-        response = await self._http.request("GET", "/credits/transactions", params=params)
-        return [CreditTransaction(**_transform_response(t, TRANSACTION_KEY_MAP)) for t in response]
-
-    async def transfer_credits(self, target_organization_id: str, amount: int) -> Dict[str, Any]:
+        response = await self._http.request(
+            "GET", "/credits/transactions", params=params, options=request_options
+        )
+        return [
+            self._http.parse(CreditTransaction, _transform_response(t, TRANSACTION_KEY_MAP))
+            for t in response
+        ]
+
+    def iter_credit_transactions(
+        self,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[CreditTransaction]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncPaginator[CreditTransaction]:
+        """Iterate through the full credit transaction history (async)."""
+
+        async def fetch_page(offset: int, limit: int) -> Page[CreditTransaction]:
+            response = await self.get_credit_transactions(
+                limit=limit, offset=offset, request_options=request_options
+            )
+            return Page(response, offset, limit)
+
+        return AsyncPaginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
+
+    async def transfer_credits(
+        self,
+        target_organization_id: str,
+        amount: int,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, Any]:
         if not target_organization_id:
             raise ValueError("target_organization_id is required")
         if not isinstance(amount, int) or amount <= 0:
             raise ValueError("amount must be a positive integer")
 
-        return await self._http.request("POST", "/credits/transfer", body={
-            "targetOrganizationId": target_organization_id,
-            "amount": amount,
-        })
-
-    async def list_api_keys(self) -> List[ApiKey]:
+        return await self._http.request(
+            "POST",
+            "/credits/transfer",
+            body={
+                "targetOrganizationId": target_organization_id,
+                "amount": amount,
+            },
+            options=request_options,
+        )
+
+    async def list_api_keys(self, request_options: Optional[RequestOptions] = None) -> List[ApiKey]:
         """List API keys for the account."""
-        response = await self._http.request("GET", "/keys")
-        return [ApiKey(**_transform_response(k, API_KEY_MAP)) for k in response]
+        response = await self._http.request("GET", "/keys", options=request_options)
+        return [self._http.parse(ApiKey, _transform_response(k, API_KEY_MAP)) for k in response]
 
-    async def get_api_key(self, key_id: str) -> ApiKey:
+    async def get_api_key(
+        self, key_id: str, request_options: Optional[RequestOptions] = None
+    ) -> ApiKey:
         """Get a specific API key by ID."""
-        response = await self._http.request("GET", f"/keys/{key_id}")
-        return ApiKey(**_transform_response(response, API_KEY_MAP))
+        response = await self._http.request("GET", f"/keys/{key_id}", options=request_options)
+        return self._http.parse(ApiKey, _transform_response(response, API_KEY_MAP))
 
-    async def get_api_key_usage(self, key_id: str) -> Dict[str, Any]:
+    async def get_api_key_usage(
+        self, key_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         """Get usage statistics for an API key."""
-        response = await self._http.request("GET", f"/keys/{key_id}/usage")
+        response = await self._http.request("GET", f"/keys/{key_id}/usage", options=request_options)
         return response
 
-    async def create_api_key(self, name: str, expires_at: Optional[str] = None) -> Dict[str, Any]:
+    async def create_api_key(
+        self,
+        name: str,
+        expires_at: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, Any]:
         """
         Create a new API key (async).
 
@@ -270,10 +387,14 @@ class AsyncAccountResource:
         if expires_at:
             body["expiresAt"] = expires_at
 
-        response = await self._http.request("POST", "/account/keys", body=body)
+        response = await self._http.request(
+            "POST", "/account/keys", body=body, options=request_options
+        )
         return response
 
-    async def revoke_api_key(self, key_id: str) -> None:
+    async def revoke_api_key(
+        self, key_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         """
         Revoke an API key (async).
 
@@ -283,4 +404,4 @@ class AsyncAccountResource:
         if not key_id:
             raise ValueError("API key ID is required")
 
-        await self._http.request("DELETE", f"/account/keys/{key_id}")
+        await self._http.request("DELETE", f"/account/keys/{key_id}", options=request_options)
@@ -18,7 +18,13 @@ from urllib.parse import quote
 import httpx
 
 from ..errors import SendlyError
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import (
+    SDK_VERSION,
+    AsyncHttpClient,
+    HttpClient,
+    RequestOptions,
+    TimeoutTypes,
+)
 
 EntityType = Literal[
     "SOLE_PROPRIETOR",
@@ -198,9 +204,9 @@ def _encode_multipart(
     """Encode form fields + file parts as multipart/form-data.
 
     Returns `(body_bytes, content_type)`. We do this ourselves rather than
-    relying on httpx's per-request encoding so the client-level
-    `Content-Type: application/json` header on the shared HTTP client can't
-    shadow the multipart boundary on the wire.
+    relying on httpx's per-request encoding so a JSON `Content-Type`
+    header on a shared HTTP client can't shadow the multipart boundary on
+    the wire.
     """
     boundary = _generate_boundary()
     crlf = b"\r\n"
@@ -259,23 +265,28 @@ def _multipart_headers(
 
 def _build_multipart_request(
     client: Union[httpx.Client, httpx.AsyncClient],
-    path: str,
+    url: str,
     api_key: str,
     organization_id: Optional[str],
     data: Dict[str, str],
     files: Optional[Dict[str, Tuple[str, bytes, str]]],
+    timeout: TimeoutTypes,
+    options: Optional[RequestOptions] = None,
 ) -> httpx.Request:
     """Build an httpx.Request carrying a pre-encoded multipart body."""
+    options = options or {}
     body, content_type = _encode_multipart(data, files)
-    user_agent = client.headers.get("User-Agent", "")
+    user_agent = f"sendly-python/{SDK_VERSION}"
     headers = _multipart_headers(
         api_key, user_agent, organization_id, content_type, len(body)
     )
+    headers.update(options.get("headers") or {})
     return client.build_request(
         method="POST",
-        url=path,
+        url=url,
         content=body,
         headers=headers,
+        timeout=options.get("timeout") or timeout,
     )
 
 
@@ -284,11 +295,20 @@ def _multipart_request_sync(
     path: str,
     data: Dict[str, str],
     files: Optional[Dict[str, Tuple[str, bytes, str]]],
+    options: Optional[RequestOptions] = None,
 ) -> Dict[str, Any]:
     """POST a multipart/form-data body via the SDK's underlying httpx client."""
+    organization_id = (options or {}).get("organization_id", http.organization_id)
     client = http.client
     request = _build_multipart_request(
-        client, path, http.api_key, http.organization_id, data, files
+        client,
+        f"{http.base_url}{path}",
+        http.api_key,
+        organization_id,
+        data,
+        files,
+        http.timeout,
+        options,
     )
     response = client.send(request)
     http._update_rate_limit_info(response.headers)
@@ -301,11 +321,20 @@ async def _multipart_request_async(
     path: str,
     data: Dict[str, str],
     files: Optional[Dict[str, Tuple[str, bytes, str]]],
+    options: Optional[RequestOptions] = None,
 ) -> Dict[str, Any]:
     """Async equivalent of `_multipart_request_sync`."""
+    organization_id = (options or {}).get("organization_id", http.organization_id)
     client = http.client
     request = _build_multipart_request(
-        client, path, http.api_key, http.organization_id, data, files
+        client,
+        f"{http.base_url}{path}",
+        http.api_key,
+        organization_id,
+        data,
+        files,
+        http.timeout,
+        options,
     )
     response = await client.send(request)
     http._update_rate_limit_info(response.headers)
@@ -345,7 +374,9 @@ class BusinessUpgradeResource:
     def __init__(self, http: HttpClient) -> None:
         self._http = http
 
-    def preflight(self, **candidate: Any) -> Dict[str, Any]:
+    def preflight(
+        self, request_options: Optional[RequestOptions] = None, **candidate: Any
+    ) -> Dict[str, Any]:
         """Validate a candidate entity upgrade payload before submission.
 
         No writes — purely advisory. Returns issues + proposed auto-fixes.
@@ -353,17 +384,21 @@ class BusinessUpgradeResource:
         Accepts the same fields as :meth:`start` (snake_case kwargs).
         """
         body = _normalize_payload(candidate)
-        data = self._http.request(method="POST", path="/verification/preflight", body=body)
+        data = self._http.request(
+            method="POST", path="/verification/preflight", body=body, options=request_options
+        )
         return _validate_response(data)
 
-    def best_prefill(self) -> Dict[str, Any]:
+    def best_prefill(self, request_options: Optional[RequestOptions] = None) -> Dict[str, Any]:
         """Get a "best-of" prefill across the caller's verified workspaces.
 
         Returns most-recent non-empty values per messaging field. Use this
         to pre-populate the upgrade form for users whose current workspace
         has incomplete data.
         """
-        data = self._http.request(method="GET", path="/verification/best-prefill")
+        data = self._http.request(
+            method="GET", path="/verification/best-prefill", options=request_options
+        )
         return _validate_response(data)
 
     def start(
@@ -371,6 +406,7 @@ class BusinessUpgradeResource:
         workspace_id: str,
         *,
         ein_doc: Optional[EinDocInput] = None,
+        request_options: Optional[RequestOptions] = None,
         **params: Any,
     ) -> Dict[str, Any]:
         """Start an entity upgrade for the given workspace.
@@ -393,9 +429,11 @@ class BusinessUpgradeResource:
         payload = _normalize_payload(params)
         data, files = _build_multipart(payload, ein_doc)
         path = f"/workspaces/{quote(workspace_id, safe='')}/upgrade"
-        return _multipart_request_sync(self._http, path, data, files)
+        return _multipart_request_sync(self._http, path, data, files, request_options)
 
-    def status(self, workspace_id: str) -> Dict[str, Any]:
+    def status(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         """Check whether the given workspace has a pending entity upgrade.
 
         Returns ``{"pending": None}`` if no upgrade is in flight.
@@ -403,10 +441,13 @@ class BusinessUpgradeResource:
         data = self._http.request(
             method="GET",
             path=f"/workspaces/{quote(workspace_id, safe='')}/upgrade/status",
+            options=request_options,
         )
         return _validate_response(data)
 
-    def cancel(self, workspace_id: str) -> Dict[str, Any]:
+    def cancel(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         """Cancel a pending entity upgrade for the given workspace.
 
         Releases the reserved toll-free number, deletes the new messaging
@@ -415,6 +456,7 @@ class BusinessUpgradeResource:
         data = self._http.request(
             method="POST",
             path=f"/workspaces/{quote(workspace_id, safe='')}/upgrade/cancel",
+            options=request_options,
         )
         return _validate_response(data)
 
@@ -423,6 +465,7 @@ class BusinessUpgradeResource:
         workspace_id: str,
         *,
         ein_doc: Optional[EinDocInput] = None,
+        request_options: Optional[RequestOptions] = None,
         **params: Any,
     ) -> Dict[str, Any]:
         """Resubmit a rejected (or waiting-for-customer) entity upgrade.
@@ -433,7 +476,7 @@ class BusinessUpgradeResource:
         payload = _normalize_payload(params)
         data, files = _build_multipart(payload, ein_doc)
         path = f"/workspaces/{quote(workspace_id, safe='')}/upgrade/resubmit"
-        return _multipart_request_sync(self._http, path, data, files)
+        return _multipart_request_sync(self._http, path, data, files, request_options)
 
     def set_disposition(
         self,
@@ -441,6 +484,7 @@ class BusinessUpgradeResource:
         *,
         disposition: Disposition,
         target_workspace_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Dict[str, Any]:
         """After a successful entity-upgrade approval, choose what happens
         to the old toll-free number.
@@ -459,6 +503,7 @@ class BusinessUpgradeResource:
             method="POST",
             path=f"/workspaces/{quote(workspace_id, safe='')}/upgrade/disposition",
             body=body,
+            options=request_options,
         )
         return _validate_response(data)
 
@@ -473,17 +518,23 @@ class AsyncBusinessUpgradeResource:
     def __init__(self, http: AsyncHttpClient) -> None:
         self._http = http
 
-    async def preflight(self, **candidate: Any) -> Dict[str, Any]:
+    async def preflight(
+        self, request_options: Optional[RequestOptions] = None, **candidate: Any
+    ) -> Dict[str, Any]:
         """Async: validate a candidate entity upgrade payload before submission."""
         body = _normalize_payload(candidate)
         data = await self._http.request(
-            method="POST", path="/verification/preflight", body=body
+            method="POST", path="/verification/preflight", body=body, options=request_options
         )
         return _validate_response(data)
 
-    async def best_prefill(self) -> Dict[str, Any]:
+    async def best_prefill(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         """Async: get a "best-of" prefill across the caller's verified workspaces."""
-        data = await self._http.request(method="GET", path="/verification/best-prefill")
+        data = await self._http.request(
+            method="GET", path="/verification/best-prefill", options=request_options
+        )
         return _validate_response(data)
 
     async def start(
@@ -491,27 +542,34 @@ class AsyncBusinessUpgradeResource:
         workspace_id: str,
         *,
         ein_doc: Optional[EinDocInput] = None,
+        request_options: Optional[RequestOptions] = None,
         **params: Any,
     ) -> Dict[str, Any]:
         """Async: start an entity upgrade for the given workspace."""
         payload = _normalize_payload(params)
         data, files = _build_multipart(payload, ein_doc)
         path = f"/workspaces/{quote(workspace_id, safe='')}/upgrade"
-        return await _multipart_request_async(self._http, path, data, files)
+        return await _multipart_request_async(self._http, path, data, files, request_options)
 
-    async def status(self, workspace_id: str) -> Dict[str, Any]:
+    async def status(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         """Async: check whether the given workspace has a pending entity upgrade."""
         data = await self._http.request(
             method="GET",
             path=f"/workspaces/{quote(workspace_id, safe='')}/upgrade/status",
+            options=request_options,
         )
         return _validate_response(data)
 
-    async def cancel(self, workspace_id: str) -> Dict[str, Any]:
+    async def cancel(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         """Async: cancel a pending entity upgrade for the given workspace."""
         data = await self._http.request(
             method="POST",
             path=f"/workspaces/{quote(workspace_id, safe='')}/upgrade/cancel",
+            options=request_options,
         )
         return _validate_response(data)
 
@@ -520,13 +578,14 @@ class AsyncBusinessUpgradeResource:
         workspace_id: str,
         *,
         ein_doc: Optional[EinDocInput] = None,
+        request_options: Optional[RequestOptions] = None,
         **params: Any,
     ) -> Dict[str, Any]:
         """Async: resubmit a rejected entity upgrade with updated fields."""
         payload = _normalize_payload(params)
         data, files = _build_multipart(payload, ein_doc)
         path = f"/workspaces/{quote(workspace_id, safe='')}/upgrade/resubmit"
-        return await _multipart_request_async(self._http, path, data, files)
+        return await _multipart_request_async(self._http, path, data, files, request_options)
 
     async def set_disposition(
         self,
@@ -534,6 +593,7 @@ class AsyncBusinessUpgradeResource:
         *,
         disposition: Disposition,
         target_workspace_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Dict[str, Any]:
         """Async: choose what happens to the old toll-free number after approval."""
         body: Dict[str, Any] = {"disposition": disposition}
@@ -543,6 +603,7 @@ class AsyncBusinessUpgradeResource:
             method="POST",
             path=f"/workspaces/{quote(workspace_id, safe='')}/upgrade/disposition",
             body=body,
+            options=request_options,
         )
         return _validate_response(data)
 
@@ -2,14 +2,17 @@
 Campaigns Resource - Bulk SMS Campaign Management
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ..types import (
     Campaign,
     CampaignListResponse,
     CampaignPreview,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
+from ..utils.models import response_field
+from ..utils.pagination import AsyncPaginator, CursorTypes, Page, Paginator
+from ..utils.pricing import EncodingOptimizer, apply_encoding_optimization
 
 
 class CampaignsResource:
@@ -34,6 +37,8 @@ class CampaignsResource:
         text: str,
         contact_list_ids: List[str],
         template_id: Optional[str] = None,
+        optimize_encoding: EncodingOptimizer = False,
+        request_options: Optional[RequestOptions] = None,
     ) -> Campaign:
         """Create a new campaign (draft)
 
@@ -42,10 +47,14 @@ class CampaignsResource:
             text: Message text with optional {{variables}}
             contact_list_ids: List IDs to send to
             template_id: Optional template ID
+            optimize_encoding: Rewrite smart quotes, dashes and similar characters
+                to GSM-7 look-alikes when that saves segments; pass a callable to
+                also receive the EncodingOptimization report
 
         Returns:
             The created campaign
         """
+        text = apply_encoding_optimization(text, None, optimize_encoding)
         body: Dict[str, Any] = {
             "name": name,
             "text": text,
@@ -54,7 +63,7 @@ class CampaignsResource:
         if template_id:
             body["templateId"] = template_id
 
-        data = self._http.request("POST", "/campaigns", body=body)
+        data = self._http.request("POST", "/campaigns", body=body, options=request_options)
         return self._transform_campaign(data)
 
     def list(
@@ -62,6 +71,7 @@ class CampaignsResource:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> CampaignListResponse:
         """List campaigns with optional filtering
 
@@ -81,17 +91,67 @@ class CampaignsResource:
         if status:
             params["status"] = status
 
-        data = self._http.request("GET", "/campaigns", params=params if params else None)
-        return CampaignListResponse(
-            campaigns=[self._transform_campaign(c) for c in data["campaigns"]],
-            total=data["total"],
-            limit=data["limit"],
-            offset=data["offset"],
+        data = self._http.request(
+            "GET", "/campaigns", params=params if params else None, options=request_options
+        )
+        return self._http.parse(
+            CampaignListResponse,
+            {
+                "campaigns": [self._transform_campaign(c) for c in data["campaigns"]],
+                "total": data["total"],
+                "limit": data["limit"],
+                "offset": data["offset"],
+            },
         )
 
-    def get(self, campaign_id: str) -> Campaign:
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Campaign]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Paginator[Campaign]:
+        """Iterate through all campaigns, fetching pages lazily
+
+        Args:
+            status: Filter by status (draft, scheduled, sending, sent, cancelled)
+            page_size: Campaigns per request (max 100)
+            prefetch: Page requests to keep in flight
+            max_items: Stop after this many campaigns
+            cursor: PageCursor (or encoded token) to resume from
+            on_page: Called with each Page before its campaigns are yielded
+
+        Returns:
+            A Paginator yielding Campaign objects
+        """
+
+        def fetch_page(offset: int, limit: int) -> Page[Campaign]:
+            response = self.list(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            return Page(
+                response_field(CampaignListResponse, response, "campaigns"),
+                offset,
+                limit,
+                total=response_field(CampaignListResponse, response, "total"),
+                response=response,
+            )
+
+        return Paginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
+
+    def get(self, campaign_id: str, request_options: Optional[RequestOptions] = None) -> Campaign:
         """Get a campaign by ID"""
-        data = self._http.request("GET", f"/campaigns/{campaign_id}")
+        data = self._http.request("GET", f"/campaigns/{campaign_id}", options=request_options)
         return self._transform_campaign(data)
 
     def update(
@@ -102,6 +162,7 @@ class CampaignsResource:
         text: Optional[str] = None,
         template_id: Optional[str] = None,
         contact_list_ids: Optional[List[str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Campaign:
         """Update a campaign (draft or scheduled only)"""
         body: Dict[str, Any] = {}
@@ -114,32 +175,41 @@ class CampaignsResource:
         if contact_list_ids is not None:
             body["contactListIds"] = contact_list_ids
 
-        data = self._http.request("PATCH", f"/campaigns/{campaign_id}", body=body)
+        data = self._http.request(
+            "PATCH", f"/campaigns/{campaign_id}", body=body, options=request_options
+        )
         return self._transform_campaign(data)
 
-    def delete(self, campaign_id: str) -> None:
+    def delete(self, campaign_id: str, request_options: Optional[RequestOptions] = None) -> None:
         """Delete a campaign (draft or cancelled only)"""
-        self._http.request("DELETE", f"/campaigns/{campaign_id}")
+        self._http.request("DELETE", f"/campaigns/{campaign_id}", options=request_options)
 
-    def preview(self, campaign_id: str) -> CampaignPreview:
+    def preview(
+        self, campaign_id: str, request_options: Optional[RequestOptions] = None
+    ) -> CampaignPreview:
         """Preview campaign before sending
 
         Returns recipient count, credit estimate, and breakdown.
         """
-        data = self._http.request("GET", f"/campaigns/{campaign_id}/preview")
-        return CampaignPreview(
-            id=data["id"],
-            recipient_count=data["recipient_count"],
-            estimated_segments=data["estimated_segments"],
-            estimated_credits=data["estimated_credits"],
-            current_balance=data["current_balance"],
-            has_enough_credits=data["has_enough_credits"],
-            breakdown=data.get("breakdown"),
+        data = self._http.request(
+            "GET", f"/campaigns/{campaign_id}/preview", options=request_options
+        )
+        return self._http.parse(
+            CampaignPreview,
+            {
+                "id": data["id"],
+                "recipient_count": data["recipient_count"],
+                "estimated_segments": data["estimated_segments"],
+                "estimated_credits": data["estimated_credits"],
+                "current_balance": data["current_balance"],
+                "has_enough_credits": data["has_enough_credits"],
+                "breakdown": data.get("breakdown"),
+            },
         )
 
-    def send(self, campaign_id: str) -> Campaign:
+    def send(self, campaign_id: str, request_options: Optional[RequestOptions] = None) -> Campaign:
         """Send a campaign immediately"""
-        data = self._http.request("POST", f"/campaigns/{campaign_id}/send")
+        data = self._http.request("POST", f"/campaigns/{campaign_id}/send", options=request_options)
         return self._transform_campaign(data)
 
     def schedule(
@@ -147,6 +217,7 @@ class CampaignsResource:
         campaign_id: str,
         scheduled_at: str,
         timezone: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Campaign:
         """Schedule a campaign for later
 
@@ -159,39 +230,50 @@ class CampaignsResource:
         if timezone:
             body["timezone"] = timezone
 
-        data = self._http.request("POST", f"/campaigns/{campaign_id}/schedule", body=body)
+        data = self._http.request(
+            "POST", f"/campaigns/{campaign_id}/schedule", body=body, options=request_options
+        )
         return self._transform_campaign(data)
 
-    def cancel(self, campaign_id: str) -> Campaign:
+    def cancel(
+        self, campaign_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Campaign:
         """Cancel a scheduled campaign"""
-        data = self._http.request("POST", f"/campaigns/{campaign_id}/cancel")
+        data = self._http.request(
+            "POST", f"/campaigns/{campaign_id}/cancel", options=request_options
+        )
         return self._transform_campaign(data)
 
-    def clone(self, campaign_id: str) -> Campaign:
+    def clone(self, campaign_id: str, request_options: Optional[RequestOptions] = None) -> Campaign:
         """Clone a campaign (creates new draft)"""
-        data = self._http.request("POST", f"/campaigns/{campaign_id}/clone")
+        data = self._http.request(
+            "POST", f"/campaigns/{campaign_id}/clone", options=request_options
+        )
         return self._transform_campaign(data)
 
     def _transform_campaign(self, data: Dict[str, Any]) -> Campaign:
-        return Campaign(
-            id=data["id"],
-            name=data["name"],
-            text=data["text"],
-            template_id=data.get("template_id"),
-            contact_list_ids=data.get("contact_list_ids", []),
-            status=data["status"],
-            recipient_count=data.get("recipient_count", 0),
-            sent_count=data.get("sent_count", 0),
-            delivered_count=data.get("delivered_count", 0),
-            failed_count=data.get("failed_count", 0),
-            estimated_credits=data.get("estimated_credits", 0),
-            credits_used=data.get("credits_used", 0),
-            scheduled_at=data.get("scheduled_at"),
-            timezone=data.get("timezone"),
-            started_at=data.get("started_at"),
-            completed_at=data.get("completed_at"),
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
+        return self._http.parse(
+            Campaign,
+            {
+                "id": data["id"],
+                "name": data["name"],
+                "text": data["text"],
+                "template_id": data.get("template_id"),
+                "contact_list_ids": data.get("contact_list_ids", []),
+                "status": data["status"],
+                "recipient_count": data.get("recipient_count", 0),
+                "sent_count": data.get("sent_count", 0),
+                "delivered_count": data.get("delivered_count", 0),
+                "failed_count": data.get("failed_count", 0),
+                "estimated_credits": data.get("estimated_credits", 0),
+                "credits_used": data.get("credits_used", 0),
+                "scheduled_at": data.get("scheduled_at"),
+                "timezone": data.get("timezone"),
+                "started_at": data.get("started_at"),
+                "completed_at": data.get("completed_at"),
+                "created_at": data["created_at"],
+                "updated_at": data["updated_at"],
+            },
         )
 
 
@@ -207,8 +289,11 @@ class AsyncCampaignsResource:
         text: str,
         contact_list_ids: List[str],
         template_id: Optional[str] = None,
+        optimize_encoding: EncodingOptimizer = False,
+        request_options: Optional[RequestOptions] = None,
     ) -> Campaign:
         """Create a new campaign (draft)"""
+        text = apply_encoding_optimization(text, None, optimize_encoding)
         body: Dict[str, Any] = {
             "name": name,
             "text": text,
@@ -217,7 +302,7 @@ class AsyncCampaignsResource:
         if template_id:
             body["templateId"] = template_id
 
-        data = await self._http.request("POST", "/campaigns", body=body)
+        data = await self._http.request("POST", "/campaigns", body=body, options=request_options)
         return self._transform_campaign(data)
 
     async def list(
@@ -225,6 +310,7 @@ class AsyncCampaignsResource:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> CampaignListResponse:
         """List campaigns with optional filtering"""
         params: Dict[str, Any] = {}
@@ -235,17 +321,57 @@ class AsyncCampaignsResource:
         if status:
             params["status"] = status
 
-        data = await self._http.request("GET", "/campaigns", params=params if params else None)
-        return CampaignListResponse(
-            campaigns=[self._transform_campaign(c) for c in data["campaigns"]],
-            total=data["total"],
-            limit=data["limit"],
-            offset=data["offset"],
+        data = await self._http.request(
+            "GET", "/campaigns", params=params if params else None, options=request_options
+        )
+        return self._http.parse(
+            CampaignListResponse,
+            {
+                "campaigns": [self._transform_campaign(c) for c in data["campaigns"]],
+                "total": data["total"],
+                "limit": data["limit"],
+                "offset": data["offset"],
+            },
+        )
+
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Campaign]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncPaginator[Campaign]:
+        """Iterate through all campaigns, fetching pages lazily (async)"""
+
+        async def fetch_page(offset: int, limit: int) -> Page[Campaign]:
+            response = await self.list(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            return Page(
+                response_field(CampaignListResponse, response, "campaigns"),
+                offset,
+                limit,
+                total=response_field(CampaignListResponse, response, "total"),
+                response=response,
+            )
+
+        return AsyncPaginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
         )
 
-    async def get(self, campaign_id: str) -> Campaign:
+    async def get(
+        self, campaign_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Campaign:
         """Get a campaign by ID"""
-        data = await self._http.request("GET", f"/campaigns/{campaign_id}")
+        data = await self._http.request("GET", f"/campaigns/{campaign_id}", options=request_options)
         return self._transform_campaign(data)
 
     async def update(
@@ -256,6 +382,7 @@ class AsyncCampaignsResource:
         text: Optional[str] = None,
         template_id: Optional[str] = None,
         contact_list_ids: Optional[List[str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Campaign:
         """Update a campaign (draft or scheduled only)"""
         body: Dict[str, Any] = {}
@@ -268,29 +395,44 @@ class AsyncCampaignsResource:
         if contact_list_ids is not None:
             body["contactListIds"] = contact_list_ids
 
-        data = await self._http.request("PATCH", f"/campaigns/{campaign_id}", body=body)
+        data = await self._http.request(
+            "PATCH", f"/campaigns/{campaign_id}", body=body, options=request_options
+        )
         return self._transform_campaign(data)
 
-    async def delete(self, campaign_id: str) -> None:
+    async def delete(
+        self, campaign_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         """Delete a campaign (draft or cancelled only)"""
-        await self._http.request("DELETE", f"/campaigns/{campaign_id}")
+        await self._http.request("DELETE", f"/campaigns/{campaign_id}", options=request_options)
 
-    async def preview(self, campaign_id: str) -> CampaignPreview:
+    async def preview(
+        self, campaign_id: str, request_options: Optional[RequestOptions] = None
+    ) -> CampaignPreview:
         """Preview campaign before sending"""
-        data = await self._http.request("GET", f"/campaigns/{campaign_id}/preview")
-        return CampaignPreview(
-            id=data["id"],
-            recipient_count=data["recipient_count"],
-            estimated_segments=data["estimated_segments"],
-            estimated_credits=data["estimated_credits"],
-            current_balance=data["current_balance"],
-            has_enough_credits=data["has_enough_credits"],
-            breakdown=data.get("breakdown"),
+        data = await self._http.request(
+            "GET", f"/campaigns/{campaign_id}/preview", options=request_options
+        )
+        return self._http.parse(
+            CampaignPreview,
+            {
+                "id": data["id"],
+                "recipient_count": data["recipient_count"],
+                "estimated_segments": data["estimated_segments"],
+                "estimated_credits": data["estimated_credits"],
+                "current_balance": data["current_balance"],
+                "has_enough_credits": data["has_enough_credits"],
+                "breakdown": data.get("breakdown"),
+            },
         )
 
-    async def send(self, campaign_id: str) -> Campaign:
+    async def send(
+        self, campaign_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Campaign:
         """Send a campaign immediately"""
-        data = await self._http.request("POST", f"/campaigns/{campaign_id}/send")
+        data = await self._http.request(
+            "POST", f"/campaigns/{campaign_id}/send", options=request_options
+        )
         return self._transform_campaign(data)
 
     async def schedule(
@@ -298,43 +440,57 @@ class AsyncCampaignsResource:
         campaign_id: str,
         scheduled_at: str,
         timezone: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Campaign:
         """Schedule a campaign for later"""
         body: Dict[str, Any] = {"scheduledAt": scheduled_at}
         if timezone:
             body["timezone"] = timezone
 
-        data = await self._http.request("POST", f"/campaigns/{campaign_id}/schedule", body=body)
+        data = await self._http.request(
+            "POST", f"/campaigns/{campaign_id}/schedule", body=body, options=request_options
+        )
         return self._transform_campaign(data)
 
-    async def cancel(self, campaign_id: str) -> Campaign:
+    async def cancel(
+        self, campaign_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Campaign:
         """Cancel a scheduled campaign"""
-        data = await self._http.request("POST", f"/campaigns/{campaign_id}/cancel")
+        data = await self._http.request(
+            "POST", f"/campaigns/{campaign_id}/cancel", options=request_options
+        )
         return self._transform_campaign(data)
 
-    async def clone(self, campaign_id: str) -> Campaign:
+    async def clone(
+        self, campaign_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Campaign:
         """Clone a campaign (creates new draft)"""
-        data = await self._http.request("POST", f"/campaigns/{campaign_id}/clone")
+        data = await self._http.request(
+            "POST", f"/campaigns/{campaign_id}/clone", options=request_options
+        )
         return self._transform_campaign(data)
 
     def _transform_campaign(self, data: Dict[str, Any]) -> Campaign:
-        return Campaign(
-            id=data["id"],
-            name=data["name"],
-            text=data["text"],
-            template_id=data.get("template_id"),
-            contact_list_ids=data.get("contact_list_ids", []),
-            status=data["status"],
-            recipient_count=data.get("recipient_count", 0),
-            sent_count=data.get("sent_count", 0),
-            delivered_count=data.get("delivered_count", 0),
-            failed_count=data.get("failed_count", 0),
-            estimated_credits=data.get("estimated_credits", 0),
-            credits_used=data.get("credits_used", 0),
-            scheduled_at=data.get("scheduled_at"),
-            timezone=data.get("timezone"),
-            started_at=data.get("started_at"),
-            completed_at=data.get("completed_at"),
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
+        return self._http.parse(
+            Campaign,
+            {
+                "id": data["id"],
+                "name": data["name"],
+                "text": data["text"],
+                "template_id": data.get("template_id"),
+                "contact_list_ids": data.get("contact_list_ids", []),
+                "status": data["status"],
+                "recipient_count": data.get("recipient_count", 0),
+                "sent_count": data.get("sent_count", 0),
+                "delivered_count": data.get("delivered_count", 0),
+                "failed_count": data.get("failed_count", 0),
+                "estimated_credits": data.get("estimated_credits", 0),
+                "credits_used": data.get("credits_used", 0),
+                "scheduled_at": data.get("scheduled_at"),
+                "timezone": data.get("timezone"),
+                "started_at": data.get("started_at"),
+                "completed_at": data.get("completed_at"),
+                "created_at": data["created_at"],
+                "updated_at": data["updated_at"],
+            },
         )
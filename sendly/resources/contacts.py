@@ -2,7 +2,7 @@
 Contacts Resource - Contact & List Management
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ..types import (
     BulkMarkValidResponse,
@@ -13,7 +13,9 @@ from ..types import (
     ImportContactItem,
     ImportContactsResponse,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
+from ..utils.models import response_field
+from ..utils.pagination import AsyncPaginator, CursorTypes, Page, Paginator
 
 
 class ContactListsResource:
@@ -22,16 +24,19 @@ class ContactListsResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def list(self) -> ContactListsResponse:
+    def list(self, request_options: Optional[RequestOptions] = None) -> ContactListsResponse:
         """List all contact lists"""
-        data = self._http.request("GET", "/contact-lists")
-        return ContactListsResponse(lists=[self._transform_list(lst) for lst in data["lists"]])
+        data = self._http.request("GET", "/contact-lists", options=request_options)
+        return self._http.parse(
+            ContactListsResponse, {"lists": [self._transform_list(lst) for lst in data["lists"]]}
+        )
 
     def get(
         self,
         list_id: str,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ContactList:
         """Get a contact list by ID with optional member pagination"""
         params: Dict[str, Any] = {}
@@ -41,17 +46,25 @@ class ContactListsResource:
             params["offset"] = offset
 
         data = self._http.request(
-            "GET", f"/contact-lists/{list_id}", params=params if params else None
+            "GET",
+            f"/contact-lists/{list_id}",
+            params=params if params else None,
+            options=request_options,
         )
         return self._transform_list(data)
 
-    def create(self, name: str, description: Optional[str] = None) -> ContactList:
+    def create(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> ContactList:
         """Create a new contact list"""
         body: Dict[str, Any] = {"name": name}
         if description:
             body["description"] = description
 
-        data = self._http.request("POST", "/contact-lists", body=body)
+        data = self._http.request("POST", "/contact-lists", body=body, options=request_options)
         return self._transform_list(data)
 
     def update(
@@ -60,6 +73,7 @@ class ContactListsResource:
         *,
         name: Optional[str] = None,
         description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ContactList:
         """Update a contact list"""
         body: Dict[str, Any] = {}
@@ -68,14 +82,18 @@ class ContactListsResource:
         if description is not None:
             body["description"] = description
 
-        data = self._http.request("PATCH", f"/contact-lists/{list_id}", body=body)
+        data = self._http.request(
+            "PATCH", f"/contact-lists/{list_id}", body=body, options=request_options
+        )
         return self._transform_list(data)
 
-    def delete(self, list_id: str) -> None:
+    def delete(self, list_id: str, request_options: Optional[RequestOptions] = None) -> None:
         """Delete a contact list (does not delete the contacts)"""
-        self._http.request("DELETE", f"/contact-lists/{list_id}")
+        self._http.request("DELETE", f"/contact-lists/{list_id}", options=request_options)
 
-    def add_contacts(self, list_id: str, contact_ids: List[str]) -> Dict[str, int]:
+    def add_contacts(
+        self, list_id: str, contact_ids: List[str], request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, int]:
         """Add contacts to a list
 
         Returns:
@@ -85,12 +103,17 @@ class ContactListsResource:
             "POST",
             f"/contact-lists/{list_id}/contacts",
             body={"contact_ids": contact_ids},
+            options=request_options,
         )
         return {"added_count": data["added_count"]}
 
-    def remove_contact(self, list_id: str, contact_id: str) -> None:
+    def remove_contact(
+        self, list_id: str, contact_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         """Remove a contact from a list"""
-        self._http.request("DELETE", f"/contact-lists/{list_id}/contacts/{contact_id}")
+        self._http.request(
+            "DELETE", f"/contact-lists/{list_id}/contacts/{contact_id}", options=request_options
+        )
 
     def _transform_list(self, data: Dict[str, Any]) -> ContactList:
         contacts = None
@@ -105,15 +128,18 @@ class ContactListsResource:
                 for c in data["contacts"]
             ]
 
-        return ContactList(
-            id=data["id"],
-            name=data["name"],
-            description=data.get("description"),
-            contact_count=data.get("contact_count", 0),
-            created_at=data["created_at"],
-            updated_at=data.get("updated_at"),
-            contacts=contacts,
-            contacts_total=data.get("contacts_total"),
+        return self._http.parse(
+            ContactList,
+            {
+                "id": data["id"],
+                "name": data["name"],
+                "description": data.get("description"),
+                "contact_count": data.get("contact_count", 0),
+                "created_at": data["created_at"],
+                "updated_at": data.get("updated_at"),
+                "contacts": contacts,
+                "contacts_total": data.get("contacts_total"),
+            },
         )
 
 
@@ -139,6 +165,7 @@ class ContactsResource:
         offset: Optional[int] = None,
         search: Optional[str] = None,
         list_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ContactListResponse:
         """List contacts with optional filtering
 
@@ -158,17 +185,70 @@ class ContactsResource:
         if list_id:
             params["list_id"] = list_id
 
-        data = self._http.request("GET", "/contacts", params=params if params else None)
-        return ContactListResponse(
-            contacts=[self._transform_contact(c) for c in data["contacts"]],
-            total=data["total"],
-            limit=data["limit"],
-            offset=data["offset"],
+        data = self._http.request(
+            "GET", "/contacts", params=params if params else None, options=request_options
         )
+        return self._http.parse(
+            ContactListResponse,
+            {
+                "contacts": [self._transform_contact(c) for c in data["contacts"]],
+                "total": data["total"],
+                "limit": data["limit"],
+                "offset": data["offset"],
+            },
+        )
+
+    def iter_all(
+        self,
+        search: Optional[str] = None,
+        list_id: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Contact]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Paginator[Contact]:
+        """Iterate through all contacts, fetching pages lazily
 
-    def get(self, contact_id: str) -> Contact:
+        Args:
+            search: Search query (name, phone, email)
+            list_id: Filter by contact list ID
+            page_size: Contacts per request (max 100)
+            prefetch: Page requests to keep in flight
+            max_items: Stop after this many contacts
+            cursor: PageCursor (or encoded token) to resume from
+            on_page: Called with each Page before its contacts are yielded
+        """
+
+        def fetch_page(offset: int, limit: int) -> Page[Contact]:
+            response = self.list(
+                limit=limit,
+                offset=offset,
+                search=search,
+                list_id=list_id,
+                request_options=request_options,
+            )
+            return Page(
+                response_field(ContactListResponse, response, "contacts"),
+                offset,
+                limit,
+                total=response_field(ContactListResponse, response, "total"),
+                response=response,
+            )
+
+        return Paginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
+
+    def get(self, contact_id: str, request_options: Optional[RequestOptions] = None) -> Contact:
         """Get a contact by ID"""
-        data = self._http.request("GET", f"/contacts/{contact_id}")
+        data = self._http.request("GET", f"/contacts/{contact_id}", options=request_options)
         return self._transform_contact(data)
 
     def create(
@@ -177,6 +257,7 @@ class ContactsResource:
         name: Optional[str] = None,
         email: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Contact:
         """Create a new contact
 
@@ -194,7 +275,7 @@ class ContactsResource:
         if metadata:
             body["metadata"] = metadata
 
-        data = self._http.request("POST", "/contacts", body=body)
+        data = self._http.request("POST", "/contacts", body=body, options=request_options)
         return self._transform_contact(data)
 
     def update(
@@ -204,6 +285,7 @@ class ContactsResource:
         name: Optional[str] = None,
         email: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Contact:
         """Update a contact"""
         body: Dict[str, Any] = {}
@@ -214,14 +296,18 @@ class ContactsResource:
         if metadata is not None:
             body["metadata"] = metadata
 
-        data = self._http.request("PATCH", f"/contacts/{contact_id}", body=body)
+        data = self._http.request(
+            "PATCH", f"/contacts/{contact_id}", body=body, options=request_options
+        )
         return self._transform_contact(data)
 
-    def delete(self, contact_id: str) -> None:
+    def delete(self, contact_id: str, request_options: Optional[RequestOptions] = None) -> None:
         """Delete a contact"""
-        self._http.request("DELETE", f"/contacts/{contact_id}")
+        self._http.request("DELETE", f"/contacts/{contact_id}", options=request_options)
 
-    def mark_valid(self, contact_id: str) -> Contact:
+    def mark_valid(
+        self, contact_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Contact:
         """Clear the invalid flag on a contact so future campaigns include it again.
 
         Contacts get auto-flagged as invalid when a send fails with a terminal
@@ -229,7 +315,9 @@ class ContactsResource:
         reports they can't receive SMS. Use this when you disagree with the
         auto-flag — e.g. the recipient ported from a landline to mobile.
         """
-        data = self._http.request("POST", f"/contacts/{contact_id}/mark-valid")
+        data = self._http.request(
+            "POST", f"/contacts/{contact_id}/mark-valid", options=request_options
+        )
         return self._transform_contact(data)
 
     def bulk_mark_valid(
@@ -237,6 +325,7 @@ class ContactsResource:
         *,
         ids: Optional[List[str]] = None,
         list_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> BulkMarkValidResponse:
         """Clear the invalid flag on many contacts at once.
 
@@ -252,14 +341,17 @@ class ContactsResource:
         if ids and list_id:
             raise ValueError("bulk_mark_valid accepts 'ids' OR 'list_id', not both")
         body: Dict[str, Any] = {"ids": ids} if ids else {"listId": list_id}
-        data = self._http.request("POST", "/contacts/bulk-mark-valid", body=body)
-        return BulkMarkValidResponse(cleared=data.get("cleared", 0))
+        data = self._http.request(
+            "POST", "/contacts/bulk-mark-valid", body=body, options=request_options
+        )
+        return self._http.parse(BulkMarkValidResponse, {"cleared": data.get("cleared", 0)})
 
     def check_numbers(
         self,
         *,
         list_id: Optional[str] = None,
         force: bool = False,
+        request_options: Optional[RequestOptions] = None,
     ) -> Dict[str, Any]:
         """Trigger a background carrier lookup across your contacts.
 
@@ -280,6 +372,7 @@ class ContactsResource:
             "POST",
             "/contacts/lookup",
             body={"listId": list_id, "force": force},
+            options=request_options,
         )
 
     def import_contacts(
@@ -288,6 +381,7 @@ class ContactsResource:
         *,
         list_id: Optional[str] = None,
         opted_in_at: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ImportContactsResponse:
         """Bulk import contacts
 
@@ -304,12 +398,15 @@ class ContactsResource:
         if opted_in_at:
             body["optedInAt"] = opted_in_at
 
-        data = self._http.request("POST", "/contacts/import", body=body)
-        return ImportContactsResponse(
-            imported=data["imported"],
-            skipped_duplicates=data["skippedDuplicates"],
-            errors=data.get("errors", []),
-            total_errors=data.get("totalErrors", 0),
+        data = self._http.request("POST", "/contacts/import", body=body, options=request_options)
+        return self._http.parse(
+            ImportContactsResponse,
+            {
+                "imported": data["imported"],
+                "skipped_duplicates": data["skippedDuplicates"],
+                "errors": data.get("errors", []),
+                "total_errors": data.get("totalErrors", 0),
+            },
         )
 
     def _transform_contact(self, data: Dict[str, Any]) -> Contact:
@@ -325,22 +422,25 @@ class ContactsResource:
                 return data[camel]
             return default
 
-        return Contact(
-            id=data["id"],
-            phone_number=pick("phone_number", "phoneNumber"),
-            name=data.get("name"),
-            email=data.get("email"),
-            metadata=data.get("metadata"),
-            opted_out=pick("opted_out", "optedOut", False),
-            line_type=pick("line_type", "lineType"),
-            carrier_name=pick("carrier_name", "carrierName"),
-            line_type_checked_at=pick("line_type_checked_at", "lineTypeCheckedAt"),
-            invalid_reason=pick("invalid_reason", "invalidReason"),
-            invalidated_at=pick("invalidated_at", "invalidatedAt"),
-            user_marked_valid_at=pick("user_marked_valid_at", "userMarkedValidAt"),
-            created_at=pick("created_at", "createdAt"),
-            updated_at=pick("updated_at", "updatedAt"),
-            lists=lists,
+        return self._http.parse(
+            Contact,
+            {
+                "id": data["id"],
+                "phone_number": pick("phone_number", "phoneNumber"),
+                "name": data.get("name"),
+                "email": data.get("email"),
+                "metadata": data.get("metadata"),
+                "opted_out": pick("opted_out", "optedOut", False),
+                "line_type": pick("line_type", "lineType"),
+                "carrier_name": pick("carrier_name", "carrierName"),
+                "line_type_checked_at": pick("line_type_checked_at", "lineTypeCheckedAt"),
+                "invalid_reason": pick("invalid_reason", "invalidReason"),
+                "invalidated_at": pick("invalidated_at", "invalidatedAt"),
+                "user_marked_valid_at": pick("user_marked_valid_at", "userMarkedValidAt"),
+                "created_at": pick("created_at", "createdAt"),
+                "updated_at": pick("updated_at", "updatedAt"),
+                "lists": lists,
+            },
         )
 
 
@@ -350,16 +450,19 @@ class AsyncContactListsResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def list(self) -> ContactListsResponse:
+    async def list(self, request_options: Optional[RequestOptions] = None) -> ContactListsResponse:
         """List all contact lists"""
-        data = await self._http.request("GET", "/contact-lists")
-        return ContactListsResponse(lists=[self._transform_list(lst) for lst in data["lists"]])
+        data = await self._http.request("GET", "/contact-lists", options=request_options)
+        return self._http.parse(
+            ContactListsResponse, {"lists": [self._transform_list(lst) for lst in data["lists"]]}
+        )
 
     async def get(
         self,
         list_id: str,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ContactList:
         """Get a contact list by ID with optional member pagination"""
         params: Dict[str, Any] = {}
@@ -369,17 +472,27 @@ class AsyncContactListsResource:
             params["offset"] = offset
 
         data = await self._http.request(
-            "GET", f"/contact-lists/{list_id}", params=params if params else None
+            "GET",
+            f"/contact-lists/{list_id}",
+            params=params if params else None,
+            options=request_options,
         )
         return self._transform_list(data)
 
-    async def create(self, name: str, description: Optional[str] = None) -> ContactList:
+    async def create(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> ContactList:
         """Create a new contact list"""
         body: Dict[str, Any] = {"name": name}
         if description:
             body["description"] = description
 
-        data = await self._http.request("POST", "/contact-lists", body=body)
+        data = await self._http.request(
+            "POST", "/contact-lists", body=body, options=request_options
+        )
         return self._transform_list(data)
 
     async def update(
@@ -388,6 +501,7 @@ class AsyncContactListsResource:
         *,
         name: Optional[str] = None,
         description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ContactList:
         """Update a contact list"""
         body: Dict[str, Any] = {}
@@ -396,25 +510,34 @@ class AsyncContactListsResource:
         if description is not None:
             body["description"] = description
 
-        data = await self._http.request("PATCH", f"/contact-lists/{list_id}", body=body)
+        data = await self._http.request(
+            "PATCH", f"/contact-lists/{list_id}", body=body, options=request_options
+        )
         return self._transform_list(data)
 
-    async def delete(self, list_id: str) -> None:
+    async def delete(self, list_id: str, request_options: Optional[RequestOptions] = None) -> None:
         """Delete a contact list (does not delete the contacts)"""
-        await self._http.request("DELETE", f"/contact-lists/{list_id}")
+        await self._http.request("DELETE", f"/contact-lists/{list_id}", options=request_options)
 
-    async def add_contacts(self, list_id: str, contact_ids: List[str]) -> Dict[str, int]:
+    async def add_contacts(
+        self, list_id: str, contact_ids: List[str], request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, int]:
         """Add contacts to a list"""
         data = await self._http.request(
             "POST",
             f"/contact-lists/{list_id}/contacts",
             body={"contact_ids": contact_ids},
+            options=request_options,
         )
         return {"added_count": data["added_count"]}
 
-    async def remove_contact(self, list_id: str, contact_id: str) -> None:
+    async def remove_contact(
+        self, list_id: str, contact_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         """Remove a contact from a list"""
-        await self._http.request("DELETE", f"/contact-lists/{list_id}/contacts/{contact_id}")
+        await self._http.request(
+            "DELETE", f"/contact-lists/{list_id}/contacts/{contact_id}", options=request_options
+        )
 
     def _transform_list(self, data: Dict[str, Any]) -> ContactList:
         contacts = None
@@ -429,15 +552,18 @@ class AsyncContactListsResource:
                 for c in data["contacts"]
             ]
 
-        return ContactList(
-            id=data["id"],
-            name=data["name"],
-            description=data.get("description"),
-            contact_count=data.get("contact_count", 0),
-            created_at=data["created_at"],
-            updated_at=data.get("updated_at"),
-            contacts=contacts,
-            contacts_total=data.get("contacts_total"),
+        return self._http.parse(
+            ContactList,
+            {
+                "id": data["id"],
+                "name": data["name"],
+                "description": data.get("description"),
+                "contact_count": data.get("contact_count", 0),
+                "created_at": data["created_at"],
+                "updated_at": data.get("updated_at"),
+                "contacts": contacts,
+                "contacts_total": data.get("contacts_total"),
+            },
         )
 
 
@@ -454,6 +580,7 @@ class AsyncContactsResource:
         offset: Optional[int] = None,
         search: Optional[str] = None,
         list_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ContactListResponse:
         """List contacts with optional filtering"""
         params: Dict[str, Any] = {}
@@ -466,17 +593,62 @@ class AsyncContactsResource:
         if list_id:
             params["list_id"] = list_id
 
-        data = await self._http.request("GET", "/contacts", params=params if params else None)
-        return ContactListResponse(
-            contacts=[self._transform_contact(c) for c in data["contacts"]],
-            total=data["total"],
-            limit=data["limit"],
-            offset=data["offset"],
+        data = await self._http.request(
+            "GET", "/contacts", params=params if params else None, options=request_options
+        )
+        return self._http.parse(
+            ContactListResponse,
+            {
+                "contacts": [self._transform_contact(c) for c in data["contacts"]],
+                "total": data["total"],
+                "limit": data["limit"],
+                "offset": data["offset"],
+            },
         )
 
-    async def get(self, contact_id: str) -> Contact:
+    def iter_all(
+        self,
+        search: Optional[str] = None,
+        list_id: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Contact]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncPaginator[Contact]:
+        """Iterate through all contacts, fetching pages lazily (async)"""
+
+        async def fetch_page(offset: int, limit: int) -> Page[Contact]:
+            response = await self.list(
+                limit=limit,
+                offset=offset,
+                search=search,
+                list_id=list_id,
+                request_options=request_options,
+            )
+            return Page(
+                response_field(ContactListResponse, response, "contacts"),
+                offset,
+                limit,
+                total=response_field(ContactListResponse, response, "total"),
+                response=response,
+            )
+
+        return AsyncPaginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
+
+    async def get(
+        self, contact_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Contact:
         """Get a contact by ID"""
-        data = await self._http.request("GET", f"/contacts/{contact_id}")
+        data = await self._http.request("GET", f"/contacts/{contact_id}", options=request_options)
         return self._transform_contact(data)
 
     async def create(
@@ -485,6 +657,7 @@ class AsyncContactsResource:
         name: Optional[str] = None,
         email: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Contact:
         """Create a new contact"""
         body: Dict[str, Any] = {"phone_number": phone_number}
@@ -495,7 +668,7 @@ class AsyncContactsResource:
         if metadata:
             body["metadata"] = metadata
 
-        data = await self._http.request("POST", "/contacts", body=body)
+        data = await self._http.request("POST", "/contacts", body=body, options=request_options)
         return self._transform_contact(data)
 
     async def update(
@@ -505,6 +678,7 @@ class AsyncContactsResource:
         name: Optional[str] = None,
         email: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Contact:
         """Update a contact"""
         body: Dict[str, Any] = {}
@@ -515,16 +689,24 @@ class AsyncContactsResource:
         if metadata is not None:
             body["metadata"] = metadata
 
-        data = await self._http.request("PATCH", f"/contacts/{contact_id}", body=body)
+        data = await self._http.request(
+            "PATCH", f"/contacts/{contact_id}", body=body, options=request_options
+        )
         return self._transform_contact(data)
 
-    async def delete(self, contact_id: str) -> None:
+    async def delete(
+        self, contact_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         """Delete a contact"""
-        await self._http.request("DELETE", f"/contacts/{contact_id}")
+        await self._http.request("DELETE", f"/contacts/{contact_id}", options=request_options)
 
-    async def mark_valid(self, contact_id: str) -> Contact:
+    async def mark_valid(
+        self, contact_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Contact:
         """Clear the invalid flag on a contact (async)."""
-        data = await self._http.request("POST", f"/contacts/{contact_id}/mark-valid")
+        data = await self._http.request(
+            "POST", f"/contacts/{contact_id}/mark-valid", options=request_options
+        )
         return self._transform_contact(data)
 
     async def bulk_mark_valid(
@@ -532,6 +714,7 @@ class AsyncContactsResource:
         *,
         ids: Optional[List[str]] = None,
         list_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> BulkMarkValidResponse:
         """Clear the invalid flag on many contacts at once (async).
 
@@ -544,15 +727,16 @@ class AsyncContactsResource:
             raise ValueError("bulk_mark_valid accepts 'ids' OR 'list_id', not both")
         body: Dict[str, Any] = {"ids": ids} if ids else {"listId": list_id}
         data = await self._http.request(
-            "POST", "/contacts/bulk-mark-valid", body=body
+            "POST", "/contacts/bulk-mark-valid", body=body, options=request_options
         )
-        return BulkMarkValidResponse(cleared=data.get("cleared", 0))
+        return self._http.parse(BulkMarkValidResponse, {"cleared": data.get("cleared", 0)})
 
     async def check_numbers(
         self,
         *,
         list_id: Optional[str] = None,
         force: bool = False,
+        request_options: Optional[RequestOptions] = None,
     ) -> Dict[str, Any]:
         """Trigger a background carrier lookup (async).
 
@@ -563,6 +747,7 @@ class AsyncContactsResource:
             "POST",
             "/contacts/lookup",
             body={"listId": list_id, "force": force},
+            options=request_options,
         )
 
     async def import_contacts(
@@ -571,6 +756,7 @@ class AsyncContactsResource:
         *,
         list_id: Optional[str] = None,
         opted_in_at: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ImportContactsResponse:
         """Bulk import contacts
 
@@ -587,12 +773,17 @@ class AsyncContactsResource:
         if opted_in_at:
             body["optedInAt"] = opted_in_at
 
-        data = await self._http.request("POST", "/contacts/import", body=body)
-        return ImportContactsResponse(
-            imported=data["imported"],
-            skipped_duplicates=data["skippedDuplicates"],
-            errors=data.get("errors", []),
-            total_errors=data.get("totalErrors", 0),
+        data = await self._http.request(
+            "POST", "/contacts/import", body=body, options=request_options
+        )
+        return self._http.parse(
+            ImportContactsResponse,
+            {
+                "imported": data["imported"],
+                "skipped_duplicates": data["skippedDuplicates"],
+                "errors": data.get("errors", []),
+                "total_errors": data.get("totalErrors", 0),
+            },
         )
 
     def _transform_contact(self, data: Dict[str, Any]) -> Contact:
@@ -608,20 +799,23 @@ class AsyncContactsResource:
                 return data[camel]
             return default
 
-        return Contact(
-            id=data["id"],
-            phone_number=pick("phone_number", "phoneNumber"),
-            name=data.get("name"),
-            email=data.get("email"),
-            metadata=data.get("metadata"),
-            opted_out=pick("opted_out", "optedOut", False),
-            line_type=pick("line_type", "lineType"),
-            carrier_name=pick("carrier_name", "carrierName"),
-            line_type_checked_at=pick("line_type_checked_at", "lineTypeCheckedAt"),
-            invalid_reason=pick("invalid_reason", "invalidReason"),
-            invalidated_at=pick("invalidated_at", "invalidatedAt"),
-            user_marked_valid_at=pick("user_marked_valid_at", "userMarkedValidAt"),
-            created_at=pick("created_at", "createdAt"),
-            updated_at=pick("updated_at", "updatedAt"),
-            lists=lists,
+        return self._http.parse(
+            Contact,
+            {
+                "id": data["id"],
+                "phone_number": pick("phone_number", "phoneNumber"),
+                "name": data.get("name"),
+                "email": data.get("email"),
+                "metadata": data.get("metadata"),
+                "opted_out": pick("opted_out", "optedOut", False),
+                "line_type": pick("line_type", "lineType"),
+                "carrier_name": pick("carrier_name", "carrierName"),
+                "line_type_checked_at": pick("line_type_checked_at", "lineTypeCheckedAt"),
+                "invalid_reason": pick("invalid_reason", "invalidReason"),
+                "invalidated_at": pick("invalidated_at", "invalidatedAt"),
+                "user_marked_valid_at": pick("user_marked_valid_at", "userMarkedValidAt"),
+                "created_at": pick("created_at", "createdAt"),
+                "updated_at": pick("updated_at", "updatedAt"),
+                "lists": lists,
+            },
         )
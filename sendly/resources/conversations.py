@@ -1,17 +1,17 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import quote
 
-from pydantic import ValidationError as PydanticValidationError
-
-from ..errors import SendlyError
 from ..types import (
     Conversation,
     ConversationContext,
     ConversationListResponse,
+    ConversationPagination,
     ConversationWithMessages,
     Message,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
+from ..utils.models import response_field
+from ..utils.pagination import AsyncPaginator, CursorTypes, Page, Paginator
 
 
 class ConversationsResource:
@@ -23,6 +23,7 @@ class ConversationsResource:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ConversationListResponse:
         params: Dict[str, Any] = {}
         if limit is not None:
@@ -36,22 +37,52 @@ class ConversationsResource:
             method="GET",
             path="/conversations",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return ConversationListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ConversationListResponse, data)
+
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Conversation]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Paginator[Conversation]:
+        """Iterate through all conversations, fetching pages lazily"""
+
+        def fetch_page(offset: int, limit: int) -> Page[Conversation]:
+            response = self.list(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            pagination = response_field(ConversationListResponse, response, "pagination")
+            return Page(
+                response_field(ConversationListResponse, response, "data"),
+                offset,
+                limit,
+                total=response_field(ConversationPagination, pagination, "total"),
+                has_more=response_field(ConversationPagination, pagination, "has_more"),
+                response=response,
+            )
+
+        return Paginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
 
     def get(
         self,
         id: str,
         include_messages: bool = False,
         message_limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ConversationWithMessages:
         params: Dict[str, Any] = {}
         if include_messages:
@@ -63,22 +94,17 @@ class ConversationsResource:
             method="GET",
             path=f"/conversations/{quote(id, safe='')}",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return ConversationWithMessages(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ConversationWithMessages, data)
 
     def reply(
         self,
         conversation_id: str,
         text: str,
         media_urls: Optional[List[str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Message:
         body: Dict[str, Any] = {"text": text}
         if media_urls:
@@ -88,22 +114,17 @@ class ConversationsResource:
             method="POST",
             path=f"/conversations/{quote(conversation_id, safe='')}/messages",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Message(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Message, data)
 
     def update(
         self,
         id: str,
         metadata: Optional[Dict[str, Any]] = None,
         tags: Optional[List[str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Conversation:
         body: Dict[str, Any] = {}
         if metadata is not None:
@@ -115,99 +136,71 @@ class ConversationsResource:
             method="PATCH",
             path=f"/conversations/{quote(id, safe='')}",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    def close(self, id: str) -> Conversation:
+    def close(self, id: str, request_options: Optional[RequestOptions] = None) -> Conversation:
         data = self._http.request(
             method="POST",
             path=f"/conversations/{quote(id, safe='')}/close",
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    def reopen(self, id: str) -> Conversation:
+    def reopen(self, id: str, request_options: Optional[RequestOptions] = None) -> Conversation:
         data = self._http.request(
             method="POST",
             path=f"/conversations/{quote(id, safe='')}/reopen",
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    def mark_read(self, id: str) -> Conversation:
+    def mark_read(self, id: str, request_options: Optional[RequestOptions] = None) -> Conversation:
         data = self._http.request(
             method="POST",
             path=f"/conversations/{quote(id, safe='')}/mark-read",
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    def add_labels(self, conversation_id: str, label_ids: List[str]) -> Conversation:
+    def add_labels(
+        self,
+        conversation_id: str,
+        label_ids: List[str],
+        request_options: Optional[RequestOptions] = None,
+    ) -> Conversation:
         body: Dict[str, Any] = {"labelIds": label_ids}
 
         data = self._http.request(
             method="POST",
             path=f"/conversations/{quote(conversation_id, safe='')}/labels",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    def remove_label(self, conversation_id: str, label_id: str) -> Conversation:
+    def remove_label(
+        self, conversation_id: str, label_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Conversation:
         data = self._http.request(
             method="DELETE",
             path=f"/conversations/{quote(conversation_id, safe='')}/labels/{quote(label_id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
     def get_context(
         self,
         id: str,
         max_messages: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ConversationContext:
         params: Dict[str, Any] = {}
         if max_messages is not None:
@@ -217,16 +210,10 @@ class ConversationsResource:
             method="GET",
             path=f"/conversations/{quote(id, safe='')}/context",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return ConversationContext(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ConversationContext, data)
 
 
 class AsyncConversationsResource:
@@ -238,6 +225,7 @@ class AsyncConversationsResource:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ConversationListResponse:
         params: Dict[str, Any] = {}
         if limit is not None:
@@ -251,22 +239,52 @@ class AsyncConversationsResource:
             method="GET",
             path="/conversations",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return ConversationListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ConversationListResponse, data)
+
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Conversation]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncPaginator[Conversation]:
+        """Iterate through all conversations, fetching pages lazily (async)"""
+
+        async def fetch_page(offset: int, limit: int) -> Page[Conversation]:
+            response = await self.list(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            pagination = response_field(ConversationListResponse, response, "pagination")
+            return Page(
+                response_field(ConversationListResponse, response, "data"),
+                offset,
+                limit,
+                total=response_field(ConversationPagination, pagination, "total"),
+                has_more=response_field(ConversationPagination, pagination, "has_more"),
+                response=response,
+            )
+
+        return AsyncPaginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
 
     async def get(
         self,
         id: str,
         include_messages: bool = False,
         message_limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ConversationWithMessages:
         params: Dict[str, Any] = {}
         if include_messages:
@@ -278,22 +296,17 @@ class AsyncConversationsResource:
             method="GET",
             path=f"/conversations/{quote(id, safe='')}",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return ConversationWithMessages(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ConversationWithMessages, data)
 
     async def reply(
         self,
         conversation_id: str,
         text: str,
         media_urls: Optional[List[str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Message:
         body: Dict[str, Any] = {"text": text}
         if media_urls:
@@ -303,22 +316,17 @@ class AsyncConversationsResource:
             method="POST",
             path=f"/conversations/{quote(conversation_id, safe='')}/messages",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Message(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Message, data)
 
     async def update(
         self,
         id: str,
         metadata: Optional[Dict[str, Any]] = None,
         tags: Optional[List[str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Conversation:
         body: Dict[str, Any] = {}
         if metadata is not None:
@@ -330,99 +338,77 @@ class AsyncConversationsResource:
             method="PATCH",
             path=f"/conversations/{quote(id, safe='')}",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    async def close(self, id: str) -> Conversation:
+    async def close(
+        self, id: str, request_options: Optional[RequestOptions] = None
+    ) -> Conversation:
         data = await self._http.request(
             method="POST",
             path=f"/conversations/{quote(id, safe='')}/close",
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    async def reopen(self, id: str) -> Conversation:
+    async def reopen(
+        self, id: str, request_options: Optional[RequestOptions] = None
+    ) -> Conversation:
         data = await self._http.request(
             method="POST",
             path=f"/conversations/{quote(id, safe='')}/reopen",
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    async def mark_read(self, id: str) -> Conversation:
+    async def mark_read(
+        self, id: str, request_options: Optional[RequestOptions] = None
+    ) -> Conversation:
         data = await self._http.request(
             method="POST",
             path=f"/conversations/{quote(id, safe='')}/mark-read",
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    async def add_labels(self, conversation_id: str, label_ids: List[str]) -> Conversation:
+    async def add_labels(
+        self,
+        conversation_id: str,
+        label_ids: List[str],
+        request_options: Optional[RequestOptions] = None,
+    ) -> Conversation:
         body: Dict[str, Any] = {"labelIds": label_ids}
 
         data = await self._http.request(
             method="POST",
             path=f"/conversations/{quote(conversation_id, safe='')}/labels",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
-    async def remove_label(self, conversation_id: str, label_id: str) -> Conversation:
+    async def remove_label(
+        self, conversation_id: str, label_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Conversation:
         data = await self._http.request(
             method="DELETE",
             path=f"/conversations/{quote(conversation_id, safe='')}/labels/{quote(label_id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return Conversation(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Conversation, data)
 
     async def get_context(
         self,
         id: str,
         max_messages: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> ConversationContext:
         params: Dict[str, Any] = {}
         if max_messages is not None:
@@ -432,13 +418,7 @@ class AsyncConversationsResource:
             method="GET",
             path=f"/conversations/{quote(id, safe='')}/context",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return ConversationContext(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ConversationContext, data)
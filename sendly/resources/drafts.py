@@ -1,14 +1,14 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import quote
 
-from pydantic import ValidationError as PydanticValidationError
-
-from ..errors import SendlyError
 from ..types import (
     DraftListResponse,
+    DraftPagination,
     MessageDraft,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
+from ..utils.models import response_field
+from ..utils.pagination import AsyncPaginator, CursorTypes, Page, Paginator
 
 
 class DraftsResource:
@@ -22,6 +22,7 @@ class DraftsResource:
         media_urls: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
         source: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> MessageDraft:
         body: Dict[str, Any] = {
             "conversationId": conversation_id,
@@ -38,16 +39,10 @@ class DraftsResource:
             method="POST",
             path="/drafts",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
 
     def list(
         self,
@@ -55,6 +50,7 @@ class DraftsResource:
         status: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> DraftListResponse:
         params: Dict[str, Any] = {}
         if conversation_id is not None:
@@ -70,31 +66,58 @@ class DraftsResource:
             method="GET",
             path="/drafts",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return DraftListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(DraftListResponse, data)
 
-    def get(self, id: str) -> MessageDraft:
+    def iter_all(
+        self,
+        conversation_id: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[MessageDraft]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Paginator[MessageDraft]:
+        """Iterate through all drafts, fetching pages lazily"""
+
+        def fetch_page(offset: int, limit: int) -> Page[MessageDraft]:
+            response = self.list(
+                conversation_id=conversation_id,
+                status=status,
+                limit=limit,
+                offset=offset,
+                request_options=request_options,
+            )
+            pagination = response_field(DraftListResponse, response, "pagination")
+            return Page(
+                response_field(DraftListResponse, response, "data"),
+                offset,
+                limit,
+                total=response_field(DraftPagination, pagination, "total"),
+                response=response,
+            )
+
+        return Paginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
+
+    def get(self, id: str, request_options: Optional[RequestOptions] = None) -> MessageDraft:
         data = self._http.request(
             method="GET",
             path=f"/drafts/{quote(id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
 
     def update(
         self,
@@ -102,6 +125,7 @@ class DraftsResource:
         text: Optional[str] = None,
         media_urls: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> MessageDraft:
         body: Dict[str, Any] = {}
         if text is not None:
@@ -115,33 +139,26 @@ class DraftsResource:
             method="PATCH",
             path=f"/drafts/{quote(id, safe='')}",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
 
-    def approve(self, id: str) -> MessageDraft:
+    def approve(self, id: str, request_options: Optional[RequestOptions] = None) -> MessageDraft:
         data = self._http.request(
             method="POST",
             path=f"/drafts/{quote(id, safe='')}/approve",
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
 
-    def reject(self, id: str, reason: Optional[str] = None) -> MessageDraft:
+    def reject(
+        self,
+        id: str,
+        reason: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> MessageDraft:
         body: Dict[str, Any] = {}
         if reason is not None:
             body["reason"] = reason
@@ -150,16 +167,10 @@ class DraftsResource:
             method="POST",
             path=f"/drafts/{quote(id, safe='')}/reject",
             body=body if body else None,
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
 
 
 class AsyncDraftsResource:
@@ -173,6 +184,7 @@ class AsyncDraftsResource:
         media_urls: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
         source: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> MessageDraft:
         body: Dict[str, Any] = {
             "conversationId": conversation_id,
@@ -189,16 +201,10 @@ class AsyncDraftsResource:
             method="POST",
             path="/drafts",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
 
     async def list(
         self,
@@ -206,6 +212,7 @@ class AsyncDraftsResource:
         status: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> DraftListResponse:
         params: Dict[str, Any] = {}
         if conversation_id is not None:
@@ -221,31 +228,58 @@ class AsyncDraftsResource:
             method="GET",
             path="/drafts",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return DraftListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(DraftListResponse, data)
 
-    async def get(self, id: str) -> MessageDraft:
+    def iter_all(
+        self,
+        conversation_id: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[MessageDraft]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncPaginator[MessageDraft]:
+        """Iterate through all drafts, fetching pages lazily (async)"""
+
+        async def fetch_page(offset: int, limit: int) -> Page[MessageDraft]:
+            response = await self.list(
+                conversation_id=conversation_id,
+                status=status,
+                limit=limit,
+                offset=offset,
+                request_options=request_options,
+            )
+            pagination = response_field(DraftListResponse, response, "pagination")
+            return Page(
+                response_field(DraftListResponse, response, "data"),
+                offset,
+                limit,
+                total=response_field(DraftPagination, pagination, "total"),
+                response=response,
+            )
+
+        return AsyncPaginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
+
+    async def get(self, id: str, request_options: Optional[RequestOptions] = None) -> MessageDraft:
         data = await self._http.request(
             method="GET",
             path=f"/drafts/{quote(id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
 
     async def update(
         self,
@@ -253,6 +287,7 @@ class AsyncDraftsResource:
         text: Optional[str] = None,
         media_urls: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> MessageDraft:
         body: Dict[str, Any] = {}
         if text is not None:
@@ -266,33 +301,28 @@ class AsyncDraftsResource:
             method="PATCH",
             path=f"/drafts/{quote(id, safe='')}",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
 
-    async def approve(self, id: str) -> MessageDraft:
+    async def approve(
+        self, id: str, request_options: Optional[RequestOptions] = None
+    ) -> MessageDraft:
         data = await self._http.request(
             method="POST",
             path=f"/drafts/{quote(id, safe='')}/approve",
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
 
-    async def reject(self, id: str, reason: Optional[str] = None) -> MessageDraft:
+    async def reject(
+        self,
+        id: str,
+        reason: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> MessageDraft:
         body: Dict[str, Any] = {}
         if reason is not None:
             body["reason"] = reason
@@ -301,13 +331,7 @@ class AsyncDraftsResource:
             method="POST",
             path=f"/drafts/{quote(id, safe='')}/reject",
             body=body if body else None,
+            options=request_options,
         )
 
-        try:
-            return MessageDraft(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageDraft, data)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import quote
 
 from ..types import (
@@ -26,41 +26,60 @@ from ..types import (
     SetWorkspaceWebhookResult,
     SuspendWorkspaceResult,
     TransferCreditsResult,
+    WorkspaceBillingItem,
     WorkspaceCredits,
     WorkspaceWebhook,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
+from ..utils.models import response_field
+from ..utils.pagination import AsyncPaginator, CursorTypes, Page, Paginator
 
 
 class WorkspacesSubResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def create(self, name: str, description: Optional[str] = None) -> EnterpriseWorkspace:
+    def create(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> EnterpriseWorkspace:
         body: Dict[str, Any] = {"name": name}
         if description is not None:
             body["description"] = description
 
-        response = self._http.request("POST", "/enterprise/workspaces", body=body)
-        return EnterpriseWorkspace(**response)
+        response = self._http.request(
+            "POST", "/enterprise/workspaces", body=body, options=request_options
+        )
+        return self._http.parse(EnterpriseWorkspace, response)
 
-    def list(self) -> EnterpriseWorkspaceListResponse:
-        response = self._http.request("GET", "/enterprise/workspaces")
-        return EnterpriseWorkspaceListResponse(**response)
+    def list(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> EnterpriseWorkspaceListResponse:
+        response = self._http.request("GET", "/enterprise/workspaces", options=request_options)
+        return self._http.parse(EnterpriseWorkspaceListResponse, response)
 
-    def get(self, workspace_id: str) -> EnterpriseWorkspaceDetail:
+    def get(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> EnterpriseWorkspaceDetail:
         response = self._http.request(
-            "GET", f"/enterprise/workspaces/{quote(workspace_id, safe='')}"
+            "GET", f"/enterprise/workspaces/{quote(workspace_id, safe='')}", options=request_options
         )
-        return EnterpriseWorkspaceDetail(**response)
+        return self._http.parse(EnterpriseWorkspaceDetail, response)
 
-    def delete(self, workspace_id: str) -> None:
-        self._http.request("DELETE", f"/enterprise/workspaces/{quote(workspace_id, safe='')}")
+    def delete(self, workspace_id: str, request_options: Optional[RequestOptions] = None) -> None:
+        self._http.request(
+            "DELETE",
+            f"/enterprise/workspaces/{quote(workspace_id, safe='')}",
+            options=request_options,
+        )
 
     def submit_verification(
         self,
         workspace_id: str,
         data: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -111,12 +130,14 @@ class WorkspacesSubResource:
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/verification/submit",
             body=body,
+            options=request_options,
         )
         return response
 
     def resubmit_verification(
         self,
         workspace_id: str,
+        request_options: Optional[RequestOptions] = None,
         **partial_updates: Any,
     ) -> Dict[str, Any]:
         """
@@ -128,25 +149,40 @@ class WorkspacesSubResource:
                 workspace_id, contact={"email": "new@email.com"}
             )
         """
-        return self.submit_verification(workspace_id, **partial_updates)
+        return self.submit_verification(
+            workspace_id, **partial_updates, request_options=request_options
+        )
 
-    def inherit_verification(self, workspace_id: str, source_workspace_id: str) -> Dict[str, Any]:
+    def inherit_verification(
+        self,
+        workspace_id: str,
+        source_workspace_id: str,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, Any]:
         response = self._http.request(
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/verification/inherit",
             body={"source_workspace_id": source_workspace_id},
+            options=request_options,
         )
         return response
 
-    def get_verification(self, workspace_id: str) -> Dict[str, Any]:
+    def get_verification(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         response = self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/verification",
+            options=request_options,
         )
         return response
 
     def transfer_credits(
-        self, workspace_id: str, source_workspace_id: str, amount: int
+        self,
+        workspace_id: str,
+        source_workspace_id: str,
+        amount: int,
+        request_options: Optional[RequestOptions] = None,
     ) -> TransferCreditsResult:
         response = self._http.request(
             "POST",
@@ -155,21 +191,26 @@ class WorkspacesSubResource:
                 "source_workspace_id": source_workspace_id,
                 "amount": amount,
             },
+            options=request_options,
         )
-        return TransferCreditsResult(**response)
+        return self._http.parse(TransferCreditsResult, response)
 
-    def get_credits(self, workspace_id: str) -> WorkspaceCredits:
+    def get_credits(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> WorkspaceCredits:
         response = self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/credits",
+            options=request_options,
         )
-        return WorkspaceCredits(**response)
+        return self._http.parse(WorkspaceCredits, response)
 
     def create_key(
         self,
         workspace_id: str,
         name: Optional[str] = None,
         type: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> CreatedApiKey:
         body: Dict[str, Any] = {}
         if name is not None:
@@ -181,28 +222,38 @@ class WorkspacesSubResource:
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/keys",
             body=body,
+            options=request_options,
         )
-        return CreatedApiKey(**response)
+        return self._http.parse(CreatedApiKey, response)
 
-    def list_keys(self, workspace_id: str) -> List[EnterpriseWorkspaceKey]:
+    def list_keys(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[EnterpriseWorkspaceKey]:
         response = self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/keys",
+            options=request_options,
         )
-        return [EnterpriseWorkspaceKey(**k) for k in response]
+        return self._http.parse_list(EnterpriseWorkspaceKey, response)
 
-    def revoke_key(self, workspace_id: str, key_id: str) -> None:
+    def revoke_key(
+        self, workspace_id: str, key_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         self._http.request(
             "DELETE",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/keys/{quote(key_id, safe='')}",
+            options=request_options,
         )
 
-    def list_opt_in_pages(self, workspace_id: str) -> List[OptInPage]:
+    def list_opt_in_pages(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[OptInPage]:
         response = self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/opt-in-pages",
+            options=request_options,
         )
-        return [OptInPage(**item) for item in response]
+        return self._http.parse_list(OptInPage, response)
 
     def create_opt_in_page(
         self,
@@ -211,6 +262,7 @@ class WorkspacesSubResource:
         use_case: Optional[str] = None,
         use_case_summary: Optional[str] = None,
         sample_messages: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> CreateOptInPageResult:
         body: Dict[str, Any] = {"businessName": business_name}
         if use_case is not None:
@@ -224,8 +276,9 @@ class WorkspacesSubResource:
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/opt-in-pages",
             body=body,
+            options=request_options,
         )
-        return CreateOptInPageResult(**response)
+        return self._http.parse(CreateOptInPageResult, response)
 
     def update_opt_in_page(
         self,
@@ -236,6 +289,7 @@ class WorkspacesSubResource:
         button_color: Optional[str] = None,
         custom_headline: Optional[str] = None,
         custom_benefits: Optional[List[str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> OptInPage:
         body: Dict[str, Any] = {}
         if logo_url is not None:
@@ -253,13 +307,17 @@ class WorkspacesSubResource:
             "PATCH",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/opt-in-pages/{quote(page_id, safe='')}",
             body=body,
+            options=request_options,
         )
-        return OptInPage(**response)
+        return self._http.parse(OptInPage, response)
 
-    def delete_opt_in_page(self, workspace_id: str, page_id: str) -> None:
+    def delete_opt_in_page(
+        self, workspace_id: str, page_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         self._http.request(
             "DELETE",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/opt-in-pages/{quote(page_id, safe='')}",
+            options=request_options,
         )
 
     def set_webhook(
@@ -268,6 +326,7 @@ class WorkspacesSubResource:
         url: str,
         events: Optional[List[str]] = None,
         description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> SetWorkspaceWebhookResult:
         body: Dict[str, Any] = {"url": url}
         if events is not None:
@@ -279,17 +338,26 @@ class WorkspacesSubResource:
             "PUT",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/webhooks",
             body=body,
+            options=request_options,
         )
-        return SetWorkspaceWebhookResult(**response)
+        return self._http.parse(SetWorkspaceWebhookResult, response)
 
-    def list_webhooks(self, workspace_id: str) -> List[WorkspaceWebhook]:
+    def list_webhooks(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[WorkspaceWebhook]:
         response = self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/webhooks",
+            options=request_options,
         )
-        return [WorkspaceWebhook(**item) for item in response]
+        return self._http.parse_list(WorkspaceWebhook, response)
 
-    def delete_webhooks(self, workspace_id: str, webhook_id: Optional[str] = None) -> None:
+    def delete_webhooks(
+        self,
+        workspace_id: str,
+        webhook_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> None:
         params: Dict[str, Any] = {}
         if webhook_id is not None:
             params["webhookId"] = webhook_id
@@ -298,16 +366,25 @@ class WorkspacesSubResource:
             "DELETE",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/webhooks",
             params=params if params else None,
+            options=request_options,
         )
 
-    def test_webhook(self, workspace_id: str) -> EnterpriseWebhookTestResult:
+    def test_webhook(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> EnterpriseWebhookTestResult:
         response = self._http.request(
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/webhooks/test",
+            options=request_options,
         )
-        return EnterpriseWebhookTestResult(**response)
+        return self._http.parse(EnterpriseWebhookTestResult, response)
 
-    def suspend(self, workspace_id: str, reason: Optional[str] = None) -> SuspendWorkspaceResult:
+    def suspend(
+        self,
+        workspace_id: str,
+        reason: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> SuspendWorkspaceResult:
         body: Dict[str, Any] = {}
         if reason is not None:
             body["reason"] = reason
@@ -316,92 +393,130 @@ class WorkspacesSubResource:
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/suspend",
             body=body if body else None,
+            options=request_options,
         )
-        return SuspendWorkspaceResult(**response)
+        return self._http.parse(SuspendWorkspaceResult, response)
 
-    def resume(self, workspace_id: str) -> ResumeWorkspaceResult:
+    def resume(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> ResumeWorkspaceResult:
         response = self._http.request(
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/resume",
+            options=request_options,
         )
-        return ResumeWorkspaceResult(**response)
+        return self._http.parse(ResumeWorkspaceResult, response)
 
-    def provision_bulk(self, workspaces: List[Dict[str, Any]]) -> BulkProvisionResult:
+    def provision_bulk(
+        self, workspaces: List[Dict[str, Any]], request_options: Optional[RequestOptions] = None
+    ) -> BulkProvisionResult:
         response = self._http.request(
             "POST",
             "/enterprise/workspaces/provision/bulk",
             body={"workspaces": workspaces},
+            options=request_options,
         )
-        return BulkProvisionResult(**response)
+        return self._http.parse(BulkProvisionResult, response)
 
     def set_custom_domain(
-        self, workspace_id: str, page_id: str, domain: str
+        self,
+        workspace_id: str,
+        page_id: str,
+        domain: str,
+        request_options: Optional[RequestOptions] = None,
     ) -> SetCustomDomainResult:
         response = self._http.request(
             "PUT",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/pages/{quote(page_id, safe='')}/domain",
             body={"domain": domain},
+            options=request_options,
         )
-        return SetCustomDomainResult(**response)
+        return self._http.parse(SetCustomDomainResult, response)
 
-    def send_invitation(self, workspace_id: str, email: str, role: str) -> Invitation:
+    def send_invitation(
+        self,
+        workspace_id: str,
+        email: str,
+        role: str,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Invitation:
         response = self._http.request(
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/invitations",
             body={"email": email, "role": role},
+            options=request_options,
         )
-        return Invitation(**response)
+        return self._http.parse(Invitation, response)
 
-    def list_invitations(self, workspace_id: str) -> List[Invitation]:
+    def list_invitations(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[Invitation]:
         response = self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/invitations",
+            options=request_options,
         )
-        return [Invitation(**item) for item in response]
+        return self._http.parse_list(Invitation, response)
 
-    def cancel_invitation(self, workspace_id: str, invite_id: str) -> None:
+    def cancel_invitation(
+        self, workspace_id: str, invite_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         self._http.request(
             "DELETE",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/invitations/{quote(invite_id, safe='')}",
+            options=request_options,
         )
 
-    def get_quota(self, workspace_id: str) -> QuotaSettings:
+    def get_quota(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> QuotaSettings:
         response = self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/quota",
+            options=request_options,
         )
-        return QuotaSettings(**response)
+        return self._http.parse(QuotaSettings, response)
 
-    def set_quota(self, workspace_id: str, monthly_message_quota: Optional[int]) -> QuotaSettings:
+    def set_quota(
+        self,
+        workspace_id: str,
+        monthly_message_quota: Optional[int],
+        request_options: Optional[RequestOptions] = None,
+    ) -> QuotaSettings:
         response = self._http.request(
             "PUT",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/quota",
             body={"monthlyMessageQuota": monthly_message_quota},
+            options=request_options,
         )
-        return QuotaSettings(**response)
+        return self._http.parse(QuotaSettings, response)
 
 
 class WebhooksSubResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def set(self, url: str) -> EnterpriseWebhook:
-        response = self._http.request("POST", "/enterprise/webhooks", body={"url": url})
-        return EnterpriseWebhook(**response)
+    def set(self, url: str, request_options: Optional[RequestOptions] = None) -> EnterpriseWebhook:
+        response = self._http.request(
+            "POST", "/enterprise/webhooks", body={"url": url}, options=request_options
+        )
+        return self._http.parse(EnterpriseWebhook, response)
 
-    def get(self) -> EnterpriseWebhook:
-        response = self._http.request("GET", "/enterprise/webhooks")
-        return EnterpriseWebhook(**response)
+    def get(self, request_options: Optional[RequestOptions] = None) -> EnterpriseWebhook:
+        response = self._http.request("GET", "/enterprise/webhooks", options=request_options)
+        return self._http.parse(EnterpriseWebhook, response)
 
-    def delete(self) -> None:
-        self._http.request("DELETE", "/enterprise/webhooks")
+    def delete(self, request_options: Optional[RequestOptions] = None) -> None:
+        self._http.request("DELETE", "/enterprise/webhooks", options=request_options)
 
-    def test(self) -> EnterpriseWebhookTestResult:
-        response = self._http.request("POST", "/enterprise/webhooks/test")
-        return EnterpriseWebhookTestResult(**response)
+    def test(self, request_options: Optional[RequestOptions] = None) -> EnterpriseWebhookTestResult:
+        response = self._http.request("POST", "/enterprise/webhooks/test", options=request_options)
+        return self._http.parse(EnterpriseWebhookTestResult, response)
 
-    def rotate_secret(self) -> Dict[str, Any]:
-        response = self._http.request("POST", "/enterprise/webhooks/rotate-secret")
+    def rotate_secret(self, request_options: Optional[RequestOptions] = None) -> Dict[str, Any]:
+        response = self._http.request(
+            "POST", "/enterprise/webhooks/rotate-secret", options=request_options
+        )
         return response
 
 
@@ -409,14 +524,17 @@ class AnalyticsSubResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def overview(self) -> AnalyticsOverview:
-        response = self._http.request("GET", "/enterprise/analytics/overview")
-        return AnalyticsOverview(**response)
+    def overview(self, request_options: Optional[RequestOptions] = None) -> AnalyticsOverview:
+        response = self._http.request(
+            "GET", "/enterprise/analytics/overview", options=request_options
+        )
+        return self._http.parse(AnalyticsOverview, response)
 
     def messages(
         self,
         period: Optional[str] = None,
         workspace_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> MessageAnalytics:
         params: Dict[str, Any] = {}
         if period is not None:
@@ -424,29 +542,43 @@ class AnalyticsSubResource:
         if workspace_id is not None:
             params["workspaceId"] = workspace_id
 
-        response = self._http.request("GET", "/enterprise/analytics/messages", params=params)
-        return MessageAnalytics(**response)
+        response = self._http.request(
+            "GET", "/enterprise/analytics/messages", params=params, options=request_options
+        )
+        return self._http.parse(MessageAnalytics, response)
 
-    def delivery(self) -> List[DeliveryAnalyticsItem]:
-        response = self._http.request("GET", "/enterprise/analytics/delivery")
-        return [DeliveryAnalyticsItem(**item) for item in response]
+    def delivery(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> List[DeliveryAnalyticsItem]:
+        response = self._http.request(
+            "GET", "/enterprise/analytics/delivery", options=request_options
+        )
+        return self._http.parse_list(DeliveryAnalyticsItem, response)
 
-    def credits(self, period: Optional[str] = None) -> CreditAnalytics:
+    def credits(
+        self, period: Optional[str] = None, request_options: Optional[RequestOptions] = None
+    ) -> CreditAnalytics:
         params: Dict[str, Any] = {}
         if period is not None:
             params["period"] = period
 
-        response = self._http.request("GET", "/enterprise/analytics/credits", params=params)
-        return CreditAnalytics(**response)
+        response = self._http.request(
+            "GET", "/enterprise/analytics/credits", params=params, options=request_options
+        )
+        return self._http.parse(CreditAnalytics, response)
 
 
 class SettingsSubResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def get_auto_top_up(self) -> AutoTopUpSettings:
-        response = self._http.request("GET", "/enterprise/settings/auto-top-up")
-        return AutoTopUpSettings(**response)
+    def get_auto_top_up(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> AutoTopUpSettings:
+        response = self._http.request(
+            "GET", "/enterprise/settings/auto-top-up", options=request_options
+        )
+        return self._http.parse(AutoTopUpSettings, response)
 
     def update_auto_top_up(
         self,
@@ -454,6 +586,7 @@ class SettingsSubResource:
         threshold: int,
         amount: int,
         source_workspace_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> AutoTopUpSettings:
         body: Dict[str, Any] = {
             "enabled": enabled,
@@ -463,23 +596,32 @@ class SettingsSubResource:
         if source_workspace_id is not None:
             body["sourceWorkspaceId"] = source_workspace_id
 
-        response = self._http.request("PUT", "/enterprise/settings/auto-top-up", body=body)
-        return AutoTopUpSettings(**response)
+        response = self._http.request(
+            "PUT", "/enterprise/settings/auto-top-up", body=body, options=request_options
+        )
+        return self._http.parse(AutoTopUpSettings, response)
 
 
 class CreditsSubResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def get(self) -> Dict[str, Any]:
-        response = self._http.request("GET", "/enterprise/credits")
+    def get(self, request_options: Optional[RequestOptions] = None) -> Dict[str, Any]:
+        response = self._http.request("GET", "/enterprise/credits", options=request_options)
         return response
 
-    def deposit(self, amount: int, description: Optional[str] = None) -> Dict[str, Any]:
+    def deposit(
+        self,
+        amount: int,
+        description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, Any]:
         body: Dict[str, Any] = {"amount": amount}
         if description is not None:
             body["description"] = description
-        response = self._http.request("POST", "/enterprise/credits/deposit", body=body)
+        response = self._http.request(
+            "POST", "/enterprise/credits/deposit", body=body, options=request_options
+        )
         return response
 
 
@@ -492,6 +634,7 @@ class BillingSubResource:
         period: Optional[str] = None,
         page: Optional[int] = None,
         limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> BillingBreakdown:
         params: Dict[str, Any] = {}
         if period is not None:
@@ -505,8 +648,41 @@ class BillingSubResource:
             "GET",
             "/enterprise/billing/workspace-breakdown",
             params=params if params else None,
+            options=request_options,
+        )
+        return self._http.parse(BillingBreakdown, response)
+
+    def iter_breakdown(
+        self,
+        period: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[WorkspaceBillingItem]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Paginator[WorkspaceBillingItem]:
+        """Iterate through the per-workspace billing items, fetching pages lazily"""
+
+        def fetch_page(offset: int, limit: int) -> Page[WorkspaceBillingItem]:
+            response = self.get_breakdown(
+                period=period,
+                page=offset // limit + 1,
+                limit=limit,
+                request_options=request_options,
+            )
+            items = response_field(BillingBreakdown, response, "workspaces")
+            return Page(items, offset, limit, response=response)
+
+        return Paginator(
+            fetch_page,
+            page_size,
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+            aligned=True,
         )
-        return BillingBreakdown(**response)
 
 
 class EnterpriseResource:
@@ -519,11 +695,13 @@ class EnterpriseResource:
         self.billing = BillingSubResource(http)
         self.credits = CreditsSubResource(http)
 
-    def get_account(self) -> EnterpriseAccount:
-        response = self._http.request("GET", "/enterprise/account")
-        return EnterpriseAccount(**response)
+    def get_account(self, request_options: Optional[RequestOptions] = None) -> EnterpriseAccount:
+        response = self._http.request("GET", "/enterprise/account", options=request_options)
+        return self._http.parse(EnterpriseAccount, response)
 
-    def provision(self, opts: Dict[str, Any]) -> Dict[str, Any]:
+    def provision(
+        self, opts: Dict[str, Any], request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         body: Dict[str, Any] = {"name": opts["name"]}
         if opts.get("sourceWorkspaceId"):
             body["sourceWorkspaceId"] = opts["sourceWorkspaceId"]
@@ -546,7 +724,9 @@ class EnterpriseResource:
         if opts.get("generateBusinessPage") is not None:
             body["generateBusinessPage"] = opts["generateBusinessPage"]
 
-        response = self._http.request("POST", "/enterprise/workspaces/provision", body=body)
+        response = self._http.request(
+            "POST", "/enterprise/workspaces/provision", body=body, options=request_options
+        )
         return response
 
     def generate_business_page(
@@ -558,6 +738,7 @@ class EnterpriseResource:
         contact_phone: Optional[str] = None,
         business_address: Optional[str] = None,
         social_url: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Dict[str, Any]:
         body: Dict[str, Any] = {"businessName": business_name}
         if use_case is not None:
@@ -574,7 +755,7 @@ class EnterpriseResource:
             body["socialUrl"] = social_url
 
         response = self._http.request(
-            "POST", "/enterprise/business-page/generate", body=body
+            "POST", "/enterprise/business-page/generate", body=body, options=request_options
         )
         return response
 
@@ -583,6 +764,7 @@ class EnterpriseResource:
         file_path: str,
         workspace_id: Optional[str] = None,
         verification_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Dict[str, Any]:
         import os
         import mimetypes
@@ -601,17 +783,24 @@ class EnterpriseResource:
             if verification_id is not None:
                 data["verificationId"] = verification_id
 
+            options = request_options or {}
+            organization_id = options.get("organization_id", self._http.organization_id)
             headers = {
                 "Authorization": f"Bearer {self._http.api_key}",
                 "Accept": "application/json",
             }
-            if self._http.organization_id:
-                headers["X-Organization-Id"] = self._http.organization_id
+            if organization_id:
+                headers["X-Organization-Id"] = organization_id
+            headers.update(options.get("headers") or {})
 
             url = f"{self._http.base_url}/enterprise/verification-document/upload"
-            import httpx
-            with httpx.Client(timeout=self._http.timeout) as client:
-                response = client.post(url, files=files, data=data, headers=headers)
+            response = self._http.client.post(
+                url,
+                files=files,
+                data=data,
+                headers=headers,
+                timeout=options.get("timeout") or self._http.timeout,
+            )
 
             if not response.is_success:
                 from ..errors import SendlyError
@@ -631,28 +820,52 @@ class AsyncWorkspacesSubResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def create(self, name: str, description: Optional[str] = None) -> EnterpriseWorkspace:
+    async def create(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> EnterpriseWorkspace:
         body: Dict[str, Any] = {"name": name}
         if description is not None:
             body["description"] = description
 
-        response = await self._http.request("POST", "/enterprise/workspaces", body=body)
-        return EnterpriseWorkspace(**response)
+        response = await self._http.request(
+            "POST", "/enterprise/workspaces", body=body, options=request_options
+        )
+        return self._http.parse(EnterpriseWorkspace, response)
 
-    async def list(self) -> EnterpriseWorkspaceListResponse:
-        response = await self._http.request("GET", "/enterprise/workspaces")
-        return EnterpriseWorkspaceListResponse(**response)
+    async def list(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> EnterpriseWorkspaceListResponse:
+        response = await self._http.request(
+            "GET", "/enterprise/workspaces", options=request_options
+        )
+        return self._http.parse(EnterpriseWorkspaceListResponse, response)
 
-    async def get(self, workspace_id: str) -> EnterpriseWorkspaceDetail:
+    async def get(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> EnterpriseWorkspaceDetail:
         response = await self._http.request(
-            "GET", f"/enterprise/workspaces/{quote(workspace_id, safe='')}"
+            "GET", f"/enterprise/workspaces/{quote(workspace_id, safe='')}", options=request_options
         )
-        return EnterpriseWorkspaceDetail(**response)
+        return self._http.parse(EnterpriseWorkspaceDetail, response)
 
-    async def delete(self, workspace_id: str) -> None:
-        await self._http.request("DELETE", f"/enterprise/workspaces/{quote(workspace_id, safe='')}")
+    async def delete(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
+        await self._http.request(
+            "DELETE",
+            f"/enterprise/workspaces/{quote(workspace_id, safe='')}",
+            options=request_options,
+        )
 
-    async def submit_verification(self, workspace_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def submit_verification(
+        self,
+        workspace_id: str,
+        data: Dict[str, Any],
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, Any]:
         body: Dict[str, Any] = {
             "business_name": data.get("business_name"),
             "business_type": data.get("business_type"),
@@ -671,28 +884,40 @@ class AsyncWorkspacesSubResource:
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/verification/submit",
             body=body,
+            options=request_options,
         )
         return response
 
     async def inherit_verification(
-        self, workspace_id: str, source_workspace_id: str
+        self,
+        workspace_id: str,
+        source_workspace_id: str,
+        request_options: Optional[RequestOptions] = None,
     ) -> Dict[str, Any]:
         response = await self._http.request(
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/verification/inherit",
             body={"source_workspace_id": source_workspace_id},
+            options=request_options,
         )
         return response
 
-    async def get_verification(self, workspace_id: str) -> Dict[str, Any]:
+    async def get_verification(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         response = await self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/verification",
+            options=request_options,
         )
         return response
 
     async def transfer_credits(
-        self, workspace_id: str, source_workspace_id: str, amount: int
+        self,
+        workspace_id: str,
+        source_workspace_id: str,
+        amount: int,
+        request_options: Optional[RequestOptions] = None,
     ) -> TransferCreditsResult:
         response = await self._http.request(
             "POST",
@@ -701,21 +926,26 @@ class AsyncWorkspacesSubResource:
                 "source_workspace_id": source_workspace_id,
                 "amount": amount,
             },
+            options=request_options,
         )
-        return TransferCreditsResult(**response)
+        return self._http.parse(TransferCreditsResult, response)
 
-    async def get_credits(self, workspace_id: str) -> WorkspaceCredits:
+    async def get_credits(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> WorkspaceCredits:
         response = await self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/credits",
+            options=request_options,
         )
-        return WorkspaceCredits(**response)
+        return self._http.parse(WorkspaceCredits, response)
 
     async def create_key(
         self,
         workspace_id: str,
         name: Optional[str] = None,
         type: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> CreatedApiKey:
         body: Dict[str, Any] = {}
         if name is not None:
@@ -727,28 +957,38 @@ class AsyncWorkspacesSubResource:
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/keys",
             body=body,
+            options=request_options,
         )
-        return CreatedApiKey(**response)
+        return self._http.parse(CreatedApiKey, response)
 
-    async def list_keys(self, workspace_id: str) -> List[EnterpriseWorkspaceKey]:
+    async def list_keys(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[EnterpriseWorkspaceKey]:
         response = await self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/keys",
+            options=request_options,
         )
-        return [EnterpriseWorkspaceKey(**k) for k in response]
+        return self._http.parse_list(EnterpriseWorkspaceKey, response)
 
-    async def revoke_key(self, workspace_id: str, key_id: str) -> None:
+    async def revoke_key(
+        self, workspace_id: str, key_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         await self._http.request(
             "DELETE",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/keys/{quote(key_id, safe='')}",
+            options=request_options,
         )
 
-    async def list_opt_in_pages(self, workspace_id: str) -> List[OptInPage]:
+    async def list_opt_in_pages(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[OptInPage]:
         response = await self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/opt-in-pages",
+            options=request_options,
         )
-        return [OptInPage(**item) for item in response]
+        return self._http.parse_list(OptInPage, response)
 
     async def create_opt_in_page(
         self,
@@ -757,6 +997,7 @@ class AsyncWorkspacesSubResource:
         use_case: Optional[str] = None,
         use_case_summary: Optional[str] = None,
         sample_messages: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> CreateOptInPageResult:
         body: Dict[str, Any] = {"businessName": business_name}
         if use_case is not None:
@@ -770,8 +1011,9 @@ class AsyncWorkspacesSubResource:
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/opt-in-pages",
             body=body,
+            options=request_options,
         )
-        return CreateOptInPageResult(**response)
+        return self._http.parse(CreateOptInPageResult, response)
 
     async def update_opt_in_page(
         self,
@@ -782,6 +1024,7 @@ class AsyncWorkspacesSubResource:
         button_color: Optional[str] = None,
         custom_headline: Optional[str] = None,
         custom_benefits: Optional[List[str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> OptInPage:
         body: Dict[str, Any] = {}
         if logo_url is not None:
@@ -799,13 +1042,17 @@ class AsyncWorkspacesSubResource:
             "PATCH",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/opt-in-pages/{quote(page_id, safe='')}",
             body=body,
+            options=request_options,
         )
-        return OptInPage(**response)
+        return self._http.parse(OptInPage, response)
 
-    async def delete_opt_in_page(self, workspace_id: str, page_id: str) -> None:
+    async def delete_opt_in_page(
+        self, workspace_id: str, page_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         await self._http.request(
             "DELETE",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/opt-in-pages/{quote(page_id, safe='')}",
+            options=request_options,
         )
 
     async def set_webhook(
@@ -814,6 +1061,7 @@ class AsyncWorkspacesSubResource:
         url: str,
         events: Optional[List[str]] = None,
         description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> SetWorkspaceWebhookResult:
         body: Dict[str, Any] = {"url": url}
         if events is not None:
@@ -825,17 +1073,26 @@ class AsyncWorkspacesSubResource:
             "PUT",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/webhooks",
             body=body,
+            options=request_options,
         )
-        return SetWorkspaceWebhookResult(**response)
+        return self._http.parse(SetWorkspaceWebhookResult, response)
 
-    async def list_webhooks(self, workspace_id: str) -> List[WorkspaceWebhook]:
+    async def list_webhooks(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[WorkspaceWebhook]:
         response = await self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/webhooks",
+            options=request_options,
         )
-        return [WorkspaceWebhook(**item) for item in response]
+        return self._http.parse_list(WorkspaceWebhook, response)
 
-    async def delete_webhooks(self, workspace_id: str, webhook_id: Optional[str] = None) -> None:
+    async def delete_webhooks(
+        self,
+        workspace_id: str,
+        webhook_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> None:
         params: Dict[str, Any] = {}
         if webhook_id is not None:
             params["webhookId"] = webhook_id
@@ -844,17 +1101,24 @@ class AsyncWorkspacesSubResource:
             "DELETE",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/webhooks",
             params=params if params else None,
+            options=request_options,
         )
 
-    async def test_webhook(self, workspace_id: str) -> EnterpriseWebhookTestResult:
+    async def test_webhook(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> EnterpriseWebhookTestResult:
         response = await self._http.request(
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/webhooks/test",
+            options=request_options,
         )
-        return EnterpriseWebhookTestResult(**response)
+        return self._http.parse(EnterpriseWebhookTestResult, response)
 
     async def suspend(
-        self, workspace_id: str, reason: Optional[str] = None
+        self,
+        workspace_id: str,
+        reason: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> SuspendWorkspaceResult:
         body: Dict[str, Any] = {}
         if reason is not None:
@@ -864,94 +1128,138 @@ class AsyncWorkspacesSubResource:
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/suspend",
             body=body if body else None,
+            options=request_options,
         )
-        return SuspendWorkspaceResult(**response)
+        return self._http.parse(SuspendWorkspaceResult, response)
 
-    async def resume(self, workspace_id: str) -> ResumeWorkspaceResult:
+    async def resume(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> ResumeWorkspaceResult:
         response = await self._http.request(
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/resume",
+            options=request_options,
         )
-        return ResumeWorkspaceResult(**response)
+        return self._http.parse(ResumeWorkspaceResult, response)
 
-    async def provision_bulk(self, workspaces: List[Dict[str, Any]]) -> BulkProvisionResult:
+    async def provision_bulk(
+        self, workspaces: List[Dict[str, Any]], request_options: Optional[RequestOptions] = None
+    ) -> BulkProvisionResult:
         response = await self._http.request(
             "POST",
             "/enterprise/workspaces/provision/bulk",
             body={"workspaces": workspaces},
+            options=request_options,
         )
-        return BulkProvisionResult(**response)
+        return self._http.parse(BulkProvisionResult, response)
 
     async def set_custom_domain(
-        self, workspace_id: str, page_id: str, domain: str
+        self,
+        workspace_id: str,
+        page_id: str,
+        domain: str,
+        request_options: Optional[RequestOptions] = None,
     ) -> SetCustomDomainResult:
         response = await self._http.request(
             "PUT",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/pages/{quote(page_id, safe='')}/domain",
             body={"domain": domain},
+            options=request_options,
         )
-        return SetCustomDomainResult(**response)
+        return self._http.parse(SetCustomDomainResult, response)
 
-    async def send_invitation(self, workspace_id: str, email: str, role: str) -> Invitation:
+    async def send_invitation(
+        self,
+        workspace_id: str,
+        email: str,
+        role: str,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Invitation:
         response = await self._http.request(
             "POST",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/invitations",
             body={"email": email, "role": role},
+            options=request_options,
         )
-        return Invitation(**response)
+        return self._http.parse(Invitation, response)
 
-    async def list_invitations(self, workspace_id: str) -> List[Invitation]:
+    async def list_invitations(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[Invitation]:
         response = await self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/invitations",
+            options=request_options,
         )
-        return [Invitation(**item) for item in response]
+        return self._http.parse_list(Invitation, response)
 
-    async def cancel_invitation(self, workspace_id: str, invite_id: str) -> None:
+    async def cancel_invitation(
+        self, workspace_id: str, invite_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         await self._http.request(
             "DELETE",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/invitations/{quote(invite_id, safe='')}",
+            options=request_options,
         )
 
-    async def get_quota(self, workspace_id: str) -> QuotaSettings:
+    async def get_quota(
+        self, workspace_id: str, request_options: Optional[RequestOptions] = None
+    ) -> QuotaSettings:
         response = await self._http.request(
             "GET",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/quota",
+            options=request_options,
         )
-        return QuotaSettings(**response)
+        return self._http.parse(QuotaSettings, response)
 
     async def set_quota(
-        self, workspace_id: str, monthly_message_quota: Optional[int]
+        self,
+        workspace_id: str,
+        monthly_message_quota: Optional[int],
+        request_options: Optional[RequestOptions] = None,
     ) -> QuotaSettings:
         response = await self._http.request(
             "PUT",
             f"/enterprise/workspaces/{quote(workspace_id, safe='')}/quota",
             body={"monthlyMessageQuota": monthly_message_quota},
+            options=request_options,
         )
-        return QuotaSettings(**response)
+        return self._http.parse(QuotaSettings, response)
 
 
 class AsyncWebhooksSubResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def set(self, url: str) -> EnterpriseWebhook:
-        response = await self._http.request("POST", "/enterprise/webhooks", body={"url": url})
-        return EnterpriseWebhook(**response)
+    async def set(
+        self, url: str, request_options: Optional[RequestOptions] = None
+    ) -> EnterpriseWebhook:
+        response = await self._http.request(
+            "POST", "/enterprise/webhooks", body={"url": url}, options=request_options
+        )
+        return self._http.parse(EnterpriseWebhook, response)
 
-    async def get(self) -> EnterpriseWebhook:
-        response = await self._http.request("GET", "/enterprise/webhooks")
-        return EnterpriseWebhook(**response)
+    async def get(self, request_options: Optional[RequestOptions] = None) -> EnterpriseWebhook:
+        response = await self._http.request("GET", "/enterprise/webhooks", options=request_options)
+        return self._http.parse(EnterpriseWebhook, response)
 
-    async def delete(self) -> None:
-        await self._http.request("DELETE", "/enterprise/webhooks")
+    async def delete(self, request_options: Optional[RequestOptions] = None) -> None:
+        await self._http.request("DELETE", "/enterprise/webhooks", options=request_options)
 
-    async def test(self) -> EnterpriseWebhookTestResult:
-        response = await self._http.request("POST", "/enterprise/webhooks/test")
-        return EnterpriseWebhookTestResult(**response)
+    async def test(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> EnterpriseWebhookTestResult:
+        response = await self._http.request(
+            "POST", "/enterprise/webhooks/test", options=request_options
+        )
+        return self._http.parse(EnterpriseWebhookTestResult, response)
 
-    async def rotate_secret(self) -> Dict[str, Any]:
-        response = await self._http.request("POST", "/enterprise/webhooks/rotate-secret")
+    async def rotate_secret(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
+        response = await self._http.request(
+            "POST", "/enterprise/webhooks/rotate-secret", options=request_options
+        )
         return response
 
 
@@ -959,14 +1267,17 @@ class AsyncAnalyticsSubResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def overview(self) -> AnalyticsOverview:
-        response = await self._http.request("GET", "/enterprise/analytics/overview")
-        return AnalyticsOverview(**response)
+    async def overview(self, request_options: Optional[RequestOptions] = None) -> AnalyticsOverview:
+        response = await self._http.request(
+            "GET", "/enterprise/analytics/overview", options=request_options
+        )
+        return self._http.parse(AnalyticsOverview, response)
 
     async def messages(
         self,
         period: Optional[str] = None,
         workspace_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> MessageAnalytics:
         params: Dict[str, Any] = {}
         if period is not None:
@@ -974,29 +1285,43 @@ class AsyncAnalyticsSubResource:
         if workspace_id is not None:
             params["workspaceId"] = workspace_id
 
-        response = await self._http.request("GET", "/enterprise/analytics/messages", params=params)
-        return MessageAnalytics(**response)
+        response = await self._http.request(
+            "GET", "/enterprise/analytics/messages", params=params, options=request_options
+        )
+        return self._http.parse(MessageAnalytics, response)
 
-    async def delivery(self) -> List[DeliveryAnalyticsItem]:
-        response = await self._http.request("GET", "/enterprise/analytics/delivery")
-        return [DeliveryAnalyticsItem(**item) for item in response]
+    async def delivery(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> List[DeliveryAnalyticsItem]:
+        response = await self._http.request(
+            "GET", "/enterprise/analytics/delivery", options=request_options
+        )
+        return self._http.parse_list(DeliveryAnalyticsItem, response)
 
-    async def credits(self, period: Optional[str] = None) -> CreditAnalytics:
+    async def credits(
+        self, period: Optional[str] = None, request_options: Optional[RequestOptions] = None
+    ) -> CreditAnalytics:
         params: Dict[str, Any] = {}
         if period is not None:
             params["period"] = period
 
-        response = await self._http.request("GET", "/enterprise/analytics/credits", params=params)
-        return CreditAnalytics(**response)
+        response = await self._http.request(
+            "GET", "/enterprise/analytics/credits", params=params, options=request_options
+        )
+        return self._http.parse(CreditAnalytics, response)
 
 
 class AsyncSettingsSubResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def get_auto_top_up(self) -> AutoTopUpSettings:
-        response = await self._http.request("GET", "/enterprise/settings/auto-top-up")
-        return AutoTopUpSettings(**response)
+    async def get_auto_top_up(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> AutoTopUpSettings:
+        response = await self._http.request(
+            "GET", "/enterprise/settings/auto-top-up", options=request_options
+        )
+        return self._http.parse(AutoTopUpSettings, response)
 
     async def update_auto_top_up(
         self,
@@ -1004,6 +1329,7 @@ class AsyncSettingsSubResource:
         threshold: int,
         amount: int,
         source_workspace_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> AutoTopUpSettings:
         body: Dict[str, Any] = {
             "enabled": enabled,
@@ -1013,23 +1339,32 @@ class AsyncSettingsSubResource:
         if source_workspace_id is not None:
             body["sourceWorkspaceId"] = source_workspace_id
 
-        response = await self._http.request("PUT", "/enterprise/settings/auto-top-up", body=body)
-        return AutoTopUpSettings(**response)
+        response = await self._http.request(
+            "PUT", "/enterprise/settings/auto-top-up", body=body, options=request_options
+        )
+        return self._http.parse(AutoTopUpSettings, response)
 
 
 class AsyncCreditsSubResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def get(self) -> Dict[str, Any]:
-        response = await self._http.request("GET", "/enterprise/credits")
+    async def get(self, request_options: Optional[RequestOptions] = None) -> Dict[str, Any]:
+        response = await self._http.request("GET", "/enterprise/credits", options=request_options)
         return response
 
-    async def deposit(self, amount: int, description: Optional[str] = None) -> Dict[str, Any]:
+    async def deposit(
+        self,
+        amount: int,
+        description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, Any]:
         body: Dict[str, Any] = {"amount": amount}
         if description is not None:
             body["description"] = description
-        response = await self._http.request("POST", "/enterprise/credits/deposit", body=body)
+        response = await self._http.request(
+            "POST", "/enterprise/credits/deposit", body=body, options=request_options
+        )
         return response
 
 
@@ -1042,6 +1377,7 @@ class AsyncBillingSubResource:
         period: Optional[str] = None,
         page: Optional[int] = None,
         limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> BillingBreakdown:
         params: Dict[str, Any] = {}
         if period is not None:
@@ -1055,8 +1391,41 @@ class AsyncBillingSubResource:
             "GET",
             "/enterprise/billing/workspace-breakdown",
             params=params if params else None,
+            options=request_options,
+        )
+        return self._http.parse(BillingBreakdown, response)
+
+    def iter_breakdown(
+        self,
+        period: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[WorkspaceBillingItem]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncPaginator[WorkspaceBillingItem]:
+        """Iterate through the per-workspace billing items (async)"""
+
+        async def fetch_page(offset: int, limit: int) -> Page[WorkspaceBillingItem]:
+            response = await self.get_breakdown(
+                period=period,
+                page=offset // limit + 1,
+                limit=limit,
+                request_options=request_options,
+            )
+            items = response_field(BillingBreakdown, response, "workspaces")
+            return Page(items, offset, limit, response=response)
+
+        return AsyncPaginator(
+            fetch_page,
+            page_size,
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+            aligned=True,
         )
-        return BillingBreakdown(**response)
 
 
 class AsyncEnterpriseResource:
@@ -1069,11 +1438,15 @@ class AsyncEnterpriseResource:
         self.billing = AsyncBillingSubResource(http)
         self.credits = AsyncCreditsSubResource(http)
 
-    async def get_account(self) -> EnterpriseAccount:
-        response = await self._http.request("GET", "/enterprise/account")
-        return EnterpriseAccount(**response)
+    async def get_account(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> EnterpriseAccount:
+        response = await self._http.request("GET", "/enterprise/account", options=request_options)
+        return self._http.parse(EnterpriseAccount, response)
 
-    async def provision(self, opts: Dict[str, Any]) -> Dict[str, Any]:
+    async def provision(
+        self, opts: Dict[str, Any], request_options: Optional[RequestOptions] = None
+    ) -> Dict[str, Any]:
         body: Dict[str, Any] = {"name": opts["name"]}
         if opts.get("sourceWorkspaceId"):
             body["sourceWorkspaceId"] = opts["sourceWorkspaceId"]
@@ -1096,7 +1469,9 @@ class AsyncEnterpriseResource:
         if opts.get("generateBusinessPage") is not None:
             body["generateBusinessPage"] = opts["generateBusinessPage"]
 
-        response = await self._http.request("POST", "/enterprise/workspaces/provision", body=body)
+        response = await self._http.request(
+            "POST", "/enterprise/workspaces/provision", body=body, options=request_options
+        )
         return response
 
     async def generate_business_page(
@@ -1108,6 +1483,7 @@ class AsyncEnterpriseResource:
         contact_phone: Optional[str] = None,
         business_address: Optional[str] = None,
         social_url: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Dict[str, Any]:
         body: Dict[str, Any] = {"businessName": business_name}
         if use_case is not None:
@@ -1124,7 +1500,7 @@ class AsyncEnterpriseResource:
             body["socialUrl"] = social_url
 
         response = await self._http.request(
-            "POST", "/enterprise/business-page/generate", body=body
+            "POST", "/enterprise/business-page/generate", body=body, options=request_options
         )
         return response
 
@@ -1133,6 +1509,7 @@ class AsyncEnterpriseResource:
         file_path: str,
         workspace_id: Optional[str] = None,
         verification_id: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Dict[str, Any]:
         import os
         import mimetypes
@@ -1152,17 +1529,24 @@ class AsyncEnterpriseResource:
         if verification_id is not None:
             data["verificationId"] = verification_id
 
+        options = request_options or {}
+        organization_id = options.get("organization_id", self._http.organization_id)
         headers = {
             "Authorization": f"Bearer {self._http.api_key}",
             "Accept": "application/json",
         }
-        if self._http.organization_id:
-            headers["X-Organization-Id"] = self._http.organization_id
+        if organization_id:
+            headers["X-Organization-Id"] = organization_id
+        headers.update(options.get("headers") or {})
 
         url = f"{self._http.base_url}/enterprise/verification-document/upload"
-        import httpx
-        async with httpx.AsyncClient(timeout=self._http.timeout) as client:
-            response = await client.post(url, files=files, data=data, headers=headers)
+        response = await self._http.client.post(
+            url,
+            files=files,
+            data=data,
+            headers=headers,
+            timeout=options.get("timeout") or self._http.timeout,
+        )
 
         if not response.is_success:
             from ..errors import SendlyError
@@ -1,14 +1,11 @@
 from typing import Any, Dict, Optional
 from urllib.parse import quote
 
-from pydantic import ValidationError as PydanticValidationError
-
-from ..errors import SendlyError
 from ..types import (
     Label,
     LabelListResponse,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
 
 
 class LabelsResource:
@@ -20,6 +17,7 @@ class LabelsResource:
         name: str,
         color: Optional[str] = None,
         description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Label:
         body: Dict[str, Any] = {"name": name}
         if color is not None:
@@ -31,36 +29,25 @@ class LabelsResource:
             method="POST",
             path="/labels",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Label(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Label, data)
 
-    def list(self) -> LabelListResponse:
+    def list(self, request_options: Optional[RequestOptions] = None) -> LabelListResponse:
         data = self._http.request(
             method="GET",
             path="/labels",
+            options=request_options,
         )
 
-        try:
-            return LabelListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(LabelListResponse, data)
 
-    def delete(self, id: str) -> None:
+    def delete(self, id: str, request_options: Optional[RequestOptions] = None) -> None:
         self._http.request(
             method="DELETE",
             path=f"/labels/{quote(id, safe='')}",
+            options=request_options,
         )
 
 
@@ -73,6 +60,7 @@ class AsyncLabelsResource:
         name: str,
         color: Optional[str] = None,
         description: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Label:
         body: Dict[str, Any] = {"name": name}
         if color is not None:
@@ -84,34 +72,23 @@ class AsyncLabelsResource:
             method="POST",
             path="/labels",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Label(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Label, data)
 
-    async def list(self) -> LabelListResponse:
+    async def list(self, request_options: Optional[RequestOptions] = None) -> LabelListResponse:
         data = await self._http.request(
             method="GET",
             path="/labels",
+            options=request_options,
         )
 
-        try:
-            return LabelListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(LabelListResponse, data)
 
-    async def delete(self, id: str) -> None:
+    async def delete(self, id: str, request_options: Optional[RequestOptions] = None) -> None:
         await self._http.request(
             method="DELETE",
             path=f"/labels/{quote(id, safe='')}",
+            options=request_options,
         )
@@ -6,11 +6,8 @@ API resource for uploading media files for MMS.
 
 from typing import Any, BinaryIO, Optional
 
-from pydantic import ValidationError as PydanticValidationError
-
-from ..errors import SendlyError
 from ..types import MediaFile
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
 
 
 class MediaResource:
@@ -27,13 +24,19 @@ class MediaResource:
     def __init__(self, http: HttpClient) -> None:
         self._http = http
 
-    def upload(self, file: BinaryIO, content_type: str = "image/jpeg") -> MediaFile:
+    def upload(
+        self,
+        file: BinaryIO,
+        content_type: str = "image/jpeg",
+        request_options: Optional[RequestOptions] = None,
+    ) -> MediaFile:
         """
         Upload a media file for use in MMS messages
 
         Args:
             file: File-like object to upload
             content_type: MIME type of the file (default: image/jpeg)
+            request_options: Per-call overrides (organization, headers, timeout)
 
         Returns:
             The uploaded media file details
@@ -53,27 +56,21 @@ class MediaResource:
             ... )
         """
         filename = getattr(file, "name", "upload")
+        options = request_options or {}
+        headers = self._http._build_headers(options=options)
+        # Let httpx set the multipart Content-Type (with boundary)
+        headers.pop("Content-Type", None)
         response = self._http.client.post(
-            "/media",
+            f"{self._http.base_url}/media",
             files={"file": (filename, file, content_type)},
-            headers={
-                "Authorization": f"Bearer {self._http.api_key}",
-                "Accept": "application/json",
-                "User-Agent": self._http.client.headers.get("User-Agent", ""),
-            },
+            headers=headers,
+            timeout=options.get("timeout") or self._http.timeout,
         )
 
         self._http._update_rate_limit_info(response.headers)
         data = self._http._parse_response(response)
 
-        try:
-            return MediaFile(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MediaFile, data)
 
 
 class AsyncMediaResource:
@@ -90,13 +87,19 @@ class AsyncMediaResource:
     def __init__(self, http: AsyncHttpClient) -> None:
         self._http = http
 
-    async def upload(self, file: BinaryIO, content_type: str = "image/jpeg") -> MediaFile:
+    async def upload(
+        self,
+        file: BinaryIO,
+        content_type: str = "image/jpeg",
+        request_options: Optional[RequestOptions] = None,
+    ) -> MediaFile:
         """
         Upload a media file for use in MMS messages (async)
 
         Args:
             file: File-like object to upload
             content_type: MIME type of the file (default: image/jpeg)
+            request_options: Per-call overrides (organization, headers, timeout)
 
         Returns:
             The uploaded media file details
@@ -111,24 +114,18 @@ class AsyncMediaResource:
             ... )
         """
         filename = getattr(file, "name", "upload")
+        options = request_options or {}
+        headers = self._http._build_headers(options=options)
+        # Let httpx set the multipart Content-Type (with boundary)
+        headers.pop("Content-Type", None)
         response = await self._http.client.post(
-            "/media",
+            f"{self._http.base_url}/media",
             files={"file": (filename, file, content_type)},
-            headers={
-                "Authorization": f"Bearer {self._http.api_key}",
-                "Accept": "application/json",
-                "User-Agent": self._http.client.headers.get("User-Agent", ""),
-            },
+            headers=headers,
+            timeout=options.get("timeout") or self._http.timeout,
         )
 
         self._http._update_rate_limit_info(response.headers)
         data = self._http._parse_response(response)
 
-        try:
-            return MediaFile(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MediaFile, data)
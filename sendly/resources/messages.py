@@ -4,24 +4,53 @@ Messages Resource
 API resource for sending and managing SMS messages.
 """
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import inspect
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import quote
 
-from pydantic import ValidationError as PydanticValidationError
-
 from ..errors import SendlyError
 from ..types import (
     BatchListResponse,
     BatchMessageResponse,
+    BatchUpdate,
     CancelledMessageResponse,
+    Credits,
     ListMessagesOptions,
     Message,
     MessageListResponse,
     ScheduledMessage,
     ScheduledMessageListResponse,
     SendMessageRequest,
+    SendResult,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.batching import (
+    MAX_BATCH_SIZE,
+    AsyncBatchStream,
+    BatchStream,
+    aiter_chunks,
+    iter_chunks,
+)
+from ..utils.concurrency import Outcome, async_bounded_map, bounded_map
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
+from ..utils.models import response_field
+from ..utils.pagination import AsyncPaginator, CursorTypes, Page, Paginator
+from ..utils.polling import BatchPoller
+from ..utils.preflight import BatchPreflight, preflight_batch
+from ..utils.pricing import EncodingOptimizer, apply_encoding_optimization
 from ..utils.validation import (
     validate_limit,
     validate_message_id,
@@ -29,6 +58,71 @@ from ..utils.validation import (
     validate_phone_number,
     validate_sender_id,
 )
+from .account import AccountResource, AsyncAccountResource
+
+# Accepted spellings for send_many items: send() kwargs or API (camelCase) keys
+_SEND_ITEM_KEYS = {
+    "to": "to",
+    "text": "text",
+    "from_": "from_",
+    "from": "from_",
+    "message_type": "message_type",
+    "messageType": "message_type",
+    "metadata": "metadata",
+    "media_urls": "media_urls",
+    "mediaUrls": "media_urls",
+    "idempotency_key": "idempotency_key",
+    "idempotencyKey": "idempotency_key",
+}
+
+
+def _send_kwargs(
+    item: Dict[str, Any],
+    from_: Optional[str],
+    message_type: Optional[str],
+) -> Dict[str, Any]:
+    """Map a send_many item to send() keyword arguments"""
+    kwargs: Dict[str, Any] = {"from_": from_, "message_type": message_type}
+    for key, value in item.items():
+        name = _SEND_ITEM_KEYS.get(key)
+        if name is None:
+            raise SendlyError(
+                message=f"Unknown message field: {key}",
+                code="invalid_request",
+                status_code=400,
+            )
+        if value is not None:
+            kwargs[name] = value
+    return kwargs
+
+
+def _fan_out_options(
+    request_options: Optional[RequestOptions], position: int
+) -> Optional[RequestOptions]:
+    """
+    Request options for one call of a fan-out (send_many, send_batch_stream)
+
+    A shared ``idempotency_key`` would make every call after the first a
+    replay of it, so each call gets ``"<key>:<position>"`` instead.
+    """
+    key = request_options.get("idempotency_key") if request_options else None
+    if not request_options or not key:
+        return request_options
+    options = request_options.copy()
+    options["idempotency_key"] = f"{key}:{position}"
+    return options
+
+
+def _send_result(outcome: Outcome) -> SendResult:
+    """Turn a bounded_map outcome into a SendResult, re-raising non-API errors"""
+    if outcome.error is not None and not isinstance(outcome.error, SendlyError):
+        raise outcome.error
+    return SendResult(
+        index=outcome.position,
+        request=outcome.item,
+        message=outcome.result,
+        error=outcome.error,
+    )
 
 
 class MessagesResource:
@@ -44,6 +138,9 @@ class MessagesResource:
 
     def __init__(self, http: HttpClient):
         self._http = http
+        self._account = AccountResource(http)
+        # Organization ID -> (fetched at, available credits) for preflight_batch
+        self._balances: Dict[Optional[str], Tuple[float, int]] = {}
 
     def send(
         self,
@@ -53,6 +150,9 @@ class MessagesResource:
         message_type: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         media_urls: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None,
+        optimize_encoding: EncodingOptimizer = False,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> Message:
         """
@@ -64,6 +164,11 @@ class MessagesResource:
             from_: Optional sender ID or phone number
             message_type: Message type for compliance - 'marketing' (default, subject to quiet hours) or 'transactional' (24/7)
             metadata: Custom JSON metadata to attach to the message (max 4KB)
+            idempotency_key: Key identifying this send so a retry can't deliver it
+                twice (generated automatically when omitted)
+            optimize_encoding: Rewrite smart quotes, dashes and similar characters
+                to GSM-7 look-alikes when that saves segments; pass a callable to
+                also receive the EncodingOptimization report
 
         Returns:
             The created message
@@ -82,6 +187,8 @@ class MessagesResource:
             >>> print(message.id)
             >>> print(message.status)
         """
+        text = apply_encoding_optimization(text, to, optimize_encoding)
+
         # Validate inputs
         validate_phone_number(to)
         validate_message_text(text)
@@ -107,20 +214,16 @@ class MessagesResource:
             method="POST",
             path="/messages",
             body=body,
+            idempotency_key=idempotency_key,
+            options=request_options,
         )
 
-        try:
-            return Message(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Message, data)
 
     def list(
         self,
         limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> MessageListResponse:
         """
@@ -154,18 +257,12 @@ class MessagesResource:
             method="GET",
             path="/messages",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return MessageListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageListResponse, data)
 
-    def get(self, id: str) -> Message:
+    def get(self, id: str, request_options: Optional[RequestOptions] = None) -> Message:
         """
         Get a specific message by ID
 
@@ -192,65 +289,67 @@ class MessagesResource:
         data = self._http.request(
             method="GET",
             path=f"/messages/{quote(id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return Message(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Message, data)
 
     def list_all(
         self,
         batch_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Message]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
-    ):
+    ) -> Paginator[Message]:
         """
         Iterate through all messages with automatic pagination
 
         Args:
             batch_size: Number of messages to fetch per request (max 100)
+            prefetch: Number of page requests to keep in flight (default 1,
+                one page at a time). Pages are still yielded in order, and at
+                most ``prefetch`` pages are buffered.
+            max_items: Stop after this many messages
+            cursor: PageCursor (or encoded token) to resume from
+            on_page: Called with each Page before its messages are yielded
 
-        Yields:
-            Message objects one at a time
+        Returns:
+            A Paginator yielding Message objects one at a time
 
         Raises:
             AuthenticationError: If the API key is invalid
             RateLimitError: If rate limit is exceeded
 
         Example:
-            >>> for message in client.messages.list_all():
+            >>> for message in client.messages.list_all(prefetch=4):
             ...     print(f'{message.id}: {message.status}')
         """
-        batch_size = min(batch_size, 100)
-        offset = 0
 
-        while True:
+        def fetch_page(offset: int, limit: int) -> Page[Message]:
             data = self._http.request(
                 method="GET",
                 path="/messages",
-                params={"limit": batch_size, "offset": offset},
+                params={"limit": limit, "offset": offset},
+                options=request_options,
             )
 
-            try:
-                response = MessageListResponse(**data)
-            except PydanticValidationError as e:
-                raise SendlyError(
-                    message=f"Invalid API response format: {e}",
-                    code="invalid_response",
-                    status_code=200,
-                ) from e
-
-            for message in response.data:
-                yield message
-
-            if len(response.data) < batch_size:
-                break
+            response = self._http.parse(MessageListResponse, data)
+            items = response_field(MessageListResponse, response, "data")
+            return Page(items, offset, limit, response=response)
+
+        return Paginator(
+            fetch_page,
+            min(batch_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
 
-            offset += batch_size
+    iter_all = list_all
 
     # =========================================================================
     # Scheduled Messages
@@ -264,6 +363,9 @@ class MessagesResource:
         from_: Optional[str] = None,
         message_type: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        optimize_encoding: EncodingOptimizer = False,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> ScheduledMessage:
         """
@@ -276,6 +378,11 @@ class MessagesResource:
             from_: Optional sender ID (for international destinations only)
             message_type: Message type for compliance - 'marketing' (default, subject to quiet hours) or 'transactional' (24/7)
             metadata: Custom JSON metadata to attach to the message (max 4KB)
+            idempotency_key: Key identifying this send so a retry can't deliver it
+                twice (generated automatically when omitted)
+            optimize_encoding: Rewrite smart quotes, dashes and similar characters
+                to GSM-7 look-alikes when that saves segments; pass a callable to
+                also receive the EncodingOptimization report
 
         Returns:
             The scheduled message
@@ -289,6 +396,7 @@ class MessagesResource:
             >>> print(scheduled.id)
             >>> print(scheduled.status)
         """
+        text = apply_encoding_optimization(text, to, optimize_encoding)
         validate_phone_number(to)
         validate_message_text(text)
         if from_:
@@ -310,22 +418,18 @@ class MessagesResource:
             method="POST",
             path="/messages/schedule",
             body=body,
+            idempotency_key=idempotency_key,
+            options=request_options,
         )
 
-        try:
-            return ScheduledMessage(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ScheduledMessage, data)
 
     def list_scheduled(
         self,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> ScheduledMessageListResponse:
         """
@@ -353,18 +457,55 @@ class MessagesResource:
             method="GET",
             path="/messages/scheduled",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return ScheduledMessageListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ScheduledMessageListResponse, data)
+
+    def iter_scheduled(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[ScheduledMessage]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Paginator[ScheduledMessage]:
+        """
+        Iterate through all scheduled messages with automatic pagination
+
+        Args:
+            status: Filter by status
+            page_size: Number of scheduled messages to fetch per request (max 100)
+            prefetch: Number of page requests to keep in flight
+            max_items: Stop after this many scheduled messages
+            cursor: PageCursor (or encoded token) to resume from
+            on_page: Called with each Page before its items are yielded
+
+        Returns:
+            A Paginator yielding ScheduledMessage objects
+        """
 
-    def get_scheduled(self, id: str) -> ScheduledMessage:
+        def fetch_page(offset: int, limit: int) -> Page[ScheduledMessage]:
+            response = self.list_scheduled(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            items = response_field(ScheduledMessageListResponse, response, "data")
+            return Page(items, offset, limit, response=response)
+
+        return Paginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
+
+    def get_scheduled(
+        self, id: str, request_options: Optional[RequestOptions] = None
+    ) -> ScheduledMessage:
         """
         Get a specific scheduled message by ID
 
@@ -379,18 +520,14 @@ class MessagesResource:
         data = self._http.request(
             method="GET",
             path=f"/messages/scheduled/{quote(id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return ScheduledMessage(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ScheduledMessage, data)
 
-    def cancel_scheduled(self, id: str) -> CancelledMessageResponse:
+    def cancel_scheduled(
+        self, id: str, request_options: Optional[RequestOptions] = None
+    ) -> CancelledMessageResponse:
         """
         Cancel a scheduled message
 
@@ -405,16 +542,10 @@ class MessagesResource:
         data = self._http.request(
             method="DELETE",
             path=f"/messages/scheduled/{quote(id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return CancelledMessageResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(CancelledMessageResponse, data)
 
     # =========================================================================
     # Batch Messages
@@ -426,6 +557,9 @@ class MessagesResource:
         from_: Optional[str] = None,
         message_type: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        optimize_encoding: EncodingOptimizer = False,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> BatchMessageResponse:
         """
@@ -436,6 +570,11 @@ class MessagesResource:
             from_: Optional sender ID (for international destinations only)
             message_type: Message type for compliance - 'marketing' (default, subject to quiet hours) or 'transactional' (24/7)
             metadata: Shared metadata for all messages in the batch (max 4KB). Per-message metadata takes priority when merging.
+            idempotency_key: Key identifying this batch so a retry can't send it
+                twice (generated automatically when omitted)
+            optimize_encoding: Rewrite each message's smart quotes, dashes and
+                similar characters to GSM-7 look-alikes when that saves segments;
+                pass a callable to also receive each EncodingOptimization report
 
         Returns:
             Batch response with individual message results
@@ -464,6 +603,17 @@ class MessagesResource:
                 status_code=400,
             )
 
+        if optimize_encoding:
+            messages = [
+                {
+                    **msg,
+                    "text": apply_encoding_optimization(
+                        msg.get("text", ""), msg.get("to"), optimize_encoding
+                    ),
+                }
+                for msg in messages
+            ]
+
         for msg in messages:
             validate_phone_number(msg.get("to", ""))
             validate_message_text(msg.get("text", ""))
@@ -483,18 +633,15 @@ class MessagesResource:
             method="POST",
             path="/messages/batch",
             body=body,
+            idempotency_key=idempotency_key,
+            options=request_options,
         )
 
-        try:
-            return BatchMessageResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(BatchMessageResponse, data)
 
-    def get_batch(self, batch_id: str) -> BatchMessageResponse:
+    def get_batch(
+        self, batch_id: str, request_options: Optional[RequestOptions] = None
+    ) -> BatchMessageResponse:
         """
         Get batch status and results
 
@@ -514,22 +661,17 @@ class MessagesResource:
         data = self._http.request(
             method="GET",
             path=f"/messages/batch/{quote(batch_id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return BatchMessageResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(BatchMessageResponse, data)
 
     def list_batches(
         self,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> BatchListResponse:
         """
@@ -557,22 +699,58 @@ class MessagesResource:
             method="GET",
             path="/messages/batches",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return BatchListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(BatchListResponse, data)
+
+    def iter_batches(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[BatchMessageResponse]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Paginator[BatchMessageResponse]:
+        """
+        Iterate through all batches with automatic pagination
+
+        Args:
+            status: Filter by status
+            page_size: Number of batches to fetch per request (max 100)
+            prefetch: Number of page requests to keep in flight
+            max_items: Stop after this many batches
+            cursor: PageCursor (or encoded token) to resume from
+            on_page: Called with each Page before its items are yielded
+
+        Returns:
+            A Paginator yielding BatchMessageResponse objects
+        """
+
+        def fetch_page(offset: int, limit: int) -> Page[BatchMessageResponse]:
+            response = self.list_batches(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            items = response_field(BatchListResponse, response, "data")
+            return Page(items, offset, limit, response=response)
+
+        return Paginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
 
     def preview_batch(
         self,
         messages: List[Dict[str, str]],
         from_: Optional[str] = None,
         message_type: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -627,7 +805,296 @@ class MessagesResource:
             method="POST",
             path="/messages/batch/preview",
             body=body,
+            options=request_options,
+        )
+
+    def preflight_batch(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        from_: Optional[str] = None,
+        balance: Optional[int] = None,
+        balance_max_age: float = 60.0,
+        request_options: Optional[RequestOptions] = None,
+    ) -> BatchPreflight:
+        """
+        Preview a batch locally, without a request per 1000 messages
+
+        Validates recipients and text, counts segments, prices each message
+        by its destination's tier and compares the total with your available
+        credits, the way :meth:`preview_batch` does, but in memory and with
+        no size limit. The balance comes from ``account.get_credits()`` and
+        is cached per organization and reused for ``balance_max_age``
+        seconds, so it can lag recent sends; use :meth:`preview_batch` for
+        an authoritative check.
+
+        Args:
+            messages: Message dicts with 'to' and 'text' keys
+            from_: Optional sender ID to validate
+            balance: Credit balance to check against (skips fetching it)
+            balance_max_age: Seconds a fetched balance is reused (0 refetches)
+
+        Returns:
+            A BatchPreflight with ``can_send``, ``credits_needed``, per-country
+            credits and the positions and reasons of blocked messages
+
+        Example:
+            >>> check = client.messages.preflight_batch(rows)
+            >>> if not check.can_send:
+            ...     print(check.credits_needed, check.balance, check.errors())
+        """
+        if from_:
+            validate_sender_id(from_)
+        if balance is None:
+            options = request_options or {}
+            organization_id = options.get("organization_id", self._http.organization_id)
+            now = time.monotonic()
+            cached = self._balances.get(organization_id)
+            if cached is None or now - cached[0] >= balance_max_age:
+                credits = self._account.get_credits(request_options=request_options)
+                cached = (now, response_field(Credits, credits, "available_balance"))
+                self._balances[organization_id] = cached
+            balance = cached[1]
+        return preflight_batch(messages, balance)
+
+    def send_batch_stream(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        chunk_size: int = MAX_BATCH_SIZE,
+        max_chunk_bytes: Optional[int] = None,
+        window: int = 4,
+        from_: Optional[str] = None,
+        message_type: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> BatchStream:
+        """
+        Send an unbounded stream of messages as consecutive batches
+
+        Consumes ``messages`` lazily (e.g. straight from a database cursor),
+        packs them into chunks of up to ``chunk_size`` messages (and
+        optionally ``max_chunk_bytes`` of request body), and submits up to
+        ``window`` chunks concurrently with :meth:`send_batch`. Memory stays
+        bounded at roughly one window of chunks.
+
+        A chunk that fails (including validation of any message in it) is
+        recorded in ``summary.errors`` and the stream carries on.
+
+        Args:
+            messages: Message dicts with 'to' and 'text' keys (and optional
+                per-message 'metadata')
+            chunk_size: Messages per batch (1-1000, default 1000)
+            max_chunk_bytes: Optional cap on each batch's encoded body size
+            window: Maximum batches in flight (default 4)
+            from_: Optional sender ID for every batch
+            message_type: Message type for every batch
+            metadata: Shared metadata for every batch
+            request_options: Options for every batch; an ``idempotency_key``
+                becomes ``"<key>:<position>"`` for each chunk
+
+        Returns:
+            A BatchStream yielding each BatchMessageResponse as it completes,
+            with running totals in ``stream.summary``
+
+        Example:
+            >>> rows = ({'to': r.phone, 'text': r.text} for r in cursor)
+            >>> stream = client.messages.send_batch_stream(rows, window=8)
+            >>> for batch in stream:
+            ...     print(f'{batch.batch_id}: {batch.queued} queued')
+            >>> print(stream.summary.queued, stream.summary.credits_used)
+        """
+
+        def send_chunk(position: int, chunk: List[Dict[str, Any]]) -> BatchMessageResponse:
+            return self.send_batch(
+                chunk,
+                from_=from_,
+                message_type=message_type,
+                metadata=metadata,
+                request_options=_fan_out_options(request_options, position),
+            )
+
+        chunks = iter_chunks(messages, chunk_size, max_chunk_bytes)
+        return BatchStream(bounded_map(send_chunk, chunks, window, with_position=True))
+
+    # =========================================================================
+    # Waiting for Batches
+    # =========================================================================
+
+    def iter_batch_updates(
+        self,
+        batch_ids: Union[str, Iterable[str]],
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        requests_per_second: float = 5.0,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[BatchUpdate]:
+        """
+        Poll batches until they finish, yielding each poll as it happens
+
+        Each batch is polled every ``poll_interval`` seconds while its results
+        are moving; polls that show no progress back off towards
+        ``max_interval``. Polls of all batches share one budget of
+        ``requests_per_second``, so waiting on hundreds of batches stays cheap.
+
+        Args:
+            batch_ids: One batch ID or several
+            timeout: Seconds to wait overall (default: no limit)
+            poll_interval: Seconds between polls while a batch progresses
+            max_interval: Longest gap between polls of a quiet batch
+            requests_per_second: Cap on get_batch calls across all batches
+
+        Yields:
+            A BatchUpdate per poll, with the message results that changed
+            since that batch's previous poll
+
+        Raises:
+            TimeoutError: If batches are still processing after ``timeout``
+
+        Example:
+            >>> for update in client.messages.iter_batch_updates(batch_ids):
+            ...     for result in update.changed:
+            ...         print(result.to, result.status)
+        """
+        poller = BatchPoller(
+            batch_ids,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_interval=max_interval,
+            requests_per_second=requests_per_second,
         )
+        while poller.pending:
+            batch_id, wait = poller.next()
+            if wait:
+                time.sleep(wait)
+            batch = self.get_batch(batch_id, request_options=request_options)
+            yield poller.update(batch_id, batch)
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        on_update: Optional[Callable[[BatchUpdate], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> BatchMessageResponse:
+        """
+        Wait until a batch reaches a final status
+
+        Args:
+            batch_id: Batch ID
+            timeout: Seconds to wait (default: no limit)
+            poll_interval: Seconds between polls while the batch progresses
+            max_interval: Longest gap between polls once progress stalls
+            on_update: Called with each BatchUpdate, e.g. to stream
+                per-message results as they change
+
+        Returns:
+            The finished batch
+
+        Raises:
+            TimeoutError: If the batch is still processing after ``timeout``
+
+        Example:
+            >>> batch = client.messages.send_batch(messages)
+            >>> done = client.messages.wait_for_batch(batch.batch_id, timeout=300)
+            >>> print(done.status, done.sent, done.failed)
+        """
+        return self.wait_for_batches(
+            [batch_id],
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_interval=max_interval,
+            on_update=on_update,
+            request_options=request_options,
+        )[batch_id]
+
+    def wait_for_batches(
+        self,
+        batch_ids: Iterable[str],
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        requests_per_second: float = 5.0,
+        on_update: Optional[Callable[[BatchUpdate], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, BatchMessageResponse]:
+        """
+        Wait until every batch reaches a final status
+
+        See :meth:`iter_batch_updates` for how polls are scheduled.
+
+        Returns:
+            The finished batches by batch ID
+        """
+        finished: Dict[str, BatchMessageResponse] = {}
+        for update in self.iter_batch_updates(
+            batch_ids,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_interval=max_interval,
+            requests_per_second=requests_per_second,
+            request_options=request_options,
+        ):
+            if on_update is not None:
+                on_update(update)
+            if update.done:
+                finished[update.batch_id] = update.batch
+        return finished
+
+    # =========================================================================
+    # Concurrent Sending
+    # =========================================================================
+
+    def send_many(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        concurrency: int = 10,
+        ordered: bool = False,
+        from_: Optional[str] = None,
+        message_type: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Iterator[SendResult]:
+        """
+        Send individually personalised messages with bounded concurrency
+
+        Each item is sent with :meth:`send` from a pool of ``concurrency``
+        worker threads. Input is consumed lazily, so generators of any size
+        are fine; at most ``concurrency`` messages are in flight or buffered
+        at once. Requests go through the client's retry and rate limiting, and
+        a failed message is reported in its result instead of stopping the run.
+
+        Args:
+            messages: Dicts with 'to' and 'text' keys, plus optional 'from',
+                'message_type', 'metadata', 'media_urls' and 'idempotency_key'
+                (API camelCase spellings are accepted too)
+            concurrency: Maximum messages in flight (default 10)
+            ordered: Yield results in input order instead of completion order
+            from_: Default sender ID for items that don't set one
+            message_type: Default message type for items that don't set one
+            request_options: Options for every send; an ``idempotency_key``
+                becomes ``"<key>:<position>"`` for each item
+
+        Yields:
+            A SendResult per message, with either ``message`` or ``error`` set
+
+        Example:
+            >>> recipients = [{'to': '+15551234567', 'text': 'Hi Ada!'}, ...]
+            >>> for result in client.messages.send_many(recipients, concurrency=20):
+            ...     if not result.ok:
+            ...         print(f'{result.request["to"]}: {result.error}')
+        """
+
+        def send_one(position: int, item: Dict[str, Any]) -> Message:
+            return self.send(
+                **_send_kwargs(item, from_, message_type),
+                request_options=_fan_out_options(request_options, position),
+            )
+
+        for outcome in bounded_map(
+            send_one, messages, concurrency, ordered=ordered, with_position=True
+        ):
+            yield _send_result(outcome)
 
 
 class AsyncMessagesResource:
@@ -642,6 +1109,9 @@ class AsyncMessagesResource:
 
     def __init__(self, http: AsyncHttpClient):
         self._http = http
+        self._account = AsyncAccountResource(http)
+        # Organization ID -> (fetched at, available credits) for preflight_batch
+        self._balances: Dict[Optional[str], Tuple[float, int]] = {}
 
     async def send(
         self,
@@ -651,6 +1121,9 @@ class AsyncMessagesResource:
         message_type: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         media_urls: Optional[List[str]] = None,
+        idempotency_key: Optional[str] = None,
+        optimize_encoding: EncodingOptimizer = False,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> Message:
         """
@@ -662,6 +1135,11 @@ class AsyncMessagesResource:
             from_: Optional sender ID or phone number
             message_type: Message type for compliance - 'marketing' (default, subject to quiet hours) or 'transactional' (24/7)
             metadata: Custom JSON metadata to attach to the message (max 4KB)
+            idempotency_key: Key identifying this send so a retry can't deliver it
+                twice (generated automatically when omitted)
+            optimize_encoding: Rewrite smart quotes, dashes and similar characters
+                to GSM-7 look-alikes when that saves segments; pass a callable to
+                also receive the EncodingOptimization report
 
         Returns:
             The created message
@@ -672,6 +1150,8 @@ class AsyncMessagesResource:
             ...     text='Your code is: 123456'
             ... )
         """
+        text = apply_encoding_optimization(text, to, optimize_encoding)
+
         # Validate inputs
         validate_phone_number(to)
         validate_message_text(text)
@@ -697,20 +1177,16 @@ class AsyncMessagesResource:
             method="POST",
             path="/messages",
             body=body,
+            idempotency_key=idempotency_key,
+            options=request_options,
         )
 
-        try:
-            return Message(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Message, data)
 
     async def list(
         self,
         limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> MessageListResponse:
         """
@@ -740,18 +1216,12 @@ class AsyncMessagesResource:
             method="GET",
             path="/messages",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return MessageListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(MessageListResponse, data)
 
-    async def get(self, id: str) -> Message:
+    async def get(self, id: str, request_options: Optional[RequestOptions] = None) -> Message:
         """
         Get a specific message by ID (async)
 
@@ -772,65 +1242,66 @@ class AsyncMessagesResource:
         data = await self._http.request(
             method="GET",
             path=f"/messages/{quote(id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return Message(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Message, data)
 
-    async def list_all(
+    def list_all(
         self,
         batch_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Message]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
-    ):
+    ) -> AsyncPaginator[Message]:
         """
         Iterate through all messages with automatic pagination (async)
 
         Args:
             batch_size: Number of messages to fetch per request (max 100)
+            prefetch: Number of page requests to keep in flight (default 1).
+                Pages are still yielded in order.
+            max_items: Stop after this many messages
+            cursor: PageCursor (or encoded token) to resume from
+            on_page: Called (or awaited) with each Page before its messages
 
-        Yields:
-            Message objects one at a time
+        Returns:
+            An AsyncPaginator yielding Message objects one at a time
 
         Raises:
             AuthenticationError: If the API key is invalid
             RateLimitError: If rate limit is exceeded
 
         Example:
-            >>> async for message in client.messages.list_all():
+            >>> async for message in client.messages.list_all(prefetch=4):
             ...     print(f'{message.id}: {message.status}')
         """
-        batch_size = min(batch_size, 100)
-        offset = 0
 
-        while True:
+        async def fetch_page(offset: int, limit: int) -> Page[Message]:
             data = await self._http.request(
                 method="GET",
                 path="/messages",
-                params={"limit": batch_size, "offset": offset},
+                params={"limit": limit, "offset": offset},
+                options=request_options,
             )
 
-            try:
-                response = MessageListResponse(**data)
-            except PydanticValidationError as e:
-                raise SendlyError(
-                    message=f"Invalid API response format: {e}",
-                    code="invalid_response",
-                    status_code=200,
-                ) from e
-
-            for message in response.data:
-                yield message
-
-            if len(response.data) < batch_size:
-                break
+            response = self._http.parse(MessageListResponse, data)
+            items = response_field(MessageListResponse, response, "data")
+            return Page(items, offset, limit, response=response)
+
+        return AsyncPaginator(
+            fetch_page,
+            min(batch_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
 
-            offset += batch_size
+    iter_all = list_all
 
     # =========================================================================
     # Scheduled Messages
@@ -844,6 +1315,9 @@ class AsyncMessagesResource:
         from_: Optional[str] = None,
         message_type: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        optimize_encoding: EncodingOptimizer = False,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> ScheduledMessage:
         """
@@ -856,10 +1330,16 @@ class AsyncMessagesResource:
             from_: Optional sender ID (for international destinations only)
             message_type: Message type for compliance - 'marketing' (default, subject to quiet hours) or 'transactional' (24/7)
             metadata: Custom JSON metadata to attach to the message (max 4KB)
+            idempotency_key: Key identifying this send so a retry can't deliver it
+                twice (generated automatically when omitted)
+            optimize_encoding: Rewrite smart quotes, dashes and similar characters
+                to GSM-7 look-alikes when that saves segments; pass a callable to
+                also receive the EncodingOptimization report
 
         Returns:
             The scheduled message
         """
+        text = apply_encoding_optimization(text, to, optimize_encoding)
         validate_phone_number(to)
         validate_message_text(text)
         if from_:
@@ -881,22 +1361,18 @@ class AsyncMessagesResource:
             method="POST",
             path="/messages/schedule",
             body=body,
+            idempotency_key=idempotency_key,
+            options=request_options,
         )
 
-        try:
-            return ScheduledMessage(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ScheduledMessage, data)
 
     async def list_scheduled(
         self,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> ScheduledMessageListResponse:
         """List scheduled messages (async)"""
@@ -914,52 +1390,66 @@ class AsyncMessagesResource:
             method="GET",
             path="/messages/scheduled",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return ScheduledMessageListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ScheduledMessageListResponse, data)
+
+    def iter_scheduled(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[ScheduledMessage]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncPaginator[ScheduledMessage]:
+        """Iterate through all scheduled messages with automatic pagination (async)"""
+
+        async def fetch_page(offset: int, limit: int) -> Page[ScheduledMessage]:
+            response = await self.list_scheduled(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            items = response_field(ScheduledMessageListResponse, response, "data")
+            return Page(items, offset, limit, response=response)
+
+        return AsyncPaginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
 
-    async def get_scheduled(self, id: str) -> ScheduledMessage:
+    async def get_scheduled(
+        self, id: str, request_options: Optional[RequestOptions] = None
+    ) -> ScheduledMessage:
         """Get a specific scheduled message by ID (async)"""
         validate_message_id(id)
 
         data = await self._http.request(
             method="GET",
             path=f"/messages/scheduled/{quote(id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return ScheduledMessage(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(ScheduledMessage, data)
 
-    async def cancel_scheduled(self, id: str) -> CancelledMessageResponse:
+    async def cancel_scheduled(
+        self, id: str, request_options: Optional[RequestOptions] = None
+    ) -> CancelledMessageResponse:
         """Cancel a scheduled message (async)"""
         validate_message_id(id)
 
         data = await self._http.request(
             method="DELETE",
             path=f"/messages/scheduled/{quote(id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return CancelledMessageResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(CancelledMessageResponse, data)
 
     # =========================================================================
     # Batch Messages
@@ -971,6 +1461,9 @@ class AsyncMessagesResource:
         from_: Optional[str] = None,
         message_type: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        optimize_encoding: EncodingOptimizer = False,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> BatchMessageResponse:
         """Send multiple SMS messages in a single batch (async)"""
@@ -988,6 +1481,17 @@ class AsyncMessagesResource:
                 status_code=400,
             )
 
+        if optimize_encoding:
+            messages = [
+                {
+                    **msg,
+                    "text": apply_encoding_optimization(
+                        msg.get("text", ""), msg.get("to"), optimize_encoding
+                    ),
+                }
+                for msg in messages
+            ]
+
         for msg in messages:
             validate_phone_number(msg.get("to", ""))
             validate_message_text(msg.get("text", ""))
@@ -1007,18 +1511,15 @@ class AsyncMessagesResource:
             method="POST",
             path="/messages/batch",
             body=body,
+            idempotency_key=idempotency_key,
+            options=request_options,
         )
 
-        try:
-            return BatchMessageResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(BatchMessageResponse, data)
 
-    async def get_batch(self, batch_id: str) -> BatchMessageResponse:
+    async def get_batch(
+        self, batch_id: str, request_options: Optional[RequestOptions] = None
+    ) -> BatchMessageResponse:
         """Get batch status and results (async)"""
         if not batch_id or not batch_id.startswith("batch_"):
             raise SendlyError(
@@ -1030,22 +1531,17 @@ class AsyncMessagesResource:
         data = await self._http.request(
             method="GET",
             path=f"/messages/batch/{quote(batch_id, safe='')}",
+            options=request_options,
         )
 
-        try:
-            return BatchMessageResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(BatchMessageResponse, data)
 
     async def list_batches(
         self,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> BatchListResponse:
         """List message batches (async)"""
@@ -1063,22 +1559,45 @@ class AsyncMessagesResource:
             method="GET",
             path="/messages/batches",
             params=params if params else None,
+            options=request_options,
         )
 
-        try:
-            return BatchListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(BatchListResponse, data)
+
+    def iter_batches(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[BatchMessageResponse]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncPaginator[BatchMessageResponse]:
+        """Iterate through all batches with automatic pagination (async)"""
+
+        async def fetch_page(offset: int, limit: int) -> Page[BatchMessageResponse]:
+            response = await self.list_batches(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            items = response_field(BatchListResponse, response, "data")
+            return Page(items, offset, limit, response=response)
+
+        return AsyncPaginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
+        )
 
     async def preview_batch(
         self,
         messages: List[Dict[str, str]],
         from_: Optional[str] = None,
         message_type: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """Preview a batch without sending (dry run) (async)"""
@@ -1113,4 +1632,203 @@ class AsyncMessagesResource:
             method="POST",
             path="/messages/batch/preview",
             body=body,
+            options=request_options,
+        )
+
+    async def preflight_batch(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        from_: Optional[str] = None,
+        balance: Optional[int] = None,
+        balance_max_age: float = 60.0,
+        request_options: Optional[RequestOptions] = None,
+    ) -> BatchPreflight:
+        """
+        Preview a batch locally, without a request per 1000 messages (async)
+
+        See :meth:`MessagesResource.preflight_batch`.
+        """
+        if from_:
+            validate_sender_id(from_)
+        if balance is None:
+            options = request_options or {}
+            organization_id = options.get("organization_id", self._http.organization_id)
+            now = time.monotonic()
+            cached = self._balances.get(organization_id)
+            if cached is None or now - cached[0] >= balance_max_age:
+                credits = await self._account.get_credits(request_options=request_options)
+                cached = (now, response_field(Credits, credits, "available_balance"))
+                self._balances[organization_id] = cached
+            balance = cached[1]
+        return preflight_batch(messages, balance)
+
+    def send_batch_stream(
+        self,
+        messages: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        chunk_size: int = MAX_BATCH_SIZE,
+        max_chunk_bytes: Optional[int] = None,
+        window: int = 4,
+        from_: Optional[str] = None,
+        message_type: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncBatchStream:
+        """
+        Send an unbounded stream of messages as consecutive batches (async)
+
+        See :meth:`MessagesResource.send_batch_stream`. ``messages`` may also
+        be an async iterable.
+
+        Example:
+            >>> stream = client.messages.send_batch_stream(rows, window=8)
+            >>> async for batch in stream:
+            ...     print(batch.batch_id)
+            >>> print(stream.summary.queued)
+        """
+
+        async def send_chunk(position: int, chunk: List[Dict[str, Any]]) -> BatchMessageResponse:
+            return await self.send_batch(
+                chunk,
+                from_=from_,
+                message_type=message_type,
+                metadata=metadata,
+                request_options=_fan_out_options(request_options, position),
+            )
+
+        chunks = aiter_chunks(messages, chunk_size, max_chunk_bytes)
+        return AsyncBatchStream(async_bounded_map(send_chunk, chunks, window, with_position=True))
+
+    # =========================================================================
+    # Waiting for Batches
+    # =========================================================================
+
+    async def iter_batch_updates(
+        self,
+        batch_ids: Union[str, Iterable[str]],
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        requests_per_second: float = 5.0,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncIterator[BatchUpdate]:
+        """
+        Poll batches until they finish, yielding each poll as it happens (async)
+
+        See :meth:`MessagesResource.iter_batch_updates`.
+
+        Example:
+            >>> async for update in client.messages.iter_batch_updates(batch_ids):
+            ...     for result in update.changed:
+            ...         print(result.to, result.status)
+        """
+        poller = BatchPoller(
+            batch_ids,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_interval=max_interval,
+            requests_per_second=requests_per_second,
         )
+        while poller.pending:
+            batch_id, wait = poller.next()
+            if wait:
+                await asyncio.sleep(wait)
+            batch = await self.get_batch(batch_id, request_options=request_options)
+            yield poller.update(batch_id, batch)
+
+    async def wait_for_batch(
+        self,
+        batch_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        on_update: Optional[Callable[[BatchUpdate], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> BatchMessageResponse:
+        """
+        Wait until a batch reaches a final status (async)
+
+        See :meth:`MessagesResource.wait_for_batch`. ``on_update`` may be a
+        coroutine function.
+
+        Example:
+            >>> done = await client.messages.wait_for_batch(batch_id, timeout=300)
+        """
+        finished = await self.wait_for_batches(
+            [batch_id],
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_interval=max_interval,
+            on_update=on_update,
+            request_options=request_options,
+        )
+        return finished[batch_id]
+
+    async def wait_for_batches(
+        self,
+        batch_ids: Iterable[str],
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        requests_per_second: float = 5.0,
+        on_update: Optional[Callable[[BatchUpdate], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Dict[str, BatchMessageResponse]:
+        """
+        Wait until every batch reaches a final status (async)
+
+        See :meth:`MessagesResource.wait_for_batches`.
+        """
+        finished: Dict[str, BatchMessageResponse] = {}
+        async for update in self.iter_batch_updates(
+            batch_ids,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_interval=max_interval,
+            requests_per_second=requests_per_second,
+            request_options=request_options,
+        ):
+            if on_update is not None:
+                result = on_update(update)
+                if inspect.isawaitable(result):
+                    await result
+            if update.done:
+                finished[update.batch_id] = update.batch
+        return finished
+
+    # =========================================================================
+    # Concurrent Sending
+    # =========================================================================
+
+    async def send_many(
+        self,
+        messages: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+        concurrency: int = 10,
+        ordered: bool = False,
+        from_: Optional[str] = None,
+        message_type: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncIterator[SendResult]:
+        """
+        Send individually personalised messages with bounded concurrency (async)
+
+        Async counterpart of :meth:`MessagesResource.send_many`: at most
+        ``concurrency`` sends run as tasks at once, ``messages`` may be a
+        regular or async iterable, and per-message failures are reported in
+        the results.
+
+        Example:
+            >>> async for result in client.messages.send_many(recipients, concurrency=50):
+            ...     if result.ok:
+            ...         print(result.message.id)
+        """
+
+        async def send_one(position: int, item: Dict[str, Any]) -> Message:
+            return await self.send(
+                **_send_kwargs(item, from_, message_type),
+                request_options=_fan_out_options(request_options, position),
+            )
+
+        async for outcome in async_bounded_map(
+            send_one, messages, concurrency, ordered=ordered, with_position=True
+        ):
+            yield _send_result(outcome)
@@ -15,16 +15,13 @@ completion is the CLI's job, not the SDK's.
 
 from typing import Any, Dict, Optional
 
-from pydantic import ValidationError as PydanticValidationError
-
-from ..errors import SendlyError
 from ..types import (
     AvailableNumbersResponse,
     BuyNumberResponse,
     NumberCountriesResponse,
     OwnedNumbersResponse,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
 
 
 class NumbersResource:
@@ -44,19 +41,19 @@ class NumbersResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def list_countries(self) -> NumberCountriesResponse:
+    def list_countries(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> NumberCountriesResponse:
         """List the countries where numbers can be searched and purchased."""
-        data = self._http.request(method="GET", path="/numbers/countries")
-        try:
-            return NumberCountriesResponse(**data)
-        except PydanticValidationError as e:
-            raise _invalid_response(e) from e
+        data = self._http.request(method="GET", path="/numbers/countries", options=request_options)
+        return self._http.parse(NumberCountriesResponse, data)
 
     def list_available(
         self,
         country: str,
         type: str,
         contains: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> AvailableNumbersResponse:
         """Search for available numbers, already priced for the customer.
 
@@ -69,19 +66,15 @@ class NumbersResource:
         if contains is not None:
             params["contains"] = contains
 
-        data = self._http.request(method="GET", path="/numbers/available", params=params)
-        try:
-            return AvailableNumbersResponse(**data)
-        except PydanticValidationError as e:
-            raise _invalid_response(e) from e
+        data = self._http.request(
+            method="GET", path="/numbers/available", params=params, options=request_options
+        )
+        return self._http.parse(AvailableNumbersResponse, data)
 
-    def list(self) -> OwnedNumbersResponse:
+    def list(self, request_options: Optional[RequestOptions] = None) -> OwnedNumbersResponse:
         """List the numbers the account already owns."""
-        data = self._http.request(method="GET", path="/numbers")
-        try:
-            return OwnedNumbersResponse(**data)
-        except PydanticValidationError as e:
-            raise _invalid_response(e) from e
+        data = self._http.request(method="GET", path="/numbers", options=request_options)
+        return self._http.parse(OwnedNumbersResponse, data)
 
     def buy(
         self,
@@ -90,6 +83,7 @@ class NumbersResource:
         phone_number_type: str,
         monthly_cost: str,
         action_code: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> BuyNumberResponse:
         """Buy a number.
 
@@ -116,11 +110,10 @@ class NumbersResource:
         if action_code is not None:
             body["actionCode"] = action_code
 
-        data = self._http.request(method="POST", path="/numbers/buy", body=body)
-        try:
-            return BuyNumberResponse(**data)
-        except PydanticValidationError as e:
-            raise _invalid_response(e) from e
+        data = self._http.request(
+            method="POST", path="/numbers/buy", body=body, options=request_options
+        )
+        return self._http.parse(BuyNumberResponse, data)
 
 
 class AsyncNumbersResource:
@@ -129,38 +122,36 @@ class AsyncNumbersResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def list_countries(self) -> NumberCountriesResponse:
+    async def list_countries(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> NumberCountriesResponse:
         """List the countries where numbers can be searched and purchased."""
-        data = await self._http.request(method="GET", path="/numbers/countries")
-        try:
-            return NumberCountriesResponse(**data)
-        except PydanticValidationError as e:
-            raise _invalid_response(e) from e
+        data = await self._http.request(
+            method="GET", path="/numbers/countries", options=request_options
+        )
+        return self._http.parse(NumberCountriesResponse, data)
 
     async def list_available(
         self,
         country: str,
         type: str,
         contains: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> AvailableNumbersResponse:
         """Search for available numbers, already priced for the customer."""
         params: Dict[str, Any] = {"country": country, "type": type}
         if contains is not None:
             params["contains"] = contains
 
-        data = await self._http.request(method="GET", path="/numbers/available", params=params)
-        try:
-            return AvailableNumbersResponse(**data)
-        except PydanticValidationError as e:
-            raise _invalid_response(e) from e
+        data = await self._http.request(
+            method="GET", path="/numbers/available", params=params, options=request_options
+        )
+        return self._http.parse(AvailableNumbersResponse, data)
 
-    async def list(self) -> OwnedNumbersResponse:
+    async def list(self, request_options: Optional[RequestOptions] = None) -> OwnedNumbersResponse:
         """List the numbers the account already owns."""
-        data = await self._http.request(method="GET", path="/numbers")
-        try:
-            return OwnedNumbersResponse(**data)
-        except PydanticValidationError as e:
-            raise _invalid_response(e) from e
+        data = await self._http.request(method="GET", path="/numbers", options=request_options)
+        return self._http.parse(OwnedNumbersResponse, data)
 
     async def buy(
         self,
@@ -169,6 +160,7 @@ class AsyncNumbersResource:
         phone_number_type: str,
         monthly_cost: str,
         action_code: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> BuyNumberResponse:
         """Buy a number. See :meth:`NumbersResource.buy`."""
         body: Dict[str, Any] = {
@@ -180,17 +172,7 @@ class AsyncNumbersResource:
         if action_code is not None:
             body["actionCode"] = action_code
 
-        data = await self._http.request(method="POST", path="/numbers/buy", body=body)
-        try:
-            return BuyNumberResponse(**data)
-        except PydanticValidationError as e:
-            raise _invalid_response(e) from e
-
-
-def _invalid_response(e: PydanticValidationError) -> SendlyError:
-    """Wrap a pydantic schema error as a SendlyError, matching the SDK's idiom."""
-    return SendlyError(
-        message=f"Invalid API response format: {e}",
-        code="invalid_response",
-        status_code=200,
-    )
+        data = await self._http.request(
+            method="POST", path="/numbers/buy", body=body, options=request_options
+        )
+        return self._http.parse(BuyNumberResponse, data)
@@ -1,34 +1,25 @@
 from typing import Any, Dict, Optional
 from urllib.parse import quote
 
-from pydantic import ValidationError as PydanticValidationError
-
-from ..errors import SendlyError
 from ..types import (
     Rule,
     RuleListResponse,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
 
 
 class RulesResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def list(self) -> RuleListResponse:
+    def list(self, request_options: Optional[RequestOptions] = None) -> RuleListResponse:
         data = self._http.request(
             method="GET",
             path="/rules",
+            options=request_options,
         )
 
-        try:
-            return RuleListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(RuleListResponse, data)
 
     def create(
         self,
@@ -36,6 +27,7 @@ class RulesResource:
         conditions: Dict[str, Any],
         actions: Dict[str, Any],
         priority: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Rule:
         body: Dict[str, Any] = {
             "name": name,
@@ -49,16 +41,10 @@ class RulesResource:
             method="POST",
             path="/rules",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Rule(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Rule, data)
 
     def update(
         self,
@@ -67,6 +53,7 @@ class RulesResource:
         conditions: Optional[Dict[str, Any]] = None,
         actions: Optional[Dict[str, Any]] = None,
         priority: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Rule:
         body: Dict[str, Any] = {}
         if name is not None:
@@ -82,21 +69,16 @@ class RulesResource:
             method="PATCH",
             path=f"/rules/{quote(id, safe='')}",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Rule(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Rule, data)
 
-    def delete(self, id: str) -> None:
+    def delete(self, id: str, request_options: Optional[RequestOptions] = None) -> None:
         self._http.request(
             method="DELETE",
             path=f"/rules/{quote(id, safe='')}",
+            options=request_options,
         )
 
 
@@ -104,20 +86,14 @@ class AsyncRulesResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def list(self) -> RuleListResponse:
+    async def list(self, request_options: Optional[RequestOptions] = None) -> RuleListResponse:
         data = await self._http.request(
             method="GET",
             path="/rules",
+            options=request_options,
         )
 
-        try:
-            return RuleListResponse(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(RuleListResponse, data)
 
     async def create(
         self,
@@ -125,6 +101,7 @@ class AsyncRulesResource:
         conditions: Dict[str, Any],
         actions: Dict[str, Any],
         priority: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Rule:
         body: Dict[str, Any] = {
             "name": name,
@@ -138,16 +115,10 @@ class AsyncRulesResource:
             method="POST",
             path="/rules",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Rule(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Rule, data)
 
     async def update(
         self,
@@ -156,6 +127,7 @@ class AsyncRulesResource:
         conditions: Optional[Dict[str, Any]] = None,
         actions: Optional[Dict[str, Any]] = None,
         priority: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Rule:
         body: Dict[str, Any] = {}
         if name is not None:
@@ -171,19 +143,14 @@ class AsyncRulesResource:
             method="PATCH",
             path=f"/rules/{quote(id, safe='')}",
             body=body,
+            options=request_options,
         )
 
-        try:
-            return Rule(**data)
-        except PydanticValidationError as e:
-            raise SendlyError(
-                message=f"Invalid API response format: {e}",
-                code="invalid_response",
-                status_code=200,
-            ) from e
+        return self._http.parse(Rule, data)
 
-    async def delete(self, id: str) -> None:
+    async def delete(self, id: str, request_options: Optional[RequestOptions] = None) -> None:
         await self._http.request(
             method="DELETE",
             path=f"/rules/{quote(id, safe='')}",
+            options=request_options,
         )
@@ -5,7 +5,7 @@ Templates Resource - SMS Template Management
 from typing import Any, Dict, List, Optional
 
 from ..types import GeneratedTemplate, Template, TemplateListResponse, TemplatePreview
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
 
 
 class TemplatesResource:
@@ -14,28 +14,34 @@ class TemplatesResource:
     def __init__(self, http: HttpClient):
         self._http = http
 
-    def list(self) -> TemplateListResponse:
+    def list(self, request_options: Optional[RequestOptions] = None) -> TemplateListResponse:
         """List all templates (presets + custom)"""
-        data = self._http.request("GET", "/templates")
-        return TemplateListResponse(
-            templates=[self._transform_template(t) for t in data["templates"]]
+        data = self._http.request("GET", "/templates", options=request_options)
+        return self._http.parse(
+            TemplateListResponse,
+            {"templates": [self._transform_template(t) for t in data["templates"]]},
         )
 
-    def presets(self) -> TemplateListResponse:
+    def presets(self, request_options: Optional[RequestOptions] = None) -> TemplateListResponse:
         """List preset templates only"""
-        data = self._http.request("GET", "/templates/presets")
-        return TemplateListResponse(
-            templates=[self._transform_template(t) for t in data["templates"]]
+        data = self._http.request("GET", "/templates/presets", options=request_options)
+        return self._http.parse(
+            TemplateListResponse,
+            {"templates": [self._transform_template(t) for t in data["templates"]]},
         )
 
-    def get(self, template_id: str) -> Template:
+    def get(self, template_id: str, request_options: Optional[RequestOptions] = None) -> Template:
         """Get a template by ID"""
-        data = self._http.request("GET", f"/templates/{template_id}")
+        data = self._http.request("GET", f"/templates/{template_id}", options=request_options)
         return self._transform_template(data)
 
-    def create(self, name: str, text: str) -> Template:
+    def create(
+        self, name: str, text: str, request_options: Optional[RequestOptions] = None
+    ) -> Template:
         """Create a new template"""
-        data = self._http.request("POST", "/templates", body={"name": name, "text": text})
+        data = self._http.request(
+            "POST", "/templates", body={"name": name, "text": text}, options=request_options
+        )
         return self._transform_template(data)
 
     def update(
@@ -44,6 +50,7 @@ class TemplatesResource:
         *,
         name: Optional[str] = None,
         text: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Template:
         """Update a template"""
         body: Dict[str, Any] = {}
@@ -52,33 +59,52 @@ class TemplatesResource:
         if text:
             body["text"] = text
 
-        data = self._http.request("PATCH", f"/templates/{template_id}", body=body)
+        data = self._http.request(
+            "PATCH", f"/templates/{template_id}", body=body, options=request_options
+        )
         return self._transform_template(data)
 
-    def publish(self, template_id: str) -> Template:
+    def publish(
+        self, template_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Template:
         """Publish a draft template"""
-        data = self._http.request("POST", f"/templates/{template_id}/publish")
+        data = self._http.request(
+            "POST", f"/templates/{template_id}/publish", options=request_options
+        )
         return self._transform_template(data)
 
     def preview(
-        self, template_id: str, variables: Optional[Dict[str, str]] = None
+        self,
+        template_id: str,
+        variables: Optional[Dict[str, str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> TemplatePreview:
         """Preview a template with sample values"""
         body = {"variables": variables} if variables else {}
-        data = self._http.request("POST", f"/templates/{template_id}/preview", body=body)
-        return TemplatePreview(
-            id=data["id"],
-            name=data["name"],
-            original_text=data["original_text"],
-            preview_text=data["preview_text"],
-            variables=data["variables"],
+        data = self._http.request(
+            "POST", f"/templates/{template_id}/preview", body=body, options=request_options
+        )
+        return self._http.parse(
+            TemplatePreview,
+            {
+                "id": data["id"],
+                "name": data["name"],
+                "original_text": data["original_text"],
+                "preview_text": data["preview_text"],
+                "variables": data["variables"],
+            },
         )
 
-    def delete(self, template_id: str) -> None:
+    def delete(self, template_id: str, request_options: Optional[RequestOptions] = None) -> None:
         """Delete a template"""
-        self._http.request("DELETE", f"/templates/{template_id}")
+        self._http.request("DELETE", f"/templates/{template_id}", options=request_options)
 
-    def clone(self, template_id: str, name: Optional[str] = None) -> Template:
+    def clone(
+        self,
+        template_id: str,
+        name: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Template:
         """Clone a template
 
         Args:
@@ -86,31 +112,39 @@ class TemplatesResource:
             name: Optional new name for the cloned template
         """
         body = {"name": name} if name else {}
-        data = self._http.request("POST", f"/templates/{template_id}/clone", body=body)
+        data = self._http.request(
+            "POST", f"/templates/{template_id}/clone", body=body, options=request_options
+        )
         return self._transform_template(data)
 
     def generate(
-        self, description: str, category: Optional[str] = None
+        self,
+        description: str,
+        category: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> GeneratedTemplate:
         body: Dict[str, Any] = {"description": description}
         if category is not None:
             body["category"] = category
-        data = self._http.request("POST", "/templates/generate", body=body)
-        return GeneratedTemplate(**data)
+        data = self._http.request("POST", "/templates/generate", body=body, options=request_options)
+        return self._http.parse(GeneratedTemplate, data)
 
     def _transform_template(self, data: Dict[str, Any]) -> Template:
-        return Template(
-            id=data["id"],
-            name=data["name"],
-            text=data["text"],
-            variables=data["variables"],
-            is_preset=data["is_preset"],
-            preset_slug=data.get("preset_slug"),
-            status=data["status"],
-            version=data["version"],
-            published_at=data.get("published_at"),
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
+        return self._http.parse(
+            Template,
+            {
+                "id": data["id"],
+                "name": data["name"],
+                "text": data["text"],
+                "variables": data["variables"],
+                "is_preset": data["is_preset"],
+                "preset_slug": data.get("preset_slug"),
+                "status": data["status"],
+                "version": data["version"],
+                "published_at": data.get("published_at"),
+                "created_at": data["created_at"],
+                "updated_at": data["updated_at"],
+            },
         )
 
 
@@ -120,28 +154,38 @@ class AsyncTemplatesResource:
     def __init__(self, http: AsyncHttpClient):
         self._http = http
 
-    async def list(self) -> TemplateListResponse:
+    async def list(self, request_options: Optional[RequestOptions] = None) -> TemplateListResponse:
         """List all templates (presets + custom)"""
-        data = await self._http.request("GET", "/templates")
-        return TemplateListResponse(
-            templates=[self._transform_template(t) for t in data["templates"]]
+        data = await self._http.request("GET", "/templates", options=request_options)
+        return self._http.parse(
+            TemplateListResponse,
+            {"templates": [self._transform_template(t) for t in data["templates"]]},
         )
 
-    async def presets(self) -> TemplateListResponse:
+    async def presets(
+        self, request_options: Optional[RequestOptions] = None
+    ) -> TemplateListResponse:
         """List preset templates only"""
-        data = await self._http.request("GET", "/templates/presets")
-        return TemplateListResponse(
-            templates=[self._transform_template(t) for t in data["templates"]]
+        data = await self._http.request("GET", "/templates/presets", options=request_options)
+        return self._http.parse(
+            TemplateListResponse,
+            {"templates": [self._transform_template(t) for t in data["templates"]]},
         )
 
-    async def get(self, template_id: str) -> Template:
+    async def get(
+        self, template_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Template:
         """Get a template by ID"""
-        data = await self._http.request("GET", f"/templates/{template_id}")
+        data = await self._http.request("GET", f"/templates/{template_id}", options=request_options)
         return self._transform_template(data)
 
-    async def create(self, name: str, text: str) -> Template:
+    async def create(
+        self, name: str, text: str, request_options: Optional[RequestOptions] = None
+    ) -> Template:
         """Create a new template"""
-        data = await self._http.request("POST", "/templates", body={"name": name, "text": text})
+        data = await self._http.request(
+            "POST", "/templates", body={"name": name, "text": text}, options=request_options
+        )
         return self._transform_template(data)
 
     async def update(
@@ -150,6 +194,7 @@ class AsyncTemplatesResource:
         *,
         name: Optional[str] = None,
         text: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Template:
         """Update a template"""
         body: Dict[str, Any] = {}
@@ -158,58 +203,89 @@ class AsyncTemplatesResource:
         if text:
             body["text"] = text
 
-        data = await self._http.request("PATCH", f"/templates/{template_id}", body=body)
+        data = await self._http.request(
+            "PATCH", f"/templates/{template_id}", body=body, options=request_options
+        )
         return self._transform_template(data)
 
-    async def publish(self, template_id: str) -> Template:
+    async def publish(
+        self, template_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Template:
         """Publish a draft template"""
-        data = await self._http.request("POST", f"/templates/{template_id}/publish")
+        data = await self._http.request(
+            "POST", f"/templates/{template_id}/publish", options=request_options
+        )
         return self._transform_template(data)
 
     async def preview(
-        self, template_id: str, variables: Optional[Dict[str, str]] = None
+        self,
+        template_id: str,
+        variables: Optional[Dict[str, str]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> TemplatePreview:
         """Preview a template with sample values"""
         body = {"variables": variables} if variables else {}
-        data = await self._http.request("POST", f"/templates/{template_id}/preview", body=body)
-        return TemplatePreview(
-            id=data["id"],
-            name=data["name"],
-            original_text=data["original_text"],
-            preview_text=data["preview_text"],
-            variables=data["variables"],
+        data = await self._http.request(
+            "POST", f"/templates/{template_id}/preview", body=body, options=request_options
+        )
+        return self._http.parse(
+            TemplatePreview,
+            {
+                "id": data["id"],
+                "name": data["name"],
+                "original_text": data["original_text"],
+                "preview_text": data["preview_text"],
+                "variables": data["variables"],
+            },
         )
 
-    async def delete(self, template_id: str) -> None:
+    async def delete(
+        self, template_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         """Delete a template"""
-        await self._http.request("DELETE", f"/templates/{template_id}")
+        await self._http.request("DELETE", f"/templates/{template_id}", options=request_options)
 
-    async def clone(self, template_id: str, name: Optional[str] = None) -> Template:
+    async def clone(
+        self,
+        template_id: str,
+        name: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Template:
         """Clone a template"""
         body = {"name": name} if name else {}
-        data = await self._http.request("POST", f"/templates/{template_id}/clone", body=body)
+        data = await self._http.request(
+            "POST", f"/templates/{template_id}/clone", body=body, options=request_options
+        )
         return self._transform_template(data)
 
     async def generate(
-        self, description: str, category: Optional[str] = None
+        self,
+        description: str,
+        category: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> GeneratedTemplate:
         body: Dict[str, Any] = {"description": description}
         if category is not None:
             body["category"] = category
-        data = await self._http.request("POST", "/templates/generate", body=body)
-        return GeneratedTemplate(**data)
+        data = await self._http.request(
+            "POST", "/templates/generate", body=body, options=request_options
+        )
+        return self._http.parse(GeneratedTemplate, data)
 
     def _transform_template(self, data: Dict[str, Any]) -> Template:
-        return Template(
-            id=data["id"],
-            name=data["name"],
-            text=data["text"],
-            variables=data["variables"],
-            is_preset=data["is_preset"],
-            preset_slug=data.get("preset_slug"),
-            status=data["status"],
-            version=data["version"],
-            published_at=data.get("published_at"),
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
+        return self._http.parse(
+            Template,
+            {
+                "id": data["id"],
+                "name": data["name"],
+                "text": data["text"],
+                "variables": data["variables"],
+                "is_preset": data["is_preset"],
+                "preset_slug": data.get("preset_slug"),
+                "status": data["status"],
+                "version": data["version"],
+                "published_at": data.get("published_at"),
+                "created_at": data["created_at"],
+                "updated_at": data["updated_at"],
+            },
         )
@@ -2,7 +2,7 @@
 Verify Resource - OTP Verification API
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from ..types import (
     CheckVerificationResponse,
@@ -12,7 +12,9 @@ from ..types import (
     VerifySession,
     ValidateSessionResponse,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
+from ..utils.models import response_field
+from ..utils.pagination import AsyncPaginator, CursorTypes, Page, Paginator
 
 
 class SessionsResource:
@@ -29,6 +31,7 @@ class SessionsResource:
         brand_name: Optional[str] = None,
         brand_color: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> VerifySession:
         """Create a hosted verification session"""
         body: Dict[str, Any] = {"success_url": success_url}
@@ -41,32 +44,42 @@ class SessionsResource:
         if metadata:
             body["metadata"] = metadata
 
-        data = self._http.request("POST", "/verify/sessions", body=body)
-        return VerifySession(
-            id=data["id"],
-            url=data["url"],
-            status=data["status"],
-            success_url=data["success_url"],
-            cancel_url=data.get("cancel_url"),
-            brand_name=data.get("brand_name"),
-            brand_color=data.get("brand_color"),
-            phone=data.get("phone"),
-            verification_id=data.get("verification_id"),
-            token=data.get("token"),
-            metadata=data.get("metadata"),
-            expires_at=data["expires_at"],
-            created_at=data["created_at"],
+        data = self._http.request("POST", "/verify/sessions", body=body, options=request_options)
+        return self._http.parse(
+            VerifySession,
+            {
+                "id": data["id"],
+                "url": data["url"],
+                "status": data["status"],
+                "success_url": data["success_url"],
+                "cancel_url": data.get("cancel_url"),
+                "brand_name": data.get("brand_name"),
+                "brand_color": data.get("brand_color"),
+                "phone": data.get("phone"),
+                "verification_id": data.get("verification_id"),
+                "token": data.get("token"),
+                "metadata": data.get("metadata"),
+                "expires_at": data["expires_at"],
+                "created_at": data["created_at"],
+            },
         )
 
-    def validate(self, token: str) -> ValidateSessionResponse:
+    def validate(
+        self, token: str, request_options: Optional[RequestOptions] = None
+    ) -> ValidateSessionResponse:
         """Validate a session token after user completes verification"""
-        data = self._http.request("POST", "/verify/sessions/validate", body={"token": token})
-        return ValidateSessionResponse(
-            valid=data["valid"],
-            session_id=data.get("session_id"),
-            phone=data.get("phone"),
-            verified_at=data.get("verified_at"),
-            metadata=data.get("metadata"),
+        data = self._http.request(
+            "POST", "/verify/sessions/validate", body={"token": token}, options=request_options
+        )
+        return self._http.parse(
+            ValidateSessionResponse,
+            {
+                "valid": data["valid"],
+                "session_id": data.get("session_id"),
+                "phone": data.get("phone"),
+                "verified_at": data.get("verified_at"),
+                "metadata": data.get("metadata"),
+            },
         )
 
 
@@ -84,6 +97,7 @@ class AsyncSessionsResource:
         brand_name: Optional[str] = None,
         brand_color: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> VerifySession:
         """Create a hosted verification session"""
         body: Dict[str, Any] = {"success_url": success_url}
@@ -96,32 +110,44 @@ class AsyncSessionsResource:
         if metadata:
             body["metadata"] = metadata
 
-        data = await self._http.request("POST", "/verify/sessions", body=body)
-        return VerifySession(
-            id=data["id"],
-            url=data["url"],
-            status=data["status"],
-            success_url=data["success_url"],
-            cancel_url=data.get("cancel_url"),
-            brand_name=data.get("brand_name"),
-            brand_color=data.get("brand_color"),
-            phone=data.get("phone"),
-            verification_id=data.get("verification_id"),
-            token=data.get("token"),
-            metadata=data.get("metadata"),
-            expires_at=data["expires_at"],
-            created_at=data["created_at"],
+        data = await self._http.request(
+            "POST", "/verify/sessions", body=body, options=request_options
+        )
+        return self._http.parse(
+            VerifySession,
+            {
+                "id": data["id"],
+                "url": data["url"],
+                "status": data["status"],
+                "success_url": data["success_url"],
+                "cancel_url": data.get("cancel_url"),
+                "brand_name": data.get("brand_name"),
+                "brand_color": data.get("brand_color"),
+                "phone": data.get("phone"),
+                "verification_id": data.get("verification_id"),
+                "token": data.get("token"),
+                "metadata": data.get("metadata"),
+                "expires_at": data["expires_at"],
+                "created_at": data["created_at"],
+            },
         )
 
-    async def validate(self, token: str) -> ValidateSessionResponse:
+    async def validate(
+        self, token: str, request_options: Optional[RequestOptions] = None
+    ) -> ValidateSessionResponse:
         """Validate a session token after user completes verification"""
-        data = await self._http.request("POST", "/verify/sessions/validate", body={"token": token})
-        return ValidateSessionResponse(
-            valid=data["valid"],
-            session_id=data.get("session_id"),
-            phone=data.get("phone"),
-            verified_at=data.get("verified_at"),
-            metadata=data.get("metadata"),
+        data = await self._http.request(
+            "POST", "/verify/sessions/validate", body={"token": token}, options=request_options
+        )
+        return self._http.parse(
+            ValidateSessionResponse,
+            {
+                "valid": data["valid"],
+                "session_id": data.get("session_id"),
+                "phone": data.get("phone"),
+                "verified_at": data.get("verified_at"),
+                "metadata": data.get("metadata"),
+            },
         )
 
 
@@ -141,6 +167,7 @@ class VerifyResource:
         app_name: Optional[str] = None,
         timeout_secs: Optional[int] = None,
         code_length: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> SendVerificationResponse:
         """Send an OTP verification code"""
         body: Dict[str, Any] = {"to": to}
@@ -155,94 +182,161 @@ class VerifyResource:
         if code_length:
             body["code_length"] = code_length
 
-        data = self._http.request("POST", "/verify", body=body)
-        return SendVerificationResponse(
-            id=data["id"],
-            status=data["status"],
-            phone=data["phone"],
-            expires_at=data["expires_at"],
-            sandbox=data["sandbox"],
-            sandbox_code=data.get("sandbox_code"),
-            message=data.get("message"),
+        data = self._http.request("POST", "/verify", body=body, options=request_options)
+        return self._http.parse(
+            SendVerificationResponse,
+            {
+                "id": data["id"],
+                "status": data["status"],
+                "phone": data["phone"],
+                "expires_at": data["expires_at"],
+                "sandbox": data["sandbox"],
+                "sandbox_code": data.get("sandbox_code"),
+                "message": data.get("message"),
+            },
         )
 
-    def resend(self, verification_id: str) -> SendVerificationResponse:
+    def resend(
+        self, verification_id: str, request_options: Optional[RequestOptions] = None
+    ) -> SendVerificationResponse:
         """Resend an OTP verification code"""
-        data = self._http.request("POST", f"/verify/{verification_id}/resend")
-        return SendVerificationResponse(
-            id=data["id"],
-            status=data["status"],
-            phone=data["phone"],
-            expires_at=data["expires_at"],
-            sandbox=data["sandbox"],
-            sandbox_code=data.get("sandbox_code"),
-            message=data.get("message"),
+        data = self._http.request(
+            "POST", f"/verify/{verification_id}/resend", options=request_options
+        )
+        return self._http.parse(
+            SendVerificationResponse,
+            {
+                "id": data["id"],
+                "status": data["status"],
+                "phone": data["phone"],
+                "expires_at": data["expires_at"],
+                "sandbox": data["sandbox"],
+                "sandbox_code": data.get("sandbox_code"),
+                "message": data.get("message"),
+            },
         )
 
-    def check(self, verification_id: str, code: str) -> CheckVerificationResponse:
+    def check(
+        self, verification_id: str, code: str, request_options: Optional[RequestOptions] = None
+    ) -> CheckVerificationResponse:
         """Check/verify an OTP code"""
-        data = self._http.request("POST", f"/verify/{verification_id}/check", body={"code": code})
-        return CheckVerificationResponse(
-            id=data["id"],
-            status=data["status"],
-            phone=data["phone"],
-            verified_at=data.get("verified_at"),
-            remaining_attempts=data.get("remaining_attempts"),
+        data = self._http.request(
+            "POST", f"/verify/{verification_id}/check", body={"code": code}, options=request_options
+        )
+        return self._http.parse(
+            CheckVerificationResponse,
+            {
+                "id": data["id"],
+                "status": data["status"],
+                "phone": data["phone"],
+                "verified_at": data.get("verified_at"),
+                "remaining_attempts": data.get("remaining_attempts"),
+            },
         )
 
-    def get(self, verification_id: str) -> Verification:
+    def get(
+        self, verification_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Verification:
         """Get a verification by ID"""
-        data = self._http.request("GET", f"/verify/{verification_id}")
-        return Verification(
-            id=data["id"],
-            status=data["status"],
-            phone=data["phone"],
-            delivery_status=data["delivery_status"],
-            attempts=data["attempts"],
-            max_attempts=data["max_attempts"],
-            expires_at=data["expires_at"],
-            verified_at=data.get("verified_at"),
-            created_at=data["created_at"],
-            sandbox=data["sandbox"],
-            app_name=data.get("app_name"),
-            template_id=data.get("template_id"),
-            profile_id=data.get("profile_id"),
+        data = self._http.request("GET", f"/verify/{verification_id}", options=request_options)
+        return self._http.parse(
+            Verification,
+            {
+                "id": data["id"],
+                "status": data["status"],
+                "phone": data["phone"],
+                "delivery_status": data["delivery_status"],
+                "attempts": data["attempts"],
+                "max_attempts": data["max_attempts"],
+                "expires_at": data["expires_at"],
+                "verified_at": data.get("verified_at"),
+                "created_at": data["created_at"],
+                "sandbox": data["sandbox"],
+                "app_name": data.get("app_name"),
+                "template_id": data.get("template_id"),
+                "profile_id": data.get("profile_id"),
+            },
         )
 
     def list(
         self,
         *,
         limit: Optional[int] = None,
+        offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> VerificationListResponse:
         """List recent verifications"""
         params: Dict[str, Any] = {}
         if limit:
             params["limit"] = limit
+        if offset:
+            params["offset"] = offset
         if status:
             params["status"] = status
 
-        data = self._http.request("GET", "/verify", params=params)
-        return VerificationListResponse(
-            verifications=[
-                Verification(
-                    id=v["id"],
-                    status=v["status"],
-                    phone=v["phone"],
-                    delivery_status=v["delivery_status"],
-                    attempts=v["attempts"],
-                    max_attempts=v["max_attempts"],
-                    expires_at=v["expires_at"],
-                    verified_at=v.get("verified_at"),
-                    created_at=v["created_at"],
-                    sandbox=v["sandbox"],
-                    app_name=v.get("app_name"),
-                    template_id=v.get("template_id"),
-                    profile_id=v.get("profile_id"),
-                )
-                for v in data["verifications"]
-            ],
-            pagination=data["pagination"],
+        data = self._http.request("GET", "/verify", params=params, options=request_options)
+        return self._http.parse(
+            VerificationListResponse,
+            {
+                "verifications": [
+                    self._http.parse(
+                        Verification,
+                        {
+                            "id": v["id"],
+                            "status": v["status"],
+                            "phone": v["phone"],
+                            "delivery_status": v["delivery_status"],
+                            "attempts": v["attempts"],
+                            "max_attempts": v["max_attempts"],
+                            "expires_at": v["expires_at"],
+                            "verified_at": v.get("verified_at"),
+                            "created_at": v["created_at"],
+                            "sandbox": v["sandbox"],
+                            "app_name": v.get("app_name"),
+                            "template_id": v.get("template_id"),
+                            "profile_id": v.get("profile_id"),
+                        },
+                    )
+                    for v in data["verifications"]
+                ],
+                "pagination": data["pagination"],
+            },
+        )
+
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Verification]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> Paginator[Verification]:
+        """Iterate through all verifications, fetching pages lazily"""
+
+        def fetch_page(offset: int, limit: int) -> Page[Verification]:
+            response = self.list(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            pagination = response_field(VerificationListResponse, response, "pagination")
+            return Page(
+                response_field(VerificationListResponse, response, "verifications"),
+                offset,
+                limit,
+                total=pagination.get("total"),
+                has_more=pagination.get("has_more"),
+                response=response,
+            )
+
+        return Paginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
         )
 
 
@@ -262,6 +356,7 @@ class AsyncVerifyResource:
         app_name: Optional[str] = None,
         timeout_secs: Optional[int] = None,
         code_length: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> SendVerificationResponse:
         """Send an OTP verification code"""
         body: Dict[str, Any] = {"to": to}
@@ -276,94 +371,161 @@ class AsyncVerifyResource:
         if code_length:
             body["code_length"] = code_length
 
-        data = await self._http.request("POST", "/verify", body=body)
-        return SendVerificationResponse(
-            id=data["id"],
-            status=data["status"],
-            phone=data["phone"],
-            expires_at=data["expires_at"],
-            sandbox=data["sandbox"],
-            sandbox_code=data.get("sandbox_code"),
-            message=data.get("message"),
+        data = await self._http.request("POST", "/verify", body=body, options=request_options)
+        return self._http.parse(
+            SendVerificationResponse,
+            {
+                "id": data["id"],
+                "status": data["status"],
+                "phone": data["phone"],
+                "expires_at": data["expires_at"],
+                "sandbox": data["sandbox"],
+                "sandbox_code": data.get("sandbox_code"),
+                "message": data.get("message"),
+            },
         )
 
-    async def resend(self, verification_id: str) -> SendVerificationResponse:
+    async def resend(
+        self, verification_id: str, request_options: Optional[RequestOptions] = None
+    ) -> SendVerificationResponse:
         """Resend an OTP verification code"""
-        data = await self._http.request("POST", f"/verify/{verification_id}/resend")
-        return SendVerificationResponse(
-            id=data["id"],
-            status=data["status"],
-            phone=data["phone"],
-            expires_at=data["expires_at"],
-            sandbox=data["sandbox"],
-            sandbox_code=data.get("sandbox_code"),
-            message=data.get("message"),
+        data = await self._http.request(
+            "POST", f"/verify/{verification_id}/resend", options=request_options
+        )
+        return self._http.parse(
+            SendVerificationResponse,
+            {
+                "id": data["id"],
+                "status": data["status"],
+                "phone": data["phone"],
+                "expires_at": data["expires_at"],
+                "sandbox": data["sandbox"],
+                "sandbox_code": data.get("sandbox_code"),
+                "message": data.get("message"),
+            },
         )
 
-    async def check(self, verification_id: str, code: str) -> CheckVerificationResponse:
+    async def check(
+        self, verification_id: str, code: str, request_options: Optional[RequestOptions] = None
+    ) -> CheckVerificationResponse:
         """Check/verify an OTP code"""
         data = await self._http.request(
-            "POST", f"/verify/{verification_id}/check", body={"code": code}
+            "POST", f"/verify/{verification_id}/check", body={"code": code}, options=request_options
         )
-        return CheckVerificationResponse(
-            id=data["id"],
-            status=data["status"],
-            phone=data["phone"],
-            verified_at=data.get("verified_at"),
-            remaining_attempts=data.get("remaining_attempts"),
+        return self._http.parse(
+            CheckVerificationResponse,
+            {
+                "id": data["id"],
+                "status": data["status"],
+                "phone": data["phone"],
+                "verified_at": data.get("verified_at"),
+                "remaining_attempts": data.get("remaining_attempts"),
+            },
         )
 
-    async def get(self, verification_id: str) -> Verification:
+    async def get(
+        self, verification_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Verification:
         """Get a verification by ID"""
-        data = await self._http.request("GET", f"/verify/{verification_id}")
-        return Verification(
-            id=data["id"],
-            status=data["status"],
-            phone=data["phone"],
-            delivery_status=data["delivery_status"],
-            attempts=data["attempts"],
-            max_attempts=data["max_attempts"],
-            expires_at=data["expires_at"],
-            verified_at=data.get("verified_at"),
-            created_at=data["created_at"],
-            sandbox=data["sandbox"],
-            app_name=data.get("app_name"),
-            template_id=data.get("template_id"),
-            profile_id=data.get("profile_id"),
+        data = await self._http.request(
+            "GET", f"/verify/{verification_id}", options=request_options
+        )
+        return self._http.parse(
+            Verification,
+            {
+                "id": data["id"],
+                "status": data["status"],
+                "phone": data["phone"],
+                "delivery_status": data["delivery_status"],
+                "attempts": data["attempts"],
+                "max_attempts": data["max_attempts"],
+                "expires_at": data["expires_at"],
+                "verified_at": data.get("verified_at"),
+                "created_at": data["created_at"],
+                "sandbox": data["sandbox"],
+                "app_name": data.get("app_name"),
+                "template_id": data.get("template_id"),
+                "profile_id": data.get("profile_id"),
+            },
         )
 
     async def list(
         self,
         *,
         limit: Optional[int] = None,
+        offset: Optional[int] = None,
         status: Optional[str] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> VerificationListResponse:
         """List recent verifications"""
         params: Dict[str, Any] = {}
         if limit:
             params["limit"] = limit
+        if offset:
+            params["offset"] = offset
         if status:
             params["status"] = status
 
-        data = await self._http.request("GET", "/verify", params=params)
-        return VerificationListResponse(
-            verifications=[
-                Verification(
-                    id=v["id"],
-                    status=v["status"],
-                    phone=v["phone"],
-                    delivery_status=v["delivery_status"],
-                    attempts=v["attempts"],
-                    max_attempts=v["max_attempts"],
-                    expires_at=v["expires_at"],
-                    verified_at=v.get("verified_at"),
-                    created_at=v["created_at"],
-                    sandbox=v["sandbox"],
-                    app_name=v.get("app_name"),
-                    template_id=v.get("template_id"),
-                    profile_id=v.get("profile_id"),
-                )
-                for v in data["verifications"]
-            ],
-            pagination=data["pagination"],
+        data = await self._http.request("GET", "/verify", params=params, options=request_options)
+        return self._http.parse(
+            VerificationListResponse,
+            {
+                "verifications": [
+                    self._http.parse(
+                        Verification,
+                        {
+                            "id": v["id"],
+                            "status": v["status"],
+                            "phone": v["phone"],
+                            "delivery_status": v["delivery_status"],
+                            "attempts": v["attempts"],
+                            "max_attempts": v["max_attempts"],
+                            "expires_at": v["expires_at"],
+                            "verified_at": v.get("verified_at"),
+                            "created_at": v["created_at"],
+                            "sandbox": v["sandbox"],
+                            "app_name": v.get("app_name"),
+                            "template_id": v.get("template_id"),
+                            "profile_id": v.get("profile_id"),
+                        },
+                    )
+                    for v in data["verifications"]
+                ],
+                "pagination": data["pagination"],
+            },
+        )
+
+    def iter_all(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[Verification]], Any]] = None,
+        request_options: Optional[RequestOptions] = None,
+    ) -> AsyncPaginator[Verification]:
+        """Iterate through all verifications, fetching pages lazily (async)"""
+
+        async def fetch_page(offset: int, limit: int) -> Page[Verification]:
+            response = await self.list(
+                limit=limit, offset=offset, status=status, request_options=request_options
+            )
+            pagination = response_field(VerificationListResponse, response, "pagination")
+            return Page(
+                response_field(VerificationListResponse, response, "verifications"),
+                offset,
+                limit,
+                total=pagination.get("total"),
+                has_more=pagination.get("has_more"),
+                response=response,
+            )
+
+        return AsyncPaginator(
+            fetch_page,
+            min(page_size, 100),
+            prefetch=prefetch,
+            max_items=max_items,
+            cursor=cursor,
+            on_page=on_page,
         )
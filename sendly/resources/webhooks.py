@@ -16,7 +16,7 @@ from ..types import (
     WebhookSecretRotation,
     WebhookTestResult,
 )
-from ..utils.http import AsyncHttpClient, HttpClient
+from ..utils.http import AsyncHttpClient, HttpClient, RequestOptions
 
 
 def _transform_webhook_response(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -98,6 +98,7 @@ class WebhooksResource:
         description: Optional[str] = None,
         mode: Optional[WebhookMode] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> WebhookCreatedResponse:
         """
         Create a new webhook endpoint.
@@ -130,20 +131,20 @@ class WebhooksResource:
         if metadata:
             body["metadata"] = metadata
 
-        response = self._http.request("POST", "/webhooks", body=body)
-        return WebhookCreatedResponse(**_transform_webhook_response(response))
+        response = self._http.request("POST", "/webhooks", body=body, options=request_options)
+        return self._http.parse(WebhookCreatedResponse, _transform_webhook_response(response))
 
-    def list(self) -> List[Webhook]:
+    def list(self, request_options: Optional[RequestOptions] = None) -> List[Webhook]:
         """
         List all webhooks.
 
         Returns:
             Array of webhook configurations
         """
-        response = self._http.request("GET", "/webhooks")
-        return [Webhook(**_transform_webhook_response(w)) for w in response]
+        response = self._http.request("GET", "/webhooks", options=request_options)
+        return [self._http.parse(Webhook, _transform_webhook_response(w)) for w in response]
 
-    def get(self, webhook_id: str) -> Webhook:
+    def get(self, webhook_id: str, request_options: Optional[RequestOptions] = None) -> Webhook:
         """
         Get a specific webhook by ID.
 
@@ -159,8 +160,8 @@ class WebhooksResource:
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        response = self._http.request("GET", f"/webhooks/{webhook_id}")
-        return Webhook(**_transform_webhook_response(response))
+        response = self._http.request("GET", f"/webhooks/{webhook_id}", options=request_options)
+        return self._http.parse(Webhook, _transform_webhook_response(response))
 
     def update(
         self,
@@ -171,6 +172,7 @@ class WebhooksResource:
         is_active: Optional[bool] = None,
         mode: Optional[WebhookMode] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Webhook:
         """
         Update a webhook configuration.
@@ -207,10 +209,12 @@ class WebhooksResource:
         if metadata is not None:
             body["metadata"] = metadata
 
-        response = self._http.request("PATCH", f"/webhooks/{webhook_id}", body=body)
-        return Webhook(**_transform_webhook_response(response))
+        response = self._http.request(
+            "PATCH", f"/webhooks/{webhook_id}", body=body, options=request_options
+        )
+        return self._http.parse(Webhook, _transform_webhook_response(response))
 
-    def delete(self, webhook_id: str) -> None:
+    def delete(self, webhook_id: str, request_options: Optional[RequestOptions] = None) -> None:
         """
         Delete a webhook.
 
@@ -223,9 +227,11 @@ class WebhooksResource:
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        self._http.request("DELETE", f"/webhooks/{webhook_id}")
+        self._http.request("DELETE", f"/webhooks/{webhook_id}", options=request_options)
 
-    def test(self, webhook_id: str) -> WebhookTestResult:
+    def test(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> WebhookTestResult:
         """
         Send a test event to a webhook endpoint.
 
@@ -238,10 +244,14 @@ class WebhooksResource:
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        response = self._http.request("POST", f"/webhooks/{webhook_id}/test")
-        return WebhookTestResult(**response)
+        response = self._http.request(
+            "POST", f"/webhooks/{webhook_id}/test", options=request_options
+        )
+        return self._http.parse(WebhookTestResult, response)
 
-    def reset_circuit(self, webhook_id: str) -> dict:
+    def reset_circuit(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> dict:
         """
         Reset the circuit breaker for a webhook.
 
@@ -257,7 +267,9 @@ class WebhooksResource:
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        return self._http.request("POST", f"/webhooks/{webhook_id}/reset-circuit")
+        return self._http.request(
+            "POST", f"/webhooks/{webhook_id}/reset-circuit", options=request_options
+        )
 
     def redeliver(
         self,
@@ -268,6 +280,7 @@ class WebhooksResource:
         event_types: Optional[List[str]] = None,
         statuses: Optional[List[str]] = None,
         limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> dict:
         """
         Replay failed or cancelled webhook deliveries from the audit log.
@@ -309,7 +322,7 @@ class WebhooksResource:
             body["limit"] = limit
 
         return self._http.request(
-            "POST", f"/webhooks/{webhook_id}/redeliver", body=body or None
+            "POST", f"/webhooks/{webhook_id}/redeliver", body=body or None, options=request_options
         )
 
     def backfill(
@@ -320,6 +333,7 @@ class WebhooksResource:
         until: Optional[str] = None,
         event_types: Optional[List[str]] = None,
         limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> dict:
         """
         Backfill missed webhook events from the underlying message log.
@@ -361,10 +375,12 @@ class WebhooksResource:
             body["limit"] = limit
 
         return self._http.request(
-            "POST", f"/webhooks/{webhook_id}/backfill", body=body or None
+            "POST", f"/webhooks/{webhook_id}/backfill", body=body or None, options=request_options
         )
 
-    def rotate_secret(self, webhook_id: str) -> WebhookSecretRotation:
+    def rotate_secret(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> WebhookSecretRotation:
         """
         Rotate the webhook signing secret.
 
@@ -379,13 +395,17 @@ class WebhooksResource:
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        response = self._http.request("POST", f"/webhooks/{webhook_id}/rotate-secret")
+        response = self._http.request(
+            "POST", f"/webhooks/{webhook_id}/rotate-secret", options=request_options
+        )
         # Transform the nested webhook object
         if "webhook" in response:
             response["webhook"] = _transform_webhook_response(response["webhook"])
-        return WebhookSecretRotation(**response)
+        return self._http.parse(WebhookSecretRotation, response)
 
-    def get_deliveries(self, webhook_id: str) -> List[WebhookDelivery]:
+    def get_deliveries(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[WebhookDelivery]:
         """
         Get delivery history for a webhook.
 
@@ -398,10 +418,16 @@ class WebhooksResource:
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        response = self._http.request("GET", f"/webhooks/{webhook_id}/deliveries")
-        return [WebhookDelivery(**_transform_delivery_response(d)) for d in response]
+        response = self._http.request(
+            "GET", f"/webhooks/{webhook_id}/deliveries", options=request_options
+        )
+        return [
+            self._http.parse(WebhookDelivery, _transform_delivery_response(d)) for d in response
+        ]
 
-    def retry_delivery(self, webhook_id: str, delivery_id: str) -> None:
+    def retry_delivery(
+        self, webhook_id: str, delivery_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         """
         Retry a failed delivery.
 
@@ -414,16 +440,20 @@ class WebhooksResource:
         if not delivery_id or not delivery_id.startswith("del_"):
             raise ValueError("Invalid delivery ID format")
 
-        self._http.request("POST", f"/webhooks/{webhook_id}/deliveries/{delivery_id}/retry")
+        self._http.request(
+            "POST",
+            f"/webhooks/{webhook_id}/deliveries/{delivery_id}/retry",
+            options=request_options,
+        )
 
-    def list_event_types(self) -> List[str]:
+    def list_event_types(self, request_options: Optional[RequestOptions] = None) -> List[str]:
         """
         List available event types.
 
         Returns:
             Array of event type strings
         """
-        response = self._http.request("GET", "/webhooks/event-types")
+        response = self._http.request("GET", "/webhooks/event-types", options=request_options)
         return [e["type"] for e in response.get("events", [])]
 
 
@@ -444,6 +474,7 @@ class AsyncWebhooksResource:
         description: Optional[str] = None,
         mode: Optional[WebhookMode] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> WebhookCreatedResponse:
         """Create a new webhook endpoint."""
         if not url or not url.startswith("https://"):
@@ -460,21 +491,25 @@ class AsyncWebhooksResource:
         if metadata:
             body["metadata"] = metadata
 
-        response = await self._http.request("POST", "/webhooks", body=body)
-        return WebhookCreatedResponse(**_transform_webhook_response(response))
+        response = await self._http.request("POST", "/webhooks", body=body, options=request_options)
+        return self._http.parse(WebhookCreatedResponse, _transform_webhook_response(response))
 
-    async def list(self) -> List[Webhook]:
+    async def list(self, request_options: Optional[RequestOptions] = None) -> List[Webhook]:
         """List all webhooks."""
-        response = await self._http.request("GET", "/webhooks")
-        return [Webhook(**_transform_webhook_response(w)) for w in response]
+        response = await self._http.request("GET", "/webhooks", options=request_options)
+        return [self._http.parse(Webhook, _transform_webhook_response(w)) for w in response]
 
-    async def get(self, webhook_id: str) -> Webhook:
+    async def get(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> Webhook:
         """Get a specific webhook by ID."""
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        response = await self._http.request("GET", f"/webhooks/{webhook_id}")
-        return Webhook(**_transform_webhook_response(response))
+        response = await self._http.request(
+            "GET", f"/webhooks/{webhook_id}", options=request_options
+        )
+        return self._http.parse(Webhook, _transform_webhook_response(response))
 
     async def update(
         self,
@@ -485,6 +520,7 @@ class AsyncWebhooksResource:
         is_active: Optional[bool] = None,
         mode: Optional[WebhookMode] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> Webhook:
         """Update a webhook configuration."""
         if not webhook_id or not webhook_id.startswith("whk_"):
@@ -507,30 +543,42 @@ class AsyncWebhooksResource:
         if metadata is not None:
             body["metadata"] = metadata
 
-        response = await self._http.request("PATCH", f"/webhooks/{webhook_id}", body=body)
-        return Webhook(**_transform_webhook_response(response))
+        response = await self._http.request(
+            "PATCH", f"/webhooks/{webhook_id}", body=body, options=request_options
+        )
+        return self._http.parse(Webhook, _transform_webhook_response(response))
 
-    async def delete(self, webhook_id: str) -> None:
+    async def delete(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         """Delete a webhook."""
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        await self._http.request("DELETE", f"/webhooks/{webhook_id}")
+        await self._http.request("DELETE", f"/webhooks/{webhook_id}", options=request_options)
 
-    async def test(self, webhook_id: str) -> WebhookTestResult:
+    async def test(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> WebhookTestResult:
         """Send a test event to a webhook endpoint."""
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        response = await self._http.request("POST", f"/webhooks/{webhook_id}/test")
-        return WebhookTestResult(**response)
+        response = await self._http.request(
+            "POST", f"/webhooks/{webhook_id}/test", options=request_options
+        )
+        return self._http.parse(WebhookTestResult, response)
 
-    async def reset_circuit(self, webhook_id: str) -> dict:
+    async def reset_circuit(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> dict:
         """Reset the circuit breaker for a webhook."""
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        return await self._http.request("POST", f"/webhooks/{webhook_id}/reset-circuit")
+        return await self._http.request(
+            "POST", f"/webhooks/{webhook_id}/reset-circuit", options=request_options
+        )
 
     async def redeliver(
         self,
@@ -541,6 +589,7 @@ class AsyncWebhooksResource:
         event_types: Optional[List[str]] = None,
         statuses: Optional[List[str]] = None,
         limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> dict:
         """Replay failed/cancelled webhook deliveries from the audit log.
 
@@ -562,7 +611,7 @@ class AsyncWebhooksResource:
             body["limit"] = limit
 
         return await self._http.request(
-            "POST", f"/webhooks/{webhook_id}/redeliver", body=body or None
+            "POST", f"/webhooks/{webhook_id}/redeliver", body=body or None, options=request_options
         )
 
     async def backfill(
@@ -573,6 +622,7 @@ class AsyncWebhooksResource:
         until: Optional[str] = None,
         event_types: Optional[List[str]] = None,
         limit: Optional[int] = None,
+        request_options: Optional[RequestOptions] = None,
     ) -> dict:
         """Backfill missed webhook events from the underlying message log.
 
@@ -592,37 +642,53 @@ class AsyncWebhooksResource:
             body["limit"] = limit
 
         return await self._http.request(
-            "POST", f"/webhooks/{webhook_id}/backfill", body=body or None
+            "POST", f"/webhooks/{webhook_id}/backfill", body=body or None, options=request_options
         )
 
-    async def rotate_secret(self, webhook_id: str) -> WebhookSecretRotation:
+    async def rotate_secret(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> WebhookSecretRotation:
         """Rotate the webhook signing secret."""
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        response = await self._http.request("POST", f"/webhooks/{webhook_id}/rotate-secret")
+        response = await self._http.request(
+            "POST", f"/webhooks/{webhook_id}/rotate-secret", options=request_options
+        )
         if "webhook" in response:
             response["webhook"] = _transform_webhook_response(response["webhook"])
-        return WebhookSecretRotation(**response)
+        return self._http.parse(WebhookSecretRotation, response)
 
-    async def get_deliveries(self, webhook_id: str) -> List[WebhookDelivery]:
+    async def get_deliveries(
+        self, webhook_id: str, request_options: Optional[RequestOptions] = None
+    ) -> List[WebhookDelivery]:
         """Get delivery history for a webhook."""
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
 
-        response = await self._http.request("GET", f"/webhooks/{webhook_id}/deliveries")
-        return [WebhookDelivery(**_transform_delivery_response(d)) for d in response]
+        response = await self._http.request(
+            "GET", f"/webhooks/{webhook_id}/deliveries", options=request_options
+        )
+        return [
+            self._http.parse(WebhookDelivery, _transform_delivery_response(d)) for d in response
+        ]
 
-    async def retry_delivery(self, webhook_id: str, delivery_id: str) -> None:
+    async def retry_delivery(
+        self, webhook_id: str, delivery_id: str, request_options: Optional[RequestOptions] = None
+    ) -> None:
         """Retry a failed delivery."""
         if not webhook_id or not webhook_id.startswith("whk_"):
             raise ValueError("Invalid webhook ID format")
         if not delivery_id or not delivery_id.startswith("del_"):
             raise ValueError("Invalid delivery ID format")
 
-        await self._http.request("POST", f"/webhooks/{webhook_id}/deliveries/{delivery_id}/retry")
+        await self._http.request(
+            "POST",
+            f"/webhooks/{webhook_id}/deliveries/{delivery_id}/retry",
+            options=request_options,
+        )
 
-    async def list_event_types(self) -> List[str]:
+    async def list_event_types(self, request_options: Optional[RequestOptions] = None) -> List[str]:
         """List available event types."""
-        response = await self._http.request("GET", "/webhooks/event-types")
+        response = await self._http.request("GET", "/webhooks/event-types", options=request_options)
         return [e["type"] for e in response.get("events", [])]
@@ -0,0 +1,646 @@
+"""
+Sendly Delivery Tracking
+
+Waits for many messages to reach a final status without polling each one:
+batches are read with one ``get_batch`` call each, loose messages are matched
+against pages of the message list, and webhook events resolve messages as
+soon as they arrive.
+"""
+
+import abc
+import asyncio
+import concurrent.futures
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Optional, Set, Tuple, TypeVar, Union
+
+from .client import AsyncSendly, Sendly
+from .errors import NotFoundError, SendlyError, TimeoutError
+from .types import BatchMessageResponse, BatchMessageResult, Message
+from .utils.models import response_field
+from .webhooks import WebhookEvent
+
+# Statuses a message never leaves
+TERMINAL_STATUSES = frozenset({"delivered", "failed", "undelivered", "bounced"})
+
+F = TypeVar("F", "concurrent.futures.Future[Any]", "asyncio.Future[Any]")
+
+
+def _status(value: Any) -> str:
+    """A status as a plain string (models carry enums)"""
+    return str(getattr(value, "value", value))
+
+
+@dataclass
+class DeliveryResult:
+    """Final status of a tracked message"""
+
+    message_id: str
+    """The message ID."""
+
+    status: str
+    """Final status: delivered, failed, undelivered or bounced."""
+
+    error: Optional[str] = None
+    """Error message for failed messages."""
+
+    delivered_at: Optional[Union[str, int]] = None
+    """When the message was delivered."""
+
+    @property
+    def delivered(self) -> bool:
+        return self.status == "delivered"
+
+
+@dataclass
+class DeliveryTrackerStats:
+    """Snapshot of a delivery tracker"""
+
+    pending: int
+    """Messages still waiting for a final status."""
+
+    pending_batches: int
+    """Batches with messages still in flight."""
+
+    resolved: int
+    """Messages that reached a final status."""
+
+    requests: int
+    """API requests made while polling."""
+
+    interval: float
+    """Seconds until the next poll."""
+
+
+class _BaseTracker(abc.ABC, Generic[F]):
+    """Bookkeeping shared by the sync and async trackers (no I/O)"""
+
+    def __init__(
+        self,
+        poll_interval: float,
+        max_interval: float,
+        backoff: float,
+        page_size: int,
+        max_pages: int,
+        max_gets: int,
+    ):
+        if poll_interval <= 0 or max_interval < poll_interval:
+            raise ValueError("poll_interval must be positive and at most max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if not 1 <= page_size <= 100:
+            raise ValueError("page_size must be between 1 and 100")
+        self.poll_interval = poll_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_gets = max_gets
+        self.interval = poll_interval
+        self._lock = threading.Lock()
+        self._messages: Dict[str, F] = {}
+        self._batch_of: Dict[str, str] = {}
+        self._batches: Dict[str, F] = {}
+        self._statuses: Dict[str, str] = {}
+        self._resolved = 0
+        self._requests = 0
+        self._gets = 0
+        self._last_get: Dict[str, int] = {}
+        self._error: Optional[BaseException] = None
+
+    @abc.abstractmethod
+    def _new_future(self) -> F:
+        """A pending future for one tracked message"""
+
+    def track(self, message_id: str, batch_id: Optional[str] = None) -> F:
+        """
+        Start tracking a message
+
+        Args:
+            message_id: The message to wait for
+            batch_id: The batch it was sent in, if any; it is then read from
+                the batch instead of the message list
+
+        Returns:
+            A future resolved with a :class:`DeliveryResult` once the message
+            is final (tracking the same ID twice returns the same future)
+        """
+        error = self._error
+        if error is not None:
+            return self._failed_future(error)
+        with self._lock:
+            idle = not self._messages and not self._batches
+            future = self._messages.get(message_id)
+            if future is None:
+                future = self._messages[message_id] = self._new_future()
+            if batch_id is not None:
+                self._batch_of[message_id] = batch_id
+        if idle:
+            self._wake()
+        return future
+
+    def track_batch(self, batch_id: str) -> F:
+        """
+        Start tracking every message of a batch
+
+        Returns:
+            A future resolved with the final batch response once each of its
+            messages is final. The messages' own futures (from :meth:`track`)
+            resolve as they finish.
+        """
+        error = self._error
+        if error is not None:
+            return self._failed_future(error)
+        with self._lock:
+            idle = not self._messages and not self._batches
+            future = self._batches.get(batch_id)
+            if future is None:
+                future = self._batches[batch_id] = self._new_future()
+        if idle:
+            self._wake()
+        return future
+
+    def handle_event(self, event: WebhookEvent) -> bool:
+        """
+        Feed a ``message.*`` webhook event to the tracker
+
+        Returns:
+            True if the event resolved a tracked message
+        """
+        data = event.data
+        return self._observe(data.id, data.status, data.error, data.delivered_at)
+
+    @property
+    def pending(self) -> int:
+        """Messages and batches still being tracked"""
+        return len(self._messages) + len(self._batches)
+
+    def stats(self) -> DeliveryTrackerStats:
+        with self._lock:
+            return DeliveryTrackerStats(
+                pending=len(self._messages),
+                pending_batches=len(self._batches),
+                resolved=self._resolved,
+                requests=self._requests,
+                interval=self.interval,
+            )
+
+    def _wake(self) -> None:
+        """Start an idle poll loop on newly tracked work"""
+
+    def _observe(
+        self,
+        message_id: Optional[str],
+        status: Any,
+        error: Optional[str] = None,
+        delivered_at: Optional[Union[str, int]] = None,
+    ) -> bool:
+        """Record a message's status, resolving it if final; True if that changed anything"""
+        if not message_id:
+            return False
+        value = _status(status)
+        with self._lock:
+            if message_id not in self._messages:
+                return False
+            if value not in TERMINAL_STATUSES:
+                changed = self._statuses.get(message_id) != value
+                self._statuses[message_id] = value
+                return changed
+            future = self._messages.pop(message_id)
+            self._batch_of.pop(message_id, None)
+            self._statuses.pop(message_id, None)
+            self._last_get.pop(message_id, None)
+            self._resolved += 1
+        if not future.done():
+            future.set_result(DeliveryResult(message_id, value, error, delivered_at))
+        return True
+
+    def _observe_batch(self, batch_id: str, batch: Any) -> bool:
+        """Record every message of a batch response; True if anything changed"""
+        changed = False
+        final = True
+        for item in response_field(BatchMessageResponse, batch, "messages"):
+            message_id = response_field(BatchMessageResult, item, "id")
+            status = _status(response_field(BatchMessageResult, item, "status"))
+            if self._observe(
+                message_id,
+                status,
+                response_field(BatchMessageResult, item, "error"),
+                response_field(BatchMessageResult, item, "delivered_at"),
+            ):
+                changed = True
+            if message_id and status not in TERMINAL_STATUSES:
+                final = False
+        if final:
+            with self._lock:
+                future = self._batches.pop(batch_id, None)
+            if future is not None and not future.done():
+                future.set_result(batch)
+                changed = True
+        return changed
+
+    def _observe_message(self, message: Any) -> bool:
+        return self._observe(
+            response_field(Message, message, "id"),
+            response_field(Message, message, "status"),
+            response_field(Message, message, "error"),
+            response_field(Message, message, "delivered_at"),
+        )
+
+    def _plan(self) -> Tuple[List[str], Set[str]]:
+        """Batches to fetch and loose messages to look for in this poll"""
+        with self._lock:
+            batches = set(self._batches)
+            batches.update(self._batch_of[m] for m in self._messages if m in self._batch_of)
+            loose = {m for m in self._messages if m not in self._batch_of}
+        return sorted(batches), loose
+
+    def _pick_gets(self, loose: Set[str]) -> List[str]:
+        """Loose messages to look up singly this poll, least recently looked up first"""
+        with self._lock:
+            last = self._last_get
+            picked = heapq.nsmallest(self.max_gets, loose, key=lambda m: (last.get(m, 0), m))
+            for message_id in picked:
+                self._gets += 1
+                last[message_id] = self._gets
+        return picked
+
+    def _fail(self, message_id: str, error: SendlyError) -> None:
+        with self._lock:
+            future = self._messages.pop(message_id, None)
+            self._batch_of.pop(message_id, None)
+            self._statuses.pop(message_id, None)
+            self._last_get.pop(message_id, None)
+        if future is not None and not future.done():
+            future.set_exception(error)
+
+    def _fail_batch(self, batch_id: str, error: SendlyError) -> None:
+        with self._lock:
+            future = self._batches.pop(batch_id, None)
+            orphans = [m for m, b in self._batch_of.items() if b == batch_id]
+        if future is not None and not future.done():
+            future.set_exception(error)
+        for message_id in orphans:
+            self._fail(message_id, error)
+
+    def _crash(self, error: BaseException) -> None:
+        """Fail every pending future (and later tracks) after the poll loop died"""
+        with self._lock:
+            self._error = error
+            futures = list(self._messages.values()) + list(self._batches.values())
+            self._messages.clear()
+            self._batches.clear()
+            self._batch_of.clear()
+            self._statuses.clear()
+            self._last_get.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _failed_future(self, error: BaseException) -> F:
+        future = self._new_future()
+        future.set_exception(error)
+        return future
+
+    def _adapt(self, progressed: bool) -> float:
+        """Poll again soon after progress, back off while nothing changes"""
+        if progressed:
+            self.interval = self.poll_interval
+        else:
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+        return self.interval
+
+
+class DeliveryTracker(_BaseTracker["concurrent.futures.Future[Any]"]):
+    """
+    Waits for message delivery with batched polling (synchronous)
+
+    Each poll costs one ``get_batch`` request per tracked batch, plus up to
+    ``max_pages`` pages of the message list for loose messages, plus at most
+    ``max_gets`` single lookups for messages the list didn't reach. Polls
+    back off while nothing changes. Futures are ``concurrent.futures.Future``
+    objects, so they can be waited on from any thread.
+
+    Example:
+        >>> tracker = DeliveryTracker(client)
+        >>> batch = client.messages.send_batch(messages)
+        >>> done = tracker.track_batch(batch.batch_id)
+        >>> futures = [tracker.track(m.id, batch.batch_id) for m in batch.messages if m.id]
+        >>> tracker.run_until_complete(timeout=300)
+        >>> print(sum(f.result().delivered for f in futures))
+    """
+
+    def __init__(
+        self,
+        client: Sendly,
+        *,
+        poll_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        page_size: int = 100,
+        max_pages: int = 10,
+        max_gets: int = 10,
+    ):
+        """
+        Args:
+            client: The client to poll with
+            poll_interval: Seconds between polls while statuses are changing
+            max_interval: Longest wait between polls when nothing changes
+            backoff: Factor the wait grows by after each poll without changes
+            page_size: Messages per list page (max 100)
+            max_pages: List pages read per poll when looking for loose messages
+            max_gets: Single-message lookups per poll for loose messages
+                the list pages didn't reach (taken in turn across polls)
+        """
+        super().__init__(poll_interval, max_interval, backoff, page_size, max_pages, max_gets)
+        self.client = client
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _new_future(self) -> "concurrent.futures.Future[Any]":
+        return concurrent.futures.Future()
+
+    def _wake(self) -> None:
+        self._wakeup.set()
+
+    def poll(self) -> bool:
+        """
+        Poll once
+
+        Returns:
+            True if any tracked message changed status
+        """
+        batches, loose = self._plan()
+        progressed = False
+        for batch_id in batches:
+            self._requests += 1
+            try:
+                batch = self.client.messages.get_batch(batch_id)
+            except NotFoundError as e:
+                self._fail_batch(batch_id, e)
+                continue
+            progressed = self._observe_batch(batch_id, batch) or progressed
+        if loose:
+            progressed = self._poll_loose(loose) or progressed
+        return progressed
+
+    def _poll_loose(self, loose: Set[str]) -> bool:
+        progressed = False
+        pages = self.client.messages.list_all(
+            batch_size=self.page_size, max_items=self.page_size * self.max_pages
+        )
+        try:
+            for page in pages.pages():
+                self._requests += 1
+                for message in page.items:
+                    message_id = response_field(Message, message, "id")
+                    if message_id in loose:
+                        loose.discard(message_id)
+                        progressed = self._observe_message(message) or progressed
+                if not loose:
+                    break
+        finally:
+            pages.close()
+        for message_id in self._pick_gets(loose):
+            self._requests += 1
+            try:
+                message = self.client.messages.get(message_id)
+            except NotFoundError as e:
+                self._fail(message_id, e)
+                continue
+            progressed = self._observe_message(message) or progressed
+        return progressed
+
+    def run_until_complete(self, timeout: Optional[float] = None) -> None:
+        """
+        Poll in this thread until every tracked message and batch is final
+
+        Raises:
+            TimeoutError: If ``timeout`` seconds pass first (tracking continues
+                on the next call)
+        """
+        until = None if timeout is None else time.monotonic() + timeout
+        while self.pending:
+            delay = self._adapt(self.poll())
+            if not self.pending:
+                return
+            if until is not None:
+                left = until - time.monotonic()
+                if left <= 0:
+                    raise TimeoutError(f"{self.pending} tracked messages still pending")
+                delay = min(delay, left)
+            time.sleep(delay)
+
+    def start(self) -> None:
+        """
+        Poll from a background thread until :meth:`stop`
+
+        API errors are retried on the next poll. Any other exception stops
+        the thread and is raised from every pending future, and from futures
+        tracked afterwards until the tracker is started again.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._error = None
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="sendly-delivery", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread (pending futures stay unresolved)"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.clear()
+            if not self.pending:
+                self._wakeup.wait()
+                continue
+            try:
+                delay = self._adapt(self.poll())
+            except SendlyError:
+                # Transient API trouble: keep the futures, try again later
+                delay = self._adapt(False)
+            except Exception as e:
+                self._crash(e)
+                return
+            self._wakeup.wait(delay)
+
+    def __enter__(self) -> "DeliveryTracker":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+class AsyncDeliveryTracker(_BaseTracker["asyncio.Future[Any]"]):
+    """
+    Waits for message delivery with batched polling (asynchronous)
+
+    Async version of :class:`DeliveryTracker`; futures are asyncio futures
+    of the loop the tracker is used on.
+
+    Example:
+        >>> async with AsyncDeliveryTracker(client) as tracker:
+        ...     futures = [tracker.track(m.id) for m in sent]
+        ...     results = await asyncio.gather(*futures)
+    """
+
+    def __init__(
+        self,
+        client: AsyncSendly,
+        *,
+        poll_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        page_size: int = 100,
+        max_pages: int = 10,
+        max_gets: int = 10,
+    ):
+        """
+        Args:
+            client: The client to poll with
+            poll_interval: Seconds between polls while statuses are changing
+            max_interval: Longest wait between polls when nothing changes
+            backoff: Factor the wait grows by after each poll without changes
+            page_size: Messages per list page (max 100)
+            max_pages: List pages read per poll when looking for loose messages
+            max_gets: Single-message lookups per poll for loose messages
+                the list pages didn't reach (taken in turn across polls)
+        """
+        super().__init__(poll_interval, max_interval, backoff, page_size, max_pages, max_gets)
+        self.client = client
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def _new_future(self) -> "asyncio.Future[Any]":
+        return asyncio.get_running_loop().create_future()
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def poll(self) -> bool:
+        """
+        Poll once
+
+        Returns:
+            True if any tracked message changed status
+        """
+        batches, loose = self._plan()
+        progressed = False
+        for batch_id in batches:
+            self._requests += 1
+            try:
+                batch = await self.client.messages.get_batch(batch_id)
+            except NotFoundError as e:
+                self._fail_batch(batch_id, e)
+                continue
+            progressed = self._observe_batch(batch_id, batch) or progressed
+        if loose:
+            progressed = await self._poll_loose(loose) or progressed
+        return progressed
+
+    async def _poll_loose(self, loose: Set[str]) -> bool:
+        progressed = False
+        pages = self.client.messages.list_all(
+            batch_size=self.page_size, max_items=self.page_size * self.max_pages
+        )
+        try:
+            async for page in pages.pages():
+                self._requests += 1
+                for message in page.items:
+                    message_id = response_field(Message, message, "id")
+                    if message_id in loose:
+                        loose.discard(message_id)
+                        progressed = self._observe_message(message) or progressed
+                if not loose:
+                    break
+        finally:
+            await pages.aclose()
+        for message_id in self._pick_gets(loose):
+            self._requests += 1
+            try:
+                message = await self.client.messages.get(message_id)
+            except NotFoundError as e:
+                self._fail(message_id, e)
+                continue
+            progressed = self._observe_message(message) or progressed
+        return progressed
+
+    async def run_until_complete(self, timeout: Optional[float] = None) -> None:
+        """
+        Poll until every tracked message and batch is final
+
+        Raises:
+            TimeoutError: If ``timeout`` seconds pass first (tracking continues
+                on the next call)
+        """
+        until = None if timeout is None else time.monotonic() + timeout
+        while self.pending:
+            delay = self._adapt(await self.poll())
+            if not self.pending:
+                return
+            if until is not None:
+                left = until - time.monotonic()
+                if left <= 0:
+                    raise TimeoutError(f"{self.pending} tracked messages still pending")
+                delay = min(delay, left)
+            await asyncio.sleep(delay)
+
+    def start(self) -> None:
+        """
+        Poll from a background task until :meth:`stop`
+
+        Errors are handled as in :meth:`DeliveryTracker.start`.
+        """
+        if self._task is not None and not self._task.done():
+            return
+        self._error = None
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task (pending futures stay unresolved)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            self._wakeup.clear()
+            if not self.pending:
+                await self._wakeup.wait()
+                continue
+            try:
+                delay = self._adapt(await self.poll())
+            except SendlyError:
+                # Transient API trouble: keep the futures, try again later
+                delay = self._adapt(False)
+            except Exception as e:
+                self._crash(e)
+                return
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def __aenter__(self) -> "AsyncDeliveryTracker":
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
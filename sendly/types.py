@@ -423,6 +423,77 @@ class ListBatchesOptions(BaseModel):
     )
 
 
+# ============================================================================
+# Bulk Sending
+# ============================================================================
+
+
+class SendResult(BaseModel):
+    """Outcome of one message in a ``send_many`` run"""
+
+    index: int = Field(..., description="Position of the message in the input")
+    request: Dict[str, Any] = Field(..., description="The input item that was sent")
+    message: Optional[Any] = Field(
+        default=None, description="The created message (a Message unless response_mode is set)"
+    )
+    error: Optional[Any] = Field(
+        default=None, description="The SendlyError raised for this message, if any"
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the message was sent successfully"""
+        return self.error is None
+
+
+class BatchChunkError(BaseModel):
+    """A ``send_batch_stream`` chunk that could not be submitted"""
+
+    index: int = Field(..., description="Position of the chunk in the stream")
+    size: int = Field(..., description="Number of messages in the chunk")
+    error: Any = Field(..., description="The SendlyError raised for the chunk")
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class BatchStreamSummary(BaseModel):
+    """Running totals across every chunk of a ``send_batch_stream`` run"""
+
+    chunks: int = Field(default=0, description="Chunks submitted successfully")
+    total: int = Field(default=0, description="Messages accepted into batches")
+    queued: int = Field(default=0, description="Messages queued successfully")
+    sent: int = Field(default=0, description="Messages sent")
+    failed: int = Field(default=0, description="Messages that failed")
+    credits_used: int = Field(default=0, description="Total credits used")
+    batch_ids: List[str] = Field(default_factory=list, description="Created batch IDs")
+    errors: List[BatchChunkError] = Field(
+        default_factory=list, description="Chunks that could not be submitted"
+    )
+
+    @property
+    def unsent(self) -> int:
+        """Messages in chunks that could not be submitted"""
+        return sum(error.size for error in self.errors)
+
+
+class BatchUpdate(BaseModel):
+    """One poll of a batch while waiting for it to finish"""
+
+    batch_id: str = Field(..., description="Polled batch ID")
+    batch: Any = Field(
+        ..., description="The polled batch (a BatchMessageResponse unless response_mode is set)"
+    )
+    changed: List[Any] = Field(
+        default_factory=list,
+        description="Message results whose status changed since the previous poll",
+    )
+    done: bool = Field(default=False, description="Whether the batch reached a final status")
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
 # ============================================================================
 # Errors
 # ============================================================================
@@ -439,7 +510,7 @@ class ApiErrorResponse(BaseModel):
     current_balance: Optional[int] = Field(
         default=None, alias="currentBalance", description="Current balance"
     )
-    retry_after: Optional[int] = Field(
+    retry_after: Optional[float] = Field(
         default=None, alias="retryAfter", description="Seconds to wait"
     )
 
@@ -456,7 +527,7 @@ class RateLimitInfo(BaseModel):
 
     limit: int = Field(..., description="Max requests per window")
     remaining: int = Field(..., description="Remaining requests")
-    reset: int = Field(..., description="Seconds until reset")
+    reset: float = Field(..., description="Seconds until reset")
 
 
 # ============================================================================
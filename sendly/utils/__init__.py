@@ -1,20 +1,90 @@
 """Sendly SDK Utilities"""
 
-from .http import AsyncHttpClient, HttpClient
+from .cache import CacheStats, ResponseCache
+from .codec import JsonCodec, MsgspecCodec, OrjsonCodec, get_codec
+from .encoding import (
+    SegmentInfo,
+    get_encoding,
+    get_segment_info,
+    split_segments,
+    transliterate,
+)
+from .hooks import (
+    ErrorEvent,
+    Hooks,
+    RequestEvent,
+    ResponseEvent,
+    RetryEvent,
+)
+from .http import AsyncHttpClient, HttpClient, RequestOptions
+from .metrics import MetricsCollector
+from .models import LazyModel, ResponseMode
+from .pagination import AsyncPaginator, Page, PageCursor, Paginator
+from .preflight import BatchPreflight, preflight_batch
+from .pricing import (
+    CostEstimate,
+    Destination,
+    EncodingOptimization,
+    estimate_cost,
+    get_pricing_tier,
+    optimize_encoding,
+    resolve_destination,
+    resolve_destinations,
+)
+from .rate_limit import AsyncRateLimiter, RateLimiter, RateLimiterStats
+from .retry import (
+    CircuitBreaker,
+    CircuitBreakerStats,
+    RetryBudget,
+    RetryPolicy,
+    deadline,
+)
+from .streaming import JsonArrayScanner
 from .validation import (
+    PhoneValidationResult,
     calculate_segments,
     get_country_from_phone,
     is_country_supported,
+    normalize_phone_number,
     validate_limit,
     validate_message_id,
     validate_message_text,
     validate_phone_number,
+    validate_phone_numbers,
     validate_sender_id,
 )
 
 __all__ = [
     "HttpClient",
     "AsyncHttpClient",
+    "RequestOptions",
+    "JsonCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "get_codec",
+    "Hooks",
+    "RequestEvent",
+    "ResponseEvent",
+    "RetryEvent",
+    "ErrorEvent",
+    "MetricsCollector",
+    "LazyModel",
+    "ResponseMode",
+    "Paginator",
+    "AsyncPaginator",
+    "Page",
+    "PageCursor",
+    "RateLimiter",
+    "AsyncRateLimiter",
+    "RateLimiterStats",
+    "RetryPolicy",
+    "RetryBudget",
+    "CircuitBreaker",
+    "CircuitBreakerStats",
+    "deadline",
+    "ResponseCache",
+    "CacheStats",
+    "JsonArrayScanner",
     "validate_phone_number",
     "validate_message_text",
     "validate_sender_id",
@@ -22,5 +92,23 @@ __all__ = [
     "validate_message_id",
     "get_country_from_phone",
     "is_country_supported",
+    "normalize_phone_number",
+    "validate_phone_numbers",
+    "PhoneValidationResult",
     "calculate_segments",
+    "get_segment_info",
+    "get_encoding",
+    "split_segments",
+    "transliterate",
+    "SegmentInfo",
+    "estimate_cost",
+    "get_pricing_tier",
+    "resolve_destination",
+    "resolve_destinations",
+    "Destination",
+    "CostEstimate",
+    "BatchPreflight",
+    "preflight_batch",
+    "optimize_encoding",
+    "EncodingOptimization",
 ]
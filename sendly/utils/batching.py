@@ -0,0 +1,198 @@
+"""
+Batch Chunking Utilities
+
+Split an unbounded stream of messages into ``send_batch``-sized chunks and
+aggregate the results, without ever holding more than the in-flight window
+of chunks in memory.
+"""
+
+import json
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from ..errors import SendlyError
+from ..types import BatchChunkError, BatchMessageResponse, BatchStreamSummary
+from .concurrency import Outcome
+from .models import response_field
+
+MAX_BATCH_SIZE = 1000
+
+# Allowance for the request envelope ({"messages":[...],"from":...}) per chunk
+_ENVELOPE_BYTES = 256
+
+
+def _message_size(message: Dict[str, Any]) -> int:
+    """Approximate encoded size of one message in a batch body"""
+    return len(json.dumps(message, separators=(",", ":")).encode("utf-8")) + 1
+
+
+def _check_chunking(chunk_size: int, max_chunk_bytes: Optional[int]) -> None:
+    if not 1 <= chunk_size <= MAX_BATCH_SIZE:
+        raise ValueError(f"chunk_size must be between 1 and {MAX_BATCH_SIZE}")
+    if max_chunk_bytes is not None and max_chunk_bytes <= _ENVELOPE_BYTES:
+        raise ValueError(f"max_chunk_bytes must be greater than {_ENVELOPE_BYTES}")
+
+
+class _ChunkBuilder:
+    """Accumulates messages until a chunk is full by count or bytes"""
+
+    def __init__(self, chunk_size: int, max_chunk_bytes: Optional[int]):
+        _check_chunking(chunk_size, max_chunk_bytes)
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.chunk: List[Dict[str, Any]] = []
+        self.size = _ENVELOPE_BYTES
+
+    def add(self, message: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Add a message, returning the previous chunk if this one overflowed it"""
+        full: Optional[List[Dict[str, Any]]] = None
+        message_size = _message_size(message) if self.max_chunk_bytes is not None else 0
+        if self.chunk and (
+            len(self.chunk) >= self.chunk_size
+            or (
+                self.max_chunk_bytes is not None and self.size + message_size > self.max_chunk_bytes
+            )
+        ):
+            full = self.flush()
+        self.chunk.append(message)
+        self.size += message_size
+        return full
+
+    def flush(self) -> List[Dict[str, Any]]:
+        chunk, self.chunk, self.size = self.chunk, [], _ENVELOPE_BYTES
+        return chunk
+
+
+def iter_chunks(
+    messages: Iterable[Dict[str, Any]],
+    chunk_size: int = MAX_BATCH_SIZE,
+    max_chunk_bytes: Optional[int] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Lazily pack messages into chunks
+
+    Args:
+        messages: Message dicts ('to', 'text', optional 'metadata')
+        chunk_size: Maximum messages per chunk (1-1000)
+        max_chunk_bytes: Optional cap on the encoded request size per chunk.
+            A single message larger than the cap gets a chunk of its own.
+
+    Returns:
+        An iterator of lists of at most ``chunk_size`` messages
+
+    Raises:
+        ValueError: If the chunk limits are out of range
+    """
+    # Validate eagerly rather than on the first next()
+    builder = _ChunkBuilder(chunk_size, max_chunk_bytes)
+
+    def chunks() -> Iterator[List[Dict[str, Any]]]:
+        for message in messages:
+            full = builder.add(message)
+            if full:
+                yield full
+        if builder.chunk:
+            yield builder.flush()
+
+    return chunks()
+
+
+def aiter_chunks(
+    messages: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]],
+    chunk_size: int = MAX_BATCH_SIZE,
+    max_chunk_bytes: Optional[int] = None,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Async counterpart of :func:`iter_chunks`, also accepting async iterables"""
+    builder = _ChunkBuilder(chunk_size, max_chunk_bytes)
+
+    async def chunks() -> AsyncIterator[List[Dict[str, Any]]]:
+        if isinstance(messages, AsyncIterable):
+            async for message in messages:
+                full = builder.add(message)
+                if full:
+                    yield full
+        else:
+            for message in messages:
+                full = builder.add(message)
+                if full:
+                    yield full
+        if builder.chunk:
+            yield builder.flush()
+
+    return chunks()
+
+
+def _record(summary: BatchStreamSummary, outcome: Outcome) -> Optional[BatchMessageResponse]:
+    """Fold one chunk outcome into the summary; returns the response on success"""
+    if outcome.error is not None:
+        if not isinstance(outcome.error, SendlyError):
+            raise outcome.error
+        summary.errors.append(
+            BatchChunkError(index=outcome.position, size=len(outcome.item), error=outcome.error)
+        )
+        return None
+
+    response: BatchMessageResponse = outcome.result
+    summary.chunks += 1
+    summary.total += response_field(BatchMessageResponse, response, "total")
+    summary.queued += response_field(BatchMessageResponse, response, "queued")
+    summary.sent += response_field(BatchMessageResponse, response, "sent")
+    summary.failed += response_field(BatchMessageResponse, response, "failed")
+    summary.credits_used += response_field(BatchMessageResponse, response, "credits_used")
+    summary.batch_ids.append(response_field(BatchMessageResponse, response, "batch_id"))
+    return response
+
+
+class BatchStream:
+    """
+    Iterator over the batches submitted by ``send_batch_stream``
+
+    Yields each BatchMessageResponse as its chunk completes and keeps a
+    running :class:`BatchStreamSummary` in ``summary``. Chunks that fail are
+    recorded in ``summary.errors`` instead of stopping the stream.
+    """
+
+    def __init__(self, outcomes: Iterator[Outcome]):
+        self._outcomes = outcomes
+        self.summary = BatchStreamSummary()
+
+    def __iter__(self) -> Iterator[BatchMessageResponse]:
+        for outcome in self._outcomes:
+            response = _record(self.summary, outcome)
+            if response is not None:
+                yield response
+
+    def wait(self) -> BatchStreamSummary:
+        """Drain the stream and return the final summary"""
+        for _ in self:
+            pass
+        return self.summary
+
+
+class AsyncBatchStream:
+    """Async counterpart of :class:`BatchStream`"""
+
+    def __init__(self, outcomes: AsyncIterator[Outcome]):
+        self._outcomes = outcomes
+        self.summary = BatchStreamSummary()
+
+    async def __aiter__(self) -> AsyncIterator[BatchMessageResponse]:
+        async for outcome in self._outcomes:
+            response = _record(self.summary, outcome)
+            if response is not None:
+                yield response
+
+    async def wait(self) -> BatchStreamSummary:
+        """Drain the stream and return the final summary"""
+        async for _ in self:
+            pass
+        return self.summary
@@ -0,0 +1,285 @@
+"""
+Response Cache
+
+Opt-in cache for GET endpoints that change rarely (countries, templates,
+labels, rules, account details). Entries live for a per-endpoint TTL, are
+revalidated with ``If-None-Match`` once they expire, can be served stale
+while a refresh runs in the background, and are dropped when a mutation
+hits the same resource or its collection.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .hooks import path_template
+
+# Read-mostly endpoints cached by default, keyed by path template
+DEFAULT_CACHE_TTLS: Dict[str, float] = {
+    "/numbers/countries": 3600.0,
+    "/templates": 300.0,
+    "/templates/presets": 3600.0,
+    "/templates/{id}": 300.0,
+    "/webhooks/event-types": 3600.0,
+    "/labels": 300.0,
+    "/rules": 300.0,
+    "/account": 60.0,
+    "/enterprise/account": 60.0,
+}
+
+# POST endpoints that only compute a result, so they invalidate nothing
+NON_MUTATING_PATHS = frozenset({"/templates/{id}/preview"})
+
+CacheKey = Tuple[Hashable, ...]
+
+# Lookup outcomes
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+def _resource_path(path: str) -> str:
+    """An API path without its query or trailing slash"""
+    return path.split("?", 1)[0].rstrip("/")
+
+
+def invalidates(mutated: str, cached: str) -> bool:
+    """
+    Whether a mutation on ``mutated`` can change the GET of ``cached``
+
+    True for the same resource, for the collections above it (a new or
+    changed template alters ``/templates``) and, when an item is mutated,
+    for the paths below it. Siblings such as ``/templates/presets`` or
+    ``/enterprise/account`` are unaffected.
+    """
+    if cached == mutated or mutated.startswith(cached + "/"):
+        return True
+    return path_template(mutated).endswith("{id}") and cached.startswith(mutated + "/")
+
+
+def cache_key(
+    api_key: str,
+    organization_id: Optional[str],
+    path: str,
+    params: Optional[Dict[str, Any]],
+) -> CacheKey:
+    """Identify a GET: same credentials, organization, path and query"""
+    query = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+    return (api_key, organization_id, path, query)
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of a response cache's counters"""
+
+    hits: int
+    """Requests answered from a fresh entry."""
+
+    stale_hits: int
+    """Requests answered from a stale entry while it was refreshed in the background."""
+
+    misses: int
+    """Requests that had to go to the API (including revalidations)."""
+
+    revalidated: int
+    """Misses the API answered with 304 Not Modified."""
+
+    invalidations: int
+    """Entries dropped because a mutation touched their resource."""
+
+    evictions: int
+    """Entries dropped to stay within ``max_entries``."""
+
+    size: int
+    """Entries currently cached."""
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered without waiting on the API"""
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+class CacheEntry:
+    """A cached response body and its freshness"""
+
+    __slots__ = ("path", "body", "etag", "expires", "stale_until", "refreshing")
+
+    def __init__(self, path: str, body: bytes, etag: Optional[str]):
+        self.path = path
+        self.body = body
+        self.etag = etag
+        self.expires = 0.0
+        self.stale_until = 0.0
+        self.refreshing = False
+
+
+class ResponseCache:
+    """
+    LRU cache of GET response bodies with per-endpoint TTLs
+
+    Thread-safe, and may be shared by several clients: entries are keyed by
+    API key and organization as well as path and query.
+
+    Example:
+        >>> cache = ResponseCache(ttls={'/templates': 60}, stale_while_revalidate=30)
+        >>> client = Sendly('sk_live_v1_xxx', cache=cache)
+        >>> client.templates.presets()   # API
+        >>> client.templates.presets()   # cache
+        >>> cache.stats().hit_ratio
+        0.5
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 512,
+        stale_while_revalidate: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttls: Seconds to keep each endpoint, by path template (e.g.
+                ``/templates/{id}``); merged over ``DEFAULT_CACHE_TTLS``. A
+                TTL of 0 turns caching off for that endpoint.
+            max_entries: Entries kept before the least recently used is evicted
+            stale_while_revalidate: Seconds past expiry during which the stale
+                body is still returned while a background request refreshes it
+            clock: Monotonic time source (for tests)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttls = dict(DEFAULT_CACHE_TTLS)
+        self.ttls.update(ttls or {})
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation, so a GET that raced a mutation
+        # doesn't store what it read before the change
+        self._generation = 0
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._revalidated = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Seconds to cache ``path`` for, or None if it isn't cached"""
+        ttl = self.ttls.get(path_template(path))
+        return ttl if ttl else None
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def lookup(self, key: CacheKey) -> Tuple[Optional[CacheEntry], str]:
+        """
+        Find the entry for a GET
+
+        Returns ``(entry, state)``. On ``FRESH`` the body can be returned
+        as-is; on ``STALE`` it can too, but should be refreshed in the
+        background. On ``MISS`` the caller must fetch, revalidating with
+        ``entry`` (which may be None) if it has an ETag.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if now < entry.expires:
+                    self._hits += 1
+                    return entry, FRESH
+                if now < entry.stale_until:
+                    self._stale_hits += 1
+                    return entry, STALE
+            self._misses += 1
+            return entry, MISS
+
+    def begin_refresh(self, entry: CacheEntry) -> bool:
+        """Claim a stale entry's background refresh; False if one is already running"""
+        with self._lock:
+            if entry.refreshing:
+                return False
+            entry.refreshing = True
+            return True
+
+    def end_refresh(self, entry: Optional[CacheEntry]) -> None:
+        if entry is not None:
+            entry.refreshing = False
+
+    def store(
+        self,
+        key: CacheKey,
+        path: str,
+        body: bytes,
+        etag: Optional[str],
+        ttl: float,
+        generation: int,
+    ) -> None:
+        """Cache a 200 response, unless its resource was invalidated since ``generation``"""
+        entry = CacheEntry(_resource_path(path), body, etag)
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._set_expiry(entry, ttl)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def revalidated(self, key: CacheKey, entry: CacheEntry, ttl: float, generation: int) -> None:
+        """Extend an entry the API answered with 304 Not Modified"""
+        with self._lock:
+            self._revalidated += 1
+            if generation == self._generation and self._entries.get(key) is entry:
+                self._set_expiry(entry, ttl)
+
+    def invalidate(self, path: Optional[str] = None) -> int:
+        """
+        Drop the entries a mutation on ``path`` affects (every entry when None)
+
+        A write to ``/templates/tpl_1`` drops ``/templates/tpl_1`` and the
+        ``/templates`` listing but keeps ``/templates/presets``; see
+        :func:`invalidates`. Paths in ``NON_MUTATING_PATHS`` (e.g. template
+        previews) drop nothing. Returns how many entries were dropped.
+        """
+        mutated = None if path is None else _resource_path(path)
+        if mutated is not None and path_template(mutated) in NON_MUTATING_PATHS:
+            return 0
+        with self._lock:
+            self._generation += 1
+            stale = [
+                k
+                for k, e in self._entries.items()
+                if mutated is None or invalidates(mutated, e.path)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)"""
+        self.invalidate()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                revalidated=self._revalidated,
+                invalidations=self._invalidations,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def _set_expiry(self, entry: CacheEntry, ttl: float) -> None:
+        entry.expires = self._clock() + ttl
+        entry.stale_until = entry.expires + self.stale_while_revalidate
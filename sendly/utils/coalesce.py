@@ -0,0 +1,110 @@
+"""
+Request Coalescing
+
+Single-flight deduplication of identical concurrent GETs: while one request
+for a resource is in flight, other callers asking for the same resource wait
+for its response instead of sending their own.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from .cache import CacheKey, cache_key
+
+T = TypeVar("T")
+
+
+def flight_key(
+    api_key: str,
+    organization_id: Optional[str],
+    path: str,
+    params: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+) -> CacheKey:
+    """Identify a GET: credentials, organization, path, query and extra headers"""
+    extra = tuple(sorted((headers or {}).items()))
+    return ("GET",) + cache_key(api_key, organization_id, path, params) + (extra,)
+
+
+class _Flight:
+    """One in-flight call and its outcome"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group
+
+    The first caller for a key runs the call; callers arriving while it
+    runs block and get the same result (or exception).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[CacheKey, _Flight] = {}
+        self.shared = 0
+        """Calls answered by another caller's request."""
+
+    def do(self, key: CacheKey, fn: Callable[[], T]) -> T:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.shared += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result  # type: ignore[no-any-return]
+        try:
+            flight.result = fn()
+            return flight.result  # type: ignore[no-any-return]
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Single-flight group for asyncio tasks
+
+    The call runs as its own task, so cancelling one waiting caller (even
+    the first) never cancels it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Any, "asyncio.Future[Any]"] = {}
+        self.shared = 0
+        """Calls answered by another caller's request."""
+
+    async def do(self, key: CacheKey, fn: Callable[[], Awaitable[T]]) -> T:
+        # Tasks can only be awaited on their own loop
+        key = (id(asyncio.get_running_loop()),) + key
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda f: self._finish(key, f))
+        else:
+            self.shared += 1
+        return await asyncio.shield(flight)
+
+    def _finish(self, key: Any, flight: "asyncio.Future[Any]") -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.cancelled():
+            # Mark the error retrieved even if every waiter was cancelled
+            flight.exception()
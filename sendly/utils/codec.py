@@ -0,0 +1,130 @@
+"""
+JSON Codecs
+
+Pluggable JSON encoding/decoding for request bodies, responses and webhook
+payloads. ``orjson`` or ``msgspec`` is picked up automatically when
+installed (``pip install "sendly[orjson]"``); otherwise the standard library
+``json`` module is used.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+
+class JsonCodec:
+    """
+    Standard library JSON codec, and the interface every codec implements
+
+    Subclass and override :meth:`dumps` / :meth:`loads` to plug in another
+    library; ``loads`` must raise ``ValueError`` on malformed input.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode ``obj`` as compact UTF-8 JSON"""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document"""
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by ``orjson``"""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps: Callable[[Any], bytes] = orjson.dumps
+        self._loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        # orjson.JSONDecodeError is a ValueError
+        return self._loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by ``msgspec``"""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)  # type: ignore[no-any-return]
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._error as e:
+            raise ValueError(str(e)) from e
+
+
+_CODECS = {
+    "json": JsonCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+# Preference order for "auto"
+_AUTO_ORDER = ("orjson", "msgspec")
+
+CodecTypes = Union[str, JsonCodec, None]
+
+_default_codec: Optional[JsonCodec] = None
+
+
+def default_codec() -> JsonCodec:
+    """The fastest codec available: orjson, then msgspec, then stdlib json"""
+    global _default_codec
+    if _default_codec is None:
+        codec: JsonCodec = JsonCodec()
+        for name in _AUTO_ORDER:
+            try:
+                codec = _CODECS[name]()
+            except ImportError:
+                continue
+            break
+        _default_codec = codec
+    return _default_codec
+
+
+def get_codec(codec: CodecTypes = None) -> JsonCodec:
+    """
+    Resolve a codec option
+
+    Args:
+        codec: A :class:`JsonCodec` instance, one of ``"json"``, ``"orjson"``
+            or ``"msgspec"``, or None / ``"auto"`` to detect the fastest
+            installed library
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the named library is not installed
+    """
+    if codec is None or codec == "auto":
+        return default_codec()
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec not in _CODECS:
+        raise ValueError(f"json_codec must be one of auto, {', '.join(_CODECS)}")
+    try:
+        return _CODECS[codec]()
+    except ImportError as e:
+        raise ImportError(
+            f'json_codec="{codec}" requires {codec}: pip install "sendly[{codec}]"'
+        ) from e
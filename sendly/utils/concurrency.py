@@ -0,0 +1,180 @@
+"""
+Bounded Concurrency Helpers
+
+Run a function over a (possibly unbounded) iterable with at most N calls in
+flight, streaming outcomes back as they finish or in input order. Input is
+consumed lazily, so memory stays bounded by the concurrency window.
+"""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Outcome(NamedTuple):
+    """Result of one call: exactly one of ``result`` / ``error`` is meaningful"""
+
+    position: int
+    """Position of the item in the input."""
+    item: Any
+    result: Any
+    error: Optional[BaseException]
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if not isinstance(concurrency, int) or concurrency < 1:
+        raise ValueError("concurrency must be a positive integer")
+
+
+def bounded_map(
+    func: Callable[..., R],
+    items: Iterable[T],
+    concurrency: int,
+    ordered: bool = False,
+    with_position: bool = False,
+) -> Iterator[Outcome]:
+    """
+    Call ``func`` on each item from a thread pool, at most ``concurrency`` at once
+
+    Exceptions raised by ``func`` are captured in the outcome instead of
+    stopping the run. In ordered mode, results finished out of order count
+    against the window, so a slow item applies backpressure rather than
+    letting the buffer grow.
+
+    Args:
+        func: Function to call for each item
+        items: Items to process (consumed lazily)
+        concurrency: Maximum calls in flight
+        ordered: Yield in input order instead of completion order
+        with_position: Call ``func(position, item)`` instead of ``func(item)``
+
+    Yields:
+        One Outcome per item
+    """
+    _check_concurrency(concurrency)
+    iterator = enumerate(items)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="sendly")
+    pending: Dict["Future[R]", Any] = {}
+    finished: Dict[int, Outcome] = {}
+    next_index = 0
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) + len(finished) < concurrency:
+                try:
+                    index, item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                args = (index, item) if with_position else (item,)
+                pending[executor.submit(func, *args)] = (index, item)
+
+            if not pending and not finished:
+                return
+
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, item = pending.pop(future)
+                    error = future.exception()
+                    outcome = Outcome(index, item, None if error else future.result(), error)
+                    if ordered:
+                        finished[index] = outcome
+                    else:
+                        yield outcome
+
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        # Wait for calls already running so no request outlives the iterator
+        executor.shutdown(wait=True)
+
+
+async def async_bounded_map(
+    func: Callable[..., Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    concurrency: int,
+    ordered: bool = False,
+    with_position: bool = False,
+) -> AsyncIterator[Outcome]:
+    """
+    Await ``func`` on each item as tasks, at most ``concurrency`` at once
+
+    Async counterpart of :func:`bounded_map`; ``items`` may be a regular or an
+    async iterable.
+
+    Args:
+        func: Coroutine function to call for each item
+        items: Items to process (consumed lazily)
+        concurrency: Maximum tasks in flight
+        ordered: Yield in input order instead of completion order
+        with_position: Await ``func(position, item)`` instead of ``func(item)``
+
+    Yields:
+        One Outcome per item
+    """
+    _check_concurrency(concurrency)
+    is_async = hasattr(items, "__aiter__")
+    async_iterator = items.__aiter__() if is_async else None  # type: ignore[union-attr]
+    sync_iterator = None if is_async else iter(items)  # type: ignore[arg-type]
+    pending: Dict["asyncio.Task[R]", Any] = {}
+    finished: Dict[int, Outcome] = {}
+    next_index = 0
+    submitted = 0
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) + len(finished) < concurrency:
+                try:
+                    if async_iterator is not None:
+                        item = await async_iterator.__anext__()
+                    else:
+                        item = next(sync_iterator)  # type: ignore[arg-type]
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    break
+                task = asyncio.ensure_future(func(submitted, item) if with_position else func(item))
+                pending[task] = (submitted, item)
+                submitted += 1
+
+            if not pending and not finished:
+                return
+
+            if pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, item = pending.pop(task)
+                    error = task.exception()
+                    outcome = Outcome(index, item, None if error else task.result(), error)
+                    if ordered:
+                        finished[index] = outcome
+                    else:
+                        yield outcome
+
+            while next_index in finished:
+                yield finished.pop(next_index)
+                next_index += 1
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,176 @@
+"""
+SMS Encoding
+
+Exact segment counting for SMS text. Messages made only of GSM 03.38
+characters are sent as GSM-7 (extension characters such as ``€`` or ``{``
+take two septets); anything else is sent as UCS-2 and counted in UTF-16
+code units, so characters outside the Basic Multilingual Plane (most
+emoji) take two. Multipart segments never split an escape pair or a
+surrogate pair.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+GSM7 = "GSM-7"
+UCS2 = "UCS-2"
+
+# GSM 03.38 basic character set (the escape character 0x1B is excluded)
+GSM7_BASIC_CHARS = (
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+# Characters reached through the escape code; each costs two septets
+GSM7_EXTENSION_CHARS = "\f^{}\\[~]|€"
+
+# Look-alike replacements that keep typographic text in GSM-7
+GSM7_TRANSLITERATIONS: Dict[str, str] = {
+    **dict.fromkeys("\u2018\u2019\u201a\u201b\u2032\u2039\u203a\u00b4`", "'"),
+    **dict.fromkeys("\u201c\u201d\u201e\u201f\u2033\u00ab\u00bb", '"'),
+    **dict.fromkeys("\u2010\u2011\u2012\u2013\u2014\u2015\u2212\u2043", "-"),
+    **dict.fromkeys("\u00a0\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008", " "),
+    **dict.fromkeys("\u2009\u200a\u202f\u205f\u3000\t", " "),
+    **dict.fromkeys("\u00ad\u200b\u200c\u200d\u2060\ufeff", ""),
+    "\u2026": "...",
+    "\u2022": "-",
+    "\u00b7": ".",
+    "\u02c6": "^",
+    "\u02dc": "~",
+    "\u2044": "/",
+    "\u00d7": "x",
+    "\u2122": "TM",
+    "\u00a9": "(c)",
+    "\u00ae": "(R)",
+}
+
+# Capacity of a single-part message and of each part of a multipart one
+SEGMENT_LIMITS = {GSM7: (160, 153), UCS2: (70, 67)}
+
+# Compiled character classes scan a message in C, one pass each
+_NON_GSM7 = re.compile("[^" + re.escape(GSM7_BASIC_CHARS + GSM7_EXTENSION_CHARS) + "]")
+_EXTENSION = re.compile("[" + re.escape(GSM7_EXTENSION_CHARS) + "]")
+_ASTRAL = re.compile("[\U00010000-\U0010ffff]")
+_TRANSLITERATE = str.maketrans(GSM7_TRANSLITERATIONS)
+
+
+@dataclass
+class SegmentInfo:
+    """How a message will be encoded and split"""
+
+    encoding: str
+    """``"GSM-7"`` or ``"UCS-2"``."""
+    segments: int
+    """Number of SMS segments (billable parts)."""
+    units: int
+    """Length in septets (GSM-7) or UTF-16 code units (UCS-2)."""
+    per_segment: int
+    """Units available per segment for this message."""
+
+    @property
+    def remaining(self) -> int:
+        """Units left in the last segment before another one is needed"""
+        return self.segments * self.per_segment - self.units
+
+
+def _measure(text: str) -> Tuple[bool, int, bool]:
+    """(is GSM-7, length in units, whether any character takes two units)"""
+    if _NON_GSM7.search(text) is None:
+        first = _EXTENSION.search(text)
+        if first is None:
+            return True, len(text), False
+        extension = len(_EXTENSION.findall(text, first.start()))
+        return True, len(text) + extension, True
+    if text.isascii():
+        return False, len(text), False
+    astral = len(_ASTRAL.findall(text))
+    return False, len(text) + astral, astral > 0
+
+
+def _unit_cost(char: str, gsm7: bool) -> int:
+    if gsm7:
+        return 2 if char in GSM7_EXTENSION_CHARS else 1
+    return 2 if ord(char) > 0xFFFF else 1
+
+
+def _pack(text: str, gsm7: bool, per_segment: int) -> List[str]:
+    """Greedily fill segments without splitting two-unit characters"""
+    parts: List[str] = []
+    start = used = 0
+    for index, char in enumerate(text):
+        cost = _unit_cost(char, gsm7)
+        if used + cost > per_segment:
+            parts.append(text[start:index])
+            start, used = index, 0
+        used += cost
+    parts.append(text[start:])
+    return parts
+
+
+def get_encoding(text: str) -> str:
+    """
+    Get the encoding a message will be sent with
+
+    Args:
+        text: Message text
+
+    Returns:
+        ``"GSM-7"`` if every character is in the GSM 03.38 tables,
+        otherwise ``"UCS-2"``
+    """
+    return GSM7 if _measure(text)[0] else UCS2
+
+
+def get_segment_info(text: str) -> SegmentInfo:
+    """
+    Get the encoding, length and segment count of a message
+
+    Args:
+        text: Message text
+
+    Returns:
+        SegmentInfo for the message (an empty message is one segment)
+    """
+    gsm7, units, wide = _measure(text)
+    encoding = GSM7 if gsm7 else UCS2
+    single, multi = SEGMENT_LIMITS[encoding]
+    if units <= single:
+        return SegmentInfo(encoding, 1, units, single)
+    if not wide:
+        return SegmentInfo(encoding, -(-units // multi), units, multi)
+    return SegmentInfo(encoding, len(_pack(text, gsm7, multi)), units, multi)
+
+
+def transliterate(text: str) -> str:
+    """
+    Replace typographic characters with GSM-7 look-alikes
+
+    Smart quotes, dashes, ellipses, non-breaking and other special spaces,
+    and similar punctuation are rewritten using :data:`GSM7_TRANSLITERATIONS`;
+    zero-width characters are dropped. Other characters are left alone, so
+    the result may still need UCS-2.
+
+    Args:
+        text: Message text
+
+    Returns:
+        The rewritten text
+    """
+    return text.translate(_TRANSLITERATE)
+
+
+def split_segments(text: str) -> List[str]:
+    """
+    Split a message into the parts it will be sent as
+
+    Args:
+        text: Message text
+
+    Returns:
+        The text of each segment, in order
+    """
+    gsm7, units, _ = _measure(text)
+    single, multi = SEGMENT_LIMITS[GSM7 if gsm7 else UCS2]
+    if units <= single:
+        return [text]
+    return _pack(text, gsm7, multi)
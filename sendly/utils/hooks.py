@@ -0,0 +1,274 @@
+"""
+Request Instrumentation Hooks
+
+Event hooks fired by the HTTP client around every attempt of every API call:
+``on_request`` before an attempt is sent, ``on_response`` when it gets an
+HTTP response (successful or not), ``on_retry`` before the client backs off
+and tries again, and ``on_error`` when a call finally fails.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from ..errors import RateLimitError, SendlyError
+
+_STATIC_SEGMENT = re.compile(r"[a-z]+(?:-[a-z]+)*")
+
+# Attempt phases reported by httpcore's "trace" request extension
+_CONNECT_EVENTS = ("connection.connect_tcp.complete", "connection.start_tls.complete")
+_HEADERS_RECEIVED = "receive_response_headers.complete"
+
+HOOK_NAMES = ("on_request", "on_response", "on_retry", "on_error")
+
+
+def path_template(path: str) -> str:
+    """
+    Collapse the IDs in an API path into ``{id}`` placeholders
+
+    Keeps metric labels bounded: ``/messages/msg_abc123`` and
+    ``/messages/msg_def456`` both become ``/messages/{id}``. Static segments
+    are lowercase words joined by hyphens; anything else counts as an ID.
+    """
+    segments = path.split("?", 1)[0].split("/")
+    return "/".join(s if not s or _STATIC_SEGMENT.fullmatch(s) else "{id}" for s in segments)
+
+
+@dataclass
+class RequestEvent:
+    """Fired before an attempt is sent"""
+
+    method: str
+    """HTTP method."""
+
+    path: str
+    """Path template, e.g. ``/messages/{id}``."""
+
+    attempt: int
+    """Attempt number, starting at 1."""
+
+    request_bytes: int
+    """Size of the encoded request body."""
+
+    rate_limit_wait: float = 0.0
+    """Seconds this attempt waited on the client-side rate limiter."""
+
+
+@dataclass
+class ResponseEvent:
+    """Fired when an attempt receives an HTTP response, whatever its status"""
+
+    method: str
+    """HTTP method."""
+
+    path: str
+    """Path template, e.g. ``/messages/{id}``."""
+
+    attempt: int
+    """Attempt number, starting at 1."""
+
+    status_code: int
+    """HTTP status code."""
+
+    elapsed: float
+    """Seconds from sending the attempt to having the response."""
+
+    connect: Optional[float] = None
+    """Seconds spent opening a connection (0 when one was reused), or None
+    when the transport does not report connection phases."""
+
+    ttfb: Optional[float] = None
+    """Seconds until the response headers arrived, or None when the
+    transport does not report it."""
+
+    request_bytes: int = 0
+    """Size of the encoded request body."""
+
+    response_bytes: Optional[int] = None
+    """Size of the response body (None for streamed responses)."""
+
+
+@dataclass
+class RetryEvent:
+    """Fired before the client waits and retries a failed attempt"""
+
+    method: str
+    """HTTP method."""
+
+    path: str
+    """Path template, e.g. ``/messages/{id}``."""
+
+    attempt: int
+    """The attempt that failed, starting at 1."""
+
+    delay: float
+    """Seconds the client will wait before the next attempt."""
+
+    error: SendlyError
+    """The error that triggered the retry."""
+
+    @property
+    def rate_limited(self) -> bool:
+        """Whether the retry is waiting out a 429"""
+        return isinstance(self.error, RateLimitError)
+
+
+@dataclass
+class ErrorEvent:
+    """Fired once when a call fails for good"""
+
+    method: str
+    """HTTP method."""
+
+    path: str
+    """Path template, e.g. ``/messages/{id}``."""
+
+    attempts: int
+    """Attempts made, including the failed one."""
+
+    elapsed: float
+    """Seconds since the call started, including retries and waits."""
+
+    error: SendlyError
+    """The error raised to the caller."""
+
+
+@dataclass
+class Hooks:
+    """
+    Callbacks run around every API call
+
+    Each field is a list of callables taking the matching event. Hooks run
+    synchronously on the calling thread (or event loop), so keep them cheap;
+    an exception in a hook propagates to the caller.
+
+    Example:
+        >>> hooks = Hooks(on_response=[lambda e: print(e.path, e.status_code, e.elapsed)])
+        >>> client = Sendly('sk_live_v1_xxx', hooks=hooks)
+    """
+
+    on_request: List[Callable[[RequestEvent], Any]] = field(default_factory=list)
+    on_response: List[Callable[[ResponseEvent], Any]] = field(default_factory=list)
+    on_retry: List[Callable[[RetryEvent], Any]] = field(default_factory=list)
+    on_error: List[Callable[[ErrorEvent], Any]] = field(default_factory=list)
+
+    def register(self, subscriber: Any) -> None:
+        """Subscribe every ``on_*`` method an object defines (e.g. a collector)"""
+        for name in HOOK_NAMES:
+            callback = getattr(subscriber, name, None)
+            if callback is not None:
+                getattr(self, name).append(callback)
+
+    def __bool__(self) -> bool:
+        return bool(self.on_request or self.on_response or self.on_retry or self.on_error)
+
+
+class _Tracer:
+    """Records connection phase timestamps from httpcore's trace extension"""
+
+    __slots__ = ("connected", "headers", "traced")
+
+    def __init__(self) -> None:
+        self.connected: Optional[float] = None
+        self.headers: Optional[float] = None
+        self.traced = False
+
+    def record(self, name: str) -> None:
+        self.traced = True
+        if name in _CONNECT_EVENTS:
+            self.connected = time.perf_counter()
+        elif name.endswith(_HEADERS_RECEIVED):
+            self.headers = time.perf_counter()
+
+    def __call__(self, name: str, info: Dict[str, Any]) -> None:
+        self.record(name)
+
+
+class _AsyncTracer(_Tracer):
+    __slots__ = ()
+
+    async def __call__(self, name: str, info: Dict[str, Any]) -> None:  # type: ignore[override]
+        self.record(name)
+
+
+class CallTracker:
+    """Builds and dispatches the events of one API call"""
+
+    def __init__(self, hooks: Hooks, method: str, path: str, is_async: bool = False):
+        self.hooks = hooks
+        self.method = method
+        self.path = path_template(path)
+        self.attempt = 0
+        self._async = is_async
+        self._started = time.perf_counter()
+        self._sent = self._started
+        self._request_bytes = 0
+        self._tracer: Optional[_Tracer] = None
+
+    def request(self, request: httpx.Request, rate_limit_wait: float) -> None:
+        """Start an attempt: attach a tracer and fire on_request"""
+        self.attempt += 1
+        self._tracer = _AsyncTracer() if self._async else _Tracer()
+        request.extensions["trace"] = self._tracer
+        self._request_bytes = len(request.content)
+        event = RequestEvent(
+            self.method, self.path, self.attempt, self._request_bytes, rate_limit_wait
+        )
+        for callback in self.hooks.on_request:
+            callback(event)
+        self._sent = time.perf_counter()
+
+    def response(self, response: httpx.Response, stream: bool) -> None:
+        """Fire on_response for the current attempt"""
+        now = time.perf_counter()
+        tracer = self._tracer
+        connect = ttfb = None
+        if tracer is not None and tracer.traced:
+            connect = tracer.connected - self._sent if tracer.connected else 0.0
+            if tracer.headers is not None:
+                ttfb = tracer.headers - self._sent
+        event = ResponseEvent(
+            method=self.method,
+            path=self.path,
+            attempt=self.attempt,
+            status_code=response.status_code,
+            elapsed=now - self._sent,
+            connect=connect,
+            ttfb=ttfb,
+            request_bytes=self._request_bytes,
+            response_bytes=None if stream else len(response.content),
+        )
+        for callback in self.hooks.on_response:
+            callback(event)
+
+    def retry(self, error: SendlyError, delay: float) -> None:
+        """Fire on_retry before backing off"""
+        event = RetryEvent(self.method, self.path, max(self.attempt, 1), delay, error)
+        for callback in self.hooks.on_retry:
+            callback(event)
+
+    def error(self, error: SendlyError) -> None:
+        """Fire on_error as the call gives up"""
+        elapsed = time.perf_counter() - self._started
+        event = ErrorEvent(self.method, self.path, max(self.attempt, 1), elapsed, error)
+        for callback in self.hooks.on_error:
+            callback(event)
+
+
+def resolve_hooks(hooks: Optional[Hooks], metrics: Any = None) -> Hooks:
+    """
+    Copy the caller's hooks and subscribe a metrics collector to the copy
+
+    Copying keeps a ``Hooks`` object shared between several clients from
+    collecting each client's collector.
+    """
+    combined = Hooks()
+    if hooks is not None:
+        for name in HOOK_NAMES:
+            getattr(combined, name).extend(getattr(hooks, name))
+    if metrics is not None:
+        combined.register(metrics)
+    return combined
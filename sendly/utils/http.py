@@ -6,10 +6,24 @@ Handles HTTP requests to the Sendly API with retries and rate limiting.
 
 import asyncio
 import os
-import random
 import re
+import threading
 import time
-from typing import Any, Dict, Optional, TypeVar, Union
+import uuid
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+    TypedDict,
+    TypeVar,
+    Union,
+)
 
 import httpx
 
@@ -20,6 +34,23 @@ from ..errors import (
     TimeoutError,
 )
 from ..types import RateLimitInfo
+from .cache import MISS, STALE, CacheEntry, CacheKey, CacheStats, ResponseCache, cache_key
+from .coalesce import AsyncSingleFlight, SingleFlight, flight_key
+from .codec import CodecTypes, JsonCodec, get_codec
+from .hooks import CallTracker, Hooks, resolve_hooks
+from .metrics import MetricsCollector
+from .models import M, ResponseMode, build_model, build_models, check_response_mode
+from .rate_limit import (
+    AsyncRateLimiter,
+    AsyncRetryGate,
+    RateLimiter,
+    RateLimiterStats,
+    RetryGate,
+    parse_reset,
+    parse_retry_after,
+)
+from .retry import CircuitBreakerStats, RetryPolicy, RetryState
+from .streaming import DEFAULT_STREAM_KEYS, JsonArrayScanner
 
 T = TypeVar("T")
 
@@ -28,6 +59,114 @@ DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_RETRIES = 3
 SDK_VERSION = "3.33.0"
 
+# Seconds to wait on a 429 that says nothing about when to retry
+DEFAULT_RETRY_AFTER = 60.0
+
+TimeoutTypes = Union[float, httpx.Timeout]
+
+# Request bodies: a dict to encode, or pre-serialized JSON bytes sent as-is
+BodyTypes = Union[Dict[str, Any], bytes]
+
+
+class RequestOptions(TypedDict, total=False):
+    """
+    Per-call overrides, accepted by every resource method as ``request_options=``
+
+    Applied to that call only, so one client can serve several organizations
+    from many threads or tasks at once.
+
+    Example:
+        >>> client.messages.send(
+        ...     to='+15551234567',
+        ...     text='Hi',
+        ...     request_options={'organization_id': 'org_123', 'timeout': 5.0},
+        ... )
+    """
+
+    organization_id: Optional[str]
+    """``X-Organization-Id`` for this call (None sends none)."""
+
+    timeout: Union[float, httpx.Timeout]
+    """Timeout for each attempt of this call."""
+
+    headers: Dict[str, str]
+    """Extra headers, sent after (and overriding) the SDK's own."""
+
+    idempotency_key: str
+    """``Idempotency-Key`` for a POST/PATCH call."""
+
+    deadline: float
+    """Seconds the whole call may take, retries and waits included."""
+
+    max_retries: int
+    """Retry attempts for this call."""
+
+    cache: bool
+    """False skips cached reads and fetches from the API (the result is still cached)."""
+
+
+# Methods that get an Idempotency-Key so retrying them can't apply them twice
+IDEMPOTENT_KEY_METHODS = frozenset({"POST", "PATCH"})
+
+
+def generate_idempotency_key() -> str:
+    """Create a random Idempotency-Key value"""
+    return str(uuid.uuid4())
+
+
+def _describe_timeout(timeout: TimeoutTypes) -> str:
+    """Render a timeout for error messages"""
+    if isinstance(timeout, httpx.Timeout):
+        return (
+            f"connect={timeout.connect}s, read={timeout.read}s, "
+            f"write={timeout.write}s, pool={timeout.pool}s"
+        )
+    return f"{timeout}s"
+
+
+def _error_from_response(response: httpx.Response, data: Any) -> SendlyError:
+    """
+    Build the error for a failed response
+
+    429s always become :class:`RateLimitError`. On 429 and 503 the wait comes
+    from the Retry-After header, then (429 only) X-RateLimit-Reset, before
+    the body's ``retryAfter``.
+    """
+    status = response.status_code
+    if isinstance(data, dict):
+        error = SendlyError.from_response(status, data)
+    else:
+        error = SendlyError(
+            message=str(data) or f"HTTP {status}",
+            code="internal_error",
+            status_code=status,
+        )
+    if status not in (429, 503):
+        return error
+
+    wait = parse_retry_after(response.headers.get("Retry-After"))
+    if wait is None and status == 429:
+        wait = parse_reset(response.headers.get("X-RateLimit-Reset"))
+    if status == 429 and not isinstance(error, RateLimitError):
+        error = RateLimitError(
+            error.message,
+            retry_after=wait if wait is not None else DEFAULT_RETRY_AFTER,
+            status_code=status,
+            response=error.response,
+        )
+    elif wait is not None:
+        error.retry_after = wait
+    return error
+
+
+def _encode_body(codec: JsonCodec, body: Optional[BodyTypes]) -> Optional[bytes]:
+    """Encode a request body once, skipping bodies that are already bytes"""
+    if body is None:
+        return None
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return bytes(body)
+    return codec.dumps(body)
+
 
 class HttpClient:
     """Synchronous HTTP client for making API requests"""
@@ -36,17 +175,52 @@ class HttpClient:
         self,
         api_key: str,
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: TimeoutTypes = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         organization_id: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.Client] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        rate_limiter: Union[bool, RateLimiter, None] = None,
+        response_mode: ResponseMode = "model",
+        json_codec: CodecTypes = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Union[bool, MetricsCollector, None] = None,
+        idempotency_keys: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Union[bool, ResponseCache, None] = None,
+        coalesce: bool = False,
     ):
+        if http_client is not None and transport is not None:
+            raise ValueError("Pass either http_client or transport, not both")
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.organization_id = organization_id or os.environ.get("SENDLY_ORG_ID")
+        self.limits = limits
+        self.http2 = http2
+        self._transport = transport
         self._rate_limit_info: Optional[RateLimitInfo] = None
-        self._client: Optional[httpx.Client] = None
+        self._client: Optional[httpx.Client] = http_client
+        # A caller-owned client is shared with other SDK instances, so we
+        # never close it and never bake per-client headers into it.
+        self._owns_client = http_client is None
+        self.rate_limiter: Optional[RateLimiter] = (
+            RateLimiter() if rate_limiter is True else rate_limiter or None
+        )
+        self.response_mode = check_response_mode(response_mode)
+        self.codec = get_codec(json_codec)
+        self.metrics: Optional[MetricsCollector] = (
+            MetricsCollector() if metrics is True else metrics or None
+        )
+        self.hooks = resolve_hooks(hooks, self.metrics)
+        self.idempotency_keys = idempotency_keys
+        self.retry_policy = retry_policy
+        self._retry_gate = RetryGate()
+        self.cache: Optional[ResponseCache] = ResponseCache() if cache is True else cache or None
+        self._flights: Optional[SingleFlight] = SingleFlight() if coalesce else None
 
         # Validate API key format
         if not self._is_valid_api_key(api_key):
@@ -64,20 +238,39 @@ class HttpClient:
         """Get current rate limit info"""
         return self._rate_limit_info
 
+    def get_rate_limiter_stats(self) -> Optional[RateLimiterStats]:
+        """Get client-side rate limiter stats, or None if pacing is disabled"""
+        if self.rate_limiter is None:
+            return None
+        return self.rate_limiter.stats()
+
+    def get_circuit_breaker_stats(self) -> Optional[CircuitBreakerStats]:
+        """Get circuit breaker state, or None if the retry policy has no breaker"""
+        if self.retry_policy is None or self.retry_policy.circuit_breaker is None:
+            return None
+        return self.retry_policy.circuit_breaker.stats()
+
+    def get_cache_stats(self) -> Optional[CacheStats]:
+        """Get response cache counters, or None if caching is disabled"""
+        if self.cache is None:
+            return None
+        return self.cache.stats()
+
     @property
     def client(self) -> httpx.Client:
         """Get or create the HTTP client"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.Client(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                headers=self._build_headers(),
-            )
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            kwargs: Dict[str, Any] = {"timeout": self.timeout, "http2": self.http2}
+            if self.limits is not None:
+                kwargs["limits"] = self.limits
+            if self._transport is not None:
+                kwargs["transport"] = self._transport
+            self._client = httpx.Client(**kwargs)
         return self._client
 
     def close(self) -> None:
-        """Close the HTTP client"""
-        if self._client is not None:
+        """Close the HTTP client (caller-owned clients are left open)"""
+        if self._client is not None and self._owns_client:
             self._client.close()
             self._client = None
 
@@ -87,7 +280,11 @@ class HttpClient:
     def __exit__(self, *args: Any) -> None:
         self.close()
 
-    def _build_headers(self) -> Dict[str, str]:
+    def _build_headers(
+        self,
+        idempotency_key: Optional[str] = None,
+        options: Optional[RequestOptions] = None,
+    ) -> Dict[str, str]:
         """Build request headers"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -95,8 +292,15 @@ class HttpClient:
             "Accept": "application/json",
             "User-Agent": f"sendly-python/{SDK_VERSION}",
         }
-        if self.organization_id:
-            headers["X-Organization-Id"] = self.organization_id
+        organization_id = self.organization_id
+        if options:
+            organization_id = options.get("organization_id", organization_id)
+        if organization_id:
+            headers["X-Organization-Id"] = organization_id
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        if options and options.get("headers"):
+            headers.update(options["headers"])
         return headers
 
     def _update_rate_limit_info(self, headers: httpx.Headers) -> None:
@@ -106,81 +310,355 @@ class HttpClient:
         reset = headers.get("X-RateLimit-Reset")
 
         if limit and remaining and reset:
-            self._rate_limit_info = RateLimitInfo(
-                limit=int(limit),
-                remaining=int(remaining),
-                reset=int(reset),
-            )
-
-    def _calculate_backoff(self, attempt: int) -> float:
-        """Calculate exponential backoff time"""
-        base_delay = 2**attempt
-        jitter = random.uniform(0, 0.5)
-        return min(base_delay + jitter, 30.0)
+            try:
+                info = RateLimitInfo(limit=int(limit), remaining=int(remaining), reset=float(reset))
+            except ValueError:
+                return
+            self._rate_limit_info = info
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(info.limit, info.remaining, info.reset)
 
     def request(
         self,
         method: str,
         path: str,
-        body: Optional[Dict[str, Any]] = None,
+        body: Optional[BodyTypes] = None,
         params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        options: Optional[RequestOptions] = None,
+    ) -> Any:
+        """
+        Make an HTTP request to the API
+
+        POST and PATCH requests carry ``idempotency_key`` (one is generated
+        when omitted), sent unchanged on every retry of the call.
+        ``deadline`` caps the seconds spent on the call, attempts and
+        backoff waits included. ``options`` overrides client settings for
+        this call only.
+
+        With a response cache, cacheable GETs may be answered from it, and
+        any other method invalidates the cached reads of its resource.
+        """
+        cache = self.cache
+        if cache is not None and method.upper() == "GET":
+            ttl = cache.ttl_for(path)
+            if ttl is not None:
+                return self._cached_get(cache, ttl, path, params, deadline, options or {})
+        try:
+            response = self._send(
+                method,
+                path,
+                body,
+                params,
+                idempotency_key=idempotency_key,
+                deadline=deadline,
+                options=options,
+            )
+        finally:
+            # Even a failed mutation may have been applied
+            if cache is not None and method.upper() != "GET":
+                cache.invalidate(path)
+        return self._parse_response(response)
+
+    def _cached_get(
+        self,
+        cache: ResponseCache,
+        ttl: float,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        deadline: Optional[float],
+        options: RequestOptions,
     ) -> Any:
-        """Make an HTTP request to the API"""
+        """GET through the response cache"""
+        organization_id = options.get("organization_id", self.organization_id)
+        key = cache_key(self.api_key, organization_id, path, params)
+        if not options.get("cache", True):
+            return self._fetch_cached(cache, key, None, ttl, path, params, deadline, options)
+        entry, state = cache.lookup(key)
+        if state == MISS or entry is None:
+            return self._fetch_cached(cache, key, entry, ttl, path, params, deadline, options)
+        if state == STALE and cache.begin_refresh(entry):
+            threading.Thread(
+                target=self._refresh_cached,
+                args=(cache, key, entry, ttl, path, params, options),
+                daemon=True,
+            ).start()
+        return self.codec.loads(entry.body)
+
+    def _refresh_cached(
+        self,
+        cache: ResponseCache,
+        key: CacheKey,
+        entry: CacheEntry,
+        ttl: float,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        options: RequestOptions,
+    ) -> None:
+        """Revalidate a stale entry in the background"""
+        try:
+            self._fetch_cached(cache, key, entry, ttl, path, params, None, options)
+        except SendlyError:
+            # Keep serving the stale body; once it ages out, callers fetch themselves
+            pass
+        finally:
+            cache.end_refresh(entry)
+
+    def _fetch_cached(
+        self,
+        cache: ResponseCache,
+        key: CacheKey,
+        entry: Optional[CacheEntry],
+        ttl: float,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        deadline: Optional[float],
+        options: RequestOptions,
+    ) -> Any:
+        """Fetch a cacheable GET, revalidating ``entry`` by ETag when there is one"""
+        generation = cache.generation
+        if entry is not None and entry.etag:
+            options = options.copy()
+            options["headers"] = {**options.get("headers", {}), "If-None-Match": entry.etag}
+        response = self._send("GET", path, None, params, deadline=deadline, options=options)
+        if response.status_code == 304 and entry is not None:
+            cache.revalidated(key, entry, ttl, generation)
+            return self.codec.loads(entry.body)
+        data = self._parse_response(response)
+        if "application/json" in response.headers.get("content-type", ""):
+            cache.store(key, path, response.content, response.headers.get("ETag"), ttl, generation)
+        return data
+
+    def stream(
+        self,
+        method: str,
+        path: str,
+        body: Optional[BodyTypes] = None,
+        params: Optional[Dict[str, Any]] = None,
+        keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+        deadline: Optional[float] = None,
+        options: Optional[RequestOptions] = None,
+    ) -> Iterator[Any]:
+        """
+        Make a request and yield the elements of its JSON array incrementally
+
+        The body is decoded as it downloads; see :class:`JsonArrayScanner` for
+        which array is streamed. Retries and ``deadline`` only apply until
+        the response headers arrive.
+        """
+        response = self._send(
+            method, path, body, params, stream=True, deadline=deadline, options=options
+        )
+        timeout = (options or {}).get("timeout") or self.timeout
+        scanner = JsonArrayScanner(keys, loads=self.codec.loads)
+        try:
+            try:
+                for chunk in response.iter_bytes():
+                    yield from scanner.feed(chunk)
+            except httpx.TimeoutException as e:
+                raise TimeoutError(f"Request timed out after {_describe_timeout(timeout)}") from e
+            except httpx.RequestError as e:
+                raise NetworkError(f"Network error: {str(e)}", e) from e
+            scanner.close()
+        finally:
+            response.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: Optional[BodyTypes] = None,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        options: Optional[RequestOptions] = None,
+    ) -> httpx.Response:
+        """Send a request with retries, returning the successful response"""
+        options = options or {}
+        if idempotency_key is None:
+            idempotency_key = options.get("idempotency_key")
+        if deadline is None:
+            deadline = options.get("deadline")
+        if (
+            idempotency_key is None
+            and self.idempotency_keys
+            and method.upper() in IDEMPOTENT_KEY_METHODS
+        ):
+            # One key per call, so every retry is recognised as the same call
+            idempotency_key = generate_idempotency_key()
+        if self._flights is not None and not stream and method.upper() == "GET":
+            # Identical GETs already in flight share that request's response
+            key = flight_key(
+                self.api_key,
+                options.get("organization_id", self.organization_id),
+                path,
+                params,
+                options.get("headers"),
+            )
+            return self._flights.do(
+                key,
+                lambda: self._send_tracked(
+                    method, path, body, params, False, None, deadline, options
+                ),
+            )
+        return self._send_tracked(
+            method, path, body, params, stream, idempotency_key, deadline, options
+        )
+
+    def _send_tracked(
+        self,
+        method: str,
+        path: str,
+        body: Optional[BodyTypes],
+        params: Optional[Dict[str, Any]],
+        stream: bool,
+        idempotency_key: Optional[str],
+        deadline: Optional[float],
+        options: RequestOptions,
+    ) -> httpx.Response:
+        """Send a request, reporting it to the hooks"""
+        call = CallTracker(self.hooks, method, path) if self.hooks else None
+        try:
+            return self._send_attempts(
+                method, path, body, params, stream, call, idempotency_key, deadline, options
+            )
+        except SendlyError as e:
+            if call is not None:
+                call.error(e)
+            raise
+
+    def _send_attempts(
+        self,
+        method: str,
+        path: str,
+        body: Optional[BodyTypes],
+        params: Optional[Dict[str, Any]],
+        stream: bool,
+        call: Optional[CallTracker],
+        idempotency_key: Optional[str],
+        deadline: Optional[float],
+        options: RequestOptions,
+    ) -> httpx.Response:
         last_error: Optional[Exception] = None
+        # Encoded once and reused by every retry
+        content = _encode_body(self.codec, body)
+        headers = self._build_headers(idempotency_key, options)
+        timeout = options.get("timeout")
+        max_retries = options.get("max_retries", self.max_retries)
+        retry = RetryState(self.retry_policy, deadline)
+
+        for attempt in range(max_retries + 1):
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.acquire()
+            else:
+                waited = self._retry_gate.wait()
+            retry.before_attempt()
 
-        for attempt in range(self.max_retries + 1):
             try:
-                response = self.client.request(
+                request = self.client.build_request(
                     method=method,
-                    url=path,
-                    json=body,
+                    url=f"{self.base_url}{path}",
+                    content=content,
                     params=params,
+                    headers=headers,
+                    timeout=retry.attempt_timeout(self.timeout, timeout),
                 )
+                if call is not None:
+                    call.request(request, waited)
+                response = self.client.send(request, stream=stream)
 
                 # Update rate limit info
                 self._update_rate_limit_info(response.headers)
-
-                # Parse response
-                data = self._parse_response(response)
-                return data
+                if call is not None:
+                    call.response(response, stream)
+
+                # 304 only answers our own cache revalidations
+                if not response.is_success and response.status_code != 304:
+                    if stream:
+                        response.read()
+                        response.close()
+                    # Raises the matching SendlyError
+                    self._parse_response(response)
+                retry.record()
+                return response
 
             except SendlyError as e:
                 last_error = e
+                retry.record(e)
 
                 # Don't retry certain errors
                 if e.status_code in (400, 401, 402, 403, 404):
                     raise
 
-                # Handle rate limiting
-                if isinstance(e, RateLimitError):
-                    if attempt < self.max_retries:
-                        time.sleep(e.retry_after)
+                # Rate limited, or unavailable with a Retry-After: wait as told
+                if e.retry_after is not None and e.status_code in (429, 503):
+                    # Server-directed waits don't spend the retry budget
+                    if attempt < max_retries and retry.can_retry(e.retry_after, budgeted=False):
+                        if call is not None:
+                            call.retry(e, e.retry_after)
+                        # Hold every caller sharing this client, not just this one
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.block(e.retry_after)
+                        else:
+                            self._retry_gate.block(e.retry_after)
                         continue
                     raise
 
+                # Server error: retried at once, or backed off under a retry policy
+                delay = retry.backoff(attempt) if self.retry_policy is not None else 0.0
+                if attempt < max_retries and retry.can_retry(delay):
+                    if call is not None:
+                        call.retry(e, delay)
+                    if delay:
+                        time.sleep(delay)
+                    continue
+                break
+
             except httpx.TimeoutException as e:
-                last_error = TimeoutError(f"Request timed out after {self.timeout}s")
-                if attempt < self.max_retries:
-                    time.sleep(self._calculate_backoff(attempt))
+                last_error = TimeoutError(
+                    f"Request timed out after {_describe_timeout(timeout or self.timeout)}"
+                )
+                retry.record(last_error)
+                delay = retry.backoff(attempt)
+                if attempt < max_retries and retry.can_retry(delay):
+                    if call is not None:
+                        call.retry(last_error, delay)
+                    time.sleep(delay)
                     continue
+                break
 
             except httpx.RequestError as e:
                 last_error = NetworkError(f"Network error: {str(e)}", e)
-                if attempt < self.max_retries:
-                    time.sleep(self._calculate_backoff(attempt))
+                retry.record(last_error)
+                delay = retry.backoff(attempt)
+                if attempt < max_retries and retry.can_retry(delay):
+                    if call is not None:
+                        call.retry(last_error, delay)
+                    time.sleep(delay)
                     continue
+                break
 
         if last_error:
             raise last_error
         raise NetworkError("Request failed after retries")
 
+    def parse(self, model: Type[M], data: Any) -> M:
+        """Build a response model according to ``response_mode``"""
+        return build_model(model, data, self.response_mode)
+
+    def parse_list(self, model: Type[M], items: List[Any]) -> List[M]:
+        """Build a list of response models according to ``response_mode``"""
+        return build_models(model, items, self.response_mode)
+
     def _parse_response(self, response: httpx.Response) -> Any:
         """Parse the response body"""
         content_type = response.headers.get("content-type", "")
 
         if "application/json" in content_type:
             try:
-                data = response.json()
+                data = self.codec.loads(response.content)
             except Exception:
                 data = response.text
         else:
@@ -188,13 +666,7 @@ class HttpClient:
 
         # Handle error responses
         if not response.is_success:
-            if isinstance(data, dict):
-                raise SendlyError.from_response(response.status_code, data)
-            raise SendlyError(
-                message=str(data) or f"HTTP {response.status_code}",
-                code="internal_error",
-                status_code=response.status_code,
-            )
+            raise _error_from_response(response, data)
 
         return data
 
@@ -206,17 +678,54 @@ class AsyncHttpClient:
         self,
         api_key: str,
         base_url: str = DEFAULT_BASE_URL,
-        timeout: float = DEFAULT_TIMEOUT,
+        timeout: TimeoutTypes = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         organization_id: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Union[bool, AsyncRateLimiter, None] = None,
+        response_mode: ResponseMode = "model",
+        json_codec: CodecTypes = None,
+        hooks: Optional[Hooks] = None,
+        metrics: Union[bool, MetricsCollector, None] = None,
+        idempotency_keys: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Union[bool, ResponseCache, None] = None,
+        coalesce: bool = False,
     ):
+        if http_client is not None and transport is not None:
+            raise ValueError("Pass either http_client or transport, not both")
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.organization_id = organization_id or os.environ.get("SENDLY_ORG_ID")
+        self.limits = limits
+        self.http2 = http2
+        self._transport = transport
         self._rate_limit_info: Optional[RateLimitInfo] = None
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.AsyncClient] = http_client
+        # A caller-owned client is shared with other SDK instances, so we
+        # never close it and never bake per-client headers into it.
+        self._owns_client = http_client is None
+        self.rate_limiter: Optional[AsyncRateLimiter] = (
+            AsyncRateLimiter() if rate_limiter is True else rate_limiter or None
+        )
+        self.response_mode = check_response_mode(response_mode)
+        self.codec = get_codec(json_codec)
+        self.metrics: Optional[MetricsCollector] = (
+            MetricsCollector() if metrics is True else metrics or None
+        )
+        self.hooks = resolve_hooks(hooks, self.metrics)
+        self.idempotency_keys = idempotency_keys
+        self.retry_policy = retry_policy
+        self._retry_gate = AsyncRetryGate()
+        self.cache: Optional[ResponseCache] = ResponseCache() if cache is True else cache or None
+        self._flights: Optional[AsyncSingleFlight] = AsyncSingleFlight() if coalesce else None
+        # Background cache refreshes, referenced until they finish
+        self._refreshes: Set["asyncio.Task[Any]"] = set()
 
         # Validate API key format
         if not self._is_valid_api_key(api_key):
@@ -234,20 +743,39 @@ class AsyncHttpClient:
         """Get current rate limit info"""
         return self._rate_limit_info
 
+    def get_rate_limiter_stats(self) -> Optional[RateLimiterStats]:
+        """Get client-side rate limiter stats, or None if pacing is disabled"""
+        if self.rate_limiter is None:
+            return None
+        return self.rate_limiter.stats()
+
+    def get_circuit_breaker_stats(self) -> Optional[CircuitBreakerStats]:
+        """Get circuit breaker state, or None if the retry policy has no breaker"""
+        if self.retry_policy is None or self.retry_policy.circuit_breaker is None:
+            return None
+        return self.retry_policy.circuit_breaker.stats()
+
+    def get_cache_stats(self) -> Optional[CacheStats]:
+        """Get response cache counters, or None if caching is disabled"""
+        if self.cache is None:
+            return None
+        return self.cache.stats()
+
     @property
     def client(self) -> httpx.AsyncClient:
         """Get or create the async HTTP client"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                headers=self._build_headers(),
-            )
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            kwargs: Dict[str, Any] = {"timeout": self.timeout, "http2": self.http2}
+            if self.limits is not None:
+                kwargs["limits"] = self.limits
+            if self._transport is not None:
+                kwargs["transport"] = self._transport
+            self._client = httpx.AsyncClient(**kwargs)
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client"""
-        if self._client is not None:
+        """Close the HTTP client (caller-owned clients are left open)"""
+        if self._client is not None and self._owns_client:
             await self._client.aclose()
             self._client = None
 
@@ -257,7 +785,11 @@ class AsyncHttpClient:
     async def __aexit__(self, *args: Any) -> None:
         await self.close()
 
-    def _build_headers(self) -> Dict[str, str]:
+    def _build_headers(
+        self,
+        idempotency_key: Optional[str] = None,
+        options: Optional[RequestOptions] = None,
+    ) -> Dict[str, str]:
         """Build request headers"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -265,8 +797,15 @@ class AsyncHttpClient:
             "Accept": "application/json",
             "User-Agent": f"sendly-python/{SDK_VERSION}",
         }
-        if self.organization_id:
-            headers["X-Organization-Id"] = self.organization_id
+        organization_id = self.organization_id
+        if options:
+            organization_id = options.get("organization_id", organization_id)
+        if organization_id:
+            headers["X-Organization-Id"] = organization_id
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        if options and options.get("headers"):
+            headers.update(options["headers"])
         return headers
 
     def _update_rate_limit_info(self, headers: httpx.Headers) -> None:
@@ -276,81 +815,356 @@ class AsyncHttpClient:
         reset = headers.get("X-RateLimit-Reset")
 
         if limit and remaining and reset:
-            self._rate_limit_info = RateLimitInfo(
-                limit=int(limit),
-                remaining=int(remaining),
-                reset=int(reset),
-            )
-
-    def _calculate_backoff(self, attempt: int) -> float:
-        """Calculate exponential backoff time"""
-        base_delay = 2**attempt
-        jitter = random.uniform(0, 0.5)
-        return min(base_delay + jitter, 30.0)
+            try:
+                info = RateLimitInfo(limit=int(limit), remaining=int(remaining), reset=float(reset))
+            except ValueError:
+                return
+            self._rate_limit_info = info
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(info.limit, info.remaining, info.reset)
 
     async def request(
         self,
         method: str,
         path: str,
-        body: Optional[Dict[str, Any]] = None,
+        body: Optional[BodyTypes] = None,
         params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        options: Optional[RequestOptions] = None,
+    ) -> Any:
+        """
+        Make an async HTTP request to the API
+
+        POST and PATCH requests carry ``idempotency_key`` (one is generated
+        when omitted), sent unchanged on every retry of the call.
+        ``deadline`` caps the seconds spent on the call, attempts and
+        backoff waits included. ``options`` overrides client settings for
+        this call only.
+
+        With a response cache, cacheable GETs may be answered from it, and
+        any other method invalidates the cached reads of its resource.
+        """
+        cache = self.cache
+        if cache is not None and method.upper() == "GET":
+            ttl = cache.ttl_for(path)
+            if ttl is not None:
+                return await self._cached_get(cache, ttl, path, params, deadline, options or {})
+        try:
+            response = await self._send(
+                method,
+                path,
+                body,
+                params,
+                idempotency_key=idempotency_key,
+                deadline=deadline,
+                options=options,
+            )
+        finally:
+            # Even a failed mutation may have been applied
+            if cache is not None and method.upper() != "GET":
+                cache.invalidate(path)
+        return self._parse_response(response)
+
+    async def _cached_get(
+        self,
+        cache: ResponseCache,
+        ttl: float,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        deadline: Optional[float],
+        options: RequestOptions,
+    ) -> Any:
+        """GET through the response cache"""
+        organization_id = options.get("organization_id", self.organization_id)
+        key = cache_key(self.api_key, organization_id, path, params)
+        if not options.get("cache", True):
+            return await self._fetch_cached(cache, key, None, ttl, path, params, deadline, options)
+        entry, state = cache.lookup(key)
+        if state == MISS or entry is None:
+            return await self._fetch_cached(cache, key, entry, ttl, path, params, deadline, options)
+        if state == STALE and cache.begin_refresh(entry):
+            task = asyncio.ensure_future(
+                self._refresh_cached(cache, key, entry, ttl, path, params, options)
+            )
+            self._refreshes.add(task)
+            task.add_done_callback(self._refreshes.discard)
+        return self.codec.loads(entry.body)
+
+    async def _refresh_cached(
+        self,
+        cache: ResponseCache,
+        key: CacheKey,
+        entry: CacheEntry,
+        ttl: float,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        options: RequestOptions,
+    ) -> None:
+        """Revalidate a stale entry in the background"""
+        try:
+            await self._fetch_cached(cache, key, entry, ttl, path, params, None, options)
+        except SendlyError:
+            # Keep serving the stale body; once it ages out, callers fetch themselves
+            pass
+        finally:
+            cache.end_refresh(entry)
+
+    async def _fetch_cached(
+        self,
+        cache: ResponseCache,
+        key: CacheKey,
+        entry: Optional[CacheEntry],
+        ttl: float,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        deadline: Optional[float],
+        options: RequestOptions,
     ) -> Any:
-        """Make an async HTTP request to the API"""
+        """Fetch a cacheable GET, revalidating ``entry`` by ETag when there is one"""
+        generation = cache.generation
+        if entry is not None and entry.etag:
+            options = options.copy()
+            options["headers"] = {**options.get("headers", {}), "If-None-Match": entry.etag}
+        response = await self._send("GET", path, None, params, deadline=deadline, options=options)
+        if response.status_code == 304 and entry is not None:
+            cache.revalidated(key, entry, ttl, generation)
+            return self.codec.loads(entry.body)
+        data = self._parse_response(response)
+        if "application/json" in response.headers.get("content-type", ""):
+            cache.store(key, path, response.content, response.headers.get("ETag"), ttl, generation)
+        return data
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        body: Optional[BodyTypes] = None,
+        params: Optional[Dict[str, Any]] = None,
+        keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+        deadline: Optional[float] = None,
+        options: Optional[RequestOptions] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Make a request and yield the elements of its JSON array incrementally
+
+        The body is decoded as it downloads; see :class:`JsonArrayScanner` for
+        which array is streamed. Retries and ``deadline`` only apply until
+        the response headers arrive.
+        """
+        response = await self._send(
+            method, path, body, params, stream=True, deadline=deadline, options=options
+        )
+        timeout = (options or {}).get("timeout") or self.timeout
+        scanner = JsonArrayScanner(keys, loads=self.codec.loads)
+        try:
+            try:
+                async for chunk in response.aiter_bytes():
+                    for item in scanner.feed(chunk):
+                        yield item
+            except httpx.TimeoutException as e:
+                raise TimeoutError(f"Request timed out after {_describe_timeout(timeout)}") from e
+            except httpx.RequestError as e:
+                raise NetworkError(f"Network error: {str(e)}", e) from e
+            scanner.close()
+        finally:
+            await response.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        body: Optional[BodyTypes] = None,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        idempotency_key: Optional[str] = None,
+        deadline: Optional[float] = None,
+        options: Optional[RequestOptions] = None,
+    ) -> httpx.Response:
+        """Send a request with retries, returning the successful response"""
+        options = options or {}
+        if idempotency_key is None:
+            idempotency_key = options.get("idempotency_key")
+        if deadline is None:
+            deadline = options.get("deadline")
+        if (
+            idempotency_key is None
+            and self.idempotency_keys
+            and method.upper() in IDEMPOTENT_KEY_METHODS
+        ):
+            # One key per call, so every retry is recognised as the same call
+            idempotency_key = generate_idempotency_key()
+        if self._flights is not None and not stream and method.upper() == "GET":
+            # Identical GETs already in flight share that request's response
+            key = flight_key(
+                self.api_key,
+                options.get("organization_id", self.organization_id),
+                path,
+                params,
+                options.get("headers"),
+            )
+            return await self._flights.do(
+                key,
+                lambda: self._send_tracked(
+                    method, path, body, params, False, None, deadline, options
+                ),
+            )
+        return await self._send_tracked(
+            method, path, body, params, stream, idempotency_key, deadline, options
+        )
+
+    async def _send_tracked(
+        self,
+        method: str,
+        path: str,
+        body: Optional[BodyTypes],
+        params: Optional[Dict[str, Any]],
+        stream: bool,
+        idempotency_key: Optional[str],
+        deadline: Optional[float],
+        options: RequestOptions,
+    ) -> httpx.Response:
+        """Send a request, reporting it to the hooks"""
+        call = CallTracker(self.hooks, method, path, is_async=True) if self.hooks else None
+        try:
+            return await self._send_attempts(
+                method, path, body, params, stream, call, idempotency_key, deadline, options
+            )
+        except SendlyError as e:
+            if call is not None:
+                call.error(e)
+            raise
+
+    async def _send_attempts(
+        self,
+        method: str,
+        path: str,
+        body: Optional[BodyTypes],
+        params: Optional[Dict[str, Any]],
+        stream: bool,
+        call: Optional[CallTracker],
+        idempotency_key: Optional[str],
+        deadline: Optional[float],
+        options: RequestOptions,
+    ) -> httpx.Response:
         last_error: Optional[Exception] = None
+        # Encoded once and reused by every retry
+        content = _encode_body(self.codec, body)
+        headers = self._build_headers(idempotency_key, options)
+        timeout = options.get("timeout")
+        max_retries = options.get("max_retries", self.max_retries)
+        retry = RetryState(self.retry_policy, deadline)
+
+        for attempt in range(max_retries + 1):
+            if self.rate_limiter is not None:
+                waited = await self.rate_limiter.acquire()
+            else:
+                waited = await self._retry_gate.wait()
+            retry.before_attempt()
 
-        for attempt in range(self.max_retries + 1):
             try:
-                response = await self.client.request(
+                request = self.client.build_request(
                     method=method,
-                    url=path,
-                    json=body,
+                    url=f"{self.base_url}{path}",
+                    content=content,
                     params=params,
+                    headers=headers,
+                    timeout=retry.attempt_timeout(self.timeout, timeout),
                 )
+                if call is not None:
+                    call.request(request, waited)
+                response = await self.client.send(request, stream=stream)
 
                 # Update rate limit info
                 self._update_rate_limit_info(response.headers)
-
-                # Parse response
-                data = self._parse_response(response)
-                return data
+                if call is not None:
+                    call.response(response, stream)
+
+                # 304 only answers our own cache revalidations
+                if not response.is_success and response.status_code != 304:
+                    if stream:
+                        await response.aread()
+                        await response.aclose()
+                    # Raises the matching SendlyError
+                    self._parse_response(response)
+                retry.record()
+                return response
 
             except SendlyError as e:
                 last_error = e
+                retry.record(e)
 
                 # Don't retry certain errors
                 if e.status_code in (400, 401, 402, 403, 404):
                     raise
 
-                # Handle rate limiting
-                if isinstance(e, RateLimitError):
-                    if attempt < self.max_retries:
-                        await asyncio.sleep(e.retry_after)
+                # Rate limited, or unavailable with a Retry-After: wait as told
+                if e.retry_after is not None and e.status_code in (429, 503):
+                    # Server-directed waits don't spend the retry budget
+                    if attempt < max_retries and retry.can_retry(e.retry_after, budgeted=False):
+                        if call is not None:
+                            call.retry(e, e.retry_after)
+                        # Hold every caller sharing this client, not just this one
+                        if self.rate_limiter is not None:
+                            self.rate_limiter.block(e.retry_after)
+                        else:
+                            self._retry_gate.block(e.retry_after)
                         continue
                     raise
 
+                # Server error: retried at once, or backed off under a retry policy
+                delay = retry.backoff(attempt) if self.retry_policy is not None else 0.0
+                if attempt < max_retries and retry.can_retry(delay):
+                    if call is not None:
+                        call.retry(e, delay)
+                    if delay:
+                        await asyncio.sleep(delay)
+                    continue
+                break
+
             except httpx.TimeoutException as e:
-                last_error = TimeoutError(f"Request timed out after {self.timeout}s")
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self._calculate_backoff(attempt))
+                last_error = TimeoutError(
+                    f"Request timed out after {_describe_timeout(timeout or self.timeout)}"
+                )
+                retry.record(last_error)
+                delay = retry.backoff(attempt)
+                if attempt < max_retries and retry.can_retry(delay):
+                    if call is not None:
+                        call.retry(last_error, delay)
+                    await asyncio.sleep(delay)
                     continue
+                break
 
             except httpx.RequestError as e:
                 last_error = NetworkError(f"Network error: {str(e)}", e)
-                if attempt < self.max_retries:
-                    await asyncio.sleep(self._calculate_backoff(attempt))
+                retry.record(last_error)
+                delay = retry.backoff(attempt)
+                if attempt < max_retries and retry.can_retry(delay):
+                    if call is not None:
+                        call.retry(last_error, delay)
+                    await asyncio.sleep(delay)
                     continue
+                break
 
         if last_error:
             raise last_error
         raise NetworkError("Request failed after retries")
 
+    def parse(self, model: Type[M], data: Any) -> M:
+        """Build a response model according to ``response_mode``"""
+        return build_model(model, data, self.response_mode)
+
+    def parse_list(self, model: Type[M], items: List[Any]) -> List[M]:
+        """Build a list of response models according to ``response_mode``"""
+        return build_models(model, items, self.response_mode)
+
     def _parse_response(self, response: httpx.Response) -> Any:
         """Parse the response body"""
         content_type = response.headers.get("content-type", "")
 
         if "application/json" in content_type:
             try:
-                data = response.json()
+                data = self.codec.loads(response.content)
             except Exception:
                 data = response.text
         else:
@@ -358,12 +1172,6 @@ class AsyncHttpClient:
 
         # Handle error responses
         if not response.is_success:
-            if isinstance(data, dict):
-                raise SendlyError.from_response(response.status_code, data)
-            raise SendlyError(
-                message=str(data) or f"HTTP {response.status_code}",
-                code="internal_error",
-                status_code=response.status_code,
-            )
+            raise _error_from_response(response, data)
 
         return data
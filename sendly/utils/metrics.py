@@ -0,0 +1,281 @@
+"""
+Request Metrics
+
+A ready-made hook subscriber that aggregates request counters and latency
+histograms per method and path template, for export to Prometheus or an
+OpenTelemetry pipeline.
+"""
+
+import bisect
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .hooks import ErrorEvent, RequestEvent, ResponseEvent, RetryEvent
+
+# Prometheus' default latency buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram (not thread-safe; guarded by its collector)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the ``q`` quantile (0-1) by interpolating within buckets,
+        like Prometheus' ``histogram_quantile``; None when empty
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                if i == len(self.buckets):
+                    # Beyond the last bucket: the best bound we have
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """``(le, count)`` pairs including ``+Inf``, as Prometheus exports them"""
+        pairs = []
+        total = 0
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            total += bucket_count
+            pairs.append((_format_number(bound), total))
+        pairs.append(("+Inf", self.count))
+        return pairs
+
+
+@dataclass
+class _Series:
+    """Every metric of one family, keyed by label set"""
+
+    kind: str
+    help: str
+    values: Dict[Labels, Any] = field(default_factory=dict)
+
+
+class MetricsCollector:
+    """
+    Aggregates the client's hook events into counters and histograms
+
+    Pass ``metrics=True`` (or an instance, to share one between clients) to
+    ``Sendly`` / ``AsyncSendly``. Labels are the HTTP method and the path
+    template (``/messages/{id}``), so cardinality stays bounded.
+
+    Metrics (``sendly_`` prefix):
+        - ``requests_total``: attempts sent, by method and path
+        - ``responses_total``: responses, by method, path and status
+        - ``request_duration_seconds``: attempt latency histogram
+        - ``request_ttfb_seconds`` / ``request_connect_seconds``: latency
+          phases, when the transport reports them
+        - ``request_bytes_total`` / ``response_bytes_total``: body sizes
+        - ``retries_total`` and ``retry_wait_seconds_total``: by reason
+          (``rate_limited``, ``server_error``, ``network``)
+        - ``rate_limiter_wait_seconds_total``: time spent in client-side pacing
+        - ``errors_total``: calls that failed for good, by error code
+
+    Example:
+        >>> client = Sendly('sk_live_v1_xxx', metrics=True)
+        >>> client.messages.send(to='+15551234567', text='Hi')
+        >>> client.metrics.quantile('/messages', 0.99)
+        >>> print(client.metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "sendly_"):
+        self.buckets = tuple(buckets)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._series: Dict[str, _Series] = {
+            "requests_total": _Series("counter", "API request attempts sent"),
+            "responses_total": _Series("counter", "HTTP responses received"),
+            "request_duration_seconds": _Series("histogram", "Attempt latency"),
+            "request_ttfb_seconds": _Series("histogram", "Time to response headers"),
+            "request_connect_seconds": _Series("histogram", "Time spent connecting"),
+            "request_bytes_total": _Series("counter", "Request body bytes sent"),
+            "response_bytes_total": _Series("counter", "Response body bytes received"),
+            "retries_total": _Series("counter", "Attempts retried"),
+            "retry_wait_seconds_total": _Series("counter", "Seconds spent waiting to retry"),
+            "rate_limiter_wait_seconds_total": _Series(
+                "counter", "Seconds spent waiting on the client-side rate limiter"
+            ),
+            "errors_total": _Series("counter", "Calls that failed after all retries"),
+        }
+
+    # Hook subscribers
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            route = (("method", event.method), ("path", event.path))
+            self._add("requests_total", route, 1)
+            self._add("request_bytes_total", route, event.request_bytes)
+            if event.rate_limit_wait > 0:
+                self._add("rate_limiter_wait_seconds_total", (), event.rate_limit_wait)
+
+    def on_response(self, event: ResponseEvent) -> None:
+        route = (("method", event.method), ("path", event.path))
+        with self._lock:
+            self._add("responses_total", route + (("status", str(event.status_code)),), 1)
+            self._observe("request_duration_seconds", route, event.elapsed)
+            if event.ttfb is not None:
+                self._observe("request_ttfb_seconds", route, event.ttfb)
+            if event.connect is not None:
+                self._observe("request_connect_seconds", route, event.connect)
+            if event.response_bytes is not None:
+                self._add("response_bytes_total", route, event.response_bytes)
+
+    def on_retry(self, event: RetryEvent) -> None:
+        if event.rate_limited:
+            reason = "rate_limited"
+        elif event.error.status_code:
+            reason = "server_error"
+        else:
+            reason = "network"
+        labels = (("method", event.method), ("path", event.path), ("reason", reason))
+        with self._lock:
+            self._add("retries_total", labels, 1)
+            self._add("retry_wait_seconds_total", labels, event.delay)
+
+    def on_error(self, event: ErrorEvent) -> None:
+        labels = (("method", event.method), ("path", event.path), ("code", event.error.code))
+        with self._lock:
+            self._add("errors_total", labels, 1)
+
+    # Queries
+
+    def counter(self, name: str, **labels: str) -> float:
+        """Sum of a counter over every series matching ``labels``"""
+        with self._lock:
+            return sum(
+                value for key, value in self._series[name].values.items() if _matches(key, labels)
+            )
+
+    def quantile(
+        self, path: Optional[str] = None, q: float = 0.99, method: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Estimated latency quantile in seconds, across matching routes
+
+        Args:
+            path: Path template to restrict to (e.g. ``/messages``)
+            q: Quantile between 0 and 1 (default: p99)
+            method: HTTP method to restrict to
+        """
+        labels = {k: v for k, v in (("path", path), ("method", method)) if v is not None}
+        merged = Histogram(self.buckets)
+        with self._lock:
+            for key, histogram in self._series["request_duration_seconds"].values.items():
+                if _matches(key, labels):
+                    merged.count += histogram.count
+                    merged.sum += histogram.sum
+                    merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+        return merged.quantile(q)
+
+    def retry_amplification(self) -> float:
+        """Attempts sent per logical call (1.0 means nothing was retried)"""
+        attempts = self.counter("requests_total")
+        # Every call ends with exactly one attempt that is not retried
+        calls = attempts - self.counter("retries_total")
+        return attempts / calls if calls > 0 else 1.0
+
+    def reset(self) -> None:
+        """Drop every recorded value"""
+        with self._lock:
+            for series in self._series.values():
+                series.values.clear()
+
+    # Export
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Plain-data copy of every metric, for feeding another exporter
+        (e.g. OpenTelemetry observable instruments)
+        """
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        with self._lock:
+            for name, series in self._series.items():
+                rows = []
+                for key, value in series.values.items():
+                    row: Dict[str, Any] = {"labels": dict(key)}
+                    if series.kind == "histogram":
+                        row.update(
+                            count=value.count,
+                            sum=value.sum,
+                            buckets=value.cumulative(),
+                        )
+                    else:
+                        row["value"] = value
+                    rows.append(row)
+                result[self.prefix + name] = rows
+        return result
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in self._series.items():
+                if not series.values:
+                    continue
+                full = self.prefix + name
+                lines.append(f"# HELP {full} {series.help}")
+                lines.append(f"# TYPE {full} {series.kind}")
+                for key, value in series.values.items():
+                    if series.kind == "histogram":
+                        for le, count in value.cumulative():
+                            labels = _render_labels(key + (("le", le),))
+                            lines.append(f"{full}_bucket{labels} {count}")
+                        lines.append(f"{full}_sum{_render_labels(key)} {_format_number(value.sum)}")
+                        lines.append(f"{full}_count{_render_labels(key)} {value.count}")
+                    else:
+                        lines.append(f"{full}{_render_labels(key)} {_format_number(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    # Internals (callers hold the lock)
+
+    def _add(self, name: str, labels: Labels, amount: float) -> None:
+        values = self._series[name].values
+        values[labels] = values.get(labels, 0) + amount
+
+    def _observe(self, name: str, labels: Labels, value: float) -> None:
+        values = self._series[name].values
+        histogram = values.get(labels)
+        if histogram is None:
+            histogram = values[labels] = Histogram(self.buckets)
+        histogram.observe(value)
+
+
+def _matches(key: Labels, labels: Dict[str, str]) -> bool:
+    items = dict(key)
+    return all(items.get(k) == v for k, v in labels.items())
+
+
+def _render_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + body + "}"
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,162 @@
+"""
+Response Model Construction
+
+Turns decoded response bodies into the SDK's pydantic models according to
+the client's ``response_mode``:
+
+- ``"model"``: fully validated models (the default)
+- ``"raw"``: the decoded dict, untouched
+- ``"lazy"``: a :class:`LazyModel` that skips validation up front and
+  validates each field the first time it is read
+"""
+
+from typing import Any, Dict, List, Literal, Set, Type, TypeVar, cast
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+from ..errors import SendlyError
+
+M = TypeVar("M", bound=BaseModel)
+
+ResponseMode = Literal["model", "raw", "lazy"]
+RESPONSE_MODES = ("model", "raw", "lazy")
+
+
+def _invalid_response(error: Any) -> SendlyError:
+    return SendlyError(
+        message=f"Invalid API response format: {error}",
+        code="invalid_response",
+        status_code=200,
+    )
+
+
+def check_response_mode(mode: str) -> str:
+    """
+    Raises:
+        ValueError: If ``mode`` is not one of model, raw or lazy
+    """
+    if mode not in RESPONSE_MODES:
+        raise ValueError(f"response_mode must be one of {', '.join(RESPONSE_MODES)}")
+    return mode
+
+
+class LazyModel:
+    """
+    Unvalidated stand-in for a response model
+
+    Built with ``model_construct``, so creating one costs next to nothing.
+    Reading a field validates (and converts) just that field, once; the rest
+    of the model's API (``model_dump()``, properties, ...) is forwarded to
+    the underlying instance. Call :meth:`to_model` for a fully validated copy.
+
+    Example:
+        >>> client = Sendly('sk_live_v1_xxx', response_mode='lazy')
+        >>> message = client.messages.send(to='+15551234567', text='Hi')
+        >>> message.id  # only 'id' is validated
+    """
+
+    __slots__ = ("_model", "_data", "_instance", "_validated")
+
+    def __init__(self, model: Type[BaseModel], data: Dict[str, Any]):
+        object.__setattr__(self, "_model", model)
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_instance", model.model_construct(**data))
+        object.__setattr__(self, "_validated", set())
+
+    @property
+    def model_class(self) -> Type[BaseModel]:
+        """The model this object stands in for"""
+        return self._model  # type: ignore[no-any-return]
+
+    def to_model(self) -> BaseModel:
+        """
+        Validate every field and return a regular model instance
+
+        Raises:
+            SendlyError: If the response does not match the model
+        """
+        try:
+            return self._model.model_validate(self._data)  # type: ignore[no-any-return]
+        except PydanticValidationError as e:
+            raise _invalid_response(e) from e
+
+    def __getattr__(self, name: str) -> Any:
+        instance = self._instance
+        validated: Set[str] = self._validated
+        if name in self._model.model_fields and name not in validated:
+            try:
+                value = getattr(instance, name)
+            except AttributeError as e:
+                raise _invalid_response(
+                    f"missing required field '{name}' for {self._model.__name__}"
+                ) from e
+            if not _holds_lazy(value):
+                try:
+                    self._model.__pydantic_validator__.validate_assignment(instance, name, value)
+                except PydanticValidationError as e:
+                    raise _invalid_response(e) from e
+            validated.add(name)
+        return getattr(instance, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyModel):
+            return self._model is other._model and self._data == other._data
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model.__name__}]({self._data!r})"
+
+
+def _holds_lazy(value: Any) -> bool:
+    """Whether a field already holds lazily-built models (from a transform)"""
+    if isinstance(value, LazyModel):
+        return True
+    return isinstance(value, list) and bool(value) and isinstance(value[0], LazyModel)
+
+
+def build_model(model: Type[M], data: Any, mode: str = "model") -> M:
+    """
+    Build ``model`` from decoded response data according to ``mode``
+
+    The result is typed as ``model`` so resource methods keep their
+    annotations: a LazyModel exposes the same attributes, while raw mode
+    returns the decoded data itself (read it with :func:`response_field`
+    when code must handle every mode).
+
+    Raises:
+        SendlyError: If the data does not match the model (model mode)
+    """
+    if mode == "raw":
+        return cast(M, data)
+    if mode == "lazy" and isinstance(data, dict):
+        return cast(M, LazyModel(model, data))
+    try:
+        return model.model_validate(data)
+    except PydanticValidationError as e:
+        raise _invalid_response(e) from e
+
+
+def build_models(model: Type[M], items: List[Any], mode: str = "model") -> List[M]:
+    """Build a list of models; see :func:`build_model`"""
+    return [build_model(model, item, mode) for item in items]
+
+
+def response_field(model: Type[BaseModel], obj: Any, name: str) -> Any:
+    """
+    Read field ``name`` from a response in any mode
+
+    Models and lazy models are read by attribute; raw dicts by the field's
+    alias (falling back to its name).
+    """
+    if isinstance(obj, dict):
+        field = model.model_fields[name]
+        if field.alias is not None and field.alias in obj:
+            return obj[field.alias]
+        return obj.get(name)
+    return getattr(obj, name)
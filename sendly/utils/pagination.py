@@ -0,0 +1,375 @@
+"""
+Pagination Utilities
+
+Lazy iterators over the API's list endpoints. A :class:`Paginator` walks an
+endpoint page by page, optionally keeping several page requests in flight,
+and tracks a :class:`PageCursor` that can be saved and handed back later to
+resume where iteration stopped.
+"""
+
+import base64
+import binascii
+import dataclasses
+import inspect
+import itertools
+import json
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .concurrency import async_bounded_map, bounded_map
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class PageCursor:
+    """
+    Serializable position in a paginated listing
+
+    ``offset`` is the index of the next item that has not been yielded yet.
+    Store ``encode()`` (or ``dataclasses.asdict``) and pass it back as
+    ``cursor=`` with the same filters to resume.
+    """
+
+    offset: int = 0
+    limit: int = DEFAULT_PAGE_SIZE
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token"""
+        raw = json.dumps({"o": self.offset, "l": self.limit}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        """
+        Decode a token produced by :meth:`encode`
+
+        Raises:
+            ValueError: If the token is not a valid cursor
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            cursor = cls(offset=int(data["o"]), limit=int(data["l"]))
+        except (binascii.Error, ValueError, KeyError, TypeError, UnicodeError) as e:
+            raise ValueError("Invalid pagination cursor") from e
+        if cursor.offset < 0 or cursor.limit < 1:
+            raise ValueError("Invalid pagination cursor")
+        return cursor
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    One page of a listing
+
+    ``total`` and ``has_more`` are filled in when the endpoint reports them;
+    ``response`` is the parsed response the items came from.
+    """
+
+    items: List[T]
+    offset: int
+    limit: int
+    total: Optional[int] = None
+    has_more: Optional[bool] = None
+    response: Any = None
+
+    @property
+    def is_last(self) -> bool:
+        """Whether no further pages follow this one"""
+        if self.has_more is not None:
+            return not self.has_more
+        if self.total is not None and self.offset + len(self.items) >= self.total:
+            return True
+        return len(self.items) < self.limit
+
+
+CursorTypes = Union[PageCursor, str, None]
+
+
+def _check_options(page_size: int, prefetch: int, max_items: Optional[int]) -> None:
+    if not isinstance(page_size, int) or page_size < 1:
+        raise ValueError("page_size must be a positive integer")
+    if not isinstance(prefetch, int) or prefetch < 1:
+        raise ValueError("prefetch must be a positive integer")
+    if max_items is not None and max_items < 0:
+        raise ValueError("max_items must not be negative")
+
+
+def _resolve_cursor(cursor: CursorTypes, page_size: int) -> PageCursor:
+    if cursor is None:
+        return PageCursor(offset=0, limit=page_size)
+    if isinstance(cursor, str):
+        return PageCursor.decode(cursor)
+    return cursor
+
+
+class _PaginatorBase:
+    """State shared by the sync and async paginators"""
+
+    def __init__(
+        self,
+        page_size: int,
+        prefetch: int,
+        max_items: Optional[int],
+        cursor: CursorTypes,
+        on_page: Optional[Callable[[Page[Any]], Any]],
+        aligned: bool,
+    ):
+        _check_options(page_size, prefetch, max_items)
+        start = _resolve_cursor(cursor, page_size)
+        self.page_size = start.limit
+        self.prefetch = prefetch
+        self.max_items = max_items
+        self._on_page = on_page
+        self._aligned = aligned
+        self._offset = start.offset
+        self._yielded = 0
+        self._done = max_items == 0
+
+    @property
+    def cursor(self) -> Optional[PageCursor]:
+        """Position of the next item, or None once the listing is exhausted"""
+        if self._done:
+            return None
+        return PageCursor(offset=self._offset, limit=self.page_size)
+
+    @property
+    def yielded(self) -> int:
+        """Number of items yielded so far"""
+        return self._yielded
+
+    def _page_offsets(self) -> Iterator[int]:
+        first = self._offset
+        if self._aligned:
+            # Page-numbered endpoints can only start on a page boundary
+            first -= first % self.page_size
+        return itertools.count(first, self.page_size)
+
+    def _view(self, page: Page[T]) -> Tuple[Page[T], bool]:
+        """Trim a fetched page to the unseen items within max_items"""
+        items = page.items
+        skip = self._offset - page.offset
+        if skip > 0:
+            items = items[skip:]
+        last = page.is_last
+        if self.max_items is not None:
+            remaining = self.max_items - self._yielded
+            if len(items) >= remaining:
+                items = items[:remaining]
+                last = True
+        return dataclasses.replace(page, items=items, offset=self._offset), last
+
+
+class Paginator(_PaginatorBase, Generic[T]):
+    """
+    Lazy iterator over every item of a paginated endpoint
+
+    Iterating yields items; :meth:`pages` yields whole :class:`Page` objects
+    instead. Only ``prefetch`` pages are ever held in memory.
+
+    Example:
+        >>> pages = client.contacts.iter_all(page_size=100, prefetch=4)
+        >>> for contact in pages:
+        ...     process(contact)
+        ...     checkpoint = pages.cursor.encode()
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int, int], Page[T]],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        *,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[T]], Any]] = None,
+        aligned: bool = False,
+    ):
+        """
+        Args:
+            fetch: Called as ``fetch(offset, limit)`` to load one page
+            page_size: Items requested per page
+            prefetch: Page requests to keep in flight (default 1, sequential)
+            max_items: Stop after yielding this many items
+            cursor: PageCursor or encoded token to resume from; its limit
+                overrides ``page_size``
+            on_page: Called with each page before its items are yielded
+            aligned: Only request offsets on page boundaries (for endpoints
+                that take a page number)
+
+        Raises:
+            ValueError: If an option is out of range or the cursor is invalid
+        """
+        super().__init__(page_size, prefetch, max_items, cursor, on_page, aligned)
+        self._fetch = fetch
+        self._iterator: Optional[Generator[T, None, None]] = None
+
+    def __iter__(self) -> "Paginator[T]":
+        return self
+
+    def __next__(self) -> T:
+        if self._iterator is None:
+            self._iterator = self._items()
+        return next(self._iterator)
+
+    def close(self) -> None:
+        """Stop iterating and cancel any prefetched page requests"""
+        if self._iterator is not None:
+            self._iterator.close()
+
+    def pages(self) -> Iterator[Page[T]]:
+        """Iterate page by page instead of item by item"""
+        for page in self._walk():
+            self._offset += len(page.items)
+            self._yielded += len(page.items)
+            yield page
+
+    def _items(self) -> Generator[T, None, None]:
+        for page in self._walk():
+            for item in page.items:
+                self._offset += 1
+                self._yielded += 1
+                yield item
+
+    def _fetch_pages(self) -> Generator[Page[T], None, None]:
+        offsets = self._page_offsets()
+        if self.prefetch <= 1:
+            for offset in offsets:
+                yield self._fetch(offset, self.page_size)
+            return
+
+        outcomes = bounded_map(
+            lambda offset: self._fetch(offset, self.page_size),
+            offsets,
+            self.prefetch,
+            ordered=True,
+        )
+        try:
+            for outcome in outcomes:
+                if outcome.error is not None:
+                    raise outcome.error
+                yield outcome.result
+        finally:
+            # Stop the page requests still in flight past the last page
+            outcomes.close()  # type: ignore[attr-defined]
+
+    def _walk(self) -> Generator[Page[T], None, None]:
+        if self._done:
+            return
+        fetched = self._fetch_pages()
+        try:
+            for page in fetched:
+                view, last = self._view(page)
+                if self._on_page is not None:
+                    self._on_page(view)
+                if view.items:
+                    yield view
+                if last:
+                    # Only once the last page has been consumed
+                    self._done = True
+                    return
+        finally:
+            fetched.close()
+
+
+class AsyncPaginator(_PaginatorBase, Generic[T]):
+    """Async counterpart of :class:`Paginator`; ``on_page`` may be a coroutine"""
+
+    def __init__(
+        self,
+        fetch: Callable[[int, int], Awaitable[Page[T]]],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        *,
+        prefetch: int = 1,
+        max_items: Optional[int] = None,
+        cursor: CursorTypes = None,
+        on_page: Optional[Callable[[Page[T]], Any]] = None,
+        aligned: bool = False,
+    ):
+        super().__init__(page_size, prefetch, max_items, cursor, on_page, aligned)
+        self._fetch = fetch
+        self._iterator: Optional[AsyncIterator[T]] = None
+
+    def __aiter__(self) -> "AsyncPaginator[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        if self._iterator is None:
+            self._iterator = self._items()
+        return await self._iterator.__anext__()
+
+    async def aclose(self) -> None:
+        """Stop iterating and cancel any prefetched page requests"""
+        if self._iterator is not None:
+            await self._iterator.aclose()  # type: ignore[attr-defined]
+
+    async def pages(self) -> AsyncIterator[Page[T]]:
+        """Iterate page by page instead of item by item"""
+        async for page in self._walk():
+            self._offset += len(page.items)
+            self._yielded += len(page.items)
+            yield page
+
+    async def _items(self) -> AsyncIterator[T]:
+        async for page in self._walk():
+            for item in page.items:
+                self._offset += 1
+                self._yielded += 1
+                yield item
+
+    async def _fetch_pages(self) -> AsyncIterator[Page[T]]:
+        offsets = self._page_offsets()
+        if self.prefetch <= 1:
+            for offset in offsets:
+                yield await self._fetch(offset, self.page_size)
+            return
+
+        outcomes = async_bounded_map(
+            lambda offset: self._fetch(offset, self.page_size),
+            offsets,
+            self.prefetch,
+            ordered=True,
+        )
+        try:
+            async for outcome in outcomes:
+                if outcome.error is not None:
+                    raise outcome.error
+                yield outcome.result
+        finally:
+            await outcomes.aclose()  # type: ignore[attr-defined]
+
+    async def _walk(self) -> AsyncIterator[Page[T]]:
+        if self._done:
+            return
+        fetched = self._fetch_pages()
+        try:
+            async for page in fetched:
+                view, last = self._view(page)
+                if self._on_page is not None:
+                    result = self._on_page(view)
+                    if inspect.isawaitable(result):
+                        await result
+                if view.items:
+                    yield view
+                if last:
+                    # Only once the last page has been consumed
+                    self._done = True
+                    return
+        finally:
+            await fetched.aclose()  # type: ignore[attr-defined]
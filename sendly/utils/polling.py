@@ -0,0 +1,132 @@
+"""
+Batch Polling
+
+Scheduling for ``wait_for_batch`` and friends: each batch is polled fast
+while its results are moving and progressively slower once they stop, and
+all polls share one request budget so waiting on many batches never floods
+the API.
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..errors import TimeoutError
+from ..types import BatchMessageResponse, BatchMessageResult, BatchUpdate
+from .models import response_field
+
+TERMINAL_BATCH_STATUSES = frozenset({"completed", "partial_failure", "failed"})
+
+
+def _status(value: Any) -> str:
+    """A status as a plain string (models carry enums)"""
+    return str(getattr(value, "value", value))
+
+
+def batch_ids_of(batch_ids: Union[str, Iterable[str]]) -> List[str]:
+    """Normalize one or many batch IDs to a de-duplicated list"""
+    ids = [batch_ids] if isinstance(batch_ids, str) else list(batch_ids)
+    return list(dict.fromkeys(ids))
+
+
+class BatchPoller:
+    """
+    Decides which batch to poll next and when
+
+    Call :meth:`next` for the batch to fetch and how long to sleep first,
+    fetch it, then hand the response to :meth:`update`. A batch that made
+    progress is polled again after ``poll_interval``; each quiet poll
+    multiplies its interval by ``backoff`` up to ``max_interval``. Polls
+    across all batches are spaced to stay under ``requests_per_second``.
+    """
+
+    def __init__(
+        self,
+        batch_ids: Union[str, Iterable[str]],
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        max_interval: float = 10.0,
+        backoff: float = 1.5,
+        requests_per_second: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if poll_interval <= 0 or max_interval < poll_interval:
+            raise ValueError("poll_interval must be positive and at most max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+
+        self._clock = clock
+        self._poll_interval = poll_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._gap = 1.0 / requests_per_second
+        self._timeout = timeout
+
+        now = clock()
+        ids = batch_ids_of(batch_ids)
+        self._due: Dict[str, float] = {batch_id: now for batch_id in ids}
+        self._interval: Dict[str, float] = {batch_id: poll_interval for batch_id in ids}
+        self._counts: Dict[str, Tuple[Any, ...]] = {}
+        self._seen: Dict[str, Dict[str, str]] = {batch_id: {} for batch_id in ids}
+        self._next_request = now
+        self._deadline = None if timeout is None else now + timeout
+        self.requests = 0
+        """get_batch calls made so far."""
+
+    @property
+    def pending(self) -> List[str]:
+        """Batches that have not reached a final status"""
+        return list(self._due)
+
+    def next(self) -> Tuple[str, float]:
+        """
+        The batch to poll next and the seconds to wait before polling it
+
+        Raises:
+            TimeoutError: If the wait would run past the timeout
+        """
+        batch_id = min(self._due, key=self._due.__getitem__)
+        now = self._clock()
+        wait = max(self._due[batch_id], self._next_request) - now
+        if self._deadline is not None and now + max(wait, 0.0) > self._deadline:
+            raise TimeoutError(
+                f"{len(self._due)} batch(es) still processing after {self._timeout}s: "
+                + ", ".join(self._due)
+            )
+        return batch_id, max(wait, 0.0)
+
+    def update(self, batch_id: str, batch: Any) -> BatchUpdate:
+        """Record a polled batch and schedule its next poll"""
+        now = self._clock()
+        self.requests += 1
+        self._next_request = now + self._gap
+
+        seen = self._seen[batch_id]
+        changed = []
+        for index, item in enumerate(response_field(BatchMessageResponse, batch, "messages")):
+            key = response_field(BatchMessageResult, item, "id") or f"#{index}"
+            status = _status(response_field(BatchMessageResult, item, "status"))
+            if seen.get(key) != status:
+                seen[key] = status
+                changed.append(item)
+
+        counts = tuple(
+            response_field(BatchMessageResponse, batch, name)
+            for name in ("status", "queued", "sent", "failed")
+        )
+        progressed = bool(changed) or counts != self._counts.get(batch_id)
+        self._counts[batch_id] = counts
+
+        done = _status(counts[0]) in TERMINAL_BATCH_STATUSES
+        if done:
+            del self._due[batch_id], self._interval[batch_id], self._seen[batch_id]
+        else:
+            if progressed:
+                interval = self._poll_interval
+            else:
+                interval = min(self._interval[batch_id] * self._backoff, self._max_interval)
+            self._interval[batch_id] = interval
+            self._due[batch_id] = now + interval
+
+        return BatchUpdate(batch_id=batch_id, batch=batch, changed=changed, done=done)
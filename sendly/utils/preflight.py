@@ -0,0 +1,140 @@
+"""
+Batch Pre-flight
+
+A local stand-in for ``messages.preview_batch``: validates recipients and
+text, counts segments, prices each message by its destination's tier and
+checks the total against a credit balance, all in memory. The remote
+preview stays the authoritative check.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..errors import ValidationError
+from .encoding import get_segment_info
+from .pricing import resolve_destination
+from .validation import validate_message_text, validate_phone_number
+
+# Reasons a message is blocked
+BLOCKED_INVALID_PHONE = "invalid_phone"
+BLOCKED_MISSING_TEXT = "missing_text"  # empty or not a string
+BLOCKED_UNSUPPORTED_COUNTRY = "unsupported_country"
+
+
+@dataclass
+class BatchPreflight:
+    """Outcome of a local batch pre-flight (see :func:`preflight_batch`)"""
+
+    total: int = 0
+    """Messages checked."""
+    will_send: int = 0
+    """Messages that pass every check."""
+    segments: int = 0
+    """Segments across the messages that will send."""
+    credits_needed: int = 0
+    """Credits the messages that will send cost."""
+    balance: Optional[int] = None
+    """Credit balance compared against, if known."""
+    credits_by_country: Dict[str, int] = field(default_factory=dict)
+    """Credits needed per destination country."""
+    messages_by_country: Dict[str, int] = field(default_factory=dict)
+    """Messages that will send per destination country."""
+    blocked_indices: List[int] = field(default_factory=list)
+    """Input positions of messages that would be rejected."""
+    reasons: List[str] = field(default_factory=list)
+    """Reason for each entry in ``blocked_indices``."""
+
+    @property
+    def blocked(self) -> int:
+        """Messages that would be rejected"""
+        return len(self.blocked_indices)
+
+    @property
+    def has_enough_credits(self) -> bool:
+        """Whether the balance covers the batch (True when the balance is unknown)"""
+        return self.balance is None or self.credits_needed <= self.balance
+
+    @property
+    def can_send(self) -> bool:
+        """Whether anything would send and the balance covers it"""
+        return self.will_send > 0 and self.has_enough_credits
+
+    def errors(self) -> Dict[int, str]:
+        """Blocked input positions mapped to their reasons"""
+        return dict(zip(self.blocked_indices, self.reasons))
+
+
+def preflight_batch(
+    messages: Iterable[Dict[str, Any]], balance: Optional[int] = None
+) -> BatchPreflight:
+    """
+    Check messages locally the way ``preview_batch`` would
+
+    Recipients must be E.164 numbers in a supported country (see
+    ``ALL_SUPPORTED_COUNTRIES``) and text must pass the same
+    ``validate_message_text`` check ``send_batch`` runs. Validation and
+    segment counts are cached per distinct text and destinations resolve
+    with a table lookup, so a million-row preview runs in memory in seconds.
+    There is no 1000-message limit; split the batch for sending with
+    ``send_batch_stream``.
+
+    Args:
+        messages: Message dicts with 'to' and 'text' keys
+        balance: Credit balance to check against (optional)
+
+    Returns:
+        A BatchPreflight with totals, per-country credits and the positions
+        and reasons of blocked messages
+    """
+    result = BatchPreflight(balance=balance)
+    credits_by_country = result.credits_by_country
+    messages_by_country = result.messages_by_country
+    blocked_indices, reasons = result.blocked_indices, result.reasons
+    segment_cache: Dict[str, int] = {}
+    total = will_send = segments = credits = 0
+
+    for index, message in enumerate(messages):
+        total += 1
+        to = message.get("to") or ""
+        try:
+            validate_phone_number(to)
+        except ValidationError:
+            blocked_indices.append(index)
+            reasons.append(BLOCKED_INVALID_PHONE)
+            continue
+
+        text = message.get("text")
+        if not isinstance(text, str):
+            blocked_indices.append(index)
+            reasons.append(BLOCKED_MISSING_TEXT)
+            continue
+
+        count = segment_cache.get(text)
+        if count is None:
+            try:
+                validate_message_text(text)
+            except ValidationError:
+                blocked_indices.append(index)
+                reasons.append(BLOCKED_MISSING_TEXT)
+                continue
+            count = segment_cache[text] = get_segment_info(text).segments
+
+        destination = resolve_destination(to)
+        if destination is None:
+            blocked_indices.append(index)
+            reasons.append(BLOCKED_UNSUPPORTED_COUNTRY)
+            continue
+
+        cost = count * destination.credits_per_sms
+        country = destination.country
+        will_send += 1
+        segments += count
+        credits += cost
+        credits_by_country[country] = credits_by_country.get(country, 0) + cost
+        messages_by_country[country] = messages_by_country.get(country, 0) + 1
+
+    result.total = total
+    result.will_send = will_send
+    result.segments = segments
+    result.credits_needed = credits
+    return result
@@ -0,0 +1,243 @@
+"""
+Cost Estimation
+
+Offline credit forecasts: each message costs its segment count (from the
+exact GSM-7 / UCS-2 engine) times the credits per SMS of its destination's
+pricing tier.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..types import CREDITS_PER_SMS, SUPPORTED_COUNTRIES, PricingTier
+from .encoding import GSM7, get_segment_info, transliterate
+from .validation import get_country_from_phone
+
+_TIER_BY_COUNTRY = {
+    country: tier for tier, countries in SUPPORTED_COUNTRIES.items() for country in countries
+}
+
+
+@dataclass(frozen=True)
+class Destination:
+    """Country and price of a phone number"""
+
+    country: str
+    """ISO country code."""
+    tier: PricingTier
+    """Pricing tier of the country."""
+    credits_per_sms: int
+    """Credits charged per segment."""
+
+
+# One shared instance per supported country
+_DESTINATIONS = {
+    country: Destination(country, tier, CREDITS_PER_SMS[tier])
+    for country, tier in _TIER_BY_COUNTRY.items()
+}
+
+
+def resolve_destination(phone: str) -> Optional[Destination]:
+    """
+    Get the country, pricing tier and credits per SMS of a phone number
+
+    Args:
+        phone: Phone number in E.164 format
+
+    Returns:
+        The Destination, or None if the country is unknown or not supported
+    """
+    return _DESTINATIONS.get(get_country_from_phone(phone) or "")
+
+
+def resolve_destinations(phones: Iterable[str]) -> List[Optional[Destination]]:
+    """
+    Resolve many phone numbers at once
+
+    Each lookup is a fixed three-digit table access (plus an area-code check
+    for +1 numbers), so cost stays flat no matter how many countries are
+    supported. Accepts any iterable, including NumPy arrays and pandas
+    Series (converted with ``tolist()``).
+
+    Args:
+        phones: Phone numbers in E.164 format
+
+    Returns:
+        A Destination (or None when unsupported) per input number, in order
+    """
+    if hasattr(phones, "tolist"):
+        phones = phones.tolist()
+    lookup = _DESTINATIONS.get
+    return [lookup(get_country_from_phone(phone) or "") if phone else None for phone in phones]
+
+
+def get_pricing_tier(phone: str) -> Optional[PricingTier]:
+    """
+    Get the pricing tier of a destination
+
+    Args:
+        phone: Phone number in E.164 format
+
+    Returns:
+        The PricingTier, or None if the country is not supported
+    """
+    destination = resolve_destination(phone)
+    return destination.tier if destination else None
+
+
+@dataclass
+class CostEstimate:
+    """Forecast produced by :func:`estimate_cost`"""
+
+    messages: int = 0
+    """Messages priced (excludes unsupported destinations)."""
+    segments: int = 0
+    """Total SMS segments."""
+    credits: int = 0
+    """Total credits."""
+    credits_by_tier: Dict[PricingTier, int] = field(default_factory=dict)
+    """Credits per pricing tier."""
+    messages_by_encoding: Dict[str, int] = field(default_factory=dict)
+    """Message count per encoding (``"GSM-7"`` / ``"UCS-2"``)."""
+    unsupported: List[int] = field(default_factory=list)
+    """Input positions whose destination country is not supported."""
+
+
+def estimate_cost(messages: Iterable[Dict[str, Any]], text: Optional[str] = None) -> CostEstimate:
+    """
+    Estimate the credits a set of messages will cost
+
+    Runs entirely offline. Destinations resolve with a constant-time table
+    lookup and segment counts are cached per distinct text, so campaigns
+    that reuse a template price around a million messages a second.
+
+    Args:
+        messages: Message dicts with 'to' and 'text' keys (as for
+            ``send_batch``)
+        text: Text for messages that don't have their own
+
+    Returns:
+        A CostEstimate with totals, a per-tier breakdown and the positions
+        of messages to unsupported countries
+
+    Example:
+        >>> estimate = estimate_cost({'to': row.phone, 'text': body} for row in rows)
+        >>> print(f'{estimate.credits} credits for {estimate.segments} segments')
+    """
+    estimate = CostEstimate()
+    by_tier = estimate.credits_by_tier
+    by_encoding = estimate.messages_by_encoding
+    unsupported = estimate.unsupported
+    segment_cache: Dict[str, Tuple[str, int]] = {}
+    segments = credits = priced = 0
+    lookup = _DESTINATIONS.get
+
+    for index, message in enumerate(messages):
+        destination = lookup(get_country_from_phone(message.get("to") or "") or "")
+        if destination is None:
+            unsupported.append(index)
+            continue
+
+        body = message.get("text", text) or ""
+        cached = segment_cache.get(body)
+        if cached is None:
+            info = get_segment_info(body)
+            cached = segment_cache[body] = (info.encoding, info.segments)
+        encoding, count = cached
+
+        cost = count * destination.credits_per_sms
+        priced += 1
+        segments += count
+        credits += cost
+        by_tier[destination.tier] = by_tier.get(destination.tier, 0) + cost
+        by_encoding[encoding] = by_encoding.get(encoding, 0) + 1
+
+    estimate.messages = priced
+    estimate.segments = segments
+    estimate.credits = credits
+    return estimate
+
+
+@dataclass
+class EncodingOptimization:
+    """Outcome of :func:`optimize_encoding` for one message"""
+
+    text: str
+    """The text to send (rewritten, or the original if rewriting didn't help)."""
+    encoding: str
+    """Encoding of ``text``."""
+    segments: int
+    """Segments of ``text``."""
+    original_segments: int
+    """Segments of the original text."""
+    changed: bool
+    """Whether ``text`` differs from the original."""
+    credits_saved: Optional[int] = None
+    """Credits saved per send, when the destination is known and supported."""
+
+    @property
+    def segments_saved(self) -> int:
+        """Segments saved per send"""
+        return self.original_segments - self.segments
+
+
+# send/schedule/campaign option: True to rewrite, or a callable that also
+# receives each EncodingOptimization
+EncodingOptimizer = Union[bool, Callable[[EncodingOptimization], Any]]
+
+
+def optimize_encoding(text: str, to: Optional[str] = None) -> EncodingOptimization:
+    """
+    Rewrite a message to stay in GSM-7 when that saves segments
+
+    Applies :func:`sendly.utils.encoding.transliterate` (smart quotes,
+    dashes, ellipses, special spaces, ...). The rewrite is kept only if the
+    result is pure GSM-7 and needs no more segments than the original; text
+    that needs UCS-2 anyway (e.g. emoji) is left untouched.
+
+    Args:
+        text: Message text
+        to: Optional destination, to report the credits saved
+
+    Returns:
+        An EncodingOptimization with the text to send and the savings
+
+    Example:
+        >>> result = optimize_encoding('Don’t miss our sale — 50% off…')
+        >>> result.text, result.segments_saved
+        ("Don't miss our sale - 50% off...", 0)
+    """
+    original = get_segment_info(text)
+    rewritten = transliterate(text)
+    info = original
+    if rewritten != text:
+        candidate = get_segment_info(rewritten)
+        if candidate.encoding == GSM7 and candidate.segments <= original.segments:
+            info = candidate
+    if info is original:
+        rewritten = text
+
+    credits_saved = None
+    if to is not None:
+        tier = get_pricing_tier(to)
+        if tier is not None:
+            credits_saved = (original.segments - info.segments) * CREDITS_PER_SMS[tier]
+
+    return EncodingOptimization(
+        text=rewritten,
+        encoding=info.encoding,
+        segments=info.segments,
+        original_segments=original.segments,
+        changed=rewritten != text,
+        credits_saved=credits_saved,
+    )
+
+
+def apply_encoding_optimization(text: str, to: Optional[str], optimize: EncodingOptimizer) -> str:
+    """The text to send for a resource method's ``optimize_encoding`` option"""
+    if not optimize or not isinstance(text, str):
+        return text
+    result = optimize_encoding(text, to)
+    if callable(optimize):
+        optimize(result)
+    return result.text
@@ -0,0 +1,366 @@
+"""
+Client-side Rate Limiting
+
+Token-bucket limiter seeded from the API's X-RateLimit-* headers, so the SDK
+paces outgoing requests at the account's real quota instead of running into
+429 responses and stalling for the whole retry window.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+
+# X-RateLimit-Reset values larger than this are unix timestamps, not seconds
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def reset_seconds(reset: float) -> float:
+    """Seconds until an X-RateLimit-Reset value (seconds or unix timestamp)"""
+    if reset > _EPOCH_THRESHOLD:
+        reset = reset - time.time()
+    return max(float(reset), 0.0)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After header, or None if absent or malformed
+
+    Accepts delta-seconds (fractions allowed, e.g. ``0.25``) and HTTP-dates.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when is None:
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from an X-RateLimit-Reset header, or None if absent or malformed"""
+    if not value:
+        return None
+    try:
+        return reset_seconds(float(value))
+    except ValueError:
+        return None
+
+
+@dataclass
+class RateLimiterStats:
+    """Snapshot of a rate limiter's state"""
+
+    tokens: float
+    """Tokens currently available (negative while requests are queued)."""
+
+    capacity: Optional[float]
+    """Bucket size (the server's X-RateLimit-Limit), None until seeded."""
+
+    refill_rate: Optional[float]
+    """Tokens added per second, None until seeded."""
+
+    acquired: int
+    """Requests that passed through the limiter."""
+
+    waits: int
+    """Requests that had to wait for a token."""
+
+    total_wait: float
+    """Total seconds spent waiting for tokens."""
+
+    max_wait: float
+    """Longest single wait in seconds."""
+
+
+class _TokenBucket:
+    """Thread-safe token bucket shared by the sync and async limiters"""
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate: Initial requests per second. When omitted the limiter lets
+                requests through until the first rate limit headers arrive.
+            burst: Bucket size (defaults to one second's worth of ``rate``)
+            clock: Monotonic clock, overridable for tests
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._capacity = burst if burst is not None else rate
+        self._tokens = float(self._capacity or 0.0)
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._window = 0.0
+        self._acquired = 0
+        self._waits = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available"""
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    def stats(self) -> RateLimiterStats:
+        """Get a snapshot of the limiter's state and wait-time counters"""
+        with self._lock:
+            self._refill(self._clock())
+            return RateLimiterStats(
+                tokens=self._tokens,
+                capacity=self._capacity,
+                refill_rate=self._rate,
+                acquired=self._acquired,
+                waits=self._waits,
+                total_wait=self._total_wait,
+                max_wait=self._max_wait,
+            )
+
+    def update(self, limit: int, remaining: int, reset: float) -> None:
+        """
+        Re-seed the bucket from X-RateLimit-Limit/Remaining/Reset
+
+        Args:
+            limit: Max requests per window
+            remaining: Requests left in the current window
+            reset: Seconds until the window resets (unix timestamps accepted)
+        """
+        if limit <= 0:
+            return
+        reset = reset_seconds(reset)
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            # The largest reset we have seen is the best estimate of the
+            # window length; spreading the limit over it gives a steady pace.
+            self._window = max(self._window, reset, 1.0)
+            seeded = self._rate is not None
+            self._capacity = float(limit)
+            self._rate = limit / self._window
+            # The server is authoritative: never believe we have more tokens
+            # than it reports, but keep local debt from queued requests.
+            if seeded:
+                self._tokens = min(self._tokens, float(remaining))
+            else:
+                self._tokens = float(remaining)
+            if remaining <= 0:
+                self._blocked_until = max(self._blocked_until, now + reset)
+
+    def block(self, seconds: float) -> None:
+        """Hold all requests for ``seconds`` (e.g. after a 429)"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, now + max(seconds, 0.0))
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last refill (lock held)"""
+        if self._rate is None or self._capacity is None:
+            self._updated = now
+            return
+        start = max(self._updated, self._blocked_until)
+        if now > start:
+            self._tokens = min(self._capacity, self._tokens + (now - start) * self._rate)
+        self._updated = max(now, self._updated)
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it"""
+        with self._lock:
+            now = self._clock()
+            self._acquired += 1
+            blocked = max(self._blocked_until - now, 0.0)
+            if self._rate is None:
+                wait = blocked
+            else:
+                self._refill(now)
+                self._tokens -= 1.0
+                deficit = -self._tokens if self._tokens < 0 else 0.0
+                wait = blocked + deficit / self._rate
+            if wait > 0:
+                self._waits += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+
+
+class RateLimiter(_TokenBucket):
+    """
+    Token-bucket rate limiter for the synchronous client
+
+    Safe to share between threads: each caller reserves a token under a lock
+    and sleeps outside of it, so waiting threads are released in order at the
+    bucket's refill rate.
+
+    Example:
+        >>> client = Sendly('sk_live_v1_xxx', rate_limiter=True)
+        >>> client.messages.send(to='+15551234567', text='Hello!')
+        >>> print(client.get_rate_limiter_stats())
+    """
+
+    def acquire(self) -> float:
+        """
+        Wait until a request may be sent
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class AsyncRateLimiter(_TokenBucket):
+    """
+    Token-bucket rate limiter for the asynchronous client
+
+    Safe to share between tasks (and between event loops in different
+    threads); reservations are taken without awaiting, so tasks resume in
+    the order they asked.
+
+    Example:
+        >>> async with AsyncSendly('sk_live_v1_xxx', rate_limiter=True) as client:
+        ...     await client.messages.send(to='+15551234567', text='Hello!')
+    """
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request may be sent
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class _Gate:
+    """Holds a client's requests until a server-directed wait (Retry-After) ends"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._until = 0.0
+
+    def remaining(self) -> float:
+        """Seconds until requests may be sent again"""
+        return max(self._until - self._clock(), 0.0)
+
+    def _extend(self, seconds: float) -> None:
+        with self._lock:
+            self._until = max(self._until, self._clock() + max(seconds, 0.0))
+
+
+class RetryGate(_Gate):
+    """
+    Server-directed wait shared by every thread using one sync client
+
+    Used when the client has no :class:`RateLimiter`: after a 429 (or a 503
+    with Retry-After) every thread holds until the same instant, instead of
+    new requests running into the limit while one thread sleeps.
+    """
+
+    def block(self, seconds: float) -> None:
+        """Hold all requests for ``seconds``"""
+        self._extend(seconds)
+
+    def wait(self) -> float:
+        """
+        Wait until the gate opens
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.remaining() <= 0:
+            return 0.0
+        started = self._clock()
+        # Sleep again only if another thread extended the wait meanwhile
+        target = 0.0
+        while self._until > target:
+            target = self._until
+            wait = target - self._clock()
+            if wait > 0:
+                time.sleep(wait)
+        return self._clock() - started
+
+
+class AsyncRetryGate(_Gate):
+    """
+    Server-directed wait shared by every task using one async client
+
+    One timer per blocked period wakes every waiting task at once when the
+    wait is over, rather than each task running its own sleep.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        super().__init__(clock)
+        self._opened: Optional[asyncio.Event] = None
+        self._timer: Optional["asyncio.Task[None]"] = None
+
+    def block(self, seconds: float) -> None:
+        """Hold all requests for ``seconds`` (call from the event loop)"""
+        self._extend(seconds)
+        if self.remaining() > 0 and not self._timer_running():
+            self._opened = asyncio.Event()
+            self._timer = asyncio.get_running_loop().create_task(self._release(self._opened))
+
+    async def wait(self) -> float:
+        """
+        Wait until the gate opens
+
+        Returns:
+            Seconds spent waiting
+        """
+        opened = self._opened
+        if opened is None:
+            return 0.0
+        started = self._clock()
+        if self._timer_running():
+            await opened.wait()
+        else:
+            # The timer belongs to another (or a closed) event loop
+            await self._sleep_out()
+        return self._clock() - started
+
+    def _timer_running(self) -> bool:
+        timer = self._timer
+        return (
+            timer is not None
+            and not timer.done()
+            and timer.get_loop() is asyncio.get_running_loop()
+        )
+
+    async def _sleep_out(self) -> None:
+        # A 429 arriving mid-wait may push the gate out; sleep again if so
+        target = 0.0
+        while self._until > target:
+            target = self._until
+            wait = target - self._clock()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    async def _release(self, opened: asyncio.Event) -> None:
+        await self._sleep_out()
+        self._opened = None
+        self._timer = None
+        opened.set()
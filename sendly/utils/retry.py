@@ -0,0 +1,443 @@
+"""
+Retry Policy
+
+Decides whether and when a failed request is retried: decorrelated-jitter
+backoff, a client-wide retry budget that keeps retries to a fraction of
+traffic during an outage, a circuit breaker that fails fast once the API
+looks down, and per-call deadlines covering every attempt and wait.
+"""
+
+import contextlib
+import contextvars
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+import httpx
+
+from ..errors import CircuitOpenError, SendlyError, TimeoutError
+from ..types import CircuitState
+
+# Absolute monotonic deadline set by the deadline() context manager
+_current_deadline: "contextvars.ContextVar[Optional[float]]" = contextvars.ContextVar(
+    "sendly_deadline", default=None
+)
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Bound every API call made inside the block by one shared deadline
+
+    Nested blocks can only shorten the deadline. Applies to the current
+    thread or asyncio task.
+
+    Example:
+        >>> with sendly.deadline(2.0):
+        ...     client.messages.send(to='+15551234567', text='Hi')
+        ...     client.messages.get(message_id)  # gets whatever time is left
+    """
+    at = time.monotonic() + seconds
+    outer = _current_deadline.get()
+    token = _current_deadline.set(at if outer is None else min(at, outer))
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+@dataclass
+class CircuitBreakerStats:
+    """Snapshot of a circuit breaker's state"""
+
+    state: CircuitState
+    """Current state."""
+
+    consecutive_failures: int
+    """Failures since the last success."""
+
+    opened: int
+    """Times the circuit has opened."""
+
+    rejected: int
+    """Calls failed fast while the circuit was open."""
+
+    retry_in: Optional[float]
+    """Seconds until an open circuit lets a probe through, else None."""
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast after repeated server or network errors
+
+    Opens after ``failure_threshold`` consecutive 5xx responses, timeouts or
+    network errors. While open, calls raise :class:`CircuitOpenError`
+    without touching the network; after ``recovery_timeout`` seconds it
+    half-opens and lets a single probe through, closing again if the probe
+    succeeds. Thread-safe, and can be shared between clients.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        on_state_change: Optional[Callable[[CircuitState, CircuitState], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to stay open before probing
+            on_state_change: Called as ``(old_state, new_state)`` on every
+                transition (e.g. to alert)
+            clock: Monotonic clock, overridable for tests
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if recovery_timeout <= 0:
+            raise ValueError("recovery_timeout must be positive")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.on_state_change = on_state_change
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an open circuit reports half-open once it may probe)"""
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._recovery_due(self._clock()):
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def stats(self) -> CircuitBreakerStats:
+        """Snapshot of the breaker's state and counters"""
+        with self._lock:
+            retry_in = None
+            if self._state is CircuitState.OPEN:
+                retry_in = max(self._opened_at + self.recovery_timeout - self._clock(), 0.0)
+            return CircuitBreakerStats(
+                state=self._state,
+                consecutive_failures=self._failures,
+                opened=self._opened,
+                rejected=self._rejected,
+                retry_in=retry_in,
+            )
+
+    def allow(self) -> None:
+        """
+        Raises:
+            CircuitOpenError: If the circuit is open (or a probe is already out)
+        """
+        transition = None
+        with self._lock:
+            now = self._clock()
+            if self._state is CircuitState.OPEN and self._recovery_due(now):
+                transition = self._set_state(CircuitState.HALF_OPEN)
+            if self._state is CircuitState.HALF_OPEN:
+                # One probe at a time; a probe that never reported back
+                # is replaced after another recovery period
+                probe = self._probe_started
+                if probe is None or now - probe >= self.recovery_timeout:
+                    self._probe_started = now
+                else:
+                    self._rejected += 1
+                    raise CircuitOpenError(self.recovery_timeout - (now - probe))
+            elif self._state is CircuitState.OPEN:
+                self._rejected += 1
+                raise CircuitOpenError(self._opened_at + self.recovery_timeout - now)
+        self._notify(transition)
+
+    def record_success(self) -> None:
+        """Report a call that reached a healthy API"""
+        with self._lock:
+            self._failures = 0
+            self._probe_started = None
+            transition = None
+            if self._state is not CircuitState.CLOSED:
+                transition = self._set_state(CircuitState.CLOSED)
+        self._notify(transition)
+
+    def record_failure(self) -> None:
+        """Report a 5xx response, timeout or network error"""
+        with self._lock:
+            self._failures += 1
+            self._probe_started = None
+            transition = None
+            if self._state is CircuitState.HALF_OPEN or (
+                self._state is CircuitState.CLOSED and self._failures >= self.failure_threshold
+            ):
+                transition = self._set_state(CircuitState.OPEN)
+                self._opened_at = self._clock()
+                self._opened += 1
+        self._notify(transition)
+
+    def record_neutral(self) -> None:
+        """
+        Report a call that says nothing about the API's health (a 429)
+
+        Leaves the state and the failure count alone, and frees a half-open
+        probe slot so the next call can probe instead.
+        """
+        with self._lock:
+            self._probe_started = None
+
+    def reset(self) -> None:
+        """Force the circuit closed"""
+        self.record_success()
+
+    def _recovery_due(self, now: float) -> bool:
+        return now - self._opened_at >= self.recovery_timeout
+
+    def _set_state(self, state: CircuitState) -> Tuple[CircuitState, CircuitState]:
+        old, self._state = self._state, state
+        return old, state
+
+    def _notify(self, transition: Optional[Tuple[CircuitState, CircuitState]]) -> None:
+        if transition is not None and self.on_state_change is not None:
+            self.on_state_change(*transition)
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of recent requests
+
+    Over a sliding ``window`` of seconds, retries are allowed while they
+    number fewer than ``min_retries + ratio * requests``. In normal
+    operation that never binds; during an outage it stops retries from
+    multiplying the load. Thread-safe, and can be shared between clients.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries: int = 10,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ratio: Retries allowed per request sent
+            min_retries: Retries always allowed per window, so low-traffic
+                clients can still retry
+            window: Sliding window in seconds
+            clock: Monotonic clock, overridable for tests
+        """
+        if ratio < 0 or min_retries < 0 or window <= 0:
+            raise ValueError("ratio and min_retries must not be negative, window must be positive")
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Ring of one-tenth-window buckets: [bucket index, requests, retries]
+        self._slots = 10
+        self._buckets: List[List[int]] = [[-1, 0, 0] for _ in range(self._slots)]
+
+    def record_request(self) -> None:
+        """Count a new call"""
+        with self._lock:
+            self._bucket()[1] += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False when it is exhausted"""
+        with self._lock:
+            requests, retries = self._totals()
+            if retries >= self.min_retries + self.ratio * requests:
+                return False
+            self._bucket()[2] += 1
+            return True
+
+    def _index(self) -> int:
+        return int(self._clock() * self._slots / self.window)
+
+    def _bucket(self) -> List[int]:
+        index = self._index()
+        bucket = self._buckets[index % self._slots]
+        if bucket[0] != index:
+            bucket[:] = [index, 0, 0]
+        return bucket
+
+    def _totals(self) -> Tuple[int, int]:
+        oldest = self._index() - self._slots + 1
+        requests = retries = 0
+        for index, bucket_requests, bucket_retries in self._buckets:
+            if index >= oldest:
+                requests += bucket_requests
+                retries += bucket_retries
+        return requests, retries
+
+
+class RetryPolicy:
+    """
+    How the client retries failed requests
+
+    Example:
+        >>> policy = RetryPolicy(
+        ...     base_delay=0.2,
+        ...     max_delay=5.0,
+        ...     budget=RetryBudget(ratio=0.1),
+        ...     circuit_breaker=True,
+        ...     deadline=10.0,
+        ... )
+        >>> client = Sendly('sk_live_v1_xxx', max_retries=5, retry_policy=policy)
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        budget: Union[bool, RetryBudget, None] = True,
+        circuit_breaker: Union[bool, CircuitBreaker, None] = None,
+        deadline: Optional[float] = None,
+    ):
+        """
+        Args:
+            base_delay: Smallest backoff in seconds
+            max_delay: Largest backoff in seconds
+            budget: Retry budget; True (default) for a new
+                :class:`RetryBudget`, an instance to share one, or
+                False/None for unlimited retries
+            circuit_breaker: True for a new :class:`CircuitBreaker`, or an
+                instance to share one (default: none)
+            deadline: Default per-call deadline in seconds, covering every
+                attempt and backoff wait
+        """
+        if base_delay <= 0 or max_delay < base_delay:
+            raise ValueError("base_delay must be positive and at most max_delay")
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget: Optional[RetryBudget] = RetryBudget() if budget is True else budget or None
+        self.circuit_breaker: Optional[CircuitBreaker] = (
+            CircuitBreaker() if circuit_breaker is True else circuit_breaker or None
+        )
+        self.deadline = deadline
+
+
+def exponential_backoff(attempt: int) -> float:
+    """Delay used without a retry policy: 2^attempt seconds plus jitter, capped at 30s"""
+    return min(2**attempt + random.uniform(0, 0.5), 30.0)
+
+
+def is_failure(error: SendlyError) -> bool:
+    """Whether an error means the API is unhealthy (5xx, timeout, network)"""
+    return error.status_code is None or error.status_code >= 500
+
+
+class RetryState:
+    """
+    Retry bookkeeping for one call: deadline, backoff, budget and breaker
+
+    Without a policy only the deadline applies, and backoff is the client's
+    plain exponential delay.
+    """
+
+    def __init__(self, policy: Optional[RetryPolicy] = None, deadline: Optional[float] = None):
+        self.policy = policy
+        if deadline is None and policy is not None:
+            deadline = policy.deadline
+        at = None if deadline is None else time.monotonic() + deadline
+        outer = _current_deadline.get()
+        if outer is not None:
+            at = outer if at is None else min(at, outer)
+        self.deadline_at = at
+        self._delay = policy.base_delay if policy is not None else 0.0
+        if policy is not None and policy.budget is not None:
+            policy.budget.record_request()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without one"""
+        if self.deadline_at is None:
+            return None
+        return self.deadline_at - time.monotonic()
+
+    def before_attempt(self) -> None:
+        """
+        Raises:
+            TimeoutError: If the deadline has passed
+            CircuitOpenError: If the circuit breaker is open
+        """
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            raise TimeoutError("Deadline exceeded before the request could be sent")
+        if self.policy is not None and self.policy.circuit_breaker is not None:
+            self.policy.circuit_breaker.allow()
+
+    def attempt_timeout(
+        self,
+        default: Union[float, httpx.Timeout],
+        override: Union[float, httpx.Timeout, None] = None,
+    ) -> Union[float, httpx.Timeout]:
+        """
+        The attempt's timeout: ``override`` when given, else the client's,
+        shrunk to fit the deadline
+
+        Always explicit, so a caller-owned ``http_client``'s own timeout never
+        replaces the SDK's.
+        """
+        timeout = default if override is None else override
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if isinstance(timeout, httpx.Timeout):
+            return httpx.Timeout(
+                connect=_cap(timeout.connect, remaining),
+                read=_cap(timeout.read, remaining),
+                write=_cap(timeout.write, remaining),
+                pool=_cap(timeout.pool, remaining),
+            )
+        return _cap(timeout, remaining)
+
+    def record(self, error: Optional[SendlyError] = None) -> None:
+        """Report an attempt's outcome to the circuit breaker"""
+        breaker = self.policy.circuit_breaker if self.policy is not None else None
+        if breaker is None:
+            return
+        if error is None:
+            breaker.record_success()
+        elif is_failure(error):
+            breaker.record_failure()
+        elif error.status_code == 429:
+            # Rate limiting is neither health nor failure
+            breaker.record_neutral()
+        else:
+            breaker.record_success()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay before retrying ``attempt`` (0-based)
+
+        With a policy this is decorrelated jitter: uniform between the base
+        delay and three times the previous delay, capped at ``max_delay``.
+        """
+        policy = self.policy
+        if policy is None:
+            return exponential_backoff(attempt)
+        self._delay = min(policy.max_delay, random.uniform(policy.base_delay, self._delay * 3))
+        return self._delay
+
+    def can_retry(self, delay: float, budgeted: bool = True) -> bool:
+        """
+        Whether waiting ``delay`` and retrying fits the deadline and budget
+
+        Spends from the budget when it returns True. ``budgeted=False``
+        skips the budget (for waits the server asked for, like a 429).
+        """
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return False
+        if budgeted and self.policy is not None and self.policy.budget is not None:
+            return self.policy.budget.try_spend()
+        return True
+
+
+def _cap(value: Optional[float], limit: float) -> float:
+    return limit if value is None else min(value, limit)
@@ -0,0 +1,214 @@
+"""
+Streaming JSON Decoding
+
+Incrementally pull the elements out of a JSON array in a response body as
+the bytes arrive, so large list payloads never have to be buffered or
+decoded in full.
+"""
+
+import json
+import re
+from typing import Any, Callable, Iterable, List, Optional, Type, TypeVar, Union, cast
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+from ..errors import SendlyError
+
+T = TypeVar("T")
+
+ModelTypes = Union[Type[T], Callable[[Any], T], None]
+
+# Top-level keys whose array value is streamed by default
+DEFAULT_STREAM_KEYS = ("data", "campaigns", "contacts", "workspaces", "verifications")
+
+# Bytes that matter outside / inside a JSON string
+_STRUCTURAL = re.compile(rb'["\[\]{},:]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+
+_QUOTE = 0x22
+_BACKSLASH = 0x5C
+_OPEN = (0x7B, 0x5B)  # { [
+_CLOSE = (0x7D, 0x5D)  # } ]
+_OPEN_ARRAY = 0x5B
+_CLOSE_ARRAY = 0x5D
+_COMMA = 0x2C
+_COLON = 0x3A
+
+
+class JsonArrayScanner:
+    """
+    Push-style scanner yielding the elements of a JSON array incrementally
+
+    Streams the array under any of ``keys`` in a top-level object, or the
+    top-level array itself. Each element is decoded on its own as soon as
+    its closing byte has been fed; everything else in the body is skipped.
+
+    Example:
+        >>> scanner = JsonArrayScanner(["data"])
+        >>> scanner.feed(b'{"data": [{"id": 1}, {"i')
+        [{'id': 1}]
+        >>> scanner.feed(b'd": 2}], "count": 2}')
+        [{'id': 2}]
+        >>> scanner.close()
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str] = DEFAULT_STREAM_KEYS,
+        loads: Callable[[bytes], Any] = json.loads,
+    ):
+        """
+        Args:
+            keys: Top-level keys whose array is streamed
+            loads: JSON decoder used for each element (e.g. a codec's ``loads``)
+        """
+        self.keys = frozenset(keys)
+        self._loads = loads
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        # Depth of the array being streamed, while inside it
+        self._array_depth: Optional[int] = None
+        self._item = bytearray()
+        # Root-level strings are buffered to recognise keys
+        self._key: Optional[bytearray] = None
+        self._last_string: Optional[str] = None
+        self._pending_key: Optional[str] = None
+
+    def feed(self, data: bytes) -> List[Any]:
+        """
+        Feed the next chunk of the body
+
+        Returns:
+            The array elements completed by this chunk, decoded
+        """
+        items: List[Any] = []
+        pos = 0
+        end = len(data)
+
+        while pos < end:
+            if self._in_string:
+                if self._escape:
+                    self._capture(data[pos : pos + 1])
+                    self._escape = False
+                    pos += 1
+                    continue
+                match = _STRING_SPECIAL.search(data, pos)
+                if match is None:
+                    self._capture(data[pos:])
+                    break
+                stop = match.start()
+                self._capture(data[pos : stop + 1])
+                pos = stop + 1
+                if data[stop] == _BACKSLASH:
+                    self._escape = True
+                else:
+                    self._end_string()
+                continue
+
+            match = _STRUCTURAL.search(data, pos)
+            if match is None:
+                self._capture(data[pos:])
+                break
+            stop = match.start()
+            self._capture(data[pos:stop])
+            pos = stop + 1
+            self._structural(data[stop], items)
+
+        return items
+
+    def close(self) -> None:
+        """
+        Signal the end of the body
+
+        Raises:
+            SendlyError: If the body ended part-way through the JSON document
+        """
+        if self._depth != 0 or self._in_string:
+            raise SendlyError(
+                message="Invalid API response format: truncated JSON body",
+                code="invalid_response",
+                status_code=200,
+            )
+
+    def _capture(self, chunk: bytes) -> None:
+        if self._array_depth is not None:
+            self._item += chunk
+        elif self._key is not None:
+            self._key += chunk
+
+    def _end_string(self) -> None:
+        self._in_string = False
+        if self._key is not None:
+            # The buffer holds the string body plus its closing quote
+            self._last_string = self._loads(b'"' + bytes(self._key))
+            self._key = None
+
+    def _flush(self, items: List[Any]) -> None:
+        if self._item.strip():
+            try:
+                items.append(self._loads(bytes(self._item)))
+            except ValueError as e:
+                raise SendlyError(
+                    message=f"Invalid API response format: {e}",
+                    code="invalid_response",
+                    status_code=200,
+                ) from e
+        self._item.clear()
+
+    def _structural(self, byte: int, items: List[Any]) -> None:
+        streaming = self._array_depth is not None
+
+        if byte == _QUOTE:
+            self._in_string = True
+            if streaming:
+                self._item.append(byte)
+            elif self._depth == 1:
+                self._key = bytearray()
+        elif byte in _OPEN:
+            self._depth += 1
+            if streaming:
+                self._item.append(byte)
+            elif byte == _OPEN_ARRAY and (
+                self._depth == 1 or (self._depth == 2 and self._pending_key in self.keys)
+            ):
+                self._array_depth = self._depth
+            if self._depth == 2:
+                self._pending_key = None
+        elif byte in _CLOSE:
+            if streaming and self._depth == self._array_depth and byte == _CLOSE_ARRAY:
+                self._flush(items)
+                self._array_depth = None
+            elif streaming:
+                self._item.append(byte)
+            self._depth -= 1
+        elif byte == _COMMA:
+            if streaming and self._depth == self._array_depth:
+                self._flush(items)
+            elif streaming:
+                self._item.append(byte)
+            elif self._depth == 1:
+                self._pending_key = None
+        elif byte == _COLON:
+            if streaming:
+                self._item.append(byte)
+            elif self._depth == 1:
+                self._pending_key = self._last_string
+
+
+def build_item(model: ModelTypes[T], item: Any) -> Any:
+    """Turn one streamed element into ``model`` (a pydantic model or any callable)"""
+    if model is None:
+        return item
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        try:
+            return model.model_validate(item)
+        except PydanticValidationError as e:
+            raise SendlyError(
+                message=f"Invalid API response format: {e}",
+                code="invalid_response",
+                status_code=200,
+            ) from e
+    # Any other class is called like a factory
+    return cast(Callable[[Any], T], model)(item)
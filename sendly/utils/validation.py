@@ -5,10 +5,116 @@ Functions for validating API inputs.
 """
 
 import re
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
 
 from ..errors import ValidationError
 from ..types import ALL_SUPPORTED_COUNTRIES
+from .encoding import get_segment_info
+
+# E.164 format: + followed by 1-15 digits
+_E164_PATTERN = re.compile(r"^\+[1-9]\d{1,14}$", re.ASCII)
+_ALPHANUMERIC_SENDER_PATTERN = re.compile(r"^[a-zA-Z0-9]{2,11}$")
+_UUID_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE
+)
+_PREFIXED_ID_PATTERN = re.compile(r"^msg_[a-zA-Z0-9_]+$")
+
+# Map of country codes to ISO codes
+_COUNTRY_PREFIXES = {
+    "44": "GB",
+    "48": "PL",
+    "351": "PT",
+    "40": "RO",
+    "420": "CZ",
+    "36": "HU",
+    "86": "CN",
+    "82": "KR",
+    "91": "IN",
+    "63": "PH",
+    "66": "TH",
+    "84": "VN",
+    "33": "FR",
+    "34": "ES",
+    "46": "SE",
+    "47": "NO",
+    "45": "DK",
+    "358": "FI",
+    "353": "IE",
+    "81": "JP",
+    "61": "AU",
+    "64": "NZ",
+    "65": "SG",
+    "852": "HK",
+    "60": "MY",
+    "62": "ID",
+    "55": "BR",
+    "54": "AR",
+    "56": "CL",
+    "57": "CO",
+    "27": "ZA",
+    "30": "GR",
+    "49": "DE",
+    "39": "IT",
+    "31": "NL",
+    "32": "BE",
+    "43": "AT",
+    "41": "CH",
+    "52": "MX",
+    "972": "IL",
+    "971": "AE",
+    "966": "SA",
+    "20": "EG",
+    "234": "NG",
+    "254": "KE",
+    "886": "TW",
+    "92": "PK",
+    "90": "TR",
+}
+
+
+def _prefix_table() -> Dict[str, str]:
+    """Every possible first three digits (and each bare code) mapped to a country"""
+    table = {}
+    for prefix, country in _COUNTRY_PREFIXES.items():
+        table[prefix] = country
+        width = 3 - len(prefix)
+        if width:
+            for rest in range(10**width):
+                table[prefix + str(rest).zfill(width)] = country
+    return table
+
+
+# Calling codes are prefix-free and at most three digits long, so a number's
+# first three digits decide its country with a single lookup
+_COUNTRY_BY_PREFIX = _prefix_table()
+
+# NANP (+1) area codes assigned to Canada; other +1 numbers are treated as US
+_CANADIAN_AREA_CODES = frozenset(
+    """
+    204 226 236 249 250 257 263 289 306 343 354 365 367 368 382 403 416 418
+    428 431 437 438 450 460 468 474 506 514 519 548 579 581 584 587 600 604
+    613 622 639 647 672 683 705 709 742 753 778 780 782 807 819 825 867 873
+    879 902 905 942
+    """.split()
+)
+
+# Calling code and trunk prefix (dropped from national numbers) per country
+_CALLING_CODES = {
+    "US": "1",
+    "CA": "1",
+    **{country: prefix for prefix, country in _COUNTRY_PREFIXES.items()},
+}
+_TRUNK_PREFIXES = {"US": "1", "CA": "1", "IT": ""}
+
+# Formatting characters removed before validation
+_SEPARATORS = str.maketrans("", "", " \t-.()/\u00a0")
+
+# Reasons reported by validate_phone_numbers
+PHONE_MISSING = "missing"
+PHONE_INVALID_CHARACTERS = "invalid_characters"
+PHONE_NO_COUNTRY_CODE = "no_country_code"
+PHONE_INVALID_FORMAT = "invalid_format"
 
 
 def validate_phone_number(phone: str) -> None:
@@ -24,10 +130,7 @@ def validate_phone_number(phone: str) -> None:
     if not phone:
         raise ValidationError("Phone number is required")
 
-    # E.164 format: + followed by 1-15 digits
-    e164_pattern = r"^\+[1-9]\d{1,14}$"
-
-    if not re.match(e164_pattern, phone):
+    if not _E164_PATTERN.match(phone):
         raise ValidationError(
             f"Invalid phone number format: {phone}. Expected E.164 format (e.g., +15551234567)"
         )
@@ -78,9 +181,7 @@ def validate_sender_id(from_: Optional[str]) -> None:
         return
 
     # Alphanumeric sender ID (2-11 characters)
-    alphanumeric_pattern = r"^[a-zA-Z0-9]{2,11}$"
-
-    if not re.match(alphanumeric_pattern, from_):
+    if not _ALPHANUMERIC_SENDER_PATTERN.match(from_):
         raise ValidationError(
             f"Invalid sender ID: {from_}. "
             "Must be 2-11 alphanumeric characters or a valid phone number."
@@ -124,10 +225,7 @@ def validate_message_id(id: str) -> None:
         raise ValidationError("Message ID must be a string")
 
     # UUID format or prefixed format
-    uuid_pattern = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-    prefixed_pattern = r"^msg_[a-zA-Z0-9_]+$"
-
-    if not (re.match(uuid_pattern, id, re.IGNORECASE) or re.match(prefixed_pattern, id)):
+    if not (_UUID_PATTERN.match(id) or _PREFIXED_ID_PATTERN.match(id)):
         raise ValidationError(f"Invalid message ID format: {id}")
 
 
@@ -144,70 +242,157 @@ def get_country_from_phone(phone: str) -> Optional[str]:
     # Remove + prefix
     digits = phone.lstrip("+")
 
-    # Check US/Canada (country code 1)
-    if digits.startswith("1") and len(digits) == 11:
-        return "US"  # Could be CA, but we treat as domestic
-
-    # Map of country codes to ISO codes
-    country_prefixes = {
-        "44": "GB",
-        "48": "PL",
-        "351": "PT",
-        "40": "RO",
-        "420": "CZ",
-        "36": "HU",
-        "86": "CN",
-        "82": "KR",
-        "91": "IN",
-        "63": "PH",
-        "66": "TH",
-        "84": "VN",
-        "33": "FR",
-        "34": "ES",
-        "46": "SE",
-        "47": "NO",
-        "45": "DK",
-        "358": "FI",
-        "353": "IE",
-        "81": "JP",
-        "61": "AU",
-        "64": "NZ",
-        "65": "SG",
-        "852": "HK",
-        "60": "MY",
-        "62": "ID",
-        "55": "BR",
-        "54": "AR",
-        "56": "CL",
-        "57": "CO",
-        "27": "ZA",
-        "30": "GR",
-        "49": "DE",
-        "39": "IT",
-        "31": "NL",
-        "32": "BE",
-        "43": "AT",
-        "41": "CH",
-        "52": "MX",
-        "972": "IL",
-        "971": "AE",
-        "966": "SA",
-        "20": "EG",
-        "234": "NG",
-        "254": "KE",
-        "886": "TW",
-        "92": "PK",
-        "90": "TR",
-    }
-
-    # Try to match country prefixes (longest first)
-    sorted_prefixes = sorted(country_prefixes.keys(), key=len, reverse=True)
-
-    for prefix in sorted_prefixes:
-        if digits.startswith(prefix):
-            return country_prefixes[prefix]
-
-    return None
+    # US/Canada (country code 1), split by area code
+    if digits.startswith("1"):
+        if len(digits) != 11:
+            return None
+        return "CA" if digits[1:4] in _CANADIAN_AREA_CODES else "US"
+
+    return _COUNTRY_BY_PREFIX.get(digits[:3])
+
+
+def normalize_phone_number(phone: str, default_country: Optional[str] = None) -> str:
+    """
+    Normalize a phone number to E.164
+
+    Spaces, dashes, dots, slashes and parentheses are removed, a leading
+    ``00`` becomes ``+``, and numbers without a country code are read as
+    national numbers of ``default_country`` (dropping the trunk prefix,
+    e.g. ``020 7123 4567`` in GB becomes ``+442071234567``).
+
+    Args:
+        phone: Phone number in any common format
+        default_country: ISO country code for numbers without a country code
+
+    Returns:
+        The number in E.164 format
+
+    Raises:
+        ValidationError: If the number cannot be normalized
+    """
+    result = validate_phone_numbers([phone], default_country)
+    if result.invalid_indices:
+        raise ValidationError(f"Invalid phone number: {phone} ({result.reasons[0]})")
+    return result.numbers[0]
+
+
+@dataclass
+class PhoneValidationResult:
+    """
+    Outcome of :func:`validate_phone_numbers`
+
+    Valid numbers are listed in E.164 with their input positions; invalid
+    ones by position with a reason (``missing``, ``invalid_characters``,
+    ``no_country_code`` or ``invalid_format``).
+    """
+
+    numbers: List[str] = field(default_factory=list)
+    """Normalized E.164 numbers, in input order."""
+    indices: List[int] = field(default_factory=list)
+    """Input position of each entry in ``numbers``."""
+    invalid_indices: List[int] = field(default_factory=list)
+    """Input positions that failed validation."""
+    reasons: List[str] = field(default_factory=list)
+    """Reason for each entry in ``invalid_indices``."""
+
+    @property
+    def all_valid(self) -> bool:
+        """Whether every input number was valid"""
+        return not self.invalid_indices
+
+    def errors(self) -> Dict[int, str]:
+        """Invalid input positions mapped to their reasons"""
+        return dict(zip(self.invalid_indices, self.reasons))
+
+
+def validate_phone_numbers(
+    phones: Iterable[Any], default_country: Optional[str] = None
+) -> PhoneValidationResult:
+    """
+    Validate and normalize many phone numbers at once
+
+    Built for large imports: patterns are compiled once, formatting is
+    stripped with a single translate per number, and repeated inputs are
+    only checked once. Accepts any iterable, including NumPy arrays and
+    pandas Series (converted with ``tolist()``).
+
+    Args:
+        phones: Phone numbers in any common format (see
+            :func:`normalize_phone_number`)
+        default_country: ISO country code for numbers without a country code
+
+    Returns:
+        A PhoneValidationResult with the valid numbers in E.164 and the
+        positions and reasons of the invalid ones
+
+    Raises:
+        ValidationError: If ``default_country`` is not a known country
+
+    Example:
+        >>> result = validate_phone_numbers(rows, default_country='GB')
+        >>> client.messages.send_batch([{'to': n, 'text': 'Hi'} for n in result.numbers])
+        >>> for index, reason in result.errors().items():
+        ...     print(f'row {index}: {reason}')
+    """
+    national_prefix = ""
+    trunk = ""
+    if default_country is not None:
+        country = default_country.upper()
+        if country not in _CALLING_CODES:
+            raise ValidationError(f"Unknown default country: {default_country}")
+        national_prefix = "+" + _CALLING_CODES[country]
+        trunk = _TRUNK_PREFIXES.get(country, "0")
+
+    if hasattr(phones, "tolist"):
+        phones = phones.tolist()
+
+    result = PhoneValidationResult()
+    numbers, indices = result.numbers, result.indices
+    invalid_indices, reasons = result.invalid_indices, result.reasons
+    seen: Dict[Any, str] = {}
+
+    for index, phone in enumerate(phones):
+        outcome = seen.get(phone) if isinstance(phone, str) else None
+        if outcome is None:
+            outcome = _normalize(phone, national_prefix, trunk)
+            if isinstance(phone, str):
+                seen[phone] = outcome
+        if outcome[0] == "+":
+            numbers.append(outcome)
+            indices.append(index)
+        else:
+            invalid_indices.append(index)
+            reasons.append(outcome)
+
+    return result
+
+
+def _normalize(phone: Any, national_prefix: str, trunk: str) -> str:
+    """An E.164 number, or the reason the input is invalid"""
+    if not isinstance(phone, str):
+        if not isinstance(phone, int) or isinstance(phone, bool):
+            return PHONE_MISSING if phone is None else PHONE_INVALID_CHARACTERS
+        phone = str(phone)
+
+    number: str = phone.translate(_SEPARATORS)
+    if not number:
+        return PHONE_MISSING
+    if number[0] != "+":
+        if number.startswith("00"):
+            number = "+" + number[2:]
+        elif not national_prefix:
+            return PHONE_NO_COUNTRY_CODE if number.isdigit() else PHONE_INVALID_CHARACTERS
+        else:
+            if trunk and number.startswith(trunk):
+                number = number[len(trunk) :]
+            number = national_prefix + number
+
+    if _E164_PATTERN.match(number):
+        return number
+    digits = number[1:]
+    if digits and not (digits.isascii() and digits.isdigit()):
+        return PHONE_INVALID_CHARACTERS
+    return PHONE_INVALID_FORMAT
 
 
 def is_country_supported(country_code: str) -> bool:
@@ -227,22 +412,14 @@ def calculate_segments(text: str) -> int:
     """
     Calculate number of SMS segments for a message
 
+    GSM-7 extension characters count as two septets and UCS-2 messages are
+    measured in UTF-16 code units; see :func:`sendly.utils.encoding.get_segment_info`
+    for the encoding and length as well.
+
     Args:
         text: Message text
 
     Returns:
         Number of SMS segments
     """
-    # Check if message contains non-GSM characters (requires UCS-2 encoding)
-    # Simple check: any character outside basic ASCII range
-    is_unicode = any(ord(c) > 127 for c in text)
-
-    # GSM: 160 chars single, 153 chars per segment for multi
-    # UCS-2: 70 chars single, 67 chars per segment for multi
-    single_limit = 70 if is_unicode else 160
-    multi_limit = 67 if is_unicode else 153
-
-    if len(text) <= single_limit:
-        return 1
-
-    return (len(text) + multi_limit - 1) // multi_limit
+    return get_segment_info(text).segments
@@ -29,10 +29,11 @@ Example:
 
 import hashlib
 import hmac
-import json
 import time
 from dataclasses import dataclass, field
-from typing import Literal, Optional, Union
+from typing import Iterable, List, Literal, Optional, Tuple, Union
+
+from .utils.codec import CodecTypes, get_codec
 
 # Webhook event types
 WebhookEventType = Literal[
@@ -69,6 +70,9 @@ WebhookMessageStatus = Literal[
 
 SIGNATURE_TOLERANCE_SECONDS = 300
 
+# Raw request bodies WebhookVerifier accepts without copying
+WebhookPayload = Union[str, bytes, bytearray, memoryview]
+
 
 @dataclass
 class WebhookMessageData:
@@ -189,12 +193,57 @@ class WebhookSignatureError(Exception):
         self.message = message
 
 
+def _event_from_payload(payload: Union[str, bytes], json_codec: CodecTypes = None) -> WebhookEvent:
+    """Decode a verified payload into a WebhookEvent"""
+    try:
+        raw_event = get_codec(json_codec).loads(payload)
+
+        if not all(key in raw_event for key in ("id", "type", "data")):
+            raise ValueError("Invalid event structure")
+
+        raw_data = raw_event["data"]
+        obj = raw_data.get("object", raw_data)
+
+        data = WebhookMessageData(
+            id=obj.get("id", obj.get("message_id", "")),
+            status=obj.get("status", ""),
+            to=obj.get("to", ""),
+            from_=obj.get("from", ""),
+            segments=obj.get("segments", 1),
+            credits_used=obj.get("credits_used", 0),
+            direction=obj.get("direction", "outbound"),
+            organization_id=obj.get("organization_id"),
+            text=obj.get("text"),
+            error=obj.get("error"),
+            error_code=obj.get("error_code"),
+            delivered_at=obj.get("delivered_at"),
+            failed_at=obj.get("failed_at"),
+            created_at=obj.get("created_at"),
+            message_format=obj.get("message_format"),
+            media_urls=obj.get("media_urls"),
+            batch_id=obj.get("batch_id"),
+        )
+
+        return WebhookEvent(
+            id=raw_event["id"],
+            type=raw_event["type"],
+            data=data,
+            created=raw_event.get("created", raw_event.get("created_at", 0)),
+            api_version=raw_event.get("api_version", "2024-01"),
+            livemode=raw_event.get("livemode", False),
+        )
+    except WebhookSignatureError:
+        raise
+    except Exception as e:
+        raise WebhookSignatureError(f"Failed to parse webhook payload: {e}")
+
+
 class Webhooks:
     """Webhook utilities for verifying and parsing Sendly webhook events."""
 
     @staticmethod
     def verify_signature(
-        payload: str,
+        payload: Union[str, bytes],
         signature: str,
         secret: str,
         timestamp: Optional[str] = None,
@@ -203,7 +252,7 @@ class Webhooks:
         Verify webhook signature from Sendly.
 
         Args:
-            payload: Raw request body as string.
+            payload: Raw request body as string or bytes.
             signature: X-Sendly-Signature header value.
             secret: Your webhook secret from dashboard.
             timestamp: X-Sendly-Timestamp header value (recommended).
@@ -223,16 +272,17 @@ class Webhooks:
             return False
 
         try:
+            body = payload if isinstance(payload, bytes) else payload.encode("utf-8")
             if timestamp:
-                signed_payload = f"{timestamp}.{payload}"
+                signed_payload = f"{timestamp}.".encode("utf-8") + body
                 if abs(time.time() - float(timestamp)) > SIGNATURE_TOLERANCE_SECONDS:
                     return False
             else:
-                signed_payload = payload
+                signed_payload = body
 
             expected = hmac.new(
                 secret.encode("utf-8"),
-                signed_payload.encode("utf-8"),
+                signed_payload,
                 hashlib.sha256,
             ).hexdigest()
 
@@ -244,19 +294,23 @@ class Webhooks:
 
     @staticmethod
     def parse_event(
-        payload: str,
+        payload: Union[str, bytes],
         signature: str,
         secret: str,
         timestamp: Optional[str] = None,
+        json_codec: CodecTypes = None,
     ) -> WebhookEvent:
         """
         Parse and validate a webhook event.
 
         Args:
-            payload: Raw request body as string.
+            payload: Raw request body as string or bytes (bytes skip a
+                decode/encode round trip).
             signature: X-Sendly-Signature header value.
             secret: Your webhook secret from dashboard.
             timestamp: X-Sendly-Timestamp header value (recommended).
+            json_codec: JSON codec for the payload (default: orjson or
+                msgspec when installed, else stdlib json).
 
         Returns:
             Parsed and validated WebhookEvent.
@@ -275,47 +329,7 @@ class Webhooks:
         if not Webhooks.verify_signature(payload, signature, secret, timestamp=timestamp):
             raise WebhookSignatureError()
 
-        try:
-            raw_event = json.loads(payload)
-
-            if not all(key in raw_event for key in ("id", "type", "data")):
-                raise ValueError("Invalid event structure")
-
-            raw_data = raw_event["data"]
-            obj = raw_data.get("object", raw_data)
-
-            data = WebhookMessageData(
-                id=obj.get("id", obj.get("message_id", "")),
-                status=obj.get("status", ""),
-                to=obj.get("to", ""),
-                from_=obj.get("from", ""),
-                segments=obj.get("segments", 1),
-                credits_used=obj.get("credits_used", 0),
-                direction=obj.get("direction", "outbound"),
-                organization_id=obj.get("organization_id"),
-                text=obj.get("text"),
-                error=obj.get("error"),
-                error_code=obj.get("error_code"),
-                delivered_at=obj.get("delivered_at"),
-                failed_at=obj.get("failed_at"),
-                created_at=obj.get("created_at"),
-                message_format=obj.get("message_format"),
-                media_urls=obj.get("media_urls"),
-                batch_id=obj.get("batch_id"),
-            )
-
-            return WebhookEvent(
-                id=raw_event["id"],
-                type=raw_event["type"],
-                data=data,
-                created=raw_event.get("created", raw_event.get("created_at", 0)),
-                api_version=raw_event.get("api_version", "2024-01"),
-                livemode=raw_event.get("livemode", False),
-            )
-        except WebhookSignatureError:
-            raise
-        except Exception as e:
-            raise WebhookSignatureError(f"Failed to parse webhook payload: {e}")
+        return _event_from_payload(payload, json_codec)
 
     @staticmethod
     def generate_signature(
@@ -345,3 +359,176 @@ class Webhooks:
             hashlib.sha256,
         ).hexdigest()
         return f"sha256={hash_value}"
+
+
+class WebhookVerifier:
+    """
+    Reusable webhook verifier for high-volume handlers.
+
+    Keys each secret into an HMAC-SHA256 state once and copies that state
+    per event, so verifying costs a single pass over the body. Bodies can be
+    ``bytes``, ``bytearray`` or ``memoryview`` and are hashed in place; the
+    timestamp is fed to the HMAC separately instead of being concatenated.
+
+    Several secrets can be active at once, which covers the 24-hour window
+    after ``webhooks.rotate_secret`` when events may be signed with either
+    the new or the old secret.
+
+    Example:
+        >>> verifier = WebhookVerifier(rotation.secret, OLD_SECRET)
+        >>>
+        >>> @app.route('/webhooks/sendly', methods=['POST'])
+        >>> def handle_webhook():
+        ...     event = verifier.parse(
+        ...         request.get_data(),
+        ...         request.headers['X-Sendly-Signature'],
+        ...         timestamp=request.headers.get('X-Sendly-Timestamp'),
+        ...     )
+    """
+
+    def __init__(
+        self,
+        secret: str,
+        *previous_secrets: str,
+        tolerance: float = SIGNATURE_TOLERANCE_SECONDS,
+        json_codec: CodecTypes = None,
+    ):
+        """
+        Create a verifier.
+
+        Args:
+            secret: Current webhook secret.
+            *previous_secrets: Older secrets still accepted (e.g. until a
+                rotation expires).
+            tolerance: Maximum age of a signed timestamp, in seconds.
+            json_codec: JSON codec for :meth:`parse` (default: orjson or
+                msgspec when installed, else stdlib json).
+        """
+        self.tolerance = tolerance
+        self._json_codec = json_codec
+        self._keys: List[Tuple[str, "hmac.HMAC"]] = []
+        for value in reversed((secret,) + previous_secrets):
+            self.add_secret(value)
+
+    @property
+    def secrets(self) -> Tuple[str, ...]:
+        """Active secrets, newest first."""
+        return tuple(secret for secret, _ in self._keys)
+
+    def add_secret(self, secret: str) -> None:
+        """
+        Accept another secret, tried before the existing ones.
+
+        Args:
+            secret: Webhook secret (e.g. the one returned by ``rotate_secret``).
+        """
+        if not secret:
+            raise ValueError("Webhook secret is required")
+        self.remove_secret(secret)
+        self._keys.insert(0, (secret, hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)))
+
+    def remove_secret(self, secret: str) -> None:
+        """
+        Stop accepting a secret (e.g. once a rotation window has passed).
+
+        Args:
+            secret: Webhook secret to drop. Unknown secrets are ignored.
+        """
+        self._keys = [key for key in self._keys if key[0] != secret]
+
+    def _verify(
+        self,
+        payload: Optional[WebhookPayload],
+        signature: Optional[str],
+        timestamp: Optional[str],
+        now: float,
+    ) -> bool:
+        if not payload or not signature or not self._keys:
+            return False
+
+        try:
+            if isinstance(payload, str):
+                payload = payload.encode("utf-8")
+            prefix = None
+            if timestamp:
+                if abs(now - float(timestamp)) > self.tolerance:
+                    return False
+                prefix = f"{timestamp}.".encode("utf-8")
+
+            for _, key in self._keys:
+                mac = key.copy()
+                if prefix is not None:
+                    mac.update(prefix)
+                mac.update(payload)
+                if hmac.compare_digest(signature, f"sha256={mac.hexdigest()}"):
+                    return True
+            return False
+        except Exception:
+            return False
+
+    def verify(
+        self,
+        payload: WebhookPayload,
+        signature: str,
+        timestamp: Optional[str] = None,
+    ) -> bool:
+        """
+        Verify a webhook signature against every active secret.
+
+        Args:
+            payload: Raw request body (str, bytes, bytearray or memoryview).
+            signature: X-Sendly-Signature header value.
+            timestamp: X-Sendly-Timestamp header value (recommended).
+
+        Returns:
+            True if any active secret produced the signature, False otherwise.
+        """
+        return self._verify(payload, signature, timestamp, time.time())
+
+    def verify_many(
+        self,
+        events: Iterable[Tuple[WebhookPayload, str, Optional[str]]],
+    ) -> List[bool]:
+        """
+        Verify a batch of webhook deliveries.
+
+        The clock is read once for the whole batch.
+
+        Args:
+            events: ``(payload, signature, timestamp)`` tuples; timestamp may
+                be None.
+
+        Returns:
+            Whether each event is valid, in order.
+        """
+        now = time.time()
+        verify = self._verify
+        return [
+            verify(payload, signature, timestamp, now) for payload, signature, timestamp in events
+        ]
+
+    def parse(
+        self,
+        payload: WebhookPayload,
+        signature: str,
+        timestamp: Optional[str] = None,
+    ) -> WebhookEvent:
+        """
+        Verify and parse a webhook event.
+
+        Args:
+            payload: Raw request body (str, bytes, bytearray or memoryview).
+            signature: X-Sendly-Signature header value.
+            timestamp: X-Sendly-Timestamp header value (recommended).
+
+        Returns:
+            Parsed and validated WebhookEvent.
+
+        Raises:
+            WebhookSignatureError: If no active secret matches or the payload is malformed.
+        """
+        if not self.verify(payload, signature, timestamp=timestamp):
+            raise WebhookSignatureError()
+        if not isinstance(payload, (str, bytes)):
+            payload = bytes(payload)
+        return _event_from_payload(payload, self._json_codec)
@@ -0,0 +1,155 @@
+"""
+Tests for waiting on batches
+"""
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Sendly
+from sendly.errors import TimeoutError
+from sendly.utils.polling import BatchPoller
+
+BASE = "https://sendly.live/api/v1"
+
+FAST = {"poll_interval": 0.001, "max_interval": 0.01}
+
+
+def batch(batch_id, status, *statuses):
+    return {
+        "batchId": batch_id,
+        "status": status,
+        "total": len(statuses),
+        "queued": statuses.count("queued"),
+        "sent": statuses.count("sent"),
+        "failed": statuses.count("failed"),
+        "creditsUsed": len(statuses),
+        "createdAt": "2025-01-20T10:00:00Z",
+        "messages": [
+            {"id": f"msg_{i}", "to": "+15551234567", "status": s} for i, s in enumerate(statuses)
+        ],
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestWaitForBatch:
+    """Test wait_for_batch and iter_batch_updates"""
+
+    def test_waits_until_final_status(self, api_key, httpx_mock: HTTPXMock):
+        """Test polling stops at a final status and only changed results are streamed"""
+        url = f"{BASE}/messages/batch/batch_1"
+        httpx_mock.add_response(url=url, json=batch("batch_1", "processing", "queued", "queued"))
+        httpx_mock.add_response(url=url, json=batch("batch_1", "processing", "sent", "queued"))
+        httpx_mock.add_response(url=url, json=batch("batch_1", "completed", "sent", "sent"))
+        client = Sendly(api_key)
+        updates = []
+
+        done = client.messages.wait_for_batch(
+            "batch_1", timeout=5, on_update=updates.append, **FAST
+        )
+
+        assert done.status == "completed" and done.sent == 2
+        assert [[m.id for m in u.changed] for u in updates] == [
+            ["msg_0", "msg_1"],
+            ["msg_0"],
+            ["msg_1"],
+        ]
+        assert [u.done for u in updates] == [False, False, True]
+        client.close()
+
+    def test_many_batches(self, api_key, httpx_mock: HTTPXMock):
+        """Test finished batches drop out while the rest keep polling"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages/batch/batch_a", json=batch("batch_a", "completed", "sent")
+        )
+        httpx_mock.add_response(
+            url=f"{BASE}/messages/batch/batch_b", json=batch("batch_b", "processing", "queued")
+        )
+        httpx_mock.add_response(
+            url=f"{BASE}/messages/batch/batch_b", json=batch("batch_b", "failed", "failed")
+        )
+        client = Sendly(api_key, response_mode="raw")
+
+        done = client.messages.wait_for_batches(
+            ["batch_a", "batch_b", "batch_a"], timeout=5, requests_per_second=1000, **FAST
+        )
+
+        assert {k: v["status"] for k, v in done.items()} == {
+            "batch_a": "completed",
+            "batch_b": "failed",
+        }
+        assert len(httpx_mock.get_requests()) == 3
+        client.close()
+
+    def test_timeout(self, api_key, httpx_mock: HTTPXMock):
+        """Test a batch that never finishes raises TimeoutError"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages/batch/batch_1",
+            json=batch("batch_1", "processing", "queued"),
+            is_reusable=True,
+        )
+        client = Sendly(api_key)
+
+        with pytest.raises(TimeoutError, match="batch_1"):
+            client.messages.wait_for_batch("batch_1", timeout=0.05, **FAST)
+        client.close()
+
+
+class TestBatchPoller:
+    """Test poll scheduling"""
+
+    def test_backs_off_while_quiet(self):
+        """Test quiet polls back off and progress resets the interval"""
+        clock = FakeClock()
+        poller = BatchPoller("batch_1", poll_interval=1, max_interval=4, backoff=2, clock=clock)
+        waits = []
+        for statuses in [("queued",), ("queued",), ("queued",), ("queued",), ("sent",)]:
+            batch_id, wait = poller.next()
+            waits.append(wait)
+            clock.now += wait
+            poller.update(batch_id, batch(batch_id, "processing", *statuses))
+
+        assert waits == [0, 1, 2, 4, 4]
+        assert poller.next() == ("batch_1", 1)
+
+    def test_shared_request_budget(self):
+        """Test polls across batches are spaced by the request budget"""
+        clock = FakeClock()
+        poller = BatchPoller(["batch_a", "batch_b", "batch_c"], requests_per_second=2, clock=clock)
+        waits = []
+        for _ in range(3):
+            batch_id, wait = poller.next()
+            waits.append(wait)
+            clock.now += wait
+            poller.update(batch_id, batch(batch_id, "processing", "queued"))
+
+        assert waits == [0, 0.5, 0.5]
+
+
+class TestAsyncWaitForBatch:
+    """Test the async waiter"""
+
+    @pytest.mark.asyncio
+    async def test_async_wait(self, api_key, httpx_mock: HTTPXMock):
+        """Test the async waiter with a coroutine on_update"""
+        url = f"{BASE}/messages/batch/batch_1"
+        httpx_mock.add_response(url=url, json=batch("batch_1", "processing", "queued"))
+        httpx_mock.add_response(url=url, json=batch("batch_1", "partial_failure", "failed"))
+        seen = []
+
+        async def on_update(update):
+            seen.extend(m.status for m in update.changed)
+
+        async with AsyncSendly(api_key) as client:
+            done = await client.messages.wait_for_batch(
+                "batch_1", timeout=5, on_update=on_update, **FAST
+            )
+
+        assert done.failed == 1
+        assert seen == ["queued", "failed"]
@@ -0,0 +1,190 @@
+"""
+Tests for the response cache
+"""
+
+import asyncio
+import time
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, ResponseCache, Sendly
+
+BASE = "https://sendly.live/api/v1"
+EVENT_TYPES_URL = f"{BASE}/webhooks/event-types"
+
+EVENTS = {"events": [{"type": "message.sent"}, {"type": "message.delivered"}]}
+NEW_EVENTS = {"events": [{"type": "message.failed"}]}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def wait_for(condition, timeout=2.0):
+    until = time.monotonic() + timeout
+    while not condition() and time.monotonic() < until:
+        time.sleep(0.005)
+    assert condition()
+
+
+class TestResponseCache:
+    """Test cached GETs"""
+
+    def test_fresh_hit(self, api_key, httpx_mock: HTTPXMock, clock):
+        """Test a second read within the TTL never reaches the API"""
+        httpx_mock.add_response(url=EVENT_TYPES_URL, json=EVENTS)
+        client = Sendly(api_key, cache=ResponseCache(clock=clock))
+
+        first = client.webhooks.list_event_types()
+        second = client.webhooks.list_event_types()
+
+        assert first == second == ["message.sent", "message.delivered"]
+        assert len(httpx_mock.get_requests()) == 1
+        stats = client.get_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        client.close()
+
+    def test_etag_revalidation(self, api_key, httpx_mock: HTTPXMock, clock):
+        """Test an expired entry is revalidated with If-None-Match and kept on 304"""
+        httpx_mock.add_response(url=EVENT_TYPES_URL, json=EVENTS, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(
+            url=EVENT_TYPES_URL, status_code=304, match_headers={"If-None-Match": '"v1"'}
+        )
+        client = Sendly(
+            api_key, cache=ResponseCache(ttls={"/webhooks/event-types": 10}, clock=clock)
+        )
+
+        client.webhooks.list_event_types()
+        clock.now += 11
+        assert client.webhooks.list_event_types() == ["message.sent", "message.delivered"]
+
+        clock.now += 5  # 304 restarted the TTL
+        client.webhooks.list_event_types()
+        stats = client.get_cache_stats()
+        assert (stats.hits, stats.misses, stats.revalidated) == (1, 2, 1)
+        client.close()
+
+    def test_stale_while_revalidate(self, api_key, httpx_mock: HTTPXMock, clock):
+        """Test a stale entry is served at once while it refreshes in the background"""
+        httpx_mock.add_response(url=EVENT_TYPES_URL, json=EVENTS)
+        httpx_mock.add_response(url=EVENT_TYPES_URL, json=NEW_EVENTS)
+        cache = ResponseCache(
+            ttls={"/webhooks/event-types": 10}, stale_while_revalidate=60, clock=clock
+        )
+        client = Sendly(api_key, cache=cache)
+
+        client.webhooks.list_event_types()
+        clock.now += 30
+
+        assert client.webhooks.list_event_types() == ["message.sent", "message.delivered"]
+        wait_for(lambda: cache.stats().size == 1 and len(httpx_mock.get_requests()) == 2)
+        wait_for(lambda: client.webhooks.list_event_types() == ["message.failed"])
+        client.close()
+
+    def test_mutation_invalidates_resource(self, api_key, httpx_mock: HTTPXMock, clock):
+        """Test a write to a resource drops its cached reads"""
+        httpx_mock.add_response(url=f"{BASE}/labels", method="GET", json={"labels": []})
+        httpx_mock.add_response(url=f"{BASE}/labels/lbl_1", method="DELETE", status_code=204)
+        httpx_mock.add_response(url=f"{BASE}/labels", method="GET", json={"labels": [1]})
+        client = Sendly(api_key, cache=ResponseCache(clock=clock), response_mode="raw")
+
+        assert client.labels.list() == {"labels": []}
+        client.labels.delete("lbl_1")
+
+        assert client.labels.list() == {"labels": [1]}
+        assert client.get_cache_stats().invalidations == 1
+        client.close()
+
+    def test_invalidation_scope(self, api_key, httpx_mock: HTTPXMock, clock):
+        """Test mutations drop their resource and collections, not siblings or the root"""
+        paths = [
+            "/templates",
+            "/templates/presets",
+            "/templates/tpl_1",
+            "/templates/tpl_2",
+            "/enterprise/account",
+        ]
+        for path in paths:
+            httpx_mock.add_response(url=f"{BASE}{path}", method="GET", json={}, is_reusable=True)
+        httpx_mock.add_response(method="POST", json={}, is_reusable=True)
+        httpx_mock.add_response(method="PATCH", json={}, is_reusable=True)
+        client = Sendly(api_key, cache=ResponseCache(clock=clock), response_mode="raw")
+
+        def cached():
+            before = len(httpx_mock.get_requests())
+            for path in paths:
+                client._http.request("GET", path)
+            fetched = {r.url.path[len("/api/v1") :] for r in httpx_mock.get_requests()[before:]}
+            return sorted(path for path in paths if path not in fetched)
+
+        cached()
+        client._http.request("POST", "/templates/tpl_1/preview", body={})
+        assert cached() == sorted(paths)
+
+        client._http.request("PATCH", "/templates/tpl_1", body={})
+        assert cached() == ["/enterprise/account", "/templates/presets", "/templates/tpl_2"]
+
+        client._http.request("POST", "/enterprise/workspaces", body={})
+        assert "/enterprise/account" in cached()
+        client.close()
+
+    def test_keys_and_eviction(self, api_key, httpx_mock: HTTPXMock, clock):
+        """Test entries are per organization, bounded, and bypassable"""
+        httpx_mock.add_response(url=EVENT_TYPES_URL, json=EVENTS, is_reusable=True)
+        client = Sendly(api_key, cache=ResponseCache(max_entries=1, clock=clock))
+
+        client.webhooks.list_event_types()
+        client.webhooks.list_event_types(request_options={"organization_id": "org_other"})
+        client.webhooks.list_event_types()
+        client.webhooks.list_event_types(request_options={"cache": False})
+
+        assert len(httpx_mock.get_requests()) == 4
+        stats = client.get_cache_stats()
+        assert (stats.evictions, stats.size) == (2, 1)
+        client.close()
+
+    def test_uncached_endpoints(self, api_key, httpx_mock: HTTPXMock, clock):
+        """Test endpoints without a TTL always reach the API"""
+        httpx_mock.add_response(url=f"{BASE}/credits", json={"balance": 10}, is_reusable=True)
+        client = Sendly(api_key, cache=True, response_mode="raw")
+
+        client._http.request("GET", "/credits")
+        client._http.request("GET", "/credits")
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert client.get_cache_stats().size == 0
+        client.close()
+
+
+class TestAsyncResponseCache:
+    """Test the cache on the async client"""
+
+    @pytest.mark.asyncio
+    async def test_hit_and_background_refresh(self, api_key, httpx_mock: HTTPXMock, clock):
+        """Test async hits and stale-while-revalidate"""
+        httpx_mock.add_response(url=EVENT_TYPES_URL, json=EVENTS)
+        httpx_mock.add_response(url=EVENT_TYPES_URL, json=NEW_EVENTS)
+        cache = ResponseCache(
+            ttls={"/webhooks/event-types": 10}, stale_while_revalidate=60, clock=clock
+        )
+
+        async with AsyncSendly(api_key, cache=cache) as client:
+            await client.webhooks.list_event_types()
+            await client.webhooks.list_event_types()
+            clock.now += 30
+            assert await client.webhooks.list_event_types() == ["message.sent", "message.delivered"]
+            await asyncio.gather(*client._http._refreshes)
+            assert await client.webhooks.list_event_types() == ["message.failed"]
+
+        stats = cache.stats()
+        assert (stats.hits, stats.stale_hits, stats.misses) == (2, 1, 1)
@@ -0,0 +1,127 @@
+"""
+Tests for single-flight coalescing of identical GETs
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Sendly, SendlyError
+
+BASE = "https://sendly.live/api/v1"
+
+MESSAGE = {
+    "id": "msg_abc123",
+    "to": "+15551234567",
+    "text": "Hello",
+    "status": "queued",
+    "createdAt": "2025-01-20T10:00:00Z",
+}
+
+
+class TestAsyncCoalescing:
+    """Test AsyncHttpClient single-flight"""
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_request(self, api_key, httpx_mock: HTTPXMock):
+        """Test a burst of identical GETs sends one request, each caller gets its own copy"""
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_abc123", json=MESSAGE)
+
+        async with AsyncSendly(api_key, coalesce=True, response_mode="raw") as client:
+            results = await asyncio.gather(*(client.messages.get("msg_abc123") for _ in range(20)))
+
+        assert len(httpx_mock.get_requests()) == 1
+        assert all(r == MESSAGE for r in results)
+        assert results[0] is not results[1]
+        assert client._http._flights.shared == 19
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_not_shared(self, api_key, httpx_mock: HTTPXMock):
+        """Test different paths, queries and organizations each get a request"""
+        httpx_mock.add_response(json=MESSAGE, is_reusable=True)
+
+        async with AsyncSendly(api_key, coalesce=True) as client:
+            await asyncio.gather(
+                client.messages.get("msg_abc123"),
+                client.messages.get("msg_def456"),
+                client.messages.get("msg_abc123", request_options={"organization_id": "org_other"}),
+            )
+
+        assert len(httpx_mock.get_requests()) == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared(self, api_key, httpx_mock: HTTPXMock):
+        """Test every waiter gets the failure of the shared request"""
+        httpx_mock.add_response(status_code=404, json={"error": "not_found", "message": "Nope"})
+
+        async with AsyncSendly(api_key, coalesce=True) as client:
+            results = await asyncio.gather(
+                *(client.messages.get("msg_abc123") for _ in range(5)), return_exceptions=True
+            )
+
+        assert all(isinstance(r, SendlyError) and r.status_code == 404 for r in results)
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self, api_key, httpx_mock: HTTPXMock):
+        """Test cancelling the first caller leaves the shared request running"""
+
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=MESSAGE)
+
+        httpx_mock.add_callback(slow, url=f"{BASE}/messages/msg_abc123")
+
+        async with AsyncSendly(api_key, coalesce=True) as client:
+            first = asyncio.ensure_future(client.messages.get("msg_abc123"))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(client.messages.get("msg_abc123"))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            message = await second
+
+        assert message.id == "msg_abc123"
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestSyncCoalescing:
+    """Test HttpClient single-flight"""
+
+    def test_threads_share_one_request(self, api_key, httpx_mock: HTTPXMock):
+        """Test identical GETs from several threads send one request"""
+        started = threading.Event()
+
+        def slow(request: httpx.Request) -> httpx.Response:
+            started.set()
+            time.sleep(0.1)
+            return httpx.Response(200, json=MESSAGE)
+
+        httpx_mock.add_callback(slow, url=f"{BASE}/messages/msg_abc123")
+        client = Sendly(api_key, coalesce=True)
+
+        with ThreadPoolExecutor(8) as pool:
+            leader = pool.submit(client.messages.get, "msg_abc123")
+            started.wait(1)
+            followers = [pool.submit(client.messages.get, "msg_abc123") for _ in range(7)]
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert all(m.id == "msg_abc123" for m in results)
+        assert len(httpx_mock.get_requests()) == 1
+        client.close()
+
+    def test_off_by_default(self, api_key, httpx_mock: HTTPXMock):
+        """Test clients without coalesce send every request"""
+        httpx_mock.add_response(json=MESSAGE, is_reusable=True)
+        client = Sendly(api_key)
+
+        with ThreadPoolExecutor(4) as pool:
+            list(pool.map(client.messages.get, ["msg_abc123"] * 4))
+
+        assert len(httpx_mock.get_requests()) == 4
+        client.close()
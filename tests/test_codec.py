@@ -0,0 +1,155 @@
+"""
+Tests for pluggable JSON codecs
+"""
+
+import importlib.util
+import json
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, JsonCodec, Sendly
+from sendly.utils.codec import OrjsonCodec, get_codec
+from sendly.webhooks import Webhooks, WebhookSignatureError
+
+BASE = "https://sendly.live/api/v1"
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+HAS_MSGSPEC = importlib.util.find_spec("msgspec") is not None
+
+MESSAGE = {
+    "id": "msg_1",
+    "to": "+15551234567",
+    "text": "Héllo 🌍",
+    "status": "queued",
+    "createdAt": "2025-01-20T10:00:00Z",
+}
+
+
+class CountingCodec(JsonCodec):
+    """Stdlib codec that records how often it is used"""
+
+    name = "counting"
+
+    def __init__(self):
+        self.encoded = 0
+        self.decoded = 0
+
+    def dumps(self, obj):
+        self.encoded += 1
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+
+class TestGetCodec:
+    """Test codec resolution"""
+
+    def test_named_and_instance(self):
+        """Test names resolve to codecs and instances pass through"""
+        codec = CountingCodec()
+        assert get_codec(codec) is codec
+        assert type(get_codec("json")) is JsonCodec
+        assert get_codec("json").loads(get_codec("json").dumps(MESSAGE)) == MESSAGE
+
+    @pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+    def test_auto_prefers_orjson(self):
+        """Test auto-detection picks orjson when it is installed"""
+        assert isinstance(get_codec(), OrjsonCodec)
+        assert get_codec("auto") is get_codec(None)
+
+    @pytest.mark.skipif(HAS_MSGSPEC, reason="msgspec installed")
+    def test_missing_library(self):
+        """Test asking for an uninstalled library explains how to get it"""
+        with pytest.raises(ImportError, match=r"sendly\[msgspec\]"):
+            get_codec("msgspec")
+
+    def test_unknown_name(self):
+        """Test an unknown codec name is rejected"""
+        with pytest.raises(ValueError, match="json_codec"):
+            get_codec("yaml")
+
+
+class TestClientCodec:
+    """Test the client's json_codec option"""
+
+    def test_encodes_and_decodes_with_codec(self, api_key, httpx_mock: HTTPXMock):
+        """Test request bodies and responses go through the codec"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=MESSAGE)
+        codec = CountingCodec()
+        client = Sendly(api_key, json_codec=codec)
+
+        message = client.messages.send(to="+15551234567", text="Héllo 🌍")
+
+        assert message.text == "Héllo 🌍"
+        assert (codec.encoded, codec.decoded) == (1, 1)
+        sent = httpx_mock.get_request()
+        assert json.loads(sent.content)["text"] == "Héllo 🌍"
+        assert sent.headers["content-type"] == "application/json"
+        client.close()
+
+    def test_bytes_body_sent_as_is(self, api_key, httpx_mock: HTTPXMock):
+        """Test pre-serialized bodies skip encoding"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=MESSAGE)
+        codec = CountingCodec()
+        client = Sendly(api_key, json_codec=codec)
+        body = b'{"to":"+15551234567","text":"hi"}'
+
+        client._http.request("POST", "/messages", body=body)
+
+        assert httpx_mock.get_request().content == body
+        assert codec.encoded == 0
+        client.close()
+
+    def test_retries_reuse_encoded_body(self, api_key, httpx_mock: HTTPXMock, monkeypatch):
+        """Test a retried request is not encoded again"""
+        monkeypatch.setattr("sendly.utils.http.time.sleep", lambda seconds: None)
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url=f"{BASE}/messages")
+        httpx_mock.add_response(url=f"{BASE}/messages", json=MESSAGE)
+        codec = CountingCodec()
+        client = Sendly(api_key, json_codec=codec)
+
+        client.messages.send(to="+15551234567", text="hi")
+
+        assert codec.encoded == 1
+        first, second = httpx_mock.get_requests()
+        assert first.content == second.content
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_client(self, api_key, httpx_mock: HTTPXMock):
+        """Test the async client uses the codec too"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=MESSAGE)
+        codec = CountingCodec()
+
+        async with AsyncSendly(api_key, json_codec=codec) as client:
+            await client.messages.send(to="+15551234567", text="hi")
+
+        assert (codec.encoded, codec.decoded) == (1, 1)
+
+
+class TestWebhookCodec:
+    """Test Webhooks.parse_event with codecs and bytes payloads"""
+
+    def test_bytes_payload_and_codec(self):
+        """Test a bytes body verifies and parses through the given codec"""
+        payload = json.dumps(
+            {"id": "evt_1", "type": "message.delivered", "data": {"object": MESSAGE}},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        signature = Webhooks.generate_signature(payload.decode("utf-8"), "secret")
+        codec = CountingCodec()
+
+        event = Webhooks.parse_event(payload, signature, "secret", json_codec=codec)
+
+        assert event.data.id == "msg_1"
+        assert codec.decoded == 1
+
+    def test_malformed_payload(self):
+        """Test malformed JSON is reported as a signature error"""
+        signature = Webhooks.generate_signature("{not json", "secret")
+        with pytest.raises(WebhookSignatureError, match="Failed to parse"):
+            Webhooks.parse_event(b"{not json", signature, "secret")
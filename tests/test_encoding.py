@@ -0,0 +1,174 @@
+"""
+Tests for SMS encoding and cost estimation
+"""
+
+import json
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import (
+    CREDITS_PER_SMS,
+    AsyncSendly,
+    PricingTier,
+    Sendly,
+    estimate_cost,
+    get_encoding,
+    get_pricing_tier,
+    get_segment_info,
+    optimize_encoding,
+    resolve_destinations,
+    split_segments,
+)
+
+BASE = "https://sendly.live/api/v1"
+
+
+class TestSegmentInfo:
+    """Test get_segment_info() and friends"""
+
+    def test_encoding_detection(self):
+        """Test GSM-7 covers accented and extension characters, not everything above ASCII"""
+        assert get_encoding("Café ñoño à 5€ {ok}") == "GSM-7"
+        assert get_encoding("Hello `world`") == "UCS-2"
+        assert get_encoding("Zürich ç") == "UCS-2"  # lowercase ç is not GSM-7
+        assert get_encoding("Hi 🌍") == "UCS-2"
+
+    def test_units(self):
+        """Test lengths are septets for GSM-7 and UTF-16 code units for UCS-2"""
+        assert get_segment_info("[x]").units == 5
+        assert get_segment_info("🌍🌍").units == 4
+        info = get_segment_info("A" * 200)
+        assert (info.segments, info.per_segment, info.remaining) == (2, 153, 106)
+
+    def test_split_keeps_pairs_together(self):
+        """Test parts never split escape pairs or surrogate pairs"""
+        parts = split_segments("A" * 152 + "€" + "A" * 10)
+        assert [len(p) for p in parts] == [152, 11]
+        assert parts[1].startswith("€")
+
+        parts = split_segments("🌍" * 40)
+        assert [len(p) for p in parts] == [33, 7]
+        assert "".join(parts) == "🌍" * 40
+
+
+class TestEstimateCost:
+    """Test estimate_cost()"""
+
+    def test_totals_by_tier(self):
+        """Test credits are segments times the tier price of each destination"""
+        estimate = estimate_cost(
+            [
+                {"to": "+15551234567", "text": "Hi"},
+                {"to": "+447700900123", "text": "A" * 161},
+                {"to": "+33612345678"},
+                {"to": "+999123456"},
+            ],
+            text="Bonjour 🌍",
+        )
+
+        domestic = CREDITS_PER_SMS[PricingTier.DOMESTIC]
+        tier1 = CREDITS_PER_SMS[PricingTier.TIER1]
+        tier2 = CREDITS_PER_SMS[PricingTier.TIER2]
+        assert estimate.messages == 3
+        assert estimate.segments == 4
+        assert estimate.credits == domestic + 2 * tier1 + tier2
+        assert estimate.credits_by_tier[PricingTier.TIER1] == 2 * tier1
+        assert estimate.messages_by_encoding == {"GSM-7": 2, "UCS-2": 1}
+        assert estimate.unsupported == [3]
+
+    def test_pricing_tier(self):
+        """Test destinations resolve to their pricing tier"""
+        assert get_pricing_tier("+15551234567") == PricingTier.DOMESTIC
+        assert get_pricing_tier("+491701234567") == PricingTier.TIER3
+        assert get_pricing_tier("+999123456") is None
+
+    def test_resolve_destinations(self):
+        """Test bulk resolution to country, tier and credits per SMS"""
+        us, ca, pt, unknown, empty = resolve_destinations(
+            ["+12125551234", "+14165551234", "+351912345678", "+999123456", ""]
+        )
+
+        assert (us.country, ca.country, pt.country) == ("US", "CA", "PT")
+        assert ca.credits_per_sms == CREDITS_PER_SMS[PricingTier.DOMESTIC]
+        assert pt.tier == PricingTier.TIER1
+        assert unknown is None and empty is None
+
+
+class TestOptimizeEncoding:
+    """Test GSM-7 transliteration"""
+
+    def test_rewrites_typography(self):
+        """Test smart punctuation is rewritten and the savings reported"""
+        text = "We\u2019re open \u2014 \u201cbig\u201d sale\u2026" * 4
+        result = optimize_encoding(text, to="+447700900123")
+
+        assert result.text == 'We\'re open - "big" sale...' * 4
+        assert (result.encoding, result.original_segments, result.segments) == ("GSM-7", 2, 1)
+        assert result.segments_saved == 1
+        assert result.credits_saved == CREDITS_PER_SMS[PricingTier.TIER1]
+
+    def test_keeps_text_that_needs_ucs2(self):
+        """Test text that stays UCS-2 (emoji) is not rewritten"""
+        result = optimize_encoding("\u201cHi\u201d \U0001f30d")
+
+        assert not result.changed
+        assert result.text == "\u201cHi\u201d \U0001f30d"
+        assert result.credits_saved is None
+
+    def test_send_and_batch(self, api_key, httpx_mock: HTTPXMock, mock_message):
+        """Test send and send_batch rewrite text and report each message"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=mock_message)
+        httpx_mock.add_response(
+            url=f"{BASE}/messages/batch",
+            json={
+                "batchId": "batch_1",
+                "status": "processing",
+                "total": 2,
+                "queued": 2,
+                "sent": 0,
+                "failed": 0,
+                "creditsUsed": 4,
+                "createdAt": "2025-01-20T10:00:00Z",
+                "messages": [],
+            },
+        )
+        reports = []
+        client = Sendly(api_key)
+
+        client.messages.send(to="+15551234567", text="It\u2019s here", optimize_encoding=True)
+        client.messages.send_batch(
+            [{"to": "+15551234567", "text": "A\u2013B"}, {"to": "+15559876543", "text": "OK"}],
+            optimize_encoding=reports.append,
+        )
+
+        sent, batch = (json.loads(r.read()) for r in httpx_mock.get_requests())
+        assert sent["text"] == "It's here"
+        assert [m["text"] for m in batch["messages"]] == ["A-B", "OK"]
+        assert [r.changed for r in reports] == [True, False]
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_campaign(self, api_key, httpx_mock: HTTPXMock):
+        """Test campaigns.create rewrites the campaign text"""
+        httpx_mock.add_response(
+            url=f"{BASE}/campaigns",
+            json={
+                "id": "cmp_1",
+                "name": "Promo",
+                "text": "x",
+                "status": "draft",
+                "created_at": "2025-01-20T10:00:00Z",
+                "updated_at": "2025-01-20T10:00:00Z",
+            },
+        )
+
+        async with AsyncSendly(api_key) as client:
+            await client.campaigns.create(
+                name="Promo",
+                text="Hi {{name}} \u2014 20% off",
+                contact_list_ids=["lst_1"],
+                optimize_encoding=True,
+            )
+
+        assert json.loads(httpx_mock.get_request().read())["text"] == "Hi {{name}} - 20% off"
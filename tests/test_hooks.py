@@ -0,0 +1,220 @@
+"""
+Tests for request hooks and the metrics collector
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Hooks, MetricsCollector, Sendly
+from sendly.errors import AuthenticationError
+from sendly.utils.hooks import ResponseEvent, path_template
+
+BASE = "https://sendly.live/api/v1"
+
+MESSAGE = {
+    "id": "msg_abc123",
+    "to": "+15551234567",
+    "text": "Hello",
+    "status": "queued",
+    "createdAt": "2025-01-20T10:00:00Z",
+}
+
+
+class Recorder:
+    """Collects every hook event in order"""
+
+    def __init__(self):
+        self.events = []
+
+    def on_request(self, event):
+        self.events.append(("request", event))
+
+    def on_response(self, event):
+        self.events.append(("response", event))
+
+    def on_retry(self, event):
+        self.events.append(("retry", event))
+
+    def on_error(self, event):
+        self.events.append(("error", event))
+
+    def hooks(self):
+        hooks = Hooks()
+        hooks.register(self)
+        return hooks
+
+    def kinds(self):
+        return [kind for kind, _ in self.events]
+
+
+class _MessageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connections are reused
+
+    def do_GET(self):
+        body = json.dumps(MESSAGE).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MessageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestPathTemplate:
+    """Test path templating for metric labels"""
+
+    def test_ids_collapsed(self):
+        """Test ID segments become placeholders and static ones stay"""
+        assert path_template("/messages/msg_abc123") == "/messages/{id}"
+        assert path_template("/messages/batch") == "/messages/batch"
+        assert (
+            path_template("/webhooks/wh_1/deliveries/del_2/retry")
+            == "/webhooks/{id}/deliveries/{id}/retry"
+        )
+        assert path_template("/enterprise/billing/workspace-breakdown?page=2") == (
+            "/enterprise/billing/workspace-breakdown"
+        )
+
+
+class TestHooks:
+    """Test hook events around calls"""
+
+    def test_success_events(self, api_key, httpx_mock: HTTPXMock):
+        """Test a successful call fires on_request then on_response"""
+        body = json.dumps(MESSAGE).encode()
+        httpx_mock.add_response(
+            url=f"{BASE}/messages/msg_abc123",
+            content=body,
+            headers={"content-type": "application/json"},
+        )
+        recorder = Recorder()
+        client = Sendly(api_key, hooks=recorder.hooks())
+
+        client.messages.get("msg_abc123")
+
+        assert recorder.kinds() == ["request", "response"]
+        request, response = (event for _, event in recorder.events)
+        assert (request.method, request.path, request.attempt) == ("GET", "/messages/{id}", 1)
+        assert response.status_code == 200
+        assert response.elapsed >= 0
+        assert response.response_bytes == len(body)
+        client.close()
+
+    def test_retry_and_error_events(self, api_key, httpx_mock: HTTPXMock, monkeypatch):
+        """Test retries and the final failure are reported"""
+        monkeypatch.setattr("sendly.utils.http.time.sleep", lambda seconds: None)
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url=f"{BASE}/messages")
+        httpx_mock.add_response(url=f"{BASE}/messages", status_code=503, json={"error": "down"})
+        httpx_mock.add_response(
+            url=f"{BASE}/messages",
+            status_code=401,
+            json={"error": "invalid_api_key", "message": "Bad key"},
+        )
+        recorder = Recorder()
+        client = Sendly(api_key, hooks=recorder.hooks())
+
+        with pytest.raises(AuthenticationError):
+            client.messages.send(to="+15551234567", text="Hello")
+
+        assert recorder.kinds() == [
+            "request",
+            "retry",
+            "request",
+            "response",
+            "retry",
+            "request",
+            "response",
+            "error",
+        ]
+        retries = [event for kind, event in recorder.events if kind == "retry"]
+        assert [r.attempt for r in retries] == [1, 2]
+        assert retries[0].delay > 0
+        error = recorder.events[-1][1]
+        assert error.attempts == 3
+        assert isinstance(error.error, AuthenticationError)
+        client.close()
+
+    def test_shared_hooks_not_mutated(self, api_key):
+        """Test a metrics collector doesn't leak into the caller's Hooks"""
+        hooks = Hooks()
+        Sendly(api_key, hooks=hooks, metrics=True)
+        assert not hooks
+
+    def test_connection_phases_over_a_real_socket(self, api_key, local_api):
+        """Test connect and TTFB come from the transport's trace events"""
+        recorder = Recorder()
+        client = Sendly(api_key, base_url=local_api, hooks=recorder.hooks())
+
+        client.messages.get("msg_abc123")
+        client.messages.get("msg_abc123")
+
+        first, second = (e for kind, e in recorder.events if kind == "response")
+        assert first.connect is not None and first.connect > 0
+        assert second.connect == 0.0  # pooled connection reused
+        assert 0 < first.ttfb <= first.elapsed
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_hooks(self, api_key, local_api):
+        """Test the async client fires the same events"""
+        recorder = Recorder()
+
+        async with AsyncSendly(api_key, base_url=local_api, hooks=recorder.hooks()) as client:
+            await client.messages.get("msg_abc123")
+
+        assert recorder.kinds() == ["request", "response"]
+        assert recorder.events[1][1].ttfb is not None
+
+
+class TestMetricsCollector:
+    """Test metrics aggregation and export"""
+
+    def test_counters_quantiles_and_amplification(self, api_key, httpx_mock: HTTPXMock):
+        """Test retries show up as amplification and latency is histogrammed"""
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_1", status_code=500, json={})
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_1", json=MESSAGE, is_reusable=True)
+        client = Sendly(api_key, metrics=True)
+
+        for _ in range(3):
+            client.messages.get("msg_1")
+
+        metrics = client.metrics
+        assert metrics.counter("requests_total", path="/messages/{id}") == 4
+        assert metrics.counter("responses_total", status="500") == 1
+        assert metrics.counter("retries_total", reason="server_error") == 1
+        assert metrics.retry_amplification() == pytest.approx(4 / 3)
+        assert 0 < metrics.quantile("/messages/{id}", 0.99) <= 10.0
+        assert metrics.quantile("/nothing") is None
+        client.close()
+
+    def test_prometheus_export(self):
+        """Test the text exposition format"""
+        metrics = MetricsCollector(buckets=(0.1, 1.0))
+        metrics.on_response(ResponseEvent("POST", "/messages", 1, 200, 0.05))
+        metrics.on_response(ResponseEvent("POST", "/messages", 1, 200, 0.5))
+
+        text = metrics.to_prometheus()
+
+        assert "# TYPE sendly_request_duration_seconds histogram" in text
+        route = 'method="POST",path="/messages"'
+        assert f'sendly_request_duration_seconds_bucket{{{route},le="0.1"}} 1' in text
+        assert f'sendly_request_duration_seconds_bucket{{{route},le="+Inf"}} 2' in text
+        assert f'sendly_responses_total{{{route},status="200"}} 2' in text
+        assert metrics.snapshot()["sendly_request_duration_seconds"][0]["count"] == 2
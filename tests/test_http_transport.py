@@ -0,0 +1,134 @@
+"""
+Tests for connection pool / transport configuration of the HTTP clients
+"""
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Sendly
+from sendly.errors import TimeoutError
+
+BASE = "https://sendly.live/api/v1"
+
+
+class TestTransportConfiguration:
+    """Test pool limits, HTTP/2 and per-phase timeouts"""
+
+    def test_limits_and_timeout_forwarded_to_owned_client(self, api_key):
+        """Test limits and httpx.Timeout are applied to the SDK-owned client"""
+        timeout = httpx.Timeout(10.0, connect=2.0)
+        limits = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+        client = Sendly(api_key, timeout=timeout, limits=limits)
+
+        assert client._http.limits is limits
+        assert client._http.client.timeout == timeout
+        client.close()
+
+    def test_custom_transport_is_used(self, api_key, mock_message):
+        """Test a custom transport receives the SDK's requests"""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json=mock_message)
+
+        client = Sendly(api_key, transport=httpx.MockTransport(handler))
+        client.messages.send(to="+15551234567", text="Test")
+
+        assert str(seen[0].url) == f"{BASE}/messages"
+        assert seen[0].headers["Authorization"] == f"Bearer {api_key}"
+        client.close()
+
+    def test_timeout_error_describes_per_phase_timeout(self, api_key, httpx_mock: HTTPXMock):
+        """Test timeout errors render httpx.Timeout values readably"""
+        client = Sendly(api_key, timeout=httpx.Timeout(5.0, connect=1.0), max_retries=0)
+        httpx_mock.add_exception(httpx.ReadTimeout("timed out"))
+
+        with pytest.raises(TimeoutError, match="connect=1.0s, read=5.0s"):
+            client.messages.get("msg_test_123")
+
+        client.close()
+
+
+class TestSharedHttpClient:
+    """Test injecting a caller-owned httpx client"""
+
+    def test_sdk_timeout_applies_to_shared_client(self, api_key, mock_message):
+        """Test Sendly(timeout=...) wins over the injected client's own timeout"""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.extensions["timeout"])
+            return httpx.Response(200, json=mock_message)
+
+        shared = httpx.Client(transport=httpx.MockTransport(handler), timeout=60.0)
+        client = Sendly(api_key, http_client=shared, timeout=3.0)
+        client.messages.send(to="+15551234567", text="Test")
+
+        assert seen[0]["read"] == 3.0
+        shared.close()
+
+    def test_transport_with_shared_client_rejected(self, api_key):
+        """Test a transport can't be combined with a caller-owned client"""
+        with httpx.Client() as shared:
+            with pytest.raises(ValueError, match="http_client or transport"):
+                Sendly(api_key, http_client=shared, transport=httpx.MockTransport(lambda r: None))
+
+    def test_shared_client_serves_several_sdk_instances(
+        self, api_key, live_api_key, mock_message, httpx_mock: HTTPXMock
+    ):
+        """Test two SDK instances share one pool with their own credentials"""
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_test_123", json=mock_message)
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_test_123", json=mock_message)
+
+        shared = httpx.Client()
+        first = Sendly(api_key, http_client=shared)
+        second = Sendly(live_api_key, http_client=shared, organization_id="org_2")
+
+        first.messages.get("msg_test_123")
+        second.messages.get("msg_test_123")
+
+        assert first._http.client is second._http.client is shared
+        first_request, second_request = httpx_mock.get_requests()
+        assert first_request.headers["Authorization"] == f"Bearer {api_key}"
+        assert "X-Organization-Id" not in first_request.headers
+        assert second_request.headers["Authorization"] == f"Bearer {live_api_key}"
+        assert second_request.headers["X-Organization-Id"] == "org_2"
+
+        first.close()
+        second.close()
+        assert not shared.is_closed
+        shared.close()
+
+    def test_set_organization_id_applies_to_next_request(
+        self, api_key, mock_message, httpx_mock: HTTPXMock
+    ):
+        """Test org changes apply even after the pool has been created"""
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_test_123", json=mock_message)
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_test_123", json=mock_message)
+
+        client = Sendly(api_key)
+        client.messages.get("msg_test_123")
+        client.set_organization_id("org_new")
+        client.messages.get("msg_test_123")
+
+        first_request, second_request = httpx_mock.get_requests()
+        assert "X-Organization-Id" not in first_request.headers
+        assert second_request.headers["X-Organization-Id"] == "org_new"
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_shared_client_left_open(
+        self, api_key, mock_message, httpx_mock: HTTPXMock
+    ):
+        """Test AsyncSendly never closes a caller-owned client"""
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_test_123", json=mock_message)
+
+        shared = httpx.AsyncClient()
+        async with AsyncSendly(api_key, http_client=shared) as client:
+            message = await client.messages.get("msg_test_123")
+            assert message.id == "msg_test_123"
+
+        assert not shared.is_closed
+        await shared.aclose()
@@ -0,0 +1,115 @@
+"""
+Tests for Idempotency-Key handling on mutating requests
+"""
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Sendly
+
+BASE = "https://sendly.live/api/v1"
+
+MESSAGE = {
+    "id": "msg_1",
+    "to": "+15551234567",
+    "text": "Hello",
+    "status": "queued",
+    "createdAt": "2025-01-20T10:00:00Z",
+}
+
+BATCH = {
+    "batchId": "batch_1",
+    "status": "processing",
+    "total": 1,
+    "queued": 1,
+    "sent": 0,
+    "failed": 0,
+    "creditsUsed": 1,
+    "messages": [],
+    "createdAt": "2025-01-20T10:00:00Z",
+}
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr("sendly.utils.http.time.sleep", lambda seconds: None)
+
+
+class TestIdempotencyKeys:
+    """Test generated and caller-supplied idempotency keys"""
+
+    def test_key_reused_across_retries(self, api_key, httpx_mock: HTTPXMock, no_sleep):
+        """Test a send retried after a timeout carries the same key"""
+        httpx_mock.add_exception(httpx.ReadTimeout("slow"), url=f"{BASE}/messages")
+        httpx_mock.add_response(url=f"{BASE}/messages", status_code=503, json={})
+        httpx_mock.add_response(url=f"{BASE}/messages", json=MESSAGE)
+        client = Sendly(api_key)
+
+        client.messages.send(to="+15551234567", text="Hello")
+
+        keys = {r.headers["Idempotency-Key"] for r in httpx_mock.get_requests()}
+        assert len(httpx_mock.get_requests()) == 3
+        assert len(keys) == 1
+        client.close()
+
+    def test_distinct_calls_get_distinct_keys(self, api_key, httpx_mock: HTTPXMock):
+        """Test each call generates its own key and GETs carry none"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=MESSAGE, is_reusable=True)
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_1", json=MESSAGE)
+        client = Sendly(api_key)
+
+        client.messages.send(to="+15551234567", text="Hello")
+        client.messages.send(to="+15551234567", text="Hello")
+        client.messages.get("msg_1")
+
+        first, second, get = httpx_mock.get_requests()
+        assert first.headers["Idempotency-Key"] != second.headers["Idempotency-Key"]
+        assert "Idempotency-Key" not in get.headers
+        client.close()
+
+    def test_caller_key(self, api_key, httpx_mock: HTTPXMock):
+        """Test a caller-supplied key is sent as-is, including via send_many"""
+        httpx_mock.add_response(url=f"{BASE}/messages/batch", json=BATCH)
+        httpx_mock.add_response(url=f"{BASE}/messages", json=MESSAGE)
+        client = Sendly(api_key)
+
+        client.messages.send_batch(
+            [{"to": "+15551234567", "text": "Hi"}], idempotency_key="order-42-batch"
+        )
+        list(
+            client.messages.send_many(
+                [{"to": "+15551234567", "text": "Hi", "idempotencyKey": "order-42-sms"}]
+            )
+        )
+
+        batch, single = httpx_mock.get_requests()
+        assert batch.headers["Idempotency-Key"] == "order-42-batch"
+        assert single.headers["Idempotency-Key"] == "order-42-sms"
+        client.close()
+
+    def test_disabled(self, api_key, httpx_mock: HTTPXMock):
+        """Test automatic keys can be turned off"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=MESSAGE)
+        client = Sendly(api_key, idempotency_keys=False)
+
+        client.messages.send(to="+15551234567", text="Hello")
+
+        assert "Idempotency-Key" not in httpx_mock.get_request().headers
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_reuse(self, api_key, httpx_mock: HTTPXMock, monkeypatch):
+        """Test the async client reuses the key across retries"""
+
+        async def no_wait(seconds):
+            pass
+
+        monkeypatch.setattr("sendly.utils.http.asyncio.sleep", no_wait)
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url=f"{BASE}/messages")
+        httpx_mock.add_response(url=f"{BASE}/messages", json=MESSAGE)
+
+        async with AsyncSendly(api_key) as client:
+            await client.messages.send(to="+15551234567", text="Hello", idempotency_key="k1")
+
+        assert [r.headers["Idempotency-Key"] for r in httpx_mock.get_requests()] == ["k1", "k1"]
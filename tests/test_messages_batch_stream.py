@@ -0,0 +1,208 @@
+"""
+Tests for messages.send_batch_stream() and the chunking helpers
+"""
+
+import json
+import threading
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Sendly
+from sendly.errors import SendlyError
+from sendly.utils.batching import iter_chunks
+
+BASE = "https://sendly.live/api/v1"
+
+
+def _batch_response(request: httpx.Request) -> httpx.Response:
+    """Respond to POST /messages/batch with every message queued"""
+    messages = json.loads(request.read())["messages"]
+    first = messages[0]["to"][-4:]
+    if messages[0]["to"] == "+15559990000":
+        return httpx.Response(500, json={"error": "internal_error", "message": "boom"})
+    return httpx.Response(
+        200,
+        json={
+            "batchId": f"batch_{first}",
+            "status": "processing",
+            "total": len(messages),
+            "queued": len(messages),
+            "sent": 0,
+            "failed": 0,
+            "creditsUsed": 2 * len(messages),
+            "messages": [],
+            "createdAt": "2025-01-20T10:00:00Z",
+        },
+    )
+
+
+def _rows(count, start=0):
+    for i in range(start, start + count):
+        yield {"to": f"+1555{i:07d}", "text": f"Hello {i}"}
+
+
+class TestIterChunks:
+    """Test lazy chunk packing"""
+
+    def test_chunks_by_count(self):
+        """Test chunks hold at most chunk_size messages"""
+        chunks = list(iter_chunks(_rows(2500)))
+        assert [len(c) for c in chunks] == [1000, 1000, 500]
+
+    def test_chunks_by_bytes(self):
+        """Test max_chunk_bytes caps the encoded size of each chunk"""
+        rows = list(_rows(50))
+        chunks = list(iter_chunks(rows, chunk_size=1000, max_chunk_bytes=1024))
+
+        assert sum(len(c) for c in chunks) == 50
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(json.dumps({"messages": chunk})) <= 1024
+
+    def test_oversized_message_gets_own_chunk(self):
+        """Test a message bigger than the byte cap is still sent"""
+        rows = [{"to": "+15550000001", "text": "x" * 2000}, {"to": "+15550000002", "text": "y"}]
+        chunks = list(iter_chunks(rows, max_chunk_bytes=512))
+        assert [len(c) for c in chunks] == [1, 1]
+
+    def test_lazy_consumption(self):
+        """Test only one chunk's worth of input is pulled at a time"""
+        pulled = 0
+
+        def generate():
+            nonlocal pulled
+            for row in _rows(10_000):
+                pulled += 1
+                yield row
+
+        chunks = iter_chunks(generate(), chunk_size=100)
+        next(chunks)
+        assert pulled == 101
+
+    def test_invalid_limits(self):
+        """Test chunk limits are validated eagerly"""
+        with pytest.raises(ValueError, match="chunk_size"):
+            iter_chunks([], chunk_size=1001)
+        with pytest.raises(ValueError, match="max_chunk_bytes"):
+            iter_chunks([], max_chunk_bytes=10)
+
+
+class TestSendBatchStream:
+    """Test the sync streaming batch sender"""
+
+    def test_streams_all_chunks_with_summary(self, api_key, httpx_mock: HTTPXMock):
+        """Test every chunk is submitted and aggregated"""
+        httpx_mock.add_callback(_batch_response, url=f"{BASE}/messages/batch", is_reusable=True)
+        client = Sendly(api_key)
+
+        stream = client.messages.send_batch_stream(_rows(2300), window=2)
+        batches = list(stream)
+
+        assert len(batches) == 3
+        assert stream.summary.chunks == 3
+        assert stream.summary.total == 2300
+        assert stream.summary.queued == 2300
+        assert stream.summary.credits_used == 4600
+        assert sorted(stream.summary.batch_ids) == sorted(b.batch_id for b in batches)
+        assert stream.summary.errors == []
+        client.close()
+
+    def test_window_bounds_in_flight_chunks(self, api_key, httpx_mock: HTTPXMock):
+        """Test no more than `window` batches are in flight"""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+        gate = threading.Event()
+
+        def slow_batch(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            gate.wait(0.02)
+            with lock:
+                in_flight -= 1
+            return _batch_response(request)
+
+        httpx_mock.add_callback(slow_batch, url=f"{BASE}/messages/batch", is_reusable=True)
+        client = Sendly(api_key)
+
+        summary = client.messages.send_batch_stream(_rows(1000), chunk_size=50, window=3).wait()
+
+        assert summary.chunks == 20
+        assert peak <= 3
+        client.close()
+
+    def test_failed_chunk_is_recorded(self, api_key, httpx_mock: HTTPXMock):
+        """Test a failing chunk doesn't stop the stream"""
+        httpx_mock.add_callback(_batch_response, url=f"{BASE}/messages/batch", is_reusable=True)
+        client = Sendly(api_key, max_retries=0)
+        rows = list(_rows(10)) + [{"to": "+15559990000", "text": "boom"}] + list(_rows(5, 20))
+
+        stream = client.messages.send_batch_stream(rows, chunk_size=10, window=1)
+        batches = list(stream)
+
+        assert len(batches) == 1
+        assert stream.summary.queued == 10
+        assert len(stream.summary.errors) == 1
+        assert stream.summary.errors[0].index == 1
+        assert stream.summary.unsent == 6
+        assert isinstance(stream.summary.errors[0].error, SendlyError)
+        client.close()
+
+    def test_shared_options_forwarded(self, api_key, httpx_mock: HTTPXMock):
+        """Test from_/message_type/metadata go on every batch"""
+        httpx_mock.add_callback(_batch_response, url=f"{BASE}/messages/batch", is_reusable=True)
+        client = Sendly(api_key)
+
+        client.messages.send_batch_stream(
+            _rows(3), from_="MyBrand", message_type="transactional", metadata={"job": 7}
+        ).wait()
+
+        sent = json.loads(httpx_mock.get_request().read())
+        assert sent["from"] == "MyBrand"
+        assert sent["messageType"] == "transactional"
+        assert sent["metadata"] == {"job": 7}
+        client.close()
+
+    def test_shared_idempotency_key_is_per_chunk(self, api_key, httpx_mock: HTTPXMock):
+        """Test a shared idempotency_key is made distinct for each chunk"""
+        httpx_mock.add_callback(_batch_response, url=f"{BASE}/messages/batch", is_reusable=True)
+        client = Sendly(api_key)
+
+        client.messages.send_batch_stream(
+            _rows(250), chunk_size=100, request_options={"idempotency_key": "job-7"}
+        ).wait()
+
+        keys = {
+            json.loads(r.read())["messages"][0]["to"]: r.headers["Idempotency-Key"]
+            for r in httpx_mock.get_requests()
+        }
+        assert keys == {
+            "+15550000000": "job-7:0",
+            "+15550000100": "job-7:1",
+            "+15550000200": "job-7:2",
+        }
+        client.close()
+
+
+class TestAsyncSendBatchStream:
+    """Test the async streaming batch sender"""
+
+    @pytest.mark.asyncio
+    async def test_async_iterable_input(self, api_key, httpx_mock: HTTPXMock):
+        """Test async input, streamed responses and the final summary"""
+        httpx_mock.add_callback(_batch_response, url=f"{BASE}/messages/batch", is_reusable=True)
+
+        async def rows():
+            for row in _rows(250):
+                yield row
+
+        async with AsyncSendly(api_key) as client:
+            stream = client.messages.send_batch_stream(rows(), chunk_size=100, window=2)
+            batches = [batch async for batch in stream]
+
+        assert [b.total for b in sorted(batches, key=lambda b: b.batch_id)] == [100, 100, 50]
+        assert stream.summary.queued == 250
@@ -0,0 +1,220 @@
+"""
+Tests for messages.send_many() concurrent fan-out
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Sendly
+from sendly.errors import InsufficientCreditsError, ValidationError
+from sendly.types import SendResult
+from sendly.utils.concurrency import bounded_map
+
+BASE = "https://sendly.live/api/v1"
+
+
+def _echo_message(request: httpx.Request) -> httpx.Response:
+    """Respond to POST /messages with a message built from the request"""
+    body = json.loads(request.read())
+    if body["to"] == "+15550000000":
+        return httpx.Response(
+            402,
+            json={"error": "insufficient_credits", "message": "No credits", "creditsNeeded": 1},
+        )
+    return httpx.Response(
+        200,
+        json={
+            "id": f"msg_{body['to'][1:]}",
+            "to": body["to"],
+            "text": body["text"],
+            "status": "queued",
+            "createdAt": "2025-01-20T10:00:00Z",
+        },
+    )
+
+
+def _recipients(count):
+    return [{"to": f"+1555000{i:04d}", "text": f"Hello {i}"} for i in range(1, count + 1)]
+
+
+class TestSendMany:
+    """Test the thread-pool backed sync fan-out"""
+
+    def test_sends_every_item(self, api_key, httpx_mock: HTTPXMock):
+        """Test each item is sent and reported once"""
+        httpx_mock.add_callback(_echo_message, url=f"{BASE}/messages", is_reusable=True)
+        client = Sendly(api_key)
+
+        results = list(client.messages.send_many(_recipients(25), concurrency=5))
+
+        assert len(results) == 25
+        assert all(isinstance(r, SendResult) and r.ok for r in results)
+        assert sorted(r.index for r in results) == list(range(25))
+        assert {r.message.to for r in results} == {m["to"] for m in _recipients(25)}
+        client.close()
+
+    def test_ordered_results(self, api_key, httpx_mock: HTTPXMock):
+        """Test ordered=True yields in input order"""
+        httpx_mock.add_callback(_echo_message, url=f"{BASE}/messages", is_reusable=True)
+        client = Sendly(api_key)
+
+        results = list(client.messages.send_many(_recipients(12), concurrency=4, ordered=True))
+
+        assert [r.index for r in results] == list(range(12))
+        assert [r.message.to for r in results] == [m["to"] for m in _recipients(12)]
+        client.close()
+
+    def test_collects_errors_without_aborting(self, api_key, httpx_mock: HTTPXMock):
+        """Test API and validation errors are reported per item"""
+        httpx_mock.add_callback(_echo_message, url=f"{BASE}/messages", is_reusable=True)
+        client = Sendly(api_key)
+        items = [
+            {"to": "+15550000001", "text": "ok"},
+            {"to": "+15550000000", "text": "no credits"},
+            {"to": "not-a-number", "text": "invalid"},
+            {"to": "+15550000002", "text": "ok"},
+        ]
+
+        results = list(client.messages.send_many(items, concurrency=2, ordered=True))
+
+        assert [r.ok for r in results] == [True, False, False, True]
+        assert isinstance(results[1].error, InsufficientCreditsError)
+        assert isinstance(results[2].error, ValidationError)
+        assert results[2].request == items[2]
+        client.close()
+
+    def test_concurrency_is_bounded_and_input_lazy(self, api_key, httpx_mock: HTTPXMock):
+        """Test no more than `concurrency` sends run and input is pulled lazily"""
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_echo(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return _echo_message(request)
+
+        httpx_mock.add_callback(slow_echo, url=f"{BASE}/messages", is_reusable=True)
+        client = Sendly(api_key)
+        pulled = 0
+
+        def generate():
+            nonlocal pulled
+            for item in _recipients(30):
+                pulled += 1
+                yield item
+
+        results = client.messages.send_many(generate(), concurrency=3)
+        first = next(results)
+        assert first.ok
+        assert pulled <= 4
+
+        rest = list(results)
+        assert len(rest) == 29
+        assert peak <= 3
+        client.close()
+
+    def test_default_sender_and_api_keys(self, api_key, httpx_mock: HTTPXMock):
+        """Test shared defaults and camelCase item keys"""
+        httpx_mock.add_callback(_echo_message, url=f"{BASE}/messages", is_reusable=True)
+        client = Sendly(api_key)
+
+        items = [{"to": "+15550000001", "text": "Hi", "messageType": "transactional"}]
+        results = list(client.messages.send_many(items, from_="MyBrand"))
+
+        assert results[0].ok
+        sent = json.loads(httpx_mock.get_request().read())
+        assert sent["from"] == "MyBrand"
+        assert sent["messageType"] == "transactional"
+        client.close()
+
+    def test_invalid_concurrency(self, api_key):
+        """Test concurrency must be positive"""
+        client = Sendly(api_key)
+        with pytest.raises(ValueError, match="concurrency"):
+            list(client.messages.send_many(_recipients(1), concurrency=0))
+        client.close()
+
+
+class TestBoundedMap:
+    """Test the bounded_map helper behind send_many"""
+
+    def test_outcome_position(self):
+        """Test outcomes carry their input position without shadowing tuple.index"""
+        outcomes = list(bounded_map(str.upper, ["a", "b", "c"], 2, ordered=True))
+
+        assert [o.position for o in outcomes] == [0, 1, 2]
+        assert [o.result for o in outcomes] == ["A", "B", "C"]
+        assert outcomes[1].index("b") == 1
+
+
+class TestAsyncSendMany:
+    """Test the task-based async fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_sends_every_item(self, api_key, httpx_mock: HTTPXMock):
+        """Test each item is sent and reported once"""
+        httpx_mock.add_callback(_echo_message, url=f"{BASE}/messages", is_reusable=True)
+
+        async with AsyncSendly(api_key) as client:
+            results = [r async for r in client.messages.send_many(_recipients(20), concurrency=8)]
+
+        assert len(results) == 20
+        assert all(r.ok for r in results)
+
+    @pytest.mark.asyncio
+    async def test_ordered_with_async_iterable_and_errors(self, api_key, httpx_mock: HTTPXMock):
+        """Test async input, input-order output and per-item errors"""
+        httpx_mock.add_callback(_echo_message, url=f"{BASE}/messages", is_reusable=True)
+
+        async def generate():
+            for item in [
+                {"to": "+15550000001", "text": "a"},
+                {"to": "+15550000000", "text": "b"},
+                {"to": "+15550000002", "text": "c"},
+            ]:
+                await asyncio.sleep(0)
+                yield item
+
+        async with AsyncSendly(api_key) as client:
+            results = [
+                r async for r in client.messages.send_many(generate(), concurrency=2, ordered=True)
+            ]
+
+        assert [r.index for r in results] == [0, 1, 2]
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, InsufficientCreditsError)
+
+    @pytest.mark.asyncio
+    async def test_shared_idempotency_key_is_per_message(self, api_key, httpx_mock: HTTPXMock):
+        """Test a shared idempotency_key becomes one key per message; item keys win"""
+        httpx_mock.add_callback(_echo_message, url=f"{BASE}/messages", is_reusable=True)
+        items = list(_recipients(3))
+        items[2]["idempotency_key"] = "own-key"
+
+        async with AsyncSendly(api_key) as client:
+            async for _ in client.messages.send_many(
+                items, concurrency=3, request_options={"idempotency_key": "run-1"}
+            ):
+                pass
+
+        keys = {
+            json.loads(r.read())["to"]: r.headers["Idempotency-Key"]
+            for r in httpx_mock.get_requests()
+        }
+        assert keys == {
+            items[0]["to"]: "run-1:0",
+            items[1]["to"]: "run-1:1",
+            items[2]["to"]: "own-key",
+        }
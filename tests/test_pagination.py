@@ -0,0 +1,294 @@
+"""
+Tests for automatic pagination, page prefetching and resumable cursors
+"""
+
+import re
+import threading
+import time
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Page, PageCursor, Paginator, Sendly
+from sendly.errors import AuthenticationError
+
+BASE = "https://sendly.live/api/v1"
+MESSAGES_URL = re.compile(rf"{re.escape(BASE)}/messages\?.*")
+CONTACTS_URL = re.compile(rf"{re.escape(BASE)}/contacts\?.*")
+BREAKDOWN_URL = re.compile(rf"{re.escape(BASE)}/enterprise/billing/workspace-breakdown\?.*")
+
+
+def _message(i):
+    return {
+        "id": f"msg_{i}",
+        "to": "+15551234567",
+        "text": f"Message {i}",
+        "status": "delivered",
+        "createdAt": "2025-01-20T10:00:00Z",
+    }
+
+
+class MessagePages:
+    """Serves /messages pages out of a fixed number of messages"""
+
+    def __init__(self, total, delay=0.0):
+        self.total = total
+        self.delay = delay
+        self.offsets = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        with self._lock:
+            self.offsets.append(offset)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        data = [_message(i) for i in range(offset, min(offset + limit, self.total))]
+        return httpx.Response(200, json={"data": data, "count": len(data)})
+
+
+class TestListAllPrefetch:
+    """Test messages.list_all(prefetch=N)"""
+
+    def test_prefetch_yields_in_order(self, api_key, httpx_mock: HTTPXMock):
+        """Test prefetched pages are yielded in order and stop on a short page"""
+        pages = MessagePages(total=95, delay=0.005)
+        httpx_mock.add_callback(pages, url=MESSAGES_URL, is_reusable=True)
+        client = Sendly(api_key)
+
+        ids = [m.id for m in client.messages.list_all(batch_size=10, prefetch=4)]
+
+        assert ids == [f"msg_{i}" for i in range(95)]
+        assert 2 <= pages.peak <= 4
+        # At most `prefetch - 1` speculative requests past the last page
+        assert max(pages.offsets) <= 90 + 3 * 10
+        client.close()
+
+    def test_prefetch_exact_multiple(self, api_key, httpx_mock: HTTPXMock):
+        """Test an empty page ends iteration when the total is a page multiple"""
+        pages = MessagePages(total=30)
+        httpx_mock.add_callback(pages, url=MESSAGES_URL, is_reusable=True)
+        client = Sendly(api_key)
+
+        messages = list(client.messages.list_all(batch_size=10, prefetch=3))
+
+        assert len(messages) == 30
+        client.close()
+
+    def test_prefetch_propagates_errors(self, api_key, httpx_mock: HTTPXMock):
+        """Test a failing page request raises from the iterator"""
+        httpx_mock.add_response(
+            url=MESSAGES_URL,
+            status_code=401,
+            json={"error": "invalid_api_key", "message": "Bad key"},
+            is_reusable=True,
+        )
+        client = Sendly(api_key)
+
+        with pytest.raises(AuthenticationError):
+            list(client.messages.list_all(batch_size=10, prefetch=2))
+        client.close()
+
+    def test_sequential_by_default(self, api_key, httpx_mock: HTTPXMock):
+        """Test the default still fetches one page at a time"""
+        pages = MessagePages(total=25)
+        httpx_mock.add_callback(pages, url=MESSAGES_URL, is_reusable=True)
+        client = Sendly(api_key)
+
+        assert len(list(client.messages.list_all(batch_size=10))) == 25
+        assert pages.offsets == [0, 10, 20]
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_prefetch(self, api_key, httpx_mock: HTTPXMock):
+        """Test async list_all with prefetch yields every message in order"""
+        pages = MessagePages(total=57)
+        httpx_mock.add_callback(pages, url=MESSAGES_URL, is_reusable=True)
+
+        async with AsyncSendly(api_key) as client:
+            ids = [m.id async for m in client.messages.list_all(batch_size=10, prefetch=3)]
+
+        assert ids == [f"msg_{i}" for i in range(57)]
+
+
+def _contact(i):
+    return {
+        "id": f"ct_{i}",
+        "phone_number": "+15551234567",
+        "opted_out": False,
+        "created_at": "2025-01-20T10:00:00Z",
+        "updated_at": "2025-01-20T10:00:00Z",
+    }
+
+
+def _workspace(i):
+    return {
+        "id": f"ws_{i}",
+        "name": f"Workspace {i}",
+        "creditsUsed": i,
+        "creditsPurchased": 0,
+        "creditsTransferredIn": 0,
+        "creditsTransferredOut": 0,
+        "messagesSent": 0,
+        "messagesDelivered": 0,
+        "workspaceFee": 0,
+        "allocatedPlatformFee": 0,
+        "totalCost": 0,
+    }
+
+
+def _contacts_page(total):
+    def respond(request: httpx.Request) -> httpx.Response:
+        limit = int(request.url.params.get("limit", 50))
+        offset = int(request.url.params.get("offset", 0))
+        contacts = [_contact(i) for i in range(offset, min(offset + limit, total))]
+        return httpx.Response(
+            200, json={"contacts": contacts, "total": total, "limit": limit, "offset": offset}
+        )
+
+    return respond
+
+
+class TestPaginator:
+    """Test the generic Paginator"""
+
+    def test_max_items_and_cursor(self):
+        """Test max_items stops early and the cursor points past the last item"""
+        calls = []
+
+        def fetch(offset, limit):
+            calls.append(offset)
+            return Page(list(range(offset, offset + limit)), offset, limit)
+
+        pages = Paginator(fetch, page_size=10, max_items=25)
+        assert list(pages) == list(range(25))
+        assert calls == [0, 10, 20]
+        assert pages.cursor is None
+
+    def test_resume_from_encoded_cursor(self):
+        """Test a saved cursor resumes at the next unseen item"""
+
+        def fetch(offset, limit):
+            return Page(list(range(offset, min(offset + limit, 42))), offset, limit)
+
+        first = Paginator(fetch, page_size=10)
+        seen = [next(first) for _ in range(13)]
+        token = first.cursor.encode()
+        first.close()
+
+        rest = list(Paginator(fetch, cursor=token))
+        assert seen + rest == list(range(42))
+        assert PageCursor.decode(token) == PageCursor(offset=13, limit=10)
+
+    def test_aligned_resume_skips_seen_items(self):
+        """Test page-numbered endpoints resume on a page boundary"""
+        requested = []
+
+        def fetch(offset, limit):
+            requested.append(offset)
+            return Page(list(range(offset, min(offset + limit, 30))), offset, limit)
+
+        items = list(Paginator(fetch, cursor=PageCursor(offset=13, limit=10), aligned=True))
+        assert requested == [10, 20, 30]
+        assert items == list(range(13, 30))
+
+    def test_pages_and_on_page(self):
+        """Test page-level iteration and the per-page callback"""
+
+        def fetch(offset, limit):
+            return Page(list(range(offset, min(offset + limit, 25))), offset, limit, total=25)
+
+        seen = []
+        pages = Paginator(fetch, page_size=10, on_page=lambda p: seen.append(p.offset))
+        assert [len(p.items) for p in pages.pages()] == [10, 10, 5]
+        assert seen == [0, 10, 20]
+
+    def test_invalid_options(self):
+        """Test options and cursors are validated"""
+        with pytest.raises(ValueError, match="prefetch"):
+            Paginator(lambda offset, limit: None, prefetch=0)
+        with pytest.raises(ValueError, match="cursor"):
+            Paginator(lambda offset, limit: None, cursor="not-a-cursor")
+
+
+class TestResourceIterators:
+    """Test iter_* on the list endpoints"""
+
+    def test_contacts_iter_all_uses_total(self, api_key, httpx_mock: HTTPXMock):
+        """Test contacts stop at the reported total without an extra request"""
+        httpx_mock.add_callback(_contacts_page(40), url=CONTACTS_URL, is_reusable=True)
+        client = Sendly(api_key)
+
+        contacts = list(client.contacts.iter_all(page_size=20, search="a"))
+
+        assert [c.id for c in contacts] == [f"ct_{i}" for i in range(40)]
+        assert len(httpx_mock.get_requests()) == 2
+        assert httpx_mock.get_requests()[0].url.params["search"] == "a"
+        client.close()
+
+    def test_billing_breakdown_pages(self, api_key, httpx_mock: HTTPXMock):
+        """Test the page-numbered breakdown endpoint"""
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            limit = int(request.url.params["limit"])
+            start = (page - 1) * limit
+            return httpx.Response(
+                200,
+                json={
+                    "period": "2025-01",
+                    "summary": {
+                        "platformFee": 0,
+                        "totalWorkspaceFees": 0,
+                        "totalCreditsUsed": 0,
+                        "totalCost": 0,
+                    },
+                    "workspaces": [_workspace(i) for i in range(start, min(start + limit, 7))],
+                },
+            )
+
+        httpx_mock.add_callback(respond, url=BREAKDOWN_URL, is_reusable=True)
+        client = Sendly(api_key)
+
+        items = list(client.enterprise.billing.iter_breakdown(period="2025-01", page_size=3))
+
+        assert [w.id for w in items] == [f"ws_{i}" for i in range(7)]
+        pages = [r.url.params["page"] for r in httpx_mock.get_requests()]
+        assert pages == ["1", "2", "3"]
+        client.close()
+
+    def test_list_all_cursor(self, api_key, httpx_mock: HTTPXMock):
+        """Test list_all exposes a resumable cursor"""
+        pages = MessagePages(total=35)
+        httpx_mock.add_callback(pages, url=MESSAGES_URL, is_reusable=True)
+        client = Sendly(api_key)
+
+        iterator = client.messages.list_all(batch_size=10)
+        head = [next(iterator).id for _ in range(12)]
+        iterator.close()
+        tail = [m.id for m in client.messages.list_all(cursor=iterator.cursor)]
+
+        assert head + tail == [f"msg_{i}" for i in range(35)]
+        assert pages.offsets == [0, 10, 12, 22, 32]
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_iter_all_with_max_items(self, api_key, httpx_mock: HTTPXMock):
+        """Test async iterators honour max_items and prefetch"""
+        httpx_mock.add_callback(_contacts_page(500), url=CONTACTS_URL, is_reusable=True)
+
+        async with AsyncSendly(api_key) as client:
+            contacts = [
+                c async for c in client.contacts.iter_all(page_size=50, prefetch=2, max_items=120)
+            ]
+
+        assert len(contacts) == 120
+        assert contacts[-1].id == "ct_119"
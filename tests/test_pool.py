@@ -0,0 +1,156 @@
+"""
+Tests for the multi-tenant client pool
+"""
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendlyPool, SendlyPool
+from sendly.pool import _BasePool
+
+BASE = "https://sendly.live/api/v1"
+
+MESSAGE = {
+    "id": "msg_abc123",
+    "to": "+15551234567",
+    "text": "Hello",
+    "status": "queued",
+    "createdAt": "2025-01-20T10:00:00Z",
+}
+
+ACME_KEY = "sk_test_v1_acme"
+GLOBEX_KEYS = ["sk_test_v1_globex_1", "sk_test_v1_globex_2"]
+
+
+def sent_with(request):
+    return request.headers["authorization"], request.headers.get("x-organization-id")
+
+
+class TestSendlyPool:
+    """Test tenant routing over the shared pool"""
+
+    def test_routes_by_tenant_over_one_client(self, httpx_mock: HTTPXMock):
+        """Test each tenant sends its own key and org through the same httpx client"""
+        httpx_mock.add_response(json=MESSAGE, is_reusable=True)
+        with SendlyPool() as pool:
+            pool.add("acme", ACME_KEY, organization_id="org_acme")
+            pool.add("globex", GLOBEX_KEYS[0], organization_id="org_globex")
+
+            pool["acme"].messages.get("msg_abc123")
+            pool["globex"].messages.get("msg_abc123")
+
+            assert pool["acme"]._http.client is pool["globex"]._http.client is pool.http_client
+            assert list(pool) == ["acme", "globex"] and "acme" in pool
+
+        first, second = httpx_mock.get_requests()
+        assert sent_with(first) == (f"Bearer {ACME_KEY}", "org_acme")
+        assert sent_with(second) == (f"Bearer {GLOBEX_KEYS[0]}", "org_globex")
+        assert pool.http_client.is_closed
+
+    def test_env_organization_not_applied(self, httpx_mock: HTTPXMock, monkeypatch):
+        """Test SENDLY_ORG_ID never scopes a tenant registered without an org"""
+        monkeypatch.setenv("SENDLY_ORG_ID", "org_env")
+        httpx_mock.add_response(json=MESSAGE, is_reusable=True)
+        with SendlyPool() as pool:
+            pool.add("acme", ACME_KEY, organization_id="org_acme")
+            pool.add("globex", GLOBEX_KEYS[0])
+
+            pool["acme"].messages.get("msg_abc123")
+            pool["globex"].messages.get("msg_abc123")
+
+        first, second = httpx_mock.get_requests()
+        assert sent_with(first) == (f"Bearer {ACME_KEY}", "org_acme")
+        assert sent_with(second) == (f"Bearer {GLOBEX_KEYS[0]}", None)
+
+    def test_spreads_across_keys(self, httpx_mock: HTTPXMock):
+        """Test a tenant's keys take turns until one reports more headroom"""
+        httpx_mock.add_response(
+            json=MESSAGE,
+            match_headers={"Authorization": f"Bearer {GLOBEX_KEYS[0]}"},
+            headers={
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": "1",
+                "X-RateLimit-Reset": "60",
+            },
+            is_reusable=True,
+        )
+        httpx_mock.add_response(
+            json=MESSAGE,
+            match_headers={"Authorization": f"Bearer {GLOBEX_KEYS[1]}"},
+            headers={
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": "90",
+                "X-RateLimit-Reset": "60",
+            },
+            is_reusable=True,
+        )
+        pool = SendlyPool()
+        pool.add("globex", GLOBEX_KEYS)
+
+        first = pool.client("globex")
+        second = pool.client("globex")
+        assert first is not second  # no headroom known yet: round-robin
+        first.messages.get("msg_abc123")
+        second.messages.get("msg_abc123")
+
+        picked = {pool.client("globex")._http.api_key for _ in range(4)}
+        assert picked == {GLOBEX_KEYS[1]}
+        pool.close()
+
+    def test_per_key_rate_limiter_shared(self):
+        """Test tenants using the same key share one limiter"""
+        pool = SendlyPool(rate_limiter=True, metrics=True)
+        pool.add("acme-us", ACME_KEY, organization_id="org_us")
+        pool.add("acme-eu", ACME_KEY, organization_id="org_eu")
+        pool.add("globex", GLOBEX_KEYS[0])
+
+        us, eu, globex = (pool[t]._http for t in ("acme-us", "acme-eu", "globex"))
+        assert us.rate_limiter is eu.rate_limiter is not globex.rate_limiter
+        assert us.metrics is globex.metrics is pool.metrics
+        pool.close()
+
+    def test_registry_errors(self):
+        """Test unknown and duplicate tenants are rejected"""
+        pool = SendlyPool()
+        pool.add("acme", ACME_KEY)
+
+        with pytest.raises(ValueError, match="already added"):
+            pool.add("acme", ACME_KEY)
+        with pytest.raises(ValueError, match="API key"):
+            pool.add("empty", [])
+        pool.remove("acme")
+        with pytest.raises(KeyError, match="acme"):
+            pool.client("acme")
+        pool.close()
+
+    def test_configuration_errors(self):
+        """Test the base pool is abstract and transport can't join a shared client"""
+        with pytest.raises(TypeError, match="abstract"):
+            _BasePool(False, None, {})
+        with httpx.Client() as shared:
+            with pytest.raises(ValueError, match="http_client or transport"):
+                SendlyPool(http_client=shared, transport=httpx.MockTransport(lambda r: None))
+
+
+class TestAsyncSendlyPool:
+    """Test the async pool"""
+
+    @pytest.mark.asyncio
+    async def test_routes_by_tenant(self, httpx_mock: HTTPXMock):
+        """Test async tenants share the pool and keep their own credentials"""
+        httpx_mock.add_response(json=MESSAGE, is_reusable=True)
+
+        async with AsyncSendlyPool() as pool:
+            pool.add("acme", ACME_KEY, organization_id="org_acme")
+            pool.add("globex", GLOBEX_KEYS)
+            await pool["acme"].messages.get("msg_abc123")
+            await pool["globex"].messages.get("msg_abc123")
+            await pool["globex"].messages.get("msg_abc123")
+
+        requests = httpx_mock.get_requests()
+        assert sent_with(requests[0]) == (f"Bearer {ACME_KEY}", "org_acme")
+        assert {r.headers["authorization"] for r in requests[1:]} == {
+            f"Bearer {key}" for key in GLOBEX_KEYS
+        }
+        assert pool.http_client.is_closed
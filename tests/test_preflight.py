@@ -0,0 +1,156 @@
+"""
+Tests for local batch pre-flight
+"""
+
+import time
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import CREDITS_PER_SMS, AsyncSendly, PricingTier, Sendly
+from sendly.errors import ValidationError
+from sendly.utils import preflight_batch
+
+BASE = "https://sendly.live/api/v1"
+
+CREDITS = {"balance": 120, "reserved_balance": 20, "available_balance": 100}
+
+
+class TestPreflightBatch:
+    """Test the offline pre-flight engine"""
+
+    def test_totals_and_blocked(self):
+        """Test per-country credits and blocked messages with reasons"""
+        result = preflight_batch(
+            [
+                {"to": "+15551234567", "text": "Hi"},
+                {"to": "+14165551234", "text": "A" * 161},
+                {"to": "+447700900123", "text": "Hello"},
+                {"to": "555-1234", "text": "Hi"},
+                {"to": "+15551234567", "text": ""},
+                {"to": "+999123456789", "text": "Hi"},
+            ],
+            balance=100,
+        )
+
+        domestic = CREDITS_PER_SMS[PricingTier.DOMESTIC]
+        assert (result.total, result.will_send, result.blocked) == (6, 3, 3)
+        assert result.segments == 4
+        assert result.credits_by_country == {
+            "US": domestic,
+            "CA": 2 * domestic,
+            "GB": CREDITS_PER_SMS[PricingTier.TIER1],
+        }
+        assert result.credits_needed == sum(result.credits_by_country.values())
+        assert result.errors() == {
+            3: "invalid_phone",
+            4: "missing_text",
+            5: "unsupported_country",
+        }
+        assert result.can_send
+
+    def test_text_matches_send_batch_validation(self, api_key):
+        """Test text send_batch would reject is blocked, not priced"""
+        messages = [
+            {"to": "+15551234567"},
+            {"to": "+15551234567", "text": None},
+            {"to": "+15551234567", "text": 42},
+            {"to": "+15551234567", "text": ["Hi"]},
+            {"to": "+15551234567", "text": "Hi"},
+        ]
+
+        result = preflight_batch(messages)
+
+        assert result.errors() == {i: "missing_text" for i in range(4)}
+        assert result.will_send == 1 and result.segments == 1
+        client = Sendly(api_key)
+        for message in messages[:4]:
+            with pytest.raises(ValidationError):
+                client.messages.send_batch([message])
+        client.close()
+
+    def test_insufficient_balance(self):
+        """Test can_send is False when the balance doesn't cover the batch"""
+        result = preflight_batch([{"to": "+447700900123", "text": "Hi"}] * 20, balance=100)
+
+        assert result.credits_needed == 20 * CREDITS_PER_SMS[PricingTier.TIER1]
+        assert not result.has_enough_credits and not result.can_send
+
+    def test_large_batch(self):
+        """Test a large batch runs in memory without a size limit"""
+        messages = [{"to": f"+1555{i:07d}", "text": "Your order shipped"} for i in range(100_000)]
+
+        started = time.perf_counter()
+        result = preflight_batch(messages)
+
+        assert result.will_send == 100_000 and result.balance is None and result.can_send
+        assert time.perf_counter() - started < 10
+
+
+class TestPreflightResource:
+    """Test messages.preflight_batch"""
+
+    def test_balance_is_cached(self, api_key, httpx_mock: HTTPXMock):
+        """Test the available balance is fetched once and reused"""
+        httpx_mock.add_response(url=f"{BASE}/credits", json=CREDITS)
+        client = Sendly(api_key)
+        messages = [{"to": "+15551234567", "text": "Hi"}]
+
+        first = client.messages.preflight_batch(messages)
+        second = client.messages.preflight_batch(messages * 60)
+
+        assert first.balance == second.balance == 100
+        assert first.can_send and not second.can_send
+        assert len(httpx_mock.get_requests()) == 1
+        assert client.messages.preflight_batch(messages, balance=5).balance == 5
+        client.close()
+
+    def test_balance_is_cached_per_organization(self, api_key, httpx_mock: HTTPXMock):
+        """Test one organization's balance is never used for another's preflight"""
+        httpx_mock.add_response(
+            url=f"{BASE}/credits",
+            match_headers={"X-Organization-Id": "org_a"},
+            json=CREDITS,
+        )
+        httpx_mock.add_response(
+            url=f"{BASE}/credits",
+            match_headers={"X-Organization-Id": "org_b"},
+            json={**CREDITS, "available_balance": 1},
+        )
+        client = Sendly(api_key)
+        messages = [{"to": "+15551234567", "text": "Hi"}] * 2
+
+        org_a = client.messages.preflight_batch(
+            messages, request_options={"organization_id": "org_a"}
+        )
+        org_b = client.messages.preflight_batch(
+            messages, request_options={"organization_id": "org_b"}
+        )
+        again = client.messages.preflight_batch(
+            messages, request_options={"organization_id": "org_a"}
+        )
+
+        assert (org_a.balance, org_b.balance, again.balance) == (100, 1, 100)
+        assert org_a.can_send and not org_b.can_send
+        assert len(httpx_mock.get_requests()) == 2
+        client.close()
+
+    def test_invalid_sender(self, api_key):
+        """Test an invalid sender ID raises before anything is fetched"""
+        client = Sendly(api_key)
+
+        with pytest.raises(ValidationError):
+            client.messages.preflight_batch([], from_="!")
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_refetches_when_stale(self, api_key, httpx_mock: HTTPXMock):
+        """Test balance_max_age=0 fetches a fresh balance"""
+        httpx_mock.add_response(url=f"{BASE}/credits", json=CREDITS, is_reusable=True)
+
+        async with AsyncSendly(api_key) as client:
+            await client.messages.preflight_batch([], balance_max_age=0)
+            result = await client.messages.preflight_batch([], balance_max_age=0)
+
+        assert result.balance == 100 and not result.can_send
+        assert len(httpx_mock.get_requests()) == 2
@@ -0,0 +1,193 @@
+"""
+Tests for the client-side token-bucket rate limiter
+"""
+
+import threading
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Sendly
+from sendly.utils.rate_limit import AsyncRateLimiter, RateLimiter
+
+BASE = "https://sendly.live/api/v1"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Test token accounting without sleeping"""
+
+    def test_unseeded_limiter_does_not_wait(self):
+        """Test requests pass through until headers seed the bucket"""
+        limiter = RateLimiter(clock=FakeClock())
+        assert limiter._reserve() == 0.0
+        assert limiter.stats().waits == 0
+
+    def test_seeded_from_headers(self):
+        """Test limit/remaining/reset seed capacity, tokens and refill rate"""
+        limiter = RateLimiter(clock=FakeClock())
+        limiter.update(limit=100, remaining=40, reset=60)
+
+        stats = limiter.stats()
+        assert stats.capacity == 100
+        assert stats.tokens == 40
+        assert stats.refill_rate == pytest.approx(100 / 60)
+
+    def test_paces_when_tokens_run_out(self):
+        """Test callers queue behind each other at the refill rate"""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=10, burst=2, clock=clock)
+
+        assert limiter._reserve() == 0.0
+        assert limiter._reserve() == 0.0
+        assert limiter._reserve() == pytest.approx(0.1)
+        assert limiter._reserve() == pytest.approx(0.2)
+
+        clock.now += 0.2
+        assert limiter.tokens == pytest.approx(0.0)
+        stats = limiter.stats()
+        assert stats.waits == 2
+        assert stats.total_wait == pytest.approx(0.3)
+        assert stats.max_wait == pytest.approx(0.2)
+
+    def test_refill_is_capped_at_capacity(self):
+        """Test idle time never grows the bucket beyond the limit"""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=10, burst=5, clock=clock)
+        clock.now += 60
+        assert limiter.tokens == 5
+
+    def test_server_remaining_caps_local_tokens(self):
+        """Test the server's remaining count wins over a fuller local bucket"""
+        limiter = RateLimiter(rate=100, burst=100, clock=FakeClock())
+        limiter.update(limit=100, remaining=3, reset=60)
+        assert limiter.tokens == 3
+
+    def test_exhausted_window_blocks_until_reset(self):
+        """Test remaining=0 holds requests until the window resets"""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.update(limit=60, remaining=0, reset=30)
+
+        wait = limiter._reserve()
+        # 30s until reset (the window estimate), then one token at 2/s
+        assert wait == pytest.approx(30.5)
+
+    def test_block_holds_all_callers(self):
+        """Test block() delays every caller, even on an unseeded limiter"""
+        clock = FakeClock()
+        limiter = RateLimiter(clock=clock)
+        limiter.block(2.5)
+        assert limiter._reserve() == pytest.approx(2.5)
+        assert limiter._reserve() == pytest.approx(2.5)
+
+    def test_reset_as_unix_timestamp(self):
+        """Test an epoch X-RateLimit-Reset is converted to seconds"""
+        import time
+
+        limiter = RateLimiter(clock=FakeClock())
+        limiter.update(limit=120, remaining=120, reset=time.time() + 60)
+        assert limiter.stats().refill_rate == pytest.approx(2.0, rel=0.05)
+
+    def test_thread_safe_reservations(self):
+        """Test concurrent reservations never lose a token"""
+        limiter = RateLimiter(rate=1000, burst=1000, clock=FakeClock())
+
+        def worker():
+            for _ in range(100):
+                limiter._reserve()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = limiter.stats()
+        assert stats.acquired == 800
+        assert stats.tokens == pytest.approx(200)
+
+
+class TestClientIntegration:
+    """Test the limiter wired into the HTTP clients"""
+
+    def test_disabled_by_default(self, api_key):
+        """Test no limiter unless requested"""
+        client = Sendly(api_key)
+        assert client.get_rate_limiter_stats() is None
+        client.close()
+
+    def test_seeded_from_response_headers(
+        self, api_key, mock_message, mock_rate_limit_headers, httpx_mock: HTTPXMock
+    ):
+        """Test response headers feed the limiter"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages",
+            method="POST",
+            json=mock_message,
+            headers=mock_rate_limit_headers,
+        )
+        client = Sendly(api_key, rate_limiter=True)
+        client.messages.send(to="+15551234567", text="Test")
+
+        stats = client.get_rate_limiter_stats()
+        assert stats.capacity == 100
+        assert stats.acquired == 1
+        assert stats.tokens == pytest.approx(99, abs=0.1)
+        client.close()
+
+    def test_shared_limiter_instance(self, api_key):
+        """Test one limiter instance can pace several clients"""
+        limiter = RateLimiter(rate=5)
+        first = Sendly(api_key, rate_limiter=limiter)
+        second = Sendly(api_key, rate_limiter=limiter)
+        assert first._http.rate_limiter is second._http.rate_limiter is limiter
+        first.close()
+        second.close()
+
+    def test_rate_limit_error_blocks_limiter(
+        self, api_key, mock_message, mock_error_response, httpx_mock: HTTPXMock, monkeypatch
+    ):
+        """Test a 429 blocks the shared limiter instead of sleeping per caller"""
+        sleeps = []
+        monkeypatch.setattr("sendly.utils.rate_limit.time.sleep", sleeps.append)
+        httpx_mock.add_response(
+            url=f"{BASE}/messages",
+            method="POST",
+            status_code=429,
+            json=mock_error_response("rate_limit_exceeded", "Slow down", retryAfter=2),
+        )
+        httpx_mock.add_response(url=f"{BASE}/messages", method="POST", json=mock_message)
+
+        client = Sendly(api_key, rate_limiter=True)
+        message = client.messages.send(to="+15551234567", text="Test")
+
+        assert message.id == "msg_test_123"
+        assert client.get_rate_limiter_stats().acquired == 2
+        assert sleeps == [pytest.approx(2.0, abs=0.1)]
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_async_limiter(
+        self, api_key, mock_message, mock_rate_limit_headers, httpx_mock: HTTPXMock
+    ):
+        """Test AsyncSendly paces through an AsyncRateLimiter"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages",
+            method="POST",
+            json=mock_message,
+            headers=mock_rate_limit_headers,
+        )
+        async with AsyncSendly(api_key, rate_limiter=True) as client:
+            assert isinstance(client._http.rate_limiter, AsyncRateLimiter)
+            await client.messages.send(to="+15551234567", text="Test")
+            assert client.get_rate_limiter_stats().capacity == 100
@@ -0,0 +1,152 @@
+"""
+Tests for per-call request_options
+"""
+
+import asyncio
+import io
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Sendly, SendlyError
+
+BASE = "https://sendly.live/api/v1"
+
+MESSAGE = {
+    "id": "msg_abc123",
+    "to": "+15551234567",
+    "text": "Hello",
+    "status": "queued",
+    "createdAt": "2025-01-20T10:00:00Z",
+}
+
+
+def page(start, count):
+    return {
+        "data": [dict(MESSAGE, id=f"msg_{i}") for i in range(start, start + count)],
+        "count": count,
+    }
+
+
+class TestOrganization:
+    """Test per-call organization overrides"""
+
+    def test_override_does_not_touch_client(self, api_key, httpx_mock: HTTPXMock):
+        """Test the org applies to one call and the client keeps its own"""
+        httpx_mock.add_response(json=MESSAGE, is_reusable=True)
+        client = Sendly(api_key, organization_id="org_default")
+
+        client.messages.get("msg_abc123", request_options={"organization_id": "org_other"})
+        client.messages.get("msg_abc123")
+
+        first, second = httpx_mock.get_requests()
+        assert first.headers["X-Organization-Id"] == "org_other"
+        assert second.headers["X-Organization-Id"] == "org_default"
+        assert client._http.organization_id == "org_default"
+        client.close()
+
+    def test_none_removes_header(self, api_key, httpx_mock: HTTPXMock):
+        """Test organization_id=None sends the call without an organization"""
+        httpx_mock.add_response(json=MESSAGE)
+        client = Sendly(api_key, organization_id="org_default")
+
+        client.messages.get("msg_abc123", request_options={"organization_id": None})
+
+        assert "X-Organization-Id" not in httpx_mock.get_request().headers
+        client.close()
+
+    def test_upload_honours_override(self, api_key, httpx_mock: HTTPXMock):
+        """Test multipart uploads take the same overrides"""
+        httpx_mock.add_response(
+            url=f"{BASE}/media",
+            json={
+                "id": "media_1",
+                "url": "https://cdn.sendly.live/m/1.jpg",
+                "contentType": "image/jpeg",
+                "sizeBytes": 2,
+            },
+        )
+        client = Sendly(api_key)
+
+        client.media.upload(
+            io.BytesIO(b"\xff\xd8"),
+            request_options={"organization_id": "org_other", "headers": {"X-Trace": "t1"}},
+        )
+
+        request = httpx_mock.get_request()
+        assert request.headers["X-Organization-Id"] == "org_other"
+        assert request.headers["X-Trace"] == "t1"
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_organizations(self, api_key, httpx_mock: HTTPXMock):
+        """Test concurrent calls for different orgs each send their own"""
+        httpx_mock.add_response(json=MESSAGE, is_reusable=True)
+
+        async with AsyncSendly(api_key) as client:
+            await asyncio.gather(
+                *(
+                    client.messages.get(
+                        "msg_abc123", request_options={"organization_id": f"org_{i}"}
+                    )
+                    for i in range(10)
+                )
+            )
+
+        sent = sorted(r.headers["X-Organization-Id"] for r in httpx_mock.get_requests())
+        assert sent == sorted(f"org_{i}" for i in range(10))
+
+
+class TestOverrides:
+    """Test headers, timeouts, idempotency keys and retries per call"""
+
+    def test_headers_and_timeout(self, api_key, httpx_mock: HTTPXMock):
+        """Test extra headers are sent and the timeout reaches the transport"""
+        httpx_mock.add_response(json=MESSAGE)
+        client = Sendly(api_key)
+
+        client.messages.get(
+            "msg_abc123",
+            request_options={"headers": {"X-Request-Source": "cron"}, "timeout": 2.5},
+        )
+
+        request = httpx_mock.get_request()
+        assert request.headers["X-Request-Source"] == "cron"
+        assert request.extensions["timeout"]["read"] == 2.5
+        client.close()
+
+    def test_idempotency_key(self, api_key, httpx_mock: HTTPXMock):
+        """Test the idempotency key can come from request_options"""
+        httpx_mock.add_response(json=MESSAGE)
+        client = Sendly(api_key)
+
+        client.messages.send(
+            to="+15551234567", text="Hello", request_options={"idempotency_key": "order-42"}
+        )
+
+        assert httpx_mock.get_request().headers["Idempotency-Key"] == "order-42"
+        client.close()
+
+    def test_max_retries(self, api_key, httpx_mock: HTTPXMock):
+        """Test max_retries=0 fails on the first server error"""
+        httpx_mock.add_response(status_code=500, json={"error": "internal_error", "message": "x"})
+        client = Sendly(api_key, max_retries=3)
+
+        with pytest.raises(SendlyError):
+            client.messages.get("msg_abc123", request_options={"max_retries": 0})
+
+        assert len(httpx_mock.get_requests()) == 1
+        client.close()
+
+    def test_paginator_forwards_options(self, api_key, httpx_mock: HTTPXMock):
+        """Test every page of list_all carries the options"""
+        httpx_mock.add_response(url=f"{BASE}/messages?limit=100&offset=0", json=page(0, 100))
+        httpx_mock.add_response(url=f"{BASE}/messages?limit=100&offset=100", json=page(100, 5))
+        client = Sendly(api_key)
+
+        items = list(client.messages.list_all(request_options={"organization_id": "org_other"}))
+
+        assert len(items) == 105
+        assert all(r.headers["X-Organization-Id"] == "org_other" for r in httpx_mock.get_requests())
+        client.close()
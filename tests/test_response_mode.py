@@ -0,0 +1,155 @@
+"""
+Tests for the response_mode client option (model / raw / lazy)
+"""
+
+import re
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, LazyModel, Sendly
+from sendly.errors import SendlyError
+from sendly.types import BatchMessageResponse, Message
+
+BASE = "https://sendly.live/api/v1"
+MESSAGES_URL = re.compile(rf"{re.escape(BASE)}/messages\?.*")
+
+
+def _message(i=1, **overrides):
+    message = {
+        "id": f"msg_{i}",
+        "to": "+15551234567",
+        "text": "Hello",
+        "status": "queued",
+        "creditsUsed": 1,
+        "createdAt": "2025-01-20T10:00:00Z",
+    }
+    message.update(overrides)
+    return message
+
+
+class TestRawMode:
+    """Test response_mode='raw'"""
+
+    def test_send_returns_dict(self, api_key, httpx_mock: HTTPXMock):
+        """Test the decoded body is returned untouched"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=_message())
+        client = Sendly(api_key, response_mode="raw")
+
+        message = client.messages.send(to="+15551234567", text="Hello")
+
+        assert message == _message()
+        client.close()
+
+    def test_list_all_yields_dicts(self, api_key, httpx_mock: HTTPXMock):
+        """Test pagination works on raw responses"""
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            offset = int(request.url.params["offset"])
+            data = [_message(i) for i in range(offset, min(offset + 10, 15))]
+            return httpx.Response(200, json={"data": data, "count": len(data)})
+
+        httpx_mock.add_callback(respond, url=MESSAGES_URL, is_reusable=True)
+        client = Sendly(api_key, response_mode="raw")
+
+        ids = [m["id"] for m in client.messages.list_all(batch_size=10)]
+
+        assert ids == [f"msg_{i}" for i in range(15)]
+        client.close()
+
+    def test_send_batch_stream_summary(self, api_key, httpx_mock: HTTPXMock):
+        """Test batch summaries read raw chunk responses"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages/batch",
+            json={
+                "batchId": "batch_1",
+                "status": "processing",
+                "total": 2,
+                "queued": 2,
+                "sent": 0,
+                "failed": 0,
+                "creditsUsed": 2,
+                "messages": [],
+            },
+        )
+        client = Sendly(api_key, response_mode="raw")
+
+        summary = client.messages.send_batch_stream(
+            [{"to": "+15551234567", "text": "a"}, {"to": "+15551234568", "text": "b"}]
+        ).wait()
+
+        assert summary.queued == 2
+        assert summary.batch_ids == ["batch_1"]
+        client.close()
+
+
+class TestLazyMode:
+    """Test response_mode='lazy'"""
+
+    def test_fields_validated_on_access(self, api_key, httpx_mock: HTTPXMock):
+        """Test a bad field only fails when it is read"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=_message(creditsUsed="not-a-number"))
+        client = Sendly(api_key, response_mode="lazy")
+
+        message = client.messages.send(to="+15551234567", text="Hello")
+
+        assert isinstance(message, LazyModel)
+        assert message.model_class is Message
+        assert message.id == "msg_1"
+        assert message.to == "+15551234567"
+        with pytest.raises(SendlyError) as exc_info:
+            message.credits_used
+        assert exc_info.value.code == "invalid_response"
+        client.close()
+
+    def test_to_model_and_conversion(self, api_key, httpx_mock: HTTPXMock):
+        """Test lazy fields are converted and to_model builds a full model"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=_message())
+        client = Sendly(api_key, response_mode="lazy")
+
+        message = client.messages.send(to="+15551234567", text="Hello")
+
+        assert message.credits_used == 1
+        assert message.to_model() == Message(**_message())
+        with pytest.raises(AttributeError):
+            message.id = "other"
+        client.close()
+
+    def test_missing_required_field(self):
+        """Test a missing required field is reported on access"""
+        lazy = LazyModel(BatchMessageResponse, {"batchId": "batch_1"})
+
+        assert lazy.batch_id == "batch_1"
+        with pytest.raises(SendlyError, match="missing required field 'total'"):
+            lazy.total
+
+    @pytest.mark.asyncio
+    async def test_async_lazy(self, api_key, httpx_mock: HTTPXMock):
+        """Test the async client honours response_mode"""
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_1", json=_message())
+
+        async with AsyncSendly(api_key, response_mode="lazy") as client:
+            message = await client.messages.get("msg_1")
+
+        assert isinstance(message, LazyModel)
+        assert message.status == "queued"
+
+
+class TestModelMode:
+    """Test the default mode and option validation"""
+
+    def test_invalid_response_raises_up_front(self, api_key, httpx_mock: HTTPXMock):
+        """Test model mode still validates the whole response"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json=_message(creditsUsed="not-a-number"))
+        client = Sendly(api_key)
+
+        with pytest.raises(SendlyError) as exc_info:
+            client.messages.send(to="+15551234567", text="Hello")
+        assert exc_info.value.code == "invalid_response"
+        client.close()
+
+    def test_unknown_mode(self, api_key):
+        """Test an unknown response_mode is rejected"""
+        with pytest.raises(ValueError, match="response_mode"):
+            Sendly(api_key, response_mode="fast")
@@ -0,0 +1,162 @@
+"""
+Tests for Retry-After / X-RateLimit-Reset handling on 429 and 503
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, RateLimitError, Sendly
+from sendly.utils.rate_limit import AsyncRetryGate, parse_reset, parse_retry_after
+
+BASE = "https://sendly.live/api/v1"
+
+MESSAGE = {
+    "id": "msg_abc123",
+    "to": "+15551234567",
+    "text": "Hello",
+    "status": "queued",
+    "createdAt": "2025-01-20T10:00:00Z",
+}
+
+RATE_LIMITED = {"error": "rate_limit_exceeded", "message": "Too many requests", "retryAfter": 60}
+
+
+@pytest.fixture
+def slept(monkeypatch):
+    calls = []
+    monkeypatch.setattr("sendly.utils.http.time.sleep", calls.append)
+    return calls
+
+
+class TestParsing:
+    """Test header parsing"""
+
+    def test_retry_after_seconds(self):
+        """Test delta-seconds, including fractions"""
+        assert parse_retry_after("0.25") == 0.25
+        assert parse_retry_after(" 3 ") == 3.0
+        assert parse_retry_after("-1") == 0.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_retry_after_http_date(self):
+        """Test HTTP-dates become a wait relative to now"""
+        future = datetime.now(timezone.utc) + timedelta(seconds=30)
+        past = datetime.now(timezone.utc) - timedelta(seconds=30)
+
+        assert 28 <= parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+        assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+    def test_reset(self):
+        """Test X-RateLimit-Reset as seconds or a unix timestamp"""
+        assert parse_reset("0.5") == 0.5
+        assert 9 <= parse_reset(str(time.time() + 10)) <= 10
+        assert parse_reset("") is None
+
+
+class TestServerDirectedWaits:
+    """Test the client waits as long as the server asks"""
+
+    def test_retry_after_header_beats_body(self, api_key, httpx_mock: HTTPXMock, slept):
+        """Test a sub-second Retry-After replaces the body's 60s"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages/msg_abc123",
+            status_code=429,
+            json=RATE_LIMITED,
+            headers={"Retry-After": "0.2"},
+        )
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_abc123", json=MESSAGE)
+        client = Sendly(api_key)
+
+        client.messages.get("msg_abc123")
+
+        assert len(slept) == 1 and 0.1 < slept[0] <= 0.2
+        client.close()
+
+    def test_rate_limit_reset_without_body(self, api_key, httpx_mock: HTTPXMock):
+        """Test a bare 429 becomes a RateLimitError timed by X-RateLimit-Reset"""
+        httpx_mock.add_response(
+            status_code=429,
+            text="slow down",
+            headers={"X-RateLimit-Reset": "0.75"},
+        )
+        client = Sendly(api_key, max_retries=0)
+
+        with pytest.raises(RateLimitError) as exc:
+            client.messages.get("msg_abc123")
+
+        assert exc.value.retry_after == 0.75
+        client.close()
+
+    def test_503_with_retry_after(self, api_key, httpx_mock: HTTPXMock, slept):
+        """Test a 503 with Retry-After waits as told; without one it retries at once"""
+        httpx_mock.add_response(
+            status_code=503,
+            json={"error": "unavailable", "message": "Busy"},
+            headers={"Retry-After": "0.3"},
+        )
+        httpx_mock.add_response(status_code=503, json={"error": "unavailable", "message": "Busy"})
+        httpx_mock.add_response(json=MESSAGE)
+        client = Sendly(api_key)
+
+        client.messages.get("msg_abc123")
+
+        # (sleep is stubbed, so the gate is still shut for the third attempt)
+        assert 0.2 < slept[0] <= 0.3
+        assert len(httpx_mock.get_requests()) == 3
+        client.close()
+
+    def test_fractional_rate_limit_info(self, api_key, httpx_mock: HTTPXMock):
+        """Test sub-second X-RateLimit-Reset values are kept"""
+        httpx_mock.add_response(
+            json=MESSAGE,
+            headers={
+                "X-RateLimit-Limit": "100",
+                "X-RateLimit-Remaining": "99",
+                "X-RateLimit-Reset": "0.5",
+            },
+        )
+        client = Sendly(api_key)
+
+        client.messages.get("msg_abc123")
+
+        assert client.get_rate_limit_info().reset == 0.5
+        client.close()
+
+
+class TestAsyncRetryGate:
+    """Test the async shared wake-up"""
+
+    @pytest.mark.asyncio
+    async def test_waiters_resume_together(self):
+        """Test every blocked task is released by one timer"""
+        gate = AsyncRetryGate()
+        gate.block(0.05)
+        gate.block(0.01)  # a shorter wait never shortens the gate
+
+        started = time.monotonic()
+        waits = await asyncio.gather(*(gate.wait() for _ in range(50)))
+
+        assert time.monotonic() - started >= 0.05
+        assert max(waits) - min(waits) < 0.01
+        assert await gate.wait() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_blocked_tasks_hold_new_requests(self, api_key, httpx_mock: HTTPXMock):
+        """Test a 429 holds the client's other tasks until Retry-After passes"""
+        httpx_mock.add_response(status_code=429, json=RATE_LIMITED, headers={"Retry-After": "0.1"})
+        httpx_mock.add_response(json=MESSAGE, is_reusable=True)
+
+        async with AsyncSendly(api_key) as client:
+            await client.messages.get("msg_abc123")
+            started = time.monotonic()
+            client._http._retry_gate.block(0.1)
+            await asyncio.gather(*(client.messages.get("msg_abc123") for _ in range(5)))
+
+        assert time.monotonic() - started >= 0.1
+        assert len(httpx_mock.get_requests()) == 7
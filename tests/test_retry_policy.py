@@ -0,0 +1,281 @@
+"""
+Tests for the retry policy: backoff, retry budget, circuit breaker and deadlines
+"""
+
+import random
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import (
+    AsyncSendly,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    RetryPolicy,
+    Sendly,
+    deadline,
+)
+from sendly.errors import RateLimitError, SendlyError, TimeoutError
+from sendly.types import CircuitState
+from sendly.utils.retry import RetryState
+
+BASE = "https://sendly.live/api/v1"
+
+MESSAGE = {
+    "id": "msg_abc123",
+    "to": "+15551234567",
+    "text": "Hello",
+    "status": "queued",
+    "createdAt": "2025-01-20T10:00:00Z",
+}
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    slept = []
+    monkeypatch.setattr("sendly.utils.http.time.sleep", slept.append)
+    return slept
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions"""
+
+    def test_opens_half_opens_and_closes(self):
+        """Test the breaker opens at the threshold and recovers through a probe"""
+        clock = FakeClock()
+        transitions = []
+        breaker = CircuitBreaker(
+            failure_threshold=2,
+            recovery_timeout=10.0,
+            clock=clock,
+            on_state_change=lambda old, new: transitions.append(new),
+        )
+
+        breaker.record_failure()
+        breaker.allow()
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError) as exc:
+            breaker.allow()
+        assert exc.value.retry_after == pytest.approx(10.0)
+        assert breaker.state == CircuitState.OPEN
+
+        clock.now += 10.0
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.allow()  # the probe
+        with pytest.raises(CircuitOpenError):
+            breaker.allow()  # only one probe at a time
+        breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert transitions == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+        stats = breaker.stats()
+        assert (stats.opened, stats.rejected, stats.consecutive_failures) == (1, 2, 0)
+
+    def test_failed_probe_reopens(self):
+        """Test a failing probe sends the breaker back to open"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5.0, clock=clock)
+        breaker.record_failure()
+        clock.now += 5.0
+        breaker.allow()
+
+        breaker.record_failure()
+
+        stats = breaker.stats()
+        assert stats.state == CircuitState.OPEN
+        assert stats.retry_in == pytest.approx(5.0)
+
+    def test_success_resets_failure_count(self):
+        """Test only consecutive failures count"""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.allow()
+
+    def test_rate_limit_is_neutral(self):
+        """Test a 429 neither resets the failure count nor closes a half-open breaker"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=5.0, clock=clock)
+        state = RetryState(RetryPolicy(circuit_breaker=breaker, budget=False))
+        rate_limited = RateLimitError("slow down", retry_after=1.0, status_code=429)
+
+        state.record(SendlyError("down", status_code=503))
+        state.record(rate_limited)
+        state.record(SendlyError("down", status_code=503))
+        assert breaker.state == CircuitState.OPEN
+
+        clock.now += 5.0
+        breaker.allow()  # the probe
+        state.record(rate_limited)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        breaker.allow()  # the probe slot is free again
+
+
+class TestRetryBudget:
+    """Test the retry budget"""
+
+    def test_ratio_of_requests(self):
+        """Test retries are capped at min_retries plus a share of requests"""
+        budget = RetryBudget(ratio=0.5, min_retries=1, clock=FakeClock())
+        for _ in range(4):
+            budget.record_request()
+
+        spent = sum(budget.try_spend() for _ in range(10))
+
+        assert spent == 3  # 1 + 0.5 * 4
+
+    def test_window_slides(self):
+        """Test old traffic stops counting once the window passes"""
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.0, min_retries=1, window=10.0, clock=clock)
+        assert budget.try_spend()
+        assert not budget.try_spend()
+
+        clock.now += 10.0
+
+        assert budget.try_spend()
+
+
+class TestBackoff:
+    """Test decorrelated-jitter backoff"""
+
+    def test_delays_bounded_and_growing(self):
+        """Test each delay lies between the base and three times the previous one"""
+        random.seed(7)
+        state = RetryState(RetryPolicy(base_delay=0.1, max_delay=2.0, budget=False))
+        previous = 0.1
+        for attempt in range(20):
+            delay = state.backoff(attempt)
+            assert 0.1 <= delay <= min(2.0, previous * 3)
+            previous = delay
+
+
+class TestClientRetryPolicy:
+    """Test the policy applied by the HTTP client"""
+
+    def test_server_errors_back_off(self, api_key, httpx_mock: HTTPXMock, no_sleep):
+        """Test 5xx responses are retried after a jittered delay under a policy"""
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_abc123", status_code=503, json={})
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_abc123", json=MESSAGE)
+        client = Sendly(api_key, retry_policy=RetryPolicy(base_delay=0.2, max_delay=1.0))
+
+        assert client.messages.get("msg_abc123").id == "msg_abc123"
+        assert len(no_sleep) == 1 and 0.2 <= no_sleep[0] <= 0.6
+        client.close()
+
+    def test_breaker_fails_fast(self, api_key, httpx_mock: HTTPXMock, no_sleep):
+        """Test an open breaker rejects calls without sending them"""
+        httpx_mock.add_exception(httpx.ConnectError("refused"), is_reusable=True)
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0)
+        client = Sendly(api_key, max_retries=5, retry_policy=RetryPolicy(circuit_breaker=breaker))
+
+        with pytest.raises(CircuitOpenError):
+            client.messages.get("msg_abc123")
+        with pytest.raises(CircuitOpenError):
+            client.messages.get("msg_abc123")
+
+        assert len(httpx_mock.get_requests()) == 3
+        stats = client.get_circuit_breaker_stats()
+        assert stats.state == CircuitState.OPEN and stats.rejected == 2
+        client.close()
+
+    def test_client_errors_keep_breaker_closed(self, api_key, httpx_mock: HTTPXMock):
+        """Test 4xx responses count as a healthy API"""
+        httpx_mock.add_response(status_code=404, json={"error": "not_found"}, is_reusable=True)
+        client = Sendly(
+            api_key,
+            retry_policy=RetryPolicy(circuit_breaker=CircuitBreaker(failure_threshold=1)),
+        )
+
+        for _ in range(3):
+            with pytest.raises(SendlyError):
+                client.messages.get("msg_abc123")
+
+        assert client.get_circuit_breaker_stats().state == CircuitState.CLOSED
+        assert Sendly(api_key).get_circuit_breaker_stats() is None
+        client.close()
+
+    def test_budget_stops_retry_storm(self, api_key, httpx_mock: HTTPXMock, no_sleep):
+        """Test an exhausted budget makes calls fail after one attempt"""
+        httpx_mock.add_response(status_code=500, json={}, is_reusable=True)
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.0, min_retries=2))
+        client = Sendly(api_key, max_retries=3, retry_policy=policy)
+
+        for _ in range(3):
+            with pytest.raises(SendlyError):
+                client.messages.get("msg_abc123")
+
+        # 3 attempts for the first call, then no budget left to retry
+        assert len(httpx_mock.get_requests()) == 5
+        client.close()
+
+    def test_deadline_caps_waits(self, api_key, httpx_mock: HTTPXMock, no_sleep):
+        """Test a retry whose backoff would overrun the deadline is not attempted"""
+        httpx_mock.add_response(status_code=503, json={})
+        client = Sendly(api_key, retry_policy=RetryPolicy(base_delay=5.0, max_delay=10.0))
+
+        with pytest.raises(SendlyError) as exc:
+            client._http.request("GET", "/messages/msg_abc123", deadline=2.0)
+
+        assert exc.value.status_code == 503
+        assert no_sleep == []
+        client.close()
+
+    def test_deadline_bounds_attempt_timeout(self, api_key, httpx_mock: HTTPXMock):
+        """Test each attempt's timeout shrinks to the time left"""
+        httpx_mock.add_response(json=MESSAGE)
+        client = Sendly(api_key, timeout=30.0)
+
+        with deadline(1.5):
+            client.messages.get("msg_abc123")
+
+        timeout = httpx_mock.get_request().extensions["timeout"]
+        assert 0 < timeout["read"] <= 1.5
+        client.close()
+
+    def test_expired_deadline(self, api_key):
+        """Test nothing is sent once the deadline has passed"""
+        client = Sendly(api_key)
+
+        with deadline(-1.0), pytest.raises(TimeoutError, match="Deadline exceeded"):
+            client.messages.get("msg_abc123")
+
+    def test_nested_deadlines_only_shorten(self):
+        """Test an inner block can't extend the outer deadline"""
+        with deadline(1.0):
+            with deadline(100.0):
+                assert RetryState().remaining() <= 1.0
+            assert RetryState(deadline=0.5).remaining() <= 0.5
+        assert RetryState().remaining() is None
+
+    @pytest.mark.asyncio
+    async def test_async_breaker(self, api_key, httpx_mock: HTTPXMock, monkeypatch):
+        """Test the async client honours the breaker too"""
+
+        async def no_sleep(seconds):
+            pass
+
+        monkeypatch.setattr("sendly.utils.http.asyncio.sleep", no_sleep)
+        httpx_mock.add_response(status_code=502, json={}, is_reusable=True)
+        policy = RetryPolicy(circuit_breaker=CircuitBreaker(failure_threshold=2))
+
+        async with AsyncSendly(api_key, max_retries=4, retry_policy=policy) as client:
+            with pytest.raises(CircuitOpenError):
+                await client.messages.get("msg_abc123")
+            assert client.get_circuit_breaker_stats().state == CircuitState.OPEN
+
+        assert len(httpx_mock.get_requests()) == 2
@@ -0,0 +1,167 @@
+"""
+Tests for streaming JSON decoding and client.stream()
+"""
+
+import json
+import random
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncSendly, Sendly
+from sendly.errors import AuthenticationError, SendlyError, TimeoutError
+from sendly.types import Message
+from sendly.utils.streaming import JsonArrayScanner
+
+BASE = "https://sendly.live/api/v1"
+
+
+def _message(i):
+    return {
+        "id": f"msg_{i}",
+        "to": "+15551234567",
+        "text": f'Tricky "text" with ]}}, [{{ and \\ {i} 🌍',
+        "status": "delivered",
+        "createdAt": "2025-01-20T10:00:00Z",
+    }
+
+
+def _feed_in_pieces(scanner, raw, max_piece=7):
+    items = []
+    pos = 0
+    while pos < len(raw):
+        size = random.randint(1, max_piece)
+        items += scanner.feed(raw[pos : pos + size])
+        pos += size
+    scanner.close()
+    return items
+
+
+class TestJsonArrayScanner:
+    """Test the incremental array scanner"""
+
+    def test_any_chunking_yields_same_items(self):
+        """Test elements are decoded correctly however the body is split"""
+        body = {
+            "meta": {"data": ["not", "this"]},
+            "note": 'a "data": [1] lookalike',
+            "data": [_message(i) for i in range(20)] + [1, "two", None, [3, {"x": []}]],
+            "count": 24,
+        }
+        raw = json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+        for _ in range(50):
+            assert _feed_in_pieces(JsonArrayScanner(), raw) == body["data"]
+
+    def test_selected_keys_and_root_array(self):
+        """Test only the requested key is streamed, and bare arrays work"""
+        scanner = JsonArrayScanner(["campaigns"])
+        items = scanner.feed(b'{"data": [1, 2], "campaigns": [{"id": "c1"}], "total": 1}')
+        assert items == [{"id": "c1"}]
+
+        assert JsonArrayScanner().feed(b'[{"id": 1}, {"id": 2}]') == [{"id": 1}, {"id": 2}]
+
+    def test_items_emitted_as_soon_as_complete(self):
+        """Test an element is available before the rest of the body"""
+        scanner = JsonArrayScanner()
+        assert scanner.feed(b'{"data": [{"id": 1}, {"id"') == [{"id": 1}]
+        assert scanner.feed(b": 2}]}") == [{"id": 2}]
+
+    def test_truncated_body(self):
+        """Test a body cut off mid-document is reported"""
+        scanner = JsonArrayScanner()
+        scanner.feed(b'{"data": [{"id": 1}, {"id": 2')
+        with pytest.raises(SendlyError, match="truncated"):
+            scanner.close()
+
+
+class TestClientStream:
+    """Test Sendly.stream()"""
+
+    def test_stream_models_incrementally(self, api_key):
+        """Test items are built into models before the body finishes"""
+        sent = []
+
+        def body():
+            yield b'{"data": ['
+            for i in range(3):
+                sent.append(i)
+                yield (b"," if i else b"") + json.dumps(_message(i)).encode()
+            yield b'], "count": 3}'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["limit"] == "3"
+            return httpx.Response(200, headers={"content-type": "application/json"}, content=body())
+
+        client = Sendly(api_key, transport=httpx.MockTransport(handler))
+        messages = client.stream("/messages", params={"limit": 3}, model=Message)
+
+        first = next(messages)
+        assert isinstance(first, Message)
+        assert first.id == "msg_0"
+        assert len(sent) < 3
+        assert [m.id for m in messages] == ["msg_1", "msg_2"]
+        client.close()
+
+    def test_stream_raw_dicts_and_errors(self, api_key, httpx_mock: HTTPXMock):
+        """Test raw items without a model, and API errors before streaming"""
+        httpx_mock.add_response(
+            url=f"{BASE}/contacts",
+            json={"contacts": [{"id": "ct_1"}], "total": 1, "limit": 50, "offset": 0},
+        )
+        httpx_mock.add_response(
+            url=f"{BASE}/messages",
+            status_code=401,
+            json={"error": "invalid_api_key", "message": "Bad key"},
+        )
+        client = Sendly(api_key)
+
+        assert list(client.stream("/contacts")) == [{"id": "ct_1"}]
+        with pytest.raises(AuthenticationError):
+            list(client.stream("/messages"))
+        client.close()
+
+    def test_invalid_item(self, api_key, httpx_mock: HTTPXMock):
+        """Test an element that doesn't match the model raises invalid_response"""
+        httpx_mock.add_response(url=f"{BASE}/messages", json={"data": [{"id": "msg_1"}]})
+        client = Sendly(api_key)
+
+        with pytest.raises(SendlyError) as exc_info:
+            list(client.stream("/messages", model=Message))
+        assert exc_info.value.code == "invalid_response"
+        client.close()
+
+    def test_body_timeout_reports_call_timeout(self, api_key):
+        """Test a mid-body timeout names the per-call timeout that applied"""
+
+        def body():
+            yield b'{"data": ['
+            raise httpx.ReadTimeout("read timed out")
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, headers={"content-type": "application/json"}, content=body())
+
+        client = Sendly(api_key, timeout=30.0, transport=httpx.MockTransport(handler))
+
+        with pytest.raises(TimeoutError, match=r"after 2\.5s"):
+            list(client.stream("/messages", request_options={"timeout": 2.5}))
+        client.close()
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self, api_key):
+        """Test AsyncSendly.stream() decodes an async body incrementally"""
+
+        async def body():
+            yield b'{"data": ['
+            for i in range(5):
+                yield (b"," if i else b"") + json.dumps(_message(i)).encode()
+            yield b"]}"
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, headers={"content-type": "application/json"}, content=body())
+
+        async with AsyncSendly(api_key, transport=httpx.MockTransport(handler)) as client:
+            ids = [m.id async for m in client.stream("/messages", model=Message)]
+
+        assert ids == [f"msg_{i}" for i in range(5)]
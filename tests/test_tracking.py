@@ -0,0 +1,210 @@
+"""
+Tests for DeliveryTracker
+"""
+
+import asyncio
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from sendly import AsyncDeliveryTracker, AsyncSendly, DeliveryTracker, Sendly
+from sendly.errors import SendlyError, TimeoutError
+from sendly.webhooks import WebhookEvent, WebhookMessageData
+
+BASE = "https://sendly.live/api/v1"
+
+FAST = {"poll_interval": 0.001, "max_interval": 0.01}
+
+
+def message(id, status, **extra):
+    return {
+        "id": id,
+        "to": "+15551234567",
+        "text": "Hi",
+        "status": status,
+        "createdAt": "2025-01-20T10:00:00Z",
+        **extra,
+    }
+
+
+def batch(*statuses):
+    return {
+        "batchId": "batch_1",
+        "status": "completed",
+        "total": len(statuses),
+        "queued": 0,
+        "sent": len(statuses),
+        "failed": 0,
+        "creditsUsed": len(statuses),
+        "createdAt": "2025-01-20T10:00:00Z",
+        "messages": [
+            {"id": f"msg_{i}", "to": "+15551234567", "status": s} for i, s in enumerate(statuses)
+        ],
+    }
+
+
+class TestDeliveryTracker:
+    """Test batched delivery polling"""
+
+    def test_batch_polling(self, api_key, httpx_mock: HTTPXMock):
+        """Test one get_batch per poll resolves every message of the batch"""
+        url = f"{BASE}/messages/batch/batch_1"
+        httpx_mock.add_response(url=url, json=batch("delivered", "sent", "queued"))
+        httpx_mock.add_response(url=url, json=batch("delivered", "delivered", "failed"))
+        client = Sendly(api_key)
+        tracker = DeliveryTracker(client, **FAST)
+
+        done = tracker.track_batch("batch_1")
+        futures = [tracker.track(f"msg_{i}", batch_id="batch_1") for i in range(3)]
+        tracker.run_until_complete(timeout=5)
+
+        assert [f.result().status for f in futures] == ["delivered", "delivered", "failed"]
+        assert done.result().batch_id == "batch_1"
+        assert tracker.stats().requests == 2
+        client.close()
+
+    def test_list_pages_then_single_lookups(self, api_key, httpx_mock: HTTPXMock):
+        """Test loose messages are read from list pages, with a capped fallback to get"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages?limit=100&offset=0",
+            json={
+                "data": [
+                    message("msg_a", "delivered", deliveredAt="2025-01-20T10:00:05Z"),
+                    message("msg_x", "sent"),
+                    message("msg_b", "failed", error="Carrier rejected"),
+                ],
+                "count": 3,
+            },
+        )
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_old", json=message("msg_old", "bounced"))
+        client = Sendly(api_key)
+        tracker = DeliveryTracker(client, **FAST)
+
+        a, b, old = (tracker.track(m) for m in ("msg_a", "msg_b", "msg_old"))
+        assert tracker.poll() is True
+
+        assert a.result().delivered and a.result().delivered_at == "2025-01-20T10:00:05Z"
+        assert b.result().error == "Carrier rejected"
+        assert old.result().status == "bounced"
+        assert tracker.pending == 0 and tracker.stats().requests == 2
+        client.close()
+
+    def test_single_lookups_rotate(self, api_key, httpx_mock: HTTPXMock):
+        """Test loose messages beyond max_gets are looked up on later polls"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages?limit=100&offset=0",
+            json={"data": [], "count": 0},
+            is_reusable=True,
+        )
+        for id in ("msg_a", "msg_b"):
+            httpx_mock.add_response(
+                url=f"{BASE}/messages/{id}", json=message(id, "sent"), is_reusable=True
+            )
+        httpx_mock.add_response(url=f"{BASE}/messages/msg_c", json=message("msg_c", "delivered"))
+        client = Sendly(api_key)
+        tracker = DeliveryTracker(client, max_gets=2, **FAST)
+
+        futures = [tracker.track(m) for m in ("msg_a", "msg_b", "msg_c")]
+        tracker.poll()
+        assert not futures[2].done()
+        tracker.poll()
+
+        looked_up = [r.url.path.rsplit("/", 1)[-1] for r in httpx_mock.get_requests()]
+        assert looked_up == ["messages", "msg_a", "msg_b", "messages", "msg_c", "msg_a"]
+        assert futures[2].result(timeout=0).delivered
+        client.close()
+
+    def test_webhook_events(self, api_key):
+        """Test webhook events resolve messages without polling"""
+        client = Sendly(api_key)
+        tracker = DeliveryTracker(client)
+        future = tracker.track("msg_abc123")
+        data = WebhookMessageData(
+            id="msg_abc123",
+            status="undelivered",
+            to="+15551234567",
+            from_="Sendly",
+            segments=1,
+            credits_used=1,
+            error="Handset off",
+        )
+
+        assert tracker.handle_event(WebhookEvent("evt_1", "message.undelivered", data)) is True
+        assert future.result(timeout=0).status == "undelivered"
+        assert tracker.handle_event(WebhookEvent("evt_2", "message.undelivered", data)) is False
+        client.close()
+
+    def test_adaptive_backoff(self, api_key):
+        """Test quiet polls back off up to max_interval and progress resets them"""
+        client = Sendly(api_key)
+        tracker = DeliveryTracker(client, poll_interval=1, max_interval=5, backoff=2)
+
+        assert [tracker._adapt(False) for _ in range(4)] == [2, 4, 5, 5]
+        assert tracker._adapt(True) == 1
+        client.close()
+
+    def test_background_thread(self, api_key, httpx_mock: HTTPXMock):
+        """Test the background thread polls until futures resolve"""
+        httpx_mock.add_response(url=f"{BASE}/messages/batch/batch_1", json=batch("delivered"))
+        client = Sendly(api_key)
+
+        with DeliveryTracker(client, **FAST) as tracker:
+            result = tracker.track("msg_0", batch_id="batch_1").result(timeout=5)
+
+        assert result.delivered
+        client.close()
+
+    def test_timeout_is_sdk_error(self, api_key, httpx_mock: HTTPXMock):
+        """Test run_until_complete raises the SDK's TimeoutError"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages/batch/batch_1", json=batch("sent"), is_reusable=True
+        )
+        client = Sendly(api_key)
+        tracker = DeliveryTracker(client, **FAST)
+        tracker.track("msg_0", batch_id="batch_1")
+
+        with pytest.raises(SendlyError) as exc_info:
+            tracker.run_until_complete(timeout=0.05)
+
+        assert isinstance(exc_info.value, TimeoutError)
+        assert tracker.pending == 1
+        client.close()
+
+    def test_background_thread_error_reaches_waiters(self, api_key, monkeypatch):
+        """Test an unexpected error in the poll thread is raised from the futures"""
+        client = Sendly(api_key)
+
+        def broken(batch_id, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(client.messages, "get_batch", broken)
+
+        with DeliveryTracker(client, **FAST) as tracker:
+            future = tracker.track("msg_0", batch_id="batch_1")
+            with pytest.raises(RuntimeError, match="boom"):
+                future.result(timeout=5)
+            with pytest.raises(RuntimeError, match="boom"):
+                tracker.track("msg_1").result(timeout=0)
+
+        assert tracker.pending == 0
+        client.close()
+
+
+class TestAsyncDeliveryTracker:
+    """Test the async tracker"""
+
+    @pytest.mark.asyncio
+    async def test_background_task(self, api_key, httpx_mock: HTTPXMock):
+        """Test futures resolve from the background task and can be gathered"""
+        httpx_mock.add_response(
+            url=f"{BASE}/messages?limit=100&offset=0",
+            json={"data": [message("msg_a", "delivered"), message("msg_b", "failed")], "count": 2},
+        )
+
+        async with AsyncSendly(api_key) as client:
+            async with AsyncDeliveryTracker(client, **FAST) as tracker:
+                results = await asyncio.wait_for(
+                    asyncio.gather(tracker.track("msg_a"), tracker.track("msg_b")), 5
+                )
+
+        assert [r.status for r in results] == ["delivered", "failed"]
@@ -9,10 +9,12 @@ from sendly.utils.validation import (
     calculate_segments,
     get_country_from_phone,
     is_country_supported,
+    normalize_phone_number,
     validate_limit,
     validate_message_id,
     validate_message_text,
     validate_phone_number,
+    validate_phone_numbers,
     validate_sender_id,
 )
 
@@ -90,6 +92,66 @@ class TestValidatePhoneNumber:
             validate_phone_number(None)
 
 
+class TestValidatePhoneNumbers:
+    """Test bulk validation and normalization"""
+
+    def test_normalizes_common_formats(self):
+        """Test separators, 00 prefixes and national numbers become E.164"""
+        result = validate_phone_numbers(
+            [
+                "+1 (555) 123-4567",
+                "555.123.4567",
+                "1-555-123-4567",
+                "0044 20 7123 4567",
+                15551234567,
+            ],
+            default_country="US",
+        )
+
+        assert result.all_valid
+        assert result.numbers == ["+15551234567"] * 3 + ["+442071234567", "+15551234567"]
+        assert result.indices == [0, 1, 2, 3, 4]
+
+    def test_trunk_prefix(self):
+        """Test the national trunk prefix is dropped for the default country"""
+        assert normalize_phone_number("020 7123 4567", "gb") == "+442071234567"
+        assert normalize_phone_number("06 12 34 56 78", "FR") == "+33612345678"
+
+    def test_invalid_indices_and_reasons(self):
+        """Test invalid numbers are reported by position with a reason"""
+        result = validate_phone_numbers(
+            ["+15551234567", None, "   ", "555-CALL-NOW", "5551234567", "+1234567890123456"]
+        )
+
+        assert result.numbers == ["+15551234567"]
+        assert result.errors() == {
+            1: "missing",
+            2: "missing",
+            3: "invalid_characters",
+            4: "no_country_code",
+            5: "invalid_format",
+        }
+
+    def test_duplicates_and_array_input(self):
+        """Test repeated inputs and objects with tolist() are handled"""
+
+        class Column:
+            def tolist(self):
+                return ["+15551234567", "bad", "+15551234567", "bad"]
+
+        result = validate_phone_numbers(Column())
+
+        assert result.indices == [0, 2]
+        assert result.invalid_indices == [1, 3]
+
+    def test_errors(self):
+        """Test unknown default countries and invalid single numbers raise"""
+        with pytest.raises(ValidationError, match="Unknown default country"):
+            validate_phone_numbers(["5551234567"], default_country="XX")
+        with pytest.raises(ValidationError, match="no_country_code"):
+            normalize_phone_number("5551234567")
+
+
 class TestValidateMessageText:
     """Test validate_message_text() function"""
 
@@ -351,6 +413,18 @@ class TestGetCountryFromPhone:
         # Country code 1 is US/Canada, we default to US
         assert get_country_from_phone("+12125551234") == "US"
 
+    def test_canadian_area_codes(self):
+        """Test +1 numbers with Canadian area codes resolve to CA"""
+        assert get_country_from_phone("+14165551234") == "CA"
+        assert get_country_from_phone("+16045551234") == "CA"
+        assert get_country_from_phone("+1416555123") is None  # too short
+
+    def test_code_only_and_longest_prefix(self):
+        """Test bare calling codes and three-digit codes sharing a leading digit"""
+        assert get_country_from_phone("+44") == "GB"
+        assert get_country_from_phone("+420123456789") == "CZ"
+        assert get_country_from_phone("+40123456789") == "RO"
+
 
 class TestIsCountrySupported:
     """Test is_country_supported() function"""
@@ -412,12 +486,15 @@ class TestCalculateSegments:
     def test_single_segment_unicode(self):
         """Test single segment unicode message"""
         assert calculate_segments("Hello 世界") == 1
-        assert calculate_segments("🌍" * 70) == 1
+        assert calculate_segments("🌍" * 35) == 1  # 70 UTF-16 code units
 
     def test_multiple_segments_unicode(self):
         """Test multiple segment unicode message"""
-        assert calculate_segments("🌍" * 71) == 2
+        assert calculate_segments("世" * 71) == 2
         assert calculate_segments("世界" * 68) == 3
+        # Surrogate pairs are never split: 33 emoji fit in a 67-unit part
+        assert calculate_segments("🌍" * 36) == 2
+        assert calculate_segments("🌍" * 67) == 3
 
     def test_empty_message(self):
         """Test empty message"""
@@ -437,11 +514,25 @@ class TestCalculateSegments:
     def test_mixed_gsm_and_unicode(self):
         """Test mixed GSM and unicode (forces unicode encoding)"""
         # Emoji forces unicode encoding
-        text = "A" * 69 + "🌍"
-        assert calculate_segments(text) == 1  # 70 chars in unicode
+        text = "A" * 68 + "🌍"
+        assert calculate_segments(text) == 1  # 70 UTF-16 code units
 
-        text = "A" * 70 + "🌍"
-        assert calculate_segments(text) == 2  # 71 chars in unicode
+        text = "A" * 69 + "🌍"
+        assert calculate_segments(text) == 2  # 71 UTF-16 code units
+
+    def test_gsm_extension_characters(self):
+        """Test extension characters take two septets"""
+        assert calculate_segments("€" * 80) == 1
+        assert calculate_segments("€" * 81) == 2
+        # An escape pair is never split across parts
+        assert calculate_segments("A" * 152 + "€" + "A" * 151) == 2
+        assert calculate_segments("A" * 152 + "€" + "A" * 152) == 3  # 306 septets
+
+    def test_gsm_characters_above_ascii(self):
+        """Test accented GSM-7 characters keep GSM-7 encoding"""
+        assert calculate_segments("é" * 160) == 1
+        assert calculate_segments("ñ" * 161) == 2
+        assert calculate_segments("`" * 71) == 2  # backtick is not GSM-7
 
     def test_newlines_and_whitespace(self):
         """Test newlines and whitespace"""
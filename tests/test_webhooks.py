@@ -3,6 +3,7 @@ Tests for webhook verification and parsing
 """
 
 import json
+import time
 
 import pytest
 
@@ -11,6 +12,7 @@ from sendly.webhooks import (
     WebhookMessageData,
     Webhooks,
     WebhookSignatureError,
+    WebhookVerifier,
 )
 
 
@@ -568,3 +570,74 @@ class TestWebhookEdgeCases:
         event = Webhooks.parse_event(payload, signature, secret)
 
         assert event.data.message_id == "msg_large"
+
+
+class TestWebhookVerifier:
+    """Test WebhookVerifier"""
+
+    payload = '{"id": "evt_1", "type": "message.delivered", "data": {"object": {"id": "msg_1"}}}'
+
+    def test_matches_static_verification(self):
+        """Test signatures accepted by verify_signature are accepted for str and bytes bodies"""
+        timestamp = str(int(time.time()))
+        signature = Webhooks.generate_signature(self.payload, "secret", timestamp)
+        verifier = WebhookVerifier("secret")
+        body = self.payload.encode()
+
+        assert verifier.verify(self.payload, signature, timestamp) is True
+        assert verifier.verify(body, signature, timestamp) is True
+        assert verifier.verify(memoryview(bytearray(body)), signature, timestamp) is True
+        assert verifier.verify(body, signature.upper(), timestamp) is False
+        assert verifier.verify(b"", signature, timestamp) is False
+
+    def test_rotation_accepts_every_active_secret(self):
+        """Test old and new secrets both verify until the old one is removed"""
+        old = Webhooks.generate_signature(self.payload, "old_secret")
+        new = Webhooks.generate_signature(self.payload, "new_secret")
+        verifier = WebhookVerifier("new_secret", "old_secret")
+
+        assert verifier.secrets == ("new_secret", "old_secret")
+        assert verifier.verify(self.payload, old) and verifier.verify(self.payload, new)
+
+        verifier.remove_secret("old_secret")
+        assert verifier.verify(self.payload, old) is False
+
+        verifier.add_secret("newest_secret")
+        assert verifier.secrets == ("newest_secret", "new_secret")
+        with pytest.raises(ValueError):
+            verifier.add_secret("")
+
+    def test_timestamp_tolerance(self):
+        """Test stale timestamps are rejected"""
+        stale = str(int(time.time()) - 600)
+        signature = Webhooks.generate_signature(self.payload, "secret", stale)
+
+        assert WebhookVerifier("secret").verify(self.payload, signature, stale) is False
+        assert WebhookVerifier("secret", tolerance=900).verify(self.payload, signature, stale)
+
+    def test_verify_many(self):
+        """Test batch verification reports each event in order"""
+        timestamp = str(int(time.time()))
+        good = Webhooks.generate_signature(self.payload, "secret", timestamp)
+        verifier = WebhookVerifier("secret")
+
+        results = verifier.verify_many(
+            [
+                (self.payload.encode(), good, timestamp),
+                (self.payload, "sha256=bad", timestamp),
+                (self.payload, Webhooks.generate_signature(self.payload, "secret"), None),
+            ]
+        )
+
+        assert results == [True, False, True]
+
+    def test_parse(self):
+        """Test parse verifies and decodes memoryview bodies"""
+        signature = Webhooks.generate_signature(self.payload, "secret")
+        verifier = WebhookVerifier("secret")
+
+        event = verifier.parse(memoryview(self.payload.encode()), signature)
+        assert (event.id, event.data.id) == ("evt_1", "msg_1")
+
+        with pytest.raises(WebhookSignatureError):
+            verifier.parse(self.payload, "sha256=bad")